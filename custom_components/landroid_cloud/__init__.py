@@ -10,6 +10,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import async_get_integration
 from pyworxcloud import WorxCloud
 from pyworxcloud.exceptions import (
@@ -34,14 +37,19 @@ from .const import (
     PLATFORMS,
     STARTUP,
 )
-from .coordinator import LandroidCloudCoordinator
+from .coordinator import LandroidCloudCoordinator, capability_store
+from .fleet import async_setup_services
 from .models import LandroidRuntimeData
+from .rain_plan import async_setup_rain_plan_services
+from .templates import async_setup_template_services
 
 LandroidConfigEntry = ConfigEntry[LandroidRuntimeData]
 _LOGGER = logging.getLogger(__name__)
 _CONFIG_ENTRY_VERSION = 2
 _SUPPORTED_CLOUDS = {provider.value for provider in CloudProvider}
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 
 def _normalize_cloud_provider(value: Any | None) -> str:
     """Return a canonical cloud provider value."""
@@ -147,6 +155,14 @@ async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry[Any]) -> b
     return True
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the account-wide Landroid Cloud services."""
+    async_setup_services(hass)
+    async_setup_template_services(hass)
+    async_setup_rain_plan_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: LandroidConfigEntry) -> bool:
     """Set up Landroid Cloud from a config entry."""
     integration = await async_get_integration(hass, DOMAIN)
@@ -186,7 +202,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: LandroidConfigEntry) ->
         await cloud.disconnect()
         raise ConfigEntryNotReady("No mowers found for this account")
 
-    coordinator = LandroidCloudCoordinator(hass, cloud)
+    coordinator = LandroidCloudCoordinator(hass, entry, cloud)
+    await coordinator.async_load_capabilities()
     await coordinator.async_setup()
     await coordinator.async_config_entry_first_refresh()
 
@@ -211,6 +228,23 @@ async def async_unload_entry(hass: HomeAssistant, entry: LandroidConfigEntry) ->
     return True
 
 
+async def async_remove_config_entry_device(
+    hass: HomeAssistant, entry: LandroidConfigEntry, device_entry: DeviceEntry
+) -> bool:
+    """Allow removing a mower device that is no longer on the account."""
+    coordinator = entry.runtime_data.coordinator
+    return not any(
+        domain == DOMAIN
+        and (identifier in coordinator.data or identifier == entry.entry_id)
+        for domain, identifier in device_entry.identifiers
+    )
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: LandroidConfigEntry) -> None:
+    """Remove stored data for a deleted config entry."""
+    await capability_store(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: LandroidConfigEntry) -> None:
     """Reload config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
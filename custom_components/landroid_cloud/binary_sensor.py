@@ -3,18 +3,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any
 
 from homeassistant.components.binary_sensor import (
+    DOMAIN as BINARY_SENSOR_DOMAIN,
     BinarySensorDeviceClass,
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from pyworxcloud import DeviceHandler
 
-from .entity import LandroidBaseEntity
+from .commands import CircuitState
+from .coordinator import LandroidCloudCoordinator
+from .entity import LandroidBaseEntity, async_add_device_entities
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -47,6 +54,15 @@ BINARY_SENSORS: tuple[LandroidBinarySensorDescription, ...] = (
     ),
 )
 
+# The circuit breaker covers the whole cloud account, so its sensor belongs to
+# the account rather than to each mower.
+CLOUD_DEGRADED_SENSOR = BinarySensorEntityDescription(
+    key="cloud_degraded",
+    translation_key="cloud_degraded",
+    device_class=BinarySensorDeviceClass.PROBLEM,
+    entity_category=EntityCategory.DIAGNOSTIC,
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -55,20 +71,38 @@ async def async_setup_entry(
 ) -> None:
     """Set up Landroid Cloud binary sensor entities."""
     coordinator = entry.runtime_data.coordinator
-    entities: list[LandroidBinarySensor] = []
-
-    for serial_number in coordinator.data:
-        for description in BINARY_SENSORS:
-            entities.append(
-                LandroidBinarySensor(
-                    coordinator=coordinator,
-                    config_entry=entry,
-                    serial_number=serial_number,
-                    description=description,
-                )
-            )
 
-    async_add_entities(entities)
+    def _entities_for_device(
+        serial_number: str, device: DeviceHandler
+    ) -> list[LandroidBinarySensor]:
+        del device
+        return [
+            LandroidBinarySensor(
+                coordinator=coordinator,
+                config_entry=entry,
+                serial_number=serial_number,
+                description=description,
+            )
+            for description in BINARY_SENSORS
+        ]
+
+    # Earlier versions created the cloud health sensor once per mower.
+    entity_registry = er.async_get(hass)
+    account_sensor = LandroidCloudDegradedSensor(coordinator, entry)
+    for registry_entry in er.async_entries_for_config_entry(
+        entity_registry, entry.entry_id
+    ):
+        if (
+            registry_entry.domain == BINARY_SENSOR_DOMAIN
+            and registry_entry.unique_id.endswith(f"_{CLOUD_DEGRADED_SENSOR.key}")
+            and registry_entry.unique_id != account_sensor.unique_id
+        ):
+            entity_registry.async_remove(registry_entry.entity_id)
+
+    async_add_entities([account_sensor])
+    async_add_device_entities(
+        coordinator, entry, async_add_entities, _entities_for_device
+    )
 
 
 class LandroidBinarySensor(LandroidBaseEntity, BinarySensorEntity):
@@ -110,3 +144,39 @@ class LandroidBinarySensor(LandroidBaseEntity, BinarySensorEntity):
             return None
 
         return None
+
+
+class LandroidCloudDegradedSensor(
+    CoordinatorEntity[LandroidCloudCoordinator], BinarySensorEntity
+):
+    """Cloud health of a Landroid Cloud account, from its circuit breaker."""
+
+    _attr_has_entity_name = True
+    entity_description = CLOUD_DEGRADED_SENSOR
+
+    def __init__(
+        self, coordinator: LandroidCloudCoordinator, config_entry: ConfigEntry
+    ) -> None:
+        """Initialize the account's cloud health sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{config_entry.entry_id}_{CLOUD_DEGRADED_SENSOR.key}"
+        self._attr_device_info = coordinator.account_device_info()
+
+    @property
+    def available(self) -> bool:
+        """Return True; the breaker state is known even when the cloud is down."""
+        return True
+
+    @property
+    def is_on(self) -> bool:
+        """Return true while the circuit breaker is not closed."""
+        return self.coordinator.circuit_breaker.state is not CircuitState.CLOSED
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return circuit breaker details."""
+        diagnostics = self.coordinator.circuit_breaker.diagnostics()
+        return {
+            "circuit_state": diagnostics["state"],
+            "consecutive_failures": diagnostics["consecutive_failures"],
+        }
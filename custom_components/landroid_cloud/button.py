@@ -9,10 +9,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from pyworxcloud import DeviceCapability
+from pyworxcloud import DeviceCapability, DeviceHandler
 
-from .commands import async_run_cloud_command
-from .entity import LandroidBaseEntity
+from .entity import LandroidBaseEntity, async_add_device_entities
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -54,25 +53,25 @@ async def async_setup_entry(
 ) -> None:
     """Set up Landroid Cloud button entities."""
     coordinator = entry.runtime_data.coordinator
-    entities: list[LandroidButton] = []
-
-    for serial_number, device in coordinator.data.items():
-        for description in BUTTONS:
-            if description.capability and not device.capabilities.check(
-                description.capability
-            ):
-                continue
-
-            entities.append(
-                LandroidButton(
-                    coordinator=coordinator,
-                    config_entry=entry,
-                    serial_number=serial_number,
-                    description=description,
-                )
+
+    def _entities_for_device(
+        serial_number: str, device: DeviceHandler
+    ) -> list[LandroidButton]:
+        return [
+            LandroidButton(
+                coordinator=coordinator,
+                config_entry=entry,
+                serial_number=serial_number,
+                description=description,
             )
+            for description in BUTTONS
+            if not description.capability
+            or device.capabilities.check(description.capability)
+        ]
 
-    async_add_entities(entities)
+    async_add_device_entities(
+        coordinator, entry, async_add_entities, _entities_for_device
+    )
 
 
 class LandroidButton(LandroidBaseEntity, ButtonEntity):
@@ -99,14 +98,14 @@ class LandroidButton(LandroidBaseEntity, ButtonEntity):
         serial_number = str(self.device.serial_number)
 
         if self.entity_description.key == "edge_cut":
-            await async_run_cloud_command(
+            await self.async_run_command(
                 lambda: self.coordinator.cloud.edgecut(serial_number)
             )
         elif self.entity_description.key == "reset_blade_time":
-            await async_run_cloud_command(
+            await self.async_run_command(
                 lambda: self.coordinator.cloud.reset_blade_counter(serial_number)
             )
         elif self.entity_description.key == "reset_battery_cycles":
-            await async_run_cloud_command(
+            await self.async_run_command(
                 lambda: self.coordinator.cloud.reset_charge_cycle_counter(serial_number)
             )
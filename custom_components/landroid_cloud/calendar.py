@@ -0,0 +1,238 @@
+"""Calendar platform for Landroid Cloud."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta, tzinfo
+from typing import Final
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from pyworxcloud import DeviceHandler, ScheduleModel
+
+from .const import DAY_MAP
+from .entity import (
+    LandroidBaseEntity,
+    async_add_device_entities,
+    auto_schedule_exclusion_days,
+    device_timezone,
+)
+from .schedule_analysis import (
+    DAY_INDEX,
+    MINUTES_PER_DAY,
+    extended_duration,
+    week_minute,
+)
+
+SUMMARY_MOWING: Final = "Mowing"
+SUMMARY_EXCLUDED: Final = "Mowing excluded"
+SUMMARY_EXCLUDED_DAY: Final = "Mowing excluded all day"
+SUMMARY_ONE_TIME: Final = "One-time mowing"
+DESCRIPTION_EDGE_CUT: Final = "Includes edge cut"
+
+# Enough expanded ranges for a calendar card and a few automations.
+_EXPANSION_CACHE_SIZE: Final = 8
+_NEXT_EVENT_WINDOW: Final = timedelta(days=8)
+
+
+@dataclass(frozen=True, slots=True)
+class WeeklyEvent:
+    """One recurring event, placed at a minute of the week from Sunday 00:00."""
+
+    offset: int
+    duration: int
+    summary: str
+    description: str | None = None
+    all_day: bool = False
+
+
+def weekly_pattern(
+    schedule: ScheduleModel | None, exclusion_days: Sequence[dict] = ()
+) -> tuple[WeeklyEvent, ...]:
+    """Return the mowing entries and exclusions of one week as recurring events.
+
+    Mowing entries carry the schedule time extension. Nothing is mowed while
+    the schedule is disabled, so its entries are left out.
+    """
+    events: list[WeeklyEvent] = []
+    if schedule is not None and schedule.enabled:
+        time_extension = int(schedule.time_extension or 0)
+        for entry in schedule.entries:
+            duration = extended_duration(entry, time_extension)
+            if duration <= 0:
+                continue
+            events.append(
+                WeeklyEvent(
+                    offset=week_minute(DAY_INDEX[entry.day], entry.start),
+                    duration=duration,
+                    summary=SUMMARY_MOWING,
+                    description=DESCRIPTION_EDGE_CUT if entry.boundary else None,
+                )
+            )
+
+    for index, day in enumerate(exclusion_days[: len(DAY_MAP)]):
+        if day.get("exclude_day"):
+            events.append(
+                WeeklyEvent(
+                    offset=index * MINUTES_PER_DAY,
+                    duration=MINUTES_PER_DAY,
+                    summary=SUMMARY_EXCLUDED_DAY,
+                    all_day=True,
+                )
+            )
+        for slot in day.get("slots", []):
+            duration = int(slot.get("duration", 0))
+            if duration <= 0:
+                continue
+            events.append(
+                WeeklyEvent(
+                    offset=index * MINUTES_PER_DAY + int(slot.get("start_time", 0)),
+                    duration=duration,
+                    summary=SUMMARY_EXCLUDED,
+                    description=str(slot.get("reason", "generic")),
+                )
+            )
+
+    events.sort(key=lambda event: (event.offset, event.summary))
+    return tuple(events)
+
+
+def expand_pattern(
+    pattern: Sequence[WeeklyEvent],
+    tz: tzinfo,
+    start_date: datetime,
+    end_date: datetime,
+) -> list[CalendarEvent]:
+    """Return the occurrences of a weekly pattern overlapping a time range.
+
+    Each weekly event is stepped a week at a time from its first occurrence,
+    so a range of months costs one step per returned event rather than one
+    pass over the pattern per day. Occurrences are placed on local dates in
+    `tz`, keeping start times on the wall clock across DST changes.
+    """
+    if not pattern:
+        return []
+
+    # Start early enough to catch an occurrence still running at `start_date`.
+    longest = max(event.duration for event in pattern)
+    first_day = (start_date.astimezone(tz) - timedelta(minutes=longest)).date()
+    week_start = first_day - timedelta(days=(first_day.weekday() + 1) % 7)
+    last_day = end_date.astimezone(tz).date()
+
+    occurrences: list[tuple[datetime, CalendarEvent]] = []
+    for event in pattern:
+        day, minute = divmod(event.offset, MINUTES_PER_DAY)
+        starts_at = time(*divmod(minute, 60))
+        date = week_start + timedelta(days=day)
+        while date <= last_day:
+            start = datetime.combine(date, starts_at, tz)
+            if event.all_day:
+                end = datetime.combine(date + timedelta(days=1), starts_at, tz)
+            else:
+                end = start + timedelta(minutes=event.duration)
+            if end > start_date and start < end_date:
+                occurrences.append(
+                    (
+                        start,
+                        CalendarEvent(
+                            start=date if event.all_day else start,
+                            end=date + timedelta(days=1) if event.all_day else end,
+                            summary=event.summary,
+                            description=event.description,
+                        ),
+                    )
+                )
+            date += timedelta(weeks=1)
+
+    occurrences.sort(key=lambda occurrence: occurrence[0])
+    return [calendar_event for _, calendar_event in occurrences]
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+) -> None:
+    """Set up Landroid Cloud calendar entities."""
+    coordinator = entry.runtime_data.coordinator
+
+    def _entities_for_device(
+        serial_number: str, device: DeviceHandler
+    ) -> list[LandroidScheduleCalendar]:
+        del device
+        return [LandroidScheduleCalendar(coordinator, entry, serial_number)]
+
+    async_add_device_entities(
+        coordinator, entry, async_add_entities, _entities_for_device
+    )
+
+
+class LandroidScheduleCalendar(LandroidBaseEntity, CalendarEntity):
+    """Calendar of a mower's mowing schedule and exclusions."""
+
+    _attr_translation_key = "schedule"
+
+    def __init__(self, coordinator, config_entry, serial_number: str) -> None:
+        """Initialize schedule calendar entity."""
+        super().__init__(coordinator, config_entry, serial_number, "schedule")
+        self._pattern: tuple[WeeklyEvent, ...] | None = None
+        self._expansions: dict[tuple[datetime, datetime], list[CalendarEvent]] = {}
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the current or next upcoming event."""
+        now = datetime.now(device_timezone(self.device))
+        events = expand_pattern(
+            self._weekly_pattern(),
+            device_timezone(self.device),
+            now,
+            now + _NEXT_EVENT_WINDOW,
+        )
+        events.extend(self._one_time_events(now, now + _NEXT_EVENT_WINDOW))
+        return min(events, key=lambda event: event.start_datetime_local, default=None)
+
+    async def async_get_events(
+        self,
+        hass: HomeAssistant,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        """Return calendar events within a datetime range."""
+        pattern = self._weekly_pattern()
+        key = (start_date, end_date)
+        if (events := self._expansions.get(key)) is None:
+            events = expand_pattern(
+                pattern, device_timezone(self.device), start_date, end_date
+            )
+            if len(self._expansions) >= _EXPANSION_CACHE_SIZE:
+                del self._expansions[next(iter(self._expansions))]
+            self._expansions[key] = events
+        return [*events, *self._one_time_events(start_date, end_date)]
+
+    def _weekly_pattern(self) -> tuple[WeeklyEvent, ...]:
+        """Return the weekly pattern, dropping cached ranges when it changed."""
+        pattern = weekly_pattern(
+            self.coordinator.cloud.get_schedule(str(self.device.serial_number)),
+            auto_schedule_exclusion_days(self.device),
+        )
+        if pattern != self._pattern:
+            self._pattern = pattern
+            self._expansions.clear()
+        return pattern
+
+    def _one_time_events(
+        self, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the last one-time schedule sent when it overlaps the range."""
+        run = self.coordinator.one_time_run(self._serial_number)
+        if run is None:
+            return []
+        started, runtime = run
+        start = started.astimezone(device_timezone(self.device))
+        end = start + timedelta(minutes=runtime)
+        if end <= start_date or start >= end_date:
+            return []
+        return [CalendarEvent(start=start, end=end, summary=SUMMARY_ONE_TIME)]
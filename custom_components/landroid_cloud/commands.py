@@ -2,15 +2,72 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import math
+import random
+import time
+from collections import Counter, deque
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
 
 from homeassistant.exceptions import HomeAssistantError
-from pyworxcloud.exceptions import APIException, NoConnectionError, OfflineError
+from pyworxcloud.exceptions import (
+    APIException,
+    InternalServerError,
+    NoConnectionError,
+    OfflineError,
+    ServiceUnavailableError,
+    TimeoutException,
+    TooManyRequestsError,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Failures that usually clear up on their own within seconds.
+TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (
+    InternalServerError,
+    NoConnectionError,
+    ServiceUnavailableError,
+    TimeoutError,
+    TimeoutException,
+    TooManyRequestsError,
+)
+
+# Failures that suggest the cloud itself is degraded.
+DEGRADED_ERRORS: tuple[type[BaseException], ...] = (
+    InternalServerError,
+    ServiceUnavailableError,
+    TimeoutError,
+    TimeoutException,
+)
 
 MQTT_NOT_READY_ERROR = "MQTT connection is not ready"
 MQTT_NOT_READY_MESSAGE = (
     "MQTT is not connected. Wait for Landroid Cloud to reconnect, then try again."
 )
+OFFLINE_EXPIRED_MESSAGE = (
+    "MQTT did not reconnect in time. The command was not sent to the mower."
+)
+ACK_TIMEOUT_MESSAGE = "The mower did not acknowledge the command in time."
+MOWER_REMOVED_MESSAGE = (
+    "The mower was removed from the account before the command was sent."
+)
+MAX_OFFLINE_COMMANDS = 20
+
+# Adaptive command timeouts: a margin over the 95th percentile of the last
+# 50 acknowledgement latencies, once at least 5 have been observed.
+ACK_LATENCY_PERCENTILE = 95
+ACK_LATENCY_WINDOW = 50
+ACK_LATENCY_MIN_SAMPLES = 5
+ACK_TIMEOUT_MARGIN = 1.5
+
+# How long a command may take to show up in the mower's pushed state, and the
+# upper bounds in seconds of the end-to-end latency histogram buckets.
+ACK_CONFIRM_TIMEOUT = 60
+ACK_LATENCY_BUCKETS: tuple[float, ...] = (1, 2, 5, 10, 20, 30, 60)
 
 
 def is_mqtt_connection_not_ready(err: BaseException) -> bool:
@@ -34,5 +91,852 @@ async def async_run_cloud_command(command: Callable[[], Awaitable[object]]) -> N
         raise HomeAssistantError(message) from err
     except (NoConnectionError, OfflineError) as err:
         raise HomeAssistantError(cloud_connection_error_message(err)) from err
+    except (TimeoutError, TimeoutException) as err:
+        raise HomeAssistantError(ACK_TIMEOUT_MESSAGE) from err
     except APIException as err:
         raise HomeAssistantError("Cloud command failed") from err
+
+
+class CircuitOpenError(HomeAssistantError):
+    """Raised when the circuit breaker rejects a cloud call."""
+
+
+class CommandSkippedError(HomeAssistantError):
+    """Raised by a queued command that found nothing left to send."""
+
+
+class CircuitState(StrEnum):
+    """States of the cloud circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CloudCircuitBreaker:
+    """Fail fast while the Landroid cloud keeps timing out or returning 5xx.
+
+    After `failure_threshold` consecutive degraded responses the breaker opens
+    and rejects calls for `cooldown` seconds. It then lets a single probe call
+    through; a healthy response closes it again, another failure reopens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        cooldown: float,
+        state_changed: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize a closed breaker."""
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._state_changed = state_changed
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self._trips = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current breaker state."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() < self._opened_at + self._cooldown:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    async def async_call[T](self, command: Callable[[], Awaitable[T]]) -> T:
+        """Run a cloud call unless the breaker is open."""
+        state = self.state
+        if state is CircuitState.OPEN or (
+            state is CircuitState.HALF_OPEN and self._probing
+        ):
+            self._rejected += 1
+            remaining = self._opened_at + self._cooldown - time.monotonic()
+            raise CircuitOpenError(
+                "Landroid Cloud is not responding. Commands are paused for "
+                f"{max(1, round(remaining))} seconds."
+            )
+
+        self._probing = state is CircuitState.HALF_OPEN
+        try:
+            result = await command()
+        except _AdaptiveTimeoutError:
+            # One mower missing its own, shorter timeout says nothing about
+            # the cloud's health.
+            self._probing = False
+            raise
+        except DEGRADED_ERRORS:
+            self._record_failure()
+            raise
+        except NoConnectionError, HomeAssistantError:
+            # A local MQTT problem, or a check that failed before anything was
+            # sent, says nothing about the cloud's health.
+            self._probing = False
+            raise
+        except BaseException as err:
+            self._probing = False
+            if isinstance(err, Exception):
+                # The cloud answered, even if it rejected the command.
+                self._record_success()
+            raise
+        self._record_success()
+        return result
+
+    def _record_failure(self) -> None:
+        """Count a degraded response and open the breaker when needed."""
+        was_probing = self._probing
+        self._probing = False
+        self._failures += 1
+        if was_probing or self._failures >= self._failure_threshold:
+            if self._opened_at is None:
+                self._trips += 1
+                _LOGGER.warning(
+                    "Landroid Cloud failed %s times in a row; pausing calls for %s seconds",
+                    self._failures,
+                    self._cooldown,
+                )
+            self._opened_at = time.monotonic()
+            self._notify()
+
+    def _record_success(self) -> None:
+        """Close the breaker after a healthy response."""
+        self._failures = 0
+        if self._opened_at is not None:
+            _LOGGER.info("Landroid Cloud is responding again")
+            self._opened_at = None
+            self._notify()
+
+    def _notify(self) -> None:
+        """Tell listeners that the breaker state changed."""
+        if self._state_changed is not None:
+            self._state_changed()
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return breaker state and counters."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "trips": self._trips,
+            "rejected": self._rejected,
+        }
+
+
+class CloudRateLimiter:
+    """Account-wide token bucket for calls to the Landroid cloud.
+
+    Callers wait for a token instead of failing, in arrival order, so bursts of
+    automations are spread out rather than tripping the cloud's rate limit.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int) -> None:
+        """Initialize a full bucket."""
+        self._rate = rate_per_minute / 60
+        self._rate_per_minute = rate_per_minute
+        self._capacity = max(1, burst)
+        self._tokens = float(self._capacity)
+        self._updated: float | None = None
+        self._lock = asyncio.Lock()
+        self._acquired = 0
+        self._throttled = 0
+        self._throttled_seconds = 0.0
+
+    def _refill(self, now: float) -> None:
+        """Add tokens earned since the last refill."""
+        if self._updated is not None:
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+        self._updated = now
+
+    async def async_acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            self._refill(loop.time())
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self._rate
+                self._throttled += 1
+                self._throttled_seconds += wait
+                _LOGGER.debug("Throttling cloud call for %.2f seconds", wait)
+                await asyncio.sleep(wait)
+                self._refill(loop.time())
+            self._tokens -= 1
+            self._acquired += 1
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return limiter settings and throttling statistics."""
+        return {
+            "rate_per_minute": self._rate_per_minute,
+            "burst": self._capacity,
+            "acquired": self._acquired,
+            "throttled": self._throttled,
+            "throttled_seconds": round(self._throttled_seconds, 3),
+        }
+
+
+def _percentile(samples: list[float], percentile: float) -> float:
+    """Return the nearest-rank percentile of a non-empty list of samples."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(len(ordered) * percentile / 100))
+    return ordered[rank - 1]
+
+
+class AdaptiveTimeout:
+    """Per-mower command timeout derived from acknowledgement latency.
+
+    Samples are the latency from publishing a command to the push confirming
+    it. Mowers with a good connection get a timeout just above their usual
+    latency and fail fast; mowers on weak Wi-Fi keep a longer one. The
+    timeout is always clamped to `minimum`..`maximum`, and `maximum` applies
+    until enough samples have been observed.
+    """
+
+    def __init__(self, minimum: float, maximum: float) -> None:
+        """Initialize without any latency samples."""
+        self._minimum = min(minimum, maximum)
+        self._maximum = maximum
+        self._samples: dict[str, deque[float]] = {}
+        self._timeouts: dict[str, int] = {}
+
+    @property
+    def maximum(self) -> float:
+        """Return the configured command timeout."""
+        return self._maximum
+
+    def timeout(self, serial_number: str) -> float:
+        """Return the timeout to use for the next command to a mower."""
+        samples = self._samples.get(serial_number)
+        if samples is None or len(samples) < ACK_LATENCY_MIN_SAMPLES:
+            return self._maximum
+
+        latency = _percentile(list(samples), ACK_LATENCY_PERCENTILE)
+        return min(self._maximum, max(self._minimum, latency * ACK_TIMEOUT_MARGIN))
+
+    def record(self, serial_number: str, latency: float) -> None:
+        """Record the acknowledgement latency of a successful command."""
+        self._samples.setdefault(
+            serial_number, deque(maxlen=ACK_LATENCY_WINDOW)
+        ).append(latency)
+
+    def record_timeout(self, serial_number: str) -> None:
+        """Record a command that was not acknowledged in time."""
+        self._timeouts[serial_number] = self._timeouts.get(serial_number, 0) + 1
+        # Count the miss as a worst-case sample so a mower whose connection
+        # got worse earns its longer timeout back instead of timing out again.
+        self.record(serial_number, self._maximum)
+
+    def forget(self, serial_number: str) -> None:
+        """Drop the latency samples of a mower removed from the account."""
+        self._samples.pop(serial_number, None)
+        self._timeouts.pop(serial_number, None)
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return per-mower latency statistics and current timeouts."""
+        return {
+            serial_number: {
+                "samples": len(samples),
+                "p95_ms": round(
+                    _percentile(list(samples), ACK_LATENCY_PERCENTILE) * 1000, 1
+                ),
+                "timeouts": self._timeouts.get(serial_number, 0),
+                "timeout": round(self.timeout(serial_number), 2),
+            }
+            for serial_number, samples in sorted(self._samples.items())
+        }
+
+
+type AckCheck = Callable[[], bool]
+
+
+@dataclass(frozen=True, slots=True)
+class CommandAck:
+    """How to recognize the push that confirms a command.
+
+    `check` is evaluated after each push for the mower has been applied to
+    the coordinator data. Without a check, the next push after the command
+    started running confirms it.
+    """
+
+    command: str
+    check: AckCheck | None = None
+
+
+@dataclass(slots=True)
+class PendingAck:
+    """A command waiting for its confirming push.
+
+    `published` is the loop time the queue started sending the command. Once
+    the command has been sent, a push where the check still fails marks
+    it as contradicted; it stays pending in case a later push confirms it.
+    """
+
+    command: str
+    check: AckCheck | None
+    started: float
+    future: asyncio.Future[float] = field(repr=False)
+    expiry: asyncio.TimerHandle | None = field(default=None, repr=False)
+    published: float | None = None
+    sent: bool = False
+    contradicted: bool = False
+
+
+class AckTracker:
+    """Correlate commands with the push showing the mower applied them.
+
+    The time from issuing a command until its confirming push is recorded as
+    the end-to-end latency, in a histogram per command type. Commands that
+    are not confirmed within `timeout` seconds count as unacknowledged. With
+    `timeouts`, the time from publish to confirming push feeds the mower's
+    adaptive command timeout.
+    """
+
+    def __init__(
+        self,
+        timeout: float = ACK_CONFIRM_TIMEOUT,
+        timeouts: AdaptiveTimeout | None = None,
+    ) -> None:
+        """Initialize without pending commands."""
+        self._timeout = timeout
+        self._timeouts = timeouts
+        self._pending: dict[str, list[PendingAck]] = {}
+        self._latest: dict[tuple[str, str], PendingAck] = {}
+        self._buckets: dict[str, list[int]] = {}
+        self._latency_total: Counter[str] = Counter()
+        self._unacknowledged: Counter[str] = Counter()
+
+    def expect(self, serial_number: str, ack: CommandAck) -> PendingAck:
+        """Start waiting for the push that confirms a command."""
+        loop = asyncio.get_running_loop()
+        pending = PendingAck(
+            command=ack.command,
+            check=ack.check,
+            started=loop.time(),
+            future=loop.create_future(),
+        )
+        pending.expiry = loop.call_later(
+            self._timeout, self._expire, serial_number, pending
+        )
+        self._pending.setdefault(serial_number, []).append(pending)
+        self._latest[(serial_number, ack.command)] = pending
+        return pending
+
+    def discard(self, serial_number: str, pending: PendingAck) -> None:
+        """Stop waiting for a command that was never sent."""
+        waiting = self._pending.get(serial_number, [])
+        if pending in waiting:
+            waiting.remove(pending)
+        if self._latest.get((serial_number, pending.command)) is pending:
+            del self._latest[(serial_number, pending.command)]
+        if pending.expiry is not None:
+            pending.expiry.cancel()
+        pending.future.cancel()
+
+    def supersede(
+        self, serial_number: str, pending: PendingAck, by: PendingAck
+    ) -> None:
+        """Stop waiting for a command replaced by a newer one before it was sent.
+
+        The replaced command completes with the outcome of the newer one.
+        """
+        waiting = self._pending.get(serial_number, [])
+        if pending in waiting:
+            waiting.remove(pending)
+        if self._latest.get((serial_number, pending.command)) is pending:
+            del self._latest[(serial_number, pending.command)]
+        if pending.expiry is not None:
+            pending.expiry.cancel()
+        _chain_future(by.future, pending.future)
+
+    def latest(self, serial_number: str, command: str) -> PendingAck | None:
+        """Return the most recent command of a type sent to a mower."""
+        return self._latest.get((serial_number, command))
+
+    async def async_wait(self, pending: PendingAck) -> float:
+        """Wait for a command to be confirmed and return its latency."""
+        try:
+            return await asyncio.shield(pending.future)
+        except TimeoutError as err:
+            raise HomeAssistantError(
+                f"The mower did not confirm {pending.command} within "
+                f"{self._timeout:g} seconds"
+            ) from err
+
+    def process(self, serial_number: str) -> None:
+        """Confirm commands whose expected change shows in the latest push."""
+        waiting = self._pending.get(serial_number)
+        if not waiting:
+            return
+
+        now = asyncio.get_running_loop().time()
+        for pending in list(waiting):
+            if pending.check is None:
+                if pending.published is None and not pending.sent:
+                    # A push from before the command ran says nothing about it.
+                    continue
+            elif not pending.check():
+                pending.contradicted = pending.sent
+                continue
+            waiting.remove(pending)
+            if pending.expiry is not None:
+                pending.expiry.cancel()
+            latency = now - pending.started
+            self._record(pending.command, latency)
+            if self._timeouts is not None and pending.published is not None:
+                self._timeouts.record(serial_number, now - pending.published)
+            if not pending.future.done():
+                pending.future.set_result(latency)
+
+    def _record(self, command: str, latency: float) -> None:
+        """Add a confirmed command to its latency histogram."""
+        buckets = self._buckets.setdefault(
+            command, [0] * (len(ACK_LATENCY_BUCKETS) + 1)
+        )
+        index = next(
+            (
+                index
+                for index, bound in enumerate(ACK_LATENCY_BUCKETS)
+                if latency <= bound
+            ),
+            len(ACK_LATENCY_BUCKETS),
+        )
+        buckets[index] += 1
+        self._latency_total[command] += latency
+
+    def _expire(self, serial_number: str, pending: PendingAck) -> None:
+        """Give up on a command that was never confirmed."""
+        waiting = self._pending.get(serial_number, [])
+        if pending not in waiting:
+            return
+
+        waiting.remove(pending)
+        self._unacknowledged[pending.command] += 1
+        _LOGGER.debug(
+            "No push confirmed %s for %s within %s seconds",
+            pending.command,
+            serial_number,
+            self._timeout,
+        )
+        if not pending.future.done():
+            pending.future.set_exception(TimeoutError())
+            pending.future.exception()
+
+    def forget(self, serial_number: str) -> None:
+        """Stop waiting for commands to a mower removed from the account."""
+        for pending in list(self._pending.pop(serial_number, ())):
+            self.discard(serial_number, pending)
+        for key in [key for key in self._latest if key[0] == serial_number]:
+            del self._latest[key]
+
+    def shutdown(self) -> None:
+        """Stop waiting for all pending commands."""
+        for serial_number, waiting in self._pending.items():
+            for pending in list(waiting):
+                self.discard(serial_number, pending)
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return latency histograms and unconfirmed counts per command type."""
+        labels = [f"<={bound:g}s" for bound in ACK_LATENCY_BUCKETS]
+        labels.append(f">{ACK_LATENCY_BUCKETS[-1]:g}s")
+        diagnostics: dict[str, Any] = {}
+        for command in sorted(self._buckets.keys() | self._unacknowledged.keys()):
+            buckets = self._buckets.get(command, [0] * len(labels))
+            confirmed = sum(buckets)
+            diagnostics[command] = {
+                "acknowledged": confirmed,
+                "unacknowledged": self._unacknowledged[command],
+                "average_ms": (
+                    round(self._latency_total[command] / confirmed * 1000, 1)
+                    if confirmed
+                    else 0.0
+                ),
+                "histogram": dict(zip(labels, buckets, strict=True)),
+            }
+        return diagnostics
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Exponential backoff with jitter for transient command failures."""
+
+    max_attempts: int
+    base_delay: float
+    jitter: float
+    deadline: float
+
+    def delay(self, attempt: int) -> float:
+        """Return the wait before the attempt following `attempt`."""
+        backoff = self.base_delay * 2 ** (attempt - 1)
+        return backoff * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+class _AdaptiveTimeoutError(TimeoutException):
+    """A mower did not respond within its adaptive timeout."""
+
+
+class _MqttNotReadyError(Exception):
+    """Raised internally when a command should wait for MQTT to reconnect."""
+
+
+@dataclass(slots=True)
+class _QueuedCommand:
+    """One pending cloud command for a mower."""
+
+    command: Callable[[], Awaitable[object]]
+    key: str | None
+    priority: bool
+    idempotent: bool
+    enqueued_at: float
+    future: asyncio.Future[None] = field(repr=False)
+    expires_at: float | None = None
+    expiry: asyncio.TimerHandle | None = field(default=None, repr=False)
+
+
+def _chain_future[T](source: asyncio.Future[T], target: asyncio.Future[T]) -> None:
+    """Resolve `target` with the outcome of `source`."""
+
+    def _copy(future: asyncio.Future[T]) -> None:
+        if target.done():
+            return
+        if future.cancelled():
+            target.cancel()
+        elif (err := future.exception()) is not None:
+            target.set_exception(err)
+            target.exception()
+        else:
+            target.set_result(future.result())
+
+    source.add_done_callback(_copy)
+
+
+class LandroidCommandQueue:
+    """Serialize cloud commands per mower and coalesce repeated setpoints.
+
+    Commands for one mower run one at a time in arrival order. A queued command
+    with the same key as a newer one is replaced by the newer one, so only the
+    last setpoint is sent and every caller waits for that send. Priority
+    commands (pause, home) skip ahead of queued setpoints. Commands whose
+    payload depends on the mower's current state are built when they run and
+    queued without a key, so they never replace one another.
+
+    Keyed commands set absolute values and are safe to repeat, so they are
+    retried on transient failures when a retry policy is configured. Unkeyed
+    commands that write a whole desired state are queued as `idempotent` to
+    be retried the same way without being coalesced.
+
+    With adaptive timeouts, each send is bounded by the mower's current
+    timeout. A miss within a timeout shorter than the configured one is the
+    mower's problem and does not count against the circuit breaker.
+
+    With an offline TTL, commands rejected because MQTT is disconnected are
+    held per mower until MQTT reconnects or the TTL runs out, keeping only the
+    latest command per key. Callers keep waiting until the held command is
+    sent or expires.
+    """
+
+    def __init__(
+        self,
+        limiter: CloudRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        offline_ttl: float = 0,
+        breaker: CloudCircuitBreaker | None = None,
+        timeouts: AdaptiveTimeout | None = None,
+    ) -> None:
+        """Initialize an empty queue."""
+        self._limiter = limiter
+        self._breaker = breaker
+        self._timeouts = timeouts
+        self._retry_policy = retry_policy
+        self._offline_ttl = offline_ttl
+        self._offline: dict[str, list[_QueuedCommand]] = {}
+        self._retries = 0
+        self._offline_flushed = 0
+        self._offline_expired = 0
+        self._pending: dict[str, deque[_QueuedCommand]] = {}
+        self._workers: dict[str, asyncio.Task[None]] = {}
+        self._executed = 0
+        self._coalesced = 0
+        self._max_depth = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def async_run(
+        self,
+        serial_number: str,
+        command: Callable[[], Awaitable[object]],
+        *,
+        key: str | None = None,
+        priority: bool = False,
+        idempotent: bool = False,
+    ) -> None:
+        """Queue a command for a mower and wait until it has been sent."""
+        loop = asyncio.get_running_loop()
+        pending = self._pending.setdefault(serial_number, deque())
+
+        if key is not None:
+            for queued in pending:
+                if queued.key == key:
+                    queued.command = command
+                    if priority and not queued.priority:
+                        # The newer command asked to skip ahead; move it there.
+                        pending.remove(queued)
+                        queued.priority = True
+                        self._enqueue(pending, queued)
+                    self._coalesced += 1
+                    await asyncio.shield(queued.future)
+                    return
+
+        queued = _QueuedCommand(
+            command=command,
+            key=key,
+            priority=priority,
+            idempotent=idempotent or key is not None,
+            enqueued_at=loop.time(),
+            future=loop.create_future(),
+        )
+        self._enqueue(pending, queued)
+        self._max_depth = max(self._max_depth, len(pending))
+
+        if serial_number not in self._workers:
+            self._workers[serial_number] = loop.create_task(
+                self._async_drain(serial_number)
+            )
+
+        await asyncio.shield(queued.future)
+
+    @staticmethod
+    def _enqueue(pending: deque[_QueuedCommand], queued: _QueuedCommand) -> None:
+        """Add a command behind queued priority commands, or at the end."""
+        if queued.priority:
+            position = next(
+                (index for index, item in enumerate(pending) if not item.priority),
+                len(pending),
+            )
+            pending.insert(position, queued)
+        else:
+            pending.append(queued)
+
+    async def _async_drain(self, serial_number: str) -> None:
+        """Run queued commands for one mower until its queue is empty."""
+        loop = asyncio.get_running_loop()
+        pending = self._pending[serial_number]
+        try:
+            while pending:
+                queued = pending.popleft()
+                wait = loop.time() - queued.enqueued_at
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+                self._executed += 1
+                try:
+                    await async_run_cloud_command(
+                        lambda: self._async_send(serial_number, queued)
+                    )
+                except asyncio.CancelledError:
+                    queued.future.cancel()
+                    raise
+                except _MqttNotReadyError as err:
+                    if not self._hold_offline(serial_number, queued):
+                        queued.future.set_exception(
+                            HomeAssistantError(MQTT_NOT_READY_MESSAGE)
+                        )
+                        queued.future.exception()
+                    _LOGGER.debug("Holding command for %s: %s", serial_number, err)
+                except Exception as err:
+                    # Hand any failure to the callers; later commands still run.
+                    queued.future.set_exception(err)
+                    # Callers may have given up waiting; avoid unretrieved warnings.
+                    queued.future.exception()
+                else:
+                    queued.future.set_result(None)
+        finally:
+            del self._workers[serial_number]
+
+    async def _async_send(self, serial_number: str, queued: _QueuedCommand) -> None:
+        """Send one command, retrying idempotent commands on transient errors."""
+        policy = self._retry_policy if queued.idempotent else None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + policy.deadline if policy is not None else 0.0
+        attempt = 1
+        while True:
+            if self._limiter is not None:
+                await self._limiter.async_acquire()
+            try:
+                if self._breaker is not None:
+                    await self._breaker.async_call(
+                        lambda: self._async_timed(serial_number, queued.command)
+                    )
+                else:
+                    await self._async_timed(serial_number, queued.command)
+            except TRANSIENT_ERRORS as err:
+                if self._offline_ttl and is_mqtt_connection_not_ready(err):
+                    raise _MqttNotReadyError(str(err)) from err
+                if policy is None or attempt >= policy.max_attempts:
+                    raise
+                delay = policy.delay(attempt)
+                if loop.time() + delay > deadline:
+                    raise
+                _LOGGER.debug(
+                    "Retrying %s command for %s in %.2f seconds after attempt %s "
+                    "failed: %s",
+                    queued.key or "state",
+                    serial_number,
+                    delay,
+                    attempt,
+                    err,
+                )
+                self._retries += 1
+                attempt += 1
+                await asyncio.sleep(delay)
+            else:
+                return
+
+    async def _async_timed(
+        self, serial_number: str, command: Callable[[], Awaitable[object]]
+    ) -> None:
+        """Run a command within the mower's adaptive timeout."""
+        if self._timeouts is None:
+            await command()
+            return
+
+        timeout = self._timeouts.timeout(serial_number)
+        try:
+            async with asyncio.timeout(timeout):
+                await command()
+        except (TimeoutError, TimeoutException) as err:
+            self._timeouts.record_timeout(serial_number)
+            if timeout < self._timeouts.maximum:
+                raise _AdaptiveTimeoutError(
+                    f"No response within {timeout:.1f} seconds"
+                ) from err
+            raise
+
+    def _hold_offline(self, serial_number: str, queued: _QueuedCommand) -> bool:
+        """Hold a command until MQTT reconnects; return False when the buffer is full."""
+        loop = asyncio.get_running_loop()
+        held = self._offline.setdefault(serial_number, [])
+
+        if queued.key is not None:
+            for index, existing in enumerate(held):
+                if existing.key == queued.key:
+                    # Latest wins: the older caller completes with the newer command.
+                    del held[index]
+                    self._cancel_expiry(existing)
+                    _chain_future(queued.future, existing.future)
+                    self._coalesced += 1
+                    break
+
+        if len(held) >= MAX_OFFLINE_COMMANDS:
+            return False
+
+        if queued.expires_at is None:
+            queued.expires_at = loop.time() + self._offline_ttl
+        queued.expiry = loop.call_at(
+            queued.expires_at, self._expire_offline, serial_number, queued
+        )
+        held.append(queued)
+        return True
+
+    def _expire_offline(self, serial_number: str, queued: _QueuedCommand) -> None:
+        """Fail a held command whose TTL ran out before MQTT reconnected."""
+        held = self._offline.get(serial_number, [])
+        if queued not in held:
+            return
+
+        held.remove(queued)
+        self._offline_expired += 1
+        if not queued.future.done():
+            queued.future.set_exception(HomeAssistantError(OFFLINE_EXPIRED_MESSAGE))
+            queued.future.exception()
+
+    @staticmethod
+    def _cancel_expiry(queued: _QueuedCommand) -> None:
+        """Stop the TTL timer of a held command."""
+        if queued.expiry is not None:
+            queued.expiry.cancel()
+            queued.expiry = None
+
+    def flush_offline(self) -> None:
+        """Send held commands in order now that MQTT has reconnected."""
+        for serial_number, held in self._offline.items():
+            if not held:
+                continue
+
+            for queued in held:
+                self._cancel_expiry(queued)
+            self._offline_flushed += len(held)
+            pending = self._pending.setdefault(serial_number, deque())
+            # Held commands were issued first; priority commands still go first.
+            merged = sorted([*held, *pending], key=lambda item: not item.priority)
+            held.clear()
+            pending.clear()
+            pending.extend(merged)
+            self._max_depth = max(self._max_depth, len(pending))
+
+            if serial_number not in self._workers:
+                self._workers[serial_number] = asyncio.get_running_loop().create_task(
+                    self._async_drain(serial_number)
+                )
+
+    def forget(self, serial_number: str) -> None:
+        """Fail queued and held commands for a mower removed from the account.
+
+        A command that is already being sent is left to finish.
+        """
+        dropped = list(self._pending.get(serial_number, ()))
+        for queued in self._offline.pop(serial_number, ()):
+            self._cancel_expiry(queued)
+            dropped.append(queued)
+        if serial_number in self._workers:
+            # The worker drains this deque and removes itself once it is empty.
+            self._pending[serial_number].clear()
+        else:
+            self._pending.pop(serial_number, None)
+
+        for queued in dropped:
+            if not queued.future.done():
+                queued.future.set_exception(HomeAssistantError(MOWER_REMOVED_MESSAGE))
+                queued.future.exception()
+
+    async def async_shutdown(self) -> None:
+        """Cancel queued commands and stop all workers."""
+        for pending in self._pending.values():
+            while pending:
+                pending.popleft().future.cancel()
+        for held in self._offline.values():
+            for queued in held:
+                self._cancel_expiry(queued)
+                queued.future.cancel()
+            held.clear()
+
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return queue depth and wait-time statistics."""
+        return {
+            "depth": {
+                serial_number: len(pending)
+                for serial_number, pending in sorted(self._pending.items())
+                if pending
+            },
+            "max_depth": self._max_depth,
+            "executed": self._executed,
+            "coalesced": self._coalesced,
+            "retries": self._retries,
+            "offline_held": {
+                serial_number: len(held)
+                for serial_number, held in sorted(self._offline.items())
+                if held
+            },
+            "offline_flushed": self._offline_flushed,
+            "offline_expired": self._offline_expired,
+            "average_wait_ms": (
+                round(self._total_wait / self._executed * 1000, 1)
+                if self._executed
+                else 0.0
+            ),
+            "max_wait_ms": round(self._max_wait * 1000, 1),
+        }
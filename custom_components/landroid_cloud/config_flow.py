@@ -8,7 +8,14 @@ from typing import Any
 import voluptuous as vol
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult, OptionsFlow
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
-from homeassistant.helpers.selector import SelectSelector, SelectSelectorConfig
+from homeassistant.helpers.selector import (
+    BooleanSelector,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    SelectSelector,
+    SelectSelectorConfig,
+)
 from pyworxcloud import WorxCloud
 from pyworxcloud.exceptions import (
     APIException,
@@ -24,8 +31,33 @@ from pyworxcloud.exceptions import (
 
 from .const import (
     CONF_CLOUD,
+    CONF_OFFLINE_TTL,
+    CONF_RATE_LIMIT,
+    CONF_RATE_LIMIT_BURST,
+    CONF_RETRY,
+    CONF_RETRY_BASE_DELAY,
+    CONF_RETRY_JITTER,
+    CONF_RETRY_MAX_ATTEMPTS,
+    CONF_TELEMETRY_AVERAGE_WINDOW,
+    CONF_TELEMETRY_FILTER,
+    CONF_TELEMETRY_MIN_INTERVAL,
     DEFAULT_CLOUD,
+    DEFAULT_OFFLINE_TTL,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RATE_LIMIT_BURST,
+    DEFAULT_RETRY,
+    DEFAULT_RETRY_BASE_DELAY,
+    DEFAULT_RETRY_JITTER,
+    DEFAULT_RETRY_MAX_ATTEMPTS,
+    DEFAULT_TELEMETRY_AVERAGE_WINDOW,
+    DEFAULT_TELEMETRY_FILTER,
+    DEFAULT_TELEMETRY_MIN_INTERVAL,
     DOMAIN,
+    MAX_OFFLINE_TTL,
+    MAX_RATE_LIMIT,
+    MAX_RATE_LIMIT_BURST,
+    MAX_RETRY_ATTEMPTS,
+    MAX_TELEMETRY_INTERVAL,
 )
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
@@ -41,6 +73,16 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+TELEMETRY_INTERVAL_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=0,
+        max=MAX_TELEMETRY_INTERVAL,
+        step=1,
+        unit_of_measurement="s",
+        mode=NumberSelectorMode.BOX,
+    )
+)
+
 
 def _target_unique_id(email: str, cloud: str) -> str:
     """Return the canonical config entry unique id."""
@@ -134,9 +176,17 @@ class LandroidCloudOptionsFlow(OptionsFlow):
         self._config_entry = config_entry
 
     async def async_step_init(
-        self, user_input: dict[str, Any] | None = None
+        self, _user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Manage options."""
+        return self.async_show_menu(
+            step_id="init", menu_options=["account", "telemetry", "commands"]
+        )
+
+    async def async_step_account(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage account credentials."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
@@ -173,12 +223,14 @@ class LandroidCloudOptionsFlow(OptionsFlow):
                         title=info["title"],
                         unique_id=unique_id,
                     )
-                    return self.async_create_entry(title="", data={})
+                    return self.async_create_entry(
+                        title="", data=dict(self._config_entry.options)
+                    )
 
         current_email = self._config_entry.data[CONF_EMAIL]
 
         return self.async_show_form(
-            step_id="init",
+            step_id="account",
             data_schema=vol.Schema(
                 {
                     vol.Required(CONF_EMAIL, default=current_email): str,
@@ -187,3 +239,137 @@ class LandroidCloudOptionsFlow(OptionsFlow):
             ),
             errors=errors,
         )
+
+    async def async_step_telemetry(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage deadband and rate-limit defaults for noisy telemetry sensors."""
+        if user_input is not None:
+            return self.async_create_entry(
+                title="", data={**self._config_entry.options, **user_input}
+            )
+
+        options = self._config_entry.options
+        return self.async_show_form(
+            step_id="telemetry",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_TELEMETRY_FILTER,
+                        default=options.get(
+                            CONF_TELEMETRY_FILTER, DEFAULT_TELEMETRY_FILTER
+                        ),
+                    ): BooleanSelector(),
+                    vol.Required(
+                        CONF_TELEMETRY_MIN_INTERVAL,
+                        default=options.get(
+                            CONF_TELEMETRY_MIN_INTERVAL, DEFAULT_TELEMETRY_MIN_INTERVAL
+                        ),
+                    ): TELEMETRY_INTERVAL_SELECTOR,
+                    vol.Required(
+                        CONF_TELEMETRY_AVERAGE_WINDOW,
+                        default=options.get(
+                            CONF_TELEMETRY_AVERAGE_WINDOW,
+                            DEFAULT_TELEMETRY_AVERAGE_WINDOW,
+                        ),
+                    ): TELEMETRY_INTERVAL_SELECTOR,
+                }
+            ),
+        )
+
+    async def async_step_commands(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage command rate limiting and retries."""
+        if user_input is not None:
+            return self.async_create_entry(
+                title="", data={**self._config_entry.options, **user_input}
+            )
+
+        options = self._config_entry.options
+        return self.async_show_form(
+            step_id="commands",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_RATE_LIMIT,
+                        default=options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=1,
+                            max=MAX_RATE_LIMIT,
+                            step=1,
+                            unit_of_measurement="calls/min",
+                            mode=NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_RATE_LIMIT_BURST,
+                        default=options.get(
+                            CONF_RATE_LIMIT_BURST, DEFAULT_RATE_LIMIT_BURST
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=1,
+                            max=MAX_RATE_LIMIT_BURST,
+                            step=1,
+                            mode=NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_RETRY, default=options.get(CONF_RETRY, DEFAULT_RETRY)
+                    ): BooleanSelector(),
+                    vol.Required(
+                        CONF_RETRY_MAX_ATTEMPTS,
+                        default=options.get(
+                            CONF_RETRY_MAX_ATTEMPTS, DEFAULT_RETRY_MAX_ATTEMPTS
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=2,
+                            max=MAX_RETRY_ATTEMPTS,
+                            step=1,
+                            mode=NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_RETRY_BASE_DELAY,
+                        default=options.get(
+                            CONF_RETRY_BASE_DELAY, DEFAULT_RETRY_BASE_DELAY
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0.1,
+                            max=10,
+                            step=0.1,
+                            unit_of_measurement="s",
+                            mode=NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_RETRY_JITTER,
+                        default=options.get(CONF_RETRY_JITTER, DEFAULT_RETRY_JITTER),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0,
+                            max=100,
+                            step=1,
+                            unit_of_measurement="%",
+                            mode=NumberSelectorMode.SLIDER,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_OFFLINE_TTL,
+                        default=options.get(CONF_OFFLINE_TTL, DEFAULT_OFFLINE_TTL),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0,
+                            max=MAX_OFFLINE_TTL,
+                            step=1,
+                            unit_of_measurement="s",
+                            mode=NumberSelectorMode.BOX,
+                        )
+                    ),
+                }
+            ),
+        )
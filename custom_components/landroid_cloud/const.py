@@ -19,6 +19,7 @@ PLATFORMS: list[Platform] = [
     Platform.SWITCH,
     Platform.BINARY_SENSOR,
     Platform.UPDATE,
+    Platform.CALENDAR,
 ]
 
 STARTUP = """
@@ -34,11 +35,38 @@ https://github.com/mtrab/landroid_cloud/issues
 
 CONF_CLOUD = "cloud"
 CONF_COMMAND_TIMEOUT = "command_timeout"
+CONF_TELEMETRY_FILTER = "telemetry_filter"
+CONF_TELEMETRY_MIN_INTERVAL = "telemetry_min_interval"
+CONF_TELEMETRY_AVERAGE_WINDOW = "telemetry_average_window"
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RATE_LIMIT_BURST = "rate_limit_burst"
+CONF_RETRY = "retry"
+CONF_RETRY_MAX_ATTEMPTS = "retry_max_attempts"
+CONF_RETRY_BASE_DELAY = "retry_base_delay"
+CONF_RETRY_JITTER = "retry_jitter"
+CONF_OFFLINE_TTL = "offline_command_ttl"
 
 DEFAULT_CLOUD = "worx"
 DEFAULT_COMMAND_TIMEOUT = 30.0
 MIN_COMMAND_TIMEOUT = 1.0
 MAX_COMMAND_TIMEOUT = 120.0
+DEFAULT_TELEMETRY_FILTER = True
+DEFAULT_TELEMETRY_MIN_INTERVAL = 0
+DEFAULT_TELEMETRY_AVERAGE_WINDOW = 0
+MAX_TELEMETRY_INTERVAL = 3600
+DEFAULT_RATE_LIMIT = 30
+DEFAULT_RATE_LIMIT_BURST = 10
+MAX_RATE_LIMIT = 600
+MAX_RATE_LIMIT_BURST = 100
+DEFAULT_RETRY = False
+DEFAULT_RETRY_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_BASE_DELAY = 1.0
+DEFAULT_RETRY_JITTER = 20
+MAX_RETRY_ATTEMPTS = 10
+DEFAULT_OFFLINE_TTL = 0
+MAX_OFFLINE_TTL = 600
+CIRCUIT_BREAKER_THRESHOLD = 5
+CIRCUIT_BREAKER_COOLDOWN = 60
 
 MOWER_STATE_IDLE = "idle"
 MOWER_STATE_STARTING = "starting"
@@ -103,32 +131,77 @@ SERVICE_SET_BORDER_CUT_SETTINGS = "set_border_cut_settings"
 SERVICE_ADD_SCHEDULE = "add_schedule"
 SERVICE_EDIT_SCHEDULE = "edit_schedule"
 SERVICE_DELETE_SCHEDULE = "delete_schedule"
+SERVICE_APPLY_SCHEDULE_CHANGES = "apply_schedule_changes"
+SERVICE_SET_SCHEDULE = "set_schedule"
 SERVICE_SET_NUTRITION = "set_nutrition"
 SERVICE_CLEAR_NUTRITION = "clear_nutrition"
 SERVICE_SET_EXCLUSION_DAY = "set_exclusion_day"
 SERVICE_ADD_EXCLUSION_SCHEDULE = "add_exclusion_schedule"
 SERVICE_EDIT_EXCLUSION_SCHEDULE = "edit_exclusion_schedule"
 SERVICE_DELETE_EXCLUSION_SCHEDULE = "delete_exclusion_schedule"
+SERVICE_SET_EXCLUSION_WEEK = "set_exclusion_week"
+SERVICE_ANALYZE_SCHEDULE = "analyze_schedule"
+SERVICE_SET_NUMBER_VALUE = "set_number_value"
+SERVICE_SET_SWITCH_STATE = "set_switch_state"
+SERVICE_SELECT_OPTION = "select_option"
+SERVICE_FLEET_COMMAND = "fleet_command"
+SERVICE_SAVE_SCHEDULE_TEMPLATE = "save_schedule_template"
+SERVICE_DELETE_SCHEDULE_TEMPLATE = "delete_schedule_template"
+SERVICE_APPLY_SCHEDULE_TEMPLATE = "apply_schedule_template"
+SERVICE_EXPORT_SCHEDULES = "export_schedules"
+SERVICE_IMPORT_SCHEDULES = "import_schedules"
+SERVICE_PLAN_RAIN = "plan_rain"
 
 ATTR_EXCLUDE_DAY = "exclude_day"
+ATTR_EXCLUDE_NIGHTS = "exclude_nights"
 ATTR_K = "k"
 ATTR_N = "n"
 ATTR_P = "p"
 ATTR_REASON = "reason"
 ATTR_BOUNDARY = "boundary"
+ATTR_ACTION = "action"
 ATTR_ALL_SCHEDULES = "all_schedules"
+ATTR_CHANGES = "changes"
 ATTR_CURRENT_DAY = "current_day"
 ATTR_CURRENT_START = "current_start"
 ATTR_DAY = "day"
 ATTR_DAYS = "days"
 ATTR_DURATION = "duration"
 ATTR_RUNTIME = "runtime"
+ATTR_SLOTS = "slots"
 ATTR_CUT_OVER_BORDER = "cut_over_border"
 ATTR_BORDER_DISTANCE_CM = "border_distance_cm"
 ATTR_START = "start"
+ATTR_WAIT_FOR_ACK = "wait_for_ack"
+ATTR_FORCE = "force"
+ATTR_OPTION = "option"
+ATTR_STATE = "state"
+ATTR_VALUE = "value"
+ATTR_COMMAND = "command"
+ATTR_SERIAL_NUMBERS = "serial_numbers"
+ATTR_MAX_PARALLEL = "max_parallel"
+ATTR_STAGGER = "stagger"
+ATTR_ENTRIES = "entries"
+ATTR_SERIAL_NUMBER = "serial_number"
+ATTR_TEMPLATE = "template"
+ATTR_TIME_EXTENSION = "time_extension"
+ATTR_DRY_RUN = "dry_run"
+ATTR_SNAPSHOT = "snapshot"
+ATTR_SNAPSHOTS = "snapshots"
+ATTR_RAIN_START = "rain_start"
+ATTR_RAIN_END = "rain_end"
+ATTR_HOURS = "hours"
+ATTR_DRYING_TIME = "drying_time"
+ATTR_MODE = "mode"
+
+FLEET_ALL_MOWERS = "all"
+DEFAULT_FLEET_MAX_PARALLEL = 4
 
 DAYS = tuple(DAY_MAP[index] for index in sorted(DAY_MAP))
 EXCLUSION_REASONS = ("generic", "irrigation")
+SCHEDULE_CHANGE_ADD = "add"
+SCHEDULE_CHANGE_EDIT = "edit"
+SCHEDULE_CHANGE_DELETE = "delete"
 VISION_BORDER_DISTANCE_CM_VALUES = (5, 10, 15, 20)
 
 AUTO_SCHEDULE_BOOST_OPTIONS = ("0", "1", "2")
@@ -4,15 +4,119 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import Counter
+from collections.abc import Callable, Coroutine, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_EMAIL
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import (
+    CONNECTION_NETWORK_MAC,
+    DeviceEntryType,
+)
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from pyworxcloud import DeviceHandler, LandroidEvent, WorxCloud
 
-from .const import DOMAIN
+from .commands import (
+    AckTracker,
+    AdaptiveTimeout,
+    CloudCircuitBreaker,
+    CloudRateLimiter,
+    LandroidCommandQueue,
+    RetryPolicy,
+)
+from .const import (
+    CIRCUIT_BREAKER_COOLDOWN,
+    CIRCUIT_BREAKER_THRESHOLD,
+    CONF_CLOUD,
+    CONF_COMMAND_TIMEOUT,
+    CONF_OFFLINE_TTL,
+    CONF_RATE_LIMIT,
+    CONF_RATE_LIMIT_BURST,
+    CONF_RETRY,
+    CONF_RETRY_BASE_DELAY,
+    CONF_RETRY_JITTER,
+    CONF_RETRY_MAX_ATTEMPTS,
+    DEFAULT_COMMAND_TIMEOUT,
+    DEFAULT_OFFLINE_TTL,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RATE_LIMIT_BURST,
+    DEFAULT_RETRY,
+    DEFAULT_RETRY_BASE_DELAY,
+    DEFAULT_RETRY_JITTER,
+    DEFAULT_RETRY_MAX_ATTEMPTS,
+    DOMAIN,
+    MIN_COMMAND_TIMEOUT,
+)
 
 _LOGGER = logging.getLogger(__name__)
+_CAPABILITY_STORAGE_VERSION = 1
+_CAPABILITY_SAVE_DELAY = 30
+
+
+def capability_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, list[str]]]:
+    """Return the store holding payload sections reported per mower."""
+    return Store(hass, _CAPABILITY_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.capabilities")
+
+
+type DeviceIdentity = tuple[str, str, str, str | None]
+
+
+@dataclass(slots=True)
+class RainDelayRestore:
+    """A mower's rain delay to set back once a raised delay has run out."""
+
+    previous: int
+    raised: int
+    when: datetime
+    cancel: CALLBACK_TYPE = field(repr=False)
+
+
+def _firmware_version(device: DeviceHandler) -> str:
+    """Return firmware version from pyworxcloud device payload."""
+    firmware = getattr(device, "firmware", None)
+    if isinstance(firmware, dict):
+        return str(firmware.get("version", "unknown"))
+    if firmware is not None:
+        return str(getattr(firmware, "version", "unknown"))
+    return "unknown"
+
+
+def _device_identity(device: DeviceHandler) -> DeviceIdentity:
+    """Return the device fields that make up Home Assistant device info."""
+    mac_address = getattr(device, "mac_address", None)
+    if not mac_address or mac_address == "__UUID__":
+        mac_address = None
+
+    return (
+        str(device.name),
+        str(getattr(device, "model", "Unknown")),
+        _firmware_version(device),
+        mac_address,
+    )
+
+
+def _retry_policy(options: Mapping[str, Any]) -> RetryPolicy | None:
+    """Return the configured command retry policy, or None when disabled."""
+    if not options.get(CONF_RETRY, DEFAULT_RETRY):
+        return None
+
+    return RetryPolicy(
+        max_attempts=int(
+            options.get(CONF_RETRY_MAX_ATTEMPTS, DEFAULT_RETRY_MAX_ATTEMPTS)
+        ),
+        base_delay=float(options.get(CONF_RETRY_BASE_DELAY, DEFAULT_RETRY_BASE_DELAY)),
+        jitter=float(options.get(CONF_RETRY_JITTER, DEFAULT_RETRY_JITTER)) / 100,
+        # Retries must not outlast the time a caller would wait for one command.
+        deadline=float(options.get(CONF_COMMAND_TIMEOUT, DEFAULT_COMMAND_TIMEOUT)),
+    )
 
 
 def _device_map(cloud: WorxCloud) -> dict[str, DeviceHandler]:
@@ -27,17 +131,51 @@ def _device_map(cloud: WorxCloud) -> dict[str, DeviceHandler]:
 class LandroidCloudCoordinator(DataUpdateCoordinator[dict[str, DeviceHandler]]):
     """Coordinate state updates for cloud-connected mowers."""
 
-    def __init__(self, hass: HomeAssistant, cloud: WorxCloud) -> None:
+    def __init__(
+        self, hass: HomeAssistant, config_entry: ConfigEntry, cloud: WorxCloud
+    ) -> None:
         """Initialize coordinator."""
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=config_entry,
             name=DOMAIN,
             update_interval=None,
         )
         self.cloud = cloud
+        self.rate_limiter = CloudRateLimiter(
+            config_entry.options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+            config_entry.options.get(CONF_RATE_LIMIT_BURST, DEFAULT_RATE_LIMIT_BURST),
+        )
+        self.circuit_breaker = CloudCircuitBreaker(
+            CIRCUIT_BREAKER_THRESHOLD,
+            CIRCUIT_BREAKER_COOLDOWN,
+            self.async_update_listeners,
+        )
+        self.command_timeouts = AdaptiveTimeout(
+            MIN_COMMAND_TIMEOUT,
+            float(
+                config_entry.options.get(CONF_COMMAND_TIMEOUT, DEFAULT_COMMAND_TIMEOUT)
+            ),
+        )
+        self.command_queue = LandroidCommandQueue(
+            self.rate_limiter,
+            _retry_policy(config_entry.options),
+            offline_ttl=config_entry.options.get(CONF_OFFLINE_TTL, DEFAULT_OFFLINE_TTL),
+            breaker=self.circuit_breaker,
+            timeouts=self.command_timeouts,
+        )
+        self.ack_tracker = AckTracker(timeouts=self.command_timeouts)
+        self._capability_store = capability_store(hass, config_entry.entry_id)
+        self._reported_sections: dict[str, set[str]] = {}
+        self._device_info: dict[str, tuple[DeviceIdentity, DeviceInfo]] = {}
+        self._device_listeners: list[Callable[[str], None]] = []
         self._event_lock = asyncio.Lock()
         self._firmware_update_info: dict[str, dict[str, Any]] = {}
+        self._state_writes: Counter[str] = Counter()
+        self._suppressed_state_writes: Counter[str] = Counter()
+        self._one_time_runs: dict[str, tuple[datetime, int]] = {}
+        self._rain_delay_restores: dict[str, RainDelayRestore] = {}
 
     async def async_setup(self) -> None:
         """Attach callbacks for push updates."""
@@ -58,6 +196,36 @@ class LandroidCloudCoordinator(DataUpdateCoordinator[dict[str, DeviceHandler]]):
         self.cloud.set_callback(LandroidEvent.API, _on_api_update)
         self.cloud.set_callback(LandroidEvent.MQTT_CONNECTION, _on_mqtt_connection)
 
+    async def async_load_capabilities(self) -> None:
+        """Load payload sections previously reported by each mower."""
+        stored = await self._capability_store.async_load() or {}
+        self._reported_sections = {
+            serial_number: set(sections) for serial_number, sections in stored.items()
+        }
+
+    def reported_sections(self, serial_number: str) -> set[str]:
+        """Return payload sections a mower has reported at least once."""
+        return set(self._reported_sections.get(serial_number, ()))
+
+    def record_reported_sections(self, serial_number: str, sections: set[str]) -> None:
+        """Persist newly reported payload sections for a mower."""
+        known = self._reported_sections.setdefault(serial_number, set())
+        if sections <= known:
+            return
+
+        known.update(sections)
+        self._async_save_capabilities()
+
+    def _async_save_capabilities(self) -> None:
+        """Persist the reported payload sections of every mower."""
+        self._capability_store.async_delay_save(
+            lambda: {
+                serial: sorted(reported)
+                for serial, reported in self._reported_sections.items()
+            },
+            _CAPABILITY_SAVE_DELAY,
+        )
+
     async def async_shutdown(self) -> None:
         """Detach callbacks for push updates."""
         # pyworxcloud exposes callback registration, but not explicit unregistration.
@@ -65,6 +233,10 @@ class LandroidCloudCoordinator(DataUpdateCoordinator[dict[str, DeviceHandler]]):
         self.cloud.set_callback(LandroidEvent.DATA_RECEIVED, lambda **_: None)
         self.cloud.set_callback(LandroidEvent.API, lambda **_: None)
         self.cloud.set_callback(LandroidEvent.MQTT_CONNECTION, lambda **_: None)
+        for serial_number in list(self._rain_delay_restores):
+            self._cancel_rain_delay_restore(serial_number)
+        await self.command_queue.async_shutdown()
+        self.ack_tracker.shutdown()
 
     async def _handle_push_update(self, device: DeviceHandler) -> None:
         """Merge push update into coordinator data in a race-safe manner."""
@@ -73,18 +245,85 @@ class LandroidCloudCoordinator(DataUpdateCoordinator[dict[str, DeviceHandler]]):
             return
 
         async with self._event_lock:
+            previous = set(self.data or {})
             data = dict(self.data) if self.data else {}
             data[str(serial_number)] = device
             self._sync_firmware_update_info(str(serial_number), device)
+            self._sync_device_info(str(serial_number), device)
+            # Settle pending commands against the pushed state before entities
+            # render it, so optimistic values are reconciled in the same write.
+            self.data = data
+            self.ack_tracker.process(str(serial_number))
             self.async_set_updated_data(data)
+            self._async_sync_devices(previous, set(data))
 
     async def _refresh_from_cloud(self) -> None:
         """Refresh local state from cloud cache in a race-safe manner."""
         async with self._event_lock:
+            previous = set(self.data or {})
             data = _device_map(self.cloud)
             for serial_number, device in data.items():
                 self._sync_firmware_update_info(serial_number, device)
+                self._sync_device_info(serial_number, device)
             self.async_set_updated_data(data)
+            self._async_sync_devices(previous, set(data))
+
+    @callback
+    def async_add_device_listener(
+        self, listener: Callable[[str], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for mowers that appear on the account after setup."""
+        self._device_listeners.append(listener)
+
+        @callback
+        def _remove_listener() -> None:
+            self._device_listeners.remove(listener)
+
+        return _remove_listener
+
+    @callback
+    def _async_sync_devices(self, previous: set[str], current: set[str]) -> None:
+        """Announce added mowers and clean up mowers removed from the account."""
+        for serial_number in sorted(current - previous):
+            _LOGGER.info("Discovered new mower %s", serial_number)
+            for listener in list(self._device_listeners):
+                listener(serial_number)
+
+        removed = previous - current
+        if not removed:
+            return
+        if not current:
+            # An empty product list is more likely a cloud hiccup than an
+            # account without mowers; keep the devices until it recovers.
+            _LOGGER.debug("Ignoring empty device list from cloud refresh")
+            return
+
+        registry = dr.async_get(self.hass)
+        for serial_number in sorted(removed):
+            _LOGGER.info("Removing mower %s no longer on the account", serial_number)
+            self._device_info.pop(serial_number, None)
+            self._firmware_update_info.pop(serial_number, None)
+            self._one_time_runs.pop(serial_number, None)
+            self._cancel_rain_delay_restore(serial_number)
+            self.command_queue.forget(serial_number)
+            self.ack_tracker.forget(serial_number)
+            self.command_timeouts.forget(serial_number)
+            registry_device = registry.async_get_device(
+                identifiers={(DOMAIN, serial_number)}
+            )
+            if registry_device is not None:
+                registry.async_update_device(
+                    registry_device.id,
+                    remove_config_entry_id=self.config_entry.entry_id,
+                )
+
+        # A mower that comes back is probed again from scratch.
+        forgotten = [
+            self._reported_sections.pop(serial_number, None)
+            for serial_number in removed
+        ]
+        if any(sections is not None for sections in forgotten):
+            self._async_save_capabilities()
 
     def _schedule_push_update(self, device: DeviceHandler) -> None:
         """Schedule push update handling on Home Assistant's event loop."""
@@ -117,12 +356,80 @@ class LandroidCloudCoordinator(DataUpdateCoordinator[dict[str, DeviceHandler]]):
 
     def _notify_connection_update(self) -> None:
         """Notify listeners of an MQTT connectivity change without refetching data."""
+        if self.cloud.mqtt_connected:
+            self.command_queue.flush_offline()
         self.async_update_listeners()
 
     async def _async_update_data(self) -> dict[str, DeviceHandler]:
         """Return current cloud cache without triggering device updates."""
         return _device_map(self.cloud)
 
+    def device_info(self, serial_number: str) -> DeviceInfo:
+        """Return Home Assistant device info shared by all entities of a mower."""
+        if (cached := self._device_info.get(serial_number)) is None:
+            identity = _device_identity(self.data[serial_number])
+            cached = (identity, self._build_device_info(serial_number, identity))
+            self._device_info[serial_number] = cached
+        return cached[1]
+
+    def account_device_info(self) -> DeviceInfo:
+        """Return Home Assistant device info for the cloud account itself."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.config_entry.entry_id)},
+            name=self.config_entry.title,
+            manufacturer=self.config_entry.data[CONF_CLOUD].capitalize(),
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    def _build_device_info(
+        self, serial_number: str, identity: DeviceIdentity
+    ) -> DeviceInfo:
+        """Build device info from a mower's identity fields."""
+        name, model, sw_version, mac_address = identity
+        info = DeviceInfo(
+            identifiers={(DOMAIN, serial_number)},
+            serial_number=serial_number,
+            name=name,
+            manufacturer=self.config_entry.data[CONF_CLOUD].capitalize(),
+            model=model,
+            sw_version=sw_version,
+            suggested_area=self.config_entry.data[CONF_EMAIL],
+        )
+        if mac_address is not None:
+            info["connections"] = {(CONNECTION_NETWORK_MAC, mac_address)}
+        return info
+
+    def _sync_device_info(self, serial_number: str, device: DeviceHandler) -> None:
+        """Rebuild cached device info and the registry entry when identity changes."""
+        cached = self._device_info.get(serial_number)
+        if cached is None:
+            return
+
+        identity = _device_identity(device)
+        if identity == cached[0]:
+            return
+
+        info = self._build_device_info(serial_number, identity)
+        self._device_info[serial_number] = (identity, info)
+
+        registry = dr.async_get(self.hass)
+        registry_device = registry.async_get_device(
+            identifiers={(DOMAIN, serial_number)}
+        )
+        if registry_device is None:
+            return
+
+        changes: dict[str, Any] = {
+            key: info[key]
+            for key in ("name", "model", "sw_version")
+            if getattr(registry_device, key) != info[key]
+        }
+        connections = info.get("connections", set())
+        if not connections <= registry_device.connections:
+            changes["merge_connections"] = connections
+        if changes:
+            registry.async_update_device(registry_device.id, **changes)
+
     def firmware_update_info(self, serial_number: str) -> dict[str, Any]:
         """Return cached firmware update metadata for a mower."""
         return dict(self._firmware_update_info.get(serial_number, {}))
@@ -163,7 +470,10 @@ class LandroidCloudCoordinator(DataUpdateCoordinator[dict[str, DeviceHandler]]):
         self, serial_number: str
     ) -> dict[str, Any]:
         """Fetch and cache firmware update metadata for a mower."""
-        info = await self.cloud.get_firmware_upgrade_info(serial_number)
+        await self.rate_limiter.async_acquire()
+        info = await self.circuit_breaker.async_call(
+            lambda: self.cloud.get_firmware_upgrade_info(serial_number)
+        )
 
         async with self._event_lock:
             device = (self.data or {}).get(serial_number)
@@ -181,3 +491,81 @@ class LandroidCloudCoordinator(DataUpdateCoordinator[dict[str, DeviceHandler]]):
         if serial_number not in self._firmware_update_info:
             return await self.async_refresh_firmware_update_info(serial_number)
         return self.firmware_update_info(serial_number)
+
+    def record_one_time_run(self, serial_number: str, runtime: int) -> None:
+        """Remember a one-time schedule started now for `runtime` minutes."""
+        self._one_time_runs[serial_number] = (datetime.now(UTC), runtime)
+
+    def one_time_run(self, serial_number: str) -> tuple[datetime, int] | None:
+        """Return the start and runtime of the last one-time schedule sent."""
+        return self._one_time_runs.get(serial_number)
+
+    def rain_delay_restore(self, serial_number: str) -> RainDelayRestore | None:
+        """Return the rain delay restore pending for a mower, if any."""
+        return self._rain_delay_restores.get(serial_number)
+
+    def schedule_rain_delay_restore(
+        self,
+        serial_number: str,
+        *,
+        previous: int,
+        raised: int,
+        when: datetime,
+        restore: Callable[[int, int], Coroutine[Any, Any, None]],
+    ) -> None:
+        """Call `restore(previous, raised)` at `when` to undo a raised rain delay.
+
+        A restore already pending for the mower keeps its previous delay and
+        the later of the two times. Restores are not kept across restarts.
+        """
+        if (pending := self._rain_delay_restores.pop(serial_number, None)) is not None:
+            pending.cancel()
+            previous = pending.previous
+            when = max(when, pending.when)
+
+        @callback
+        def _async_restore(_now: datetime) -> None:
+            self._rain_delay_restores.pop(serial_number, None)
+            self.config_entry.async_create_background_task(
+                self.hass,
+                restore(previous, raised),
+                f"{DOMAIN} rain delay restore {serial_number}",
+            )
+
+        self._rain_delay_restores[serial_number] = RainDelayRestore(
+            previous=previous,
+            raised=raised,
+            when=when,
+            cancel=async_track_point_in_utc_time(self.hass, _async_restore, when),
+        )
+
+    def _cancel_rain_delay_restore(self, serial_number: str) -> None:
+        """Drop the rain delay restore pending for a mower."""
+        if (pending := self._rain_delay_restores.pop(serial_number, None)) is not None:
+            pending.cancel()
+
+    def record_state_write(self, platform: str, suppressed: bool) -> None:
+        """Count an entity state write, or a write skipped as unchanged."""
+        if suppressed:
+            self._suppressed_state_writes[platform] += 1
+        else:
+            self._state_writes[platform] += 1
+
+    def runtime_diagnostics(self) -> dict[str, Any]:
+        """Return runtime counters for config entry diagnostics."""
+        return {
+            "state_writes": {
+                platform: {
+                    "written": self._state_writes[platform],
+                    "suppressed": self._suppressed_state_writes[platform],
+                }
+                for platform in sorted(
+                    self._state_writes.keys() | self._suppressed_state_writes.keys()
+                )
+            },
+            "command_queue": self.command_queue.diagnostics(),
+            "rate_limiter": self.rate_limiter.diagnostics(),
+            "circuit_breaker": self.circuit_breaker.diagnostics(),
+            "command_timeouts": self.command_timeouts.diagnostics(),
+            "acknowledgements": self.ack_tracker.diagnostics(),
+        }
@@ -21,11 +21,16 @@ from homeassistant.const import (
     CONF_TYPE,
 )
 from homeassistant.core import Context, HomeAssistant
-from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
 from homeassistant.helpers.entity import get_supported_features
 from homeassistant.helpers.typing import ConfigType, TemplateVarsType
 
-from .const import DOMAIN
+from .const import ATTR_WAIT_FOR_ACK, DOMAIN
 
 ACTION_TO_SERVICE: Final[dict[str, str]] = {
     "start_mowing": SERVICE_START_MOWING,
@@ -42,6 +47,7 @@ _ACTION_SCHEMA = cv.DEVICE_ACTION_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_TYPE): vol.In(ACTION_TO_SERVICE),
         vol.Required(CONF_ENTITY_ID): cv.entity_id_or_uuid,
+        vol.Optional(ATTR_WAIT_FOR_ACK): cv.boolean,
     }
 )
 
@@ -78,6 +84,44 @@ async def async_get_actions(
     return actions
 
 
+async def async_get_action_capabilities(
+    hass: HomeAssistant, config: ConfigType
+) -> dict[str, vol.Schema]:
+    """List action capabilities."""
+    del hass, config
+    return {
+        "extra_fields": vol.Schema(
+            {vol.Optional(ATTR_WAIT_FOR_ACK, default=False): cv.boolean}
+        )
+    }
+
+
+async def _async_wait_for_ack(
+    hass: HomeAssistant, entity_id: str, action_type: str
+) -> None:
+    """Wait for the push confirming the mower acted on a device action."""
+    entity_entry = er.async_get(hass).async_get(entity_id)
+    if entity_entry is None or entity_entry.device_id is None:
+        raise HomeAssistantError(f"Unknown Landroid Cloud mower: {entity_id}")
+
+    config_entry = hass.config_entries.async_get_entry(entity_entry.config_entry_id)
+    device = dr.async_get(hass).async_get(entity_entry.device_id)
+    serial_number = next(
+        (
+            identifier
+            for domain, identifier in (device.identifiers if device else ())
+            if domain == DOMAIN
+        ),
+        None,
+    )
+    if config_entry is None or serial_number is None:
+        raise HomeAssistantError(f"Unknown Landroid Cloud mower: {entity_id}")
+
+    tracker = config_entry.runtime_data.coordinator.ack_tracker
+    if (pending := tracker.latest(serial_number, action_type)) is not None:
+        await tracker.async_wait(pending)
+
+
 async def async_call_action_from_config(
     hass: HomeAssistant,
     config: ConfigType,
@@ -94,3 +138,5 @@ async def async_call_action_from_config(
         blocking=True,
         context=context,
     )
+    if config.get(ATTR_WAIT_FOR_ACK):
+        await _async_wait_for_ack(hass, config[CONF_ENTITY_ID], config[CONF_TYPE])
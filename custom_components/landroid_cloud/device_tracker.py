@@ -6,8 +6,14 @@ from homeassistant.components.device_tracker import SourceType, TrackerEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from pyworxcloud import DeviceHandler
 
-from .entity import LandroidBaseEntity, device_coordinates, device_supports_location
+from .entity import (
+    LandroidBaseEntity,
+    async_add_device_entities,
+    device_coordinates,
+    device_supports_location,
+)
 
 
 async def async_setup_entry(
@@ -18,10 +24,15 @@ async def async_setup_entry(
     """Set up Landroid Cloud device tracker entities."""
     coordinator = entry.runtime_data.coordinator
 
-    async_add_entities(
-        LandroidCloudLocationEntity(coordinator, entry, serial_number)
-        for serial_number, device in coordinator.data.items()
-        if device_supports_location(device)
+    def _entities_for_device(
+        serial_number: str, device: DeviceHandler
+    ) -> list[LandroidCloudLocationEntity]:
+        if not device_supports_location(device):
+            return []
+        return [LandroidCloudLocationEntity(coordinator, entry, serial_number)]
+
+    async_add_device_entities(
+        coordinator, entry, async_add_entities, _entities_for_device
     )
 
 
@@ -103,6 +103,7 @@ async def async_get_config_entry_diagnostics(
             "entry": entry.as_dict(),
             "domain": DOMAIN,
             "devices": devices,
+            "runtime": runtime_data.coordinator.runtime_diagnostics(),
         },
         TO_REDACT,
     )
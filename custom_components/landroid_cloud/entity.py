@@ -2,31 +2,28 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from copy import deepcopy
 from dataclasses import dataclass
-from typing import TypeVar
+from datetime import UTC, tzinfo
+from typing import Any, TypeVar
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_EMAIL
-from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo, Entity
+from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from pyworxcloud import DeviceHandler
 
-from .const import CONF_CLOUD, DOMAIN
+from .commands import CommandAck, PendingAck
 from .coordinator import LandroidCloudCoordinator
 
-T = TypeVar("T")
-
+_LOGGER = logging.getLogger(__name__)
 
-def _firmware_version(device: DeviceHandler) -> str:
-    """Return firmware version from pyworxcloud device payload."""
-    firmware = getattr(device, "firmware", None)
-    if isinstance(firmware, dict):
-        return str(firmware.get("version", "unknown"))
-    if firmware is not None:
-        return str(getattr(firmware, "version", "unknown"))
-    return "unknown"
+T = TypeVar("T")
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -43,6 +40,8 @@ class LandroidBaseEntity(CoordinatorEntity[LandroidCloudCoordinator]):
     _attr_has_entity_name = True
     _attr_requires_online = False
     _attr_requires_auto_schedule = False
+    _last_rendered_state: tuple[Any, ...] | None = None
+    _optimistic: tuple[Any, PendingAck] | None = None
 
     def __init__(
         self,
@@ -78,24 +77,187 @@ class LandroidBaseEntity(CoordinatorEntity[LandroidCloudCoordinator]):
     @property
     def device_info(self) -> DeviceInfo:
         """Return Home Assistant device info."""
-        device = self.device
-        cloud_type = self._config_entry.data[CONF_CLOUD]
+        return self.coordinator.device_info(self._serial_number)
 
-        info = {
-            "identifiers": {(DOMAIN, str(device.serial_number))},
-            "serial_number": str(device.serial_number),
-            "name": str(device.name),
-            "manufacturer": cloud_type.capitalize(),
-            "model": str(getattr(device, "model", "Unknown")),
-            "sw_version": _firmware_version(device),
-            "suggested_area": self._config_entry.data[CONF_EMAIL],
-        }
-
-        mac_address = getattr(device, "mac_address", None)
-        if mac_address and mac_address != "__UUID__":
-            info["connections"] = {(CONNECTION_NETWORK_MAC, mac_address)}
+    async def async_run_command(
+        self,
+        command: Callable[[], Awaitable[object]],
+        *,
+        key: str | None = None,
+        priority: bool = False,
+        idempotent: bool = False,
+        ack: CommandAck | None = None,
+        wait_for_ack: bool = False,
+        optimistic: Any = None,
+    ) -> None:
+        """Send a cloud command through this mower's command queue.
+
+        An `idempotent` command writes a whole desired state and is retried on
+        transient errors like keyed commands, without being coalesced.
+
+        With `ack`, the push confirming the command is tracked, and with
+        `wait_for_ack` this only returns once that push has arrived. An
+        `optimistic` value is shown right away until the command is
+        confirmed, contradicted by a push, fails or times out.
+        """
+        if ack is None:
+            await self.coordinator.command_queue.async_run(
+                self._serial_number,
+                command,
+                key=key,
+                priority=priority,
+                idempotent=idempotent,
+            )
+            return
+
+        tracker = self.coordinator.ack_tracker
+        pending = tracker.expect(self._serial_number, ack)
+        if optimistic is not None:
+            self._set_optimistic(optimistic, pending)
+
+        async def _async_publish() -> object:
+            pending.published = asyncio.get_running_loop().time()
+            return await command()
+
+        try:
+            await self.coordinator.command_queue.async_run(
+                self._serial_number,
+                _async_publish,
+                key=key,
+                priority=priority,
+                idempotent=idempotent,
+            )
+        except BaseException:
+            tracker.discard(self._serial_number, pending)
+            raise
+        if pending.published is None:
+            # A newer command with the same key was sent in place of this one.
+            latest = tracker.latest(self._serial_number, ack.command)
+            if latest is None or latest is pending:
+                tracker.discard(self._serial_number, pending)
+                return
+            tracker.supersede(self._serial_number, pending, latest)
+        else:
+            pending.sent = True
+
+        if wait_for_ack:
+            await tracker.async_wait(pending)
+
+    def _write_is_noop(self, current: Any, requested: Any, *, force: bool) -> bool:
+        """Return whether writing `requested` would leave the state unchanged.
+
+        `current` is the rendered value, so repeating a command whose
+        optimistic value is still pending is suppressed as well.
+        """
+        if force or current is None or current != requested:
+            return False
+        _LOGGER.debug(
+            "Skipping %s write for %s: already %s",
+            self.entity_description.key,
+            self._serial_number,
+            requested,
+        )
+        return True
 
-        return DeviceInfo(**info)
+    def _optimistic_or[V](self, reported: V) -> V:
+        """Return the pending optimistic value, or the reported one."""
+        if self._optimistic is not None:
+            return self._optimistic[0]
+        return reported
+
+    @callback
+    def _set_optimistic(self, value: Any, pending: PendingAck) -> None:
+        """Show `value` until the pending command is settled."""
+        self._optimistic = (value, pending)
+        pending.future.add_done_callback(lambda _: self._clear_optimistic(pending))
+        self._async_write_rendered_state()
+
+    @callback
+    def _clear_optimistic(self, pending: PendingAck) -> None:
+        """Fall back to the reported state once a command is settled."""
+        if self._optimistic is None or self._optimistic[1] is not pending:
+            return
+        self._optimistic = None
+        self._async_write_rendered_state()
+
+    @callback
+    def _reconcile_optimistic(self) -> None:
+        """Drop an optimistic value the latest push confirmed or contradicted."""
+        if self._optimistic is None:
+            return
+        pending = self._optimistic[1]
+        if pending.future.done() or pending.contradicted:
+            self._optimistic = None
+
+    @callback
+    def _async_write_rendered_state(self) -> None:
+        """Write the current state outside of a coordinator update."""
+        if self.hass is None:
+            return
+        self._last_rendered_state = deepcopy(self._rendered_state())
+        self.async_write_ha_state()
+
+    def _rendered_state(self) -> tuple[Any, ...]:
+        """Return everything Home Assistant would render for this entity."""
+        if not self.available:
+            return (False,)
+
+        return (
+            True,
+            self.state,
+            self.state_attributes,
+            self.extra_state_attributes,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the initial rendered state written when the entity is added."""
+        await super().async_added_to_hass()
+        self._last_rendered_state = deepcopy(self._rendered_state())
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop showing optimistic state once the entity is removed."""
+        self._optimistic = None
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the rendered entity state has changed."""
+        self._reconcile_optimistic()
+        rendered = self._rendered_state()
+        suppressed = rendered == self._last_rendered_state
+        self.coordinator.record_state_write(self.platform.domain, suppressed)
+        if suppressed:
+            return
+
+        # Payload dicts are shared with pyworxcloud and may be mutated in place.
+        self._last_rendered_state = deepcopy(rendered)
+        super()._handle_coordinator_update()
+
+
+@callback
+def async_add_device_entities(
+    coordinator: LandroidCloudCoordinator,
+    entry: ConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+    entities_for_device: Callable[[str, DeviceHandler], Iterable[Entity]],
+) -> None:
+    """Add entities for current mowers and for mowers discovered later."""
+    async_add_entities(
+        [
+            entity
+            for serial_number, device in coordinator.data.items()
+            for entity in entities_for_device(serial_number, device)
+        ]
+    )
+
+    @callback
+    def _async_device_added(serial_number: str) -> None:
+        """Add entities for a mower that appeared after setup."""
+        device = coordinator.data[serial_number]
+        if entities := list(entities_for_device(serial_number, device)):
+            async_add_entities(entities)
+
+    entry.async_on_unload(coordinator.async_add_device_listener(_async_device_added))
 
 
 def device_coordinates(device: DeviceHandler) -> tuple[float, float] | None:
@@ -157,3 +319,45 @@ def auto_schedule_settings(device: DeviceHandler) -> dict:
 def auto_schedule_enabled(device: DeviceHandler) -> bool:
     """Return whether auto-schedule is enabled for the device."""
     return bool(auto_schedule(device).get("enabled", False))
+
+
+def device_timezone(device: DeviceHandler) -> tzinfo:
+    """Return the mower timezone, or UTC when it is missing or unknown."""
+    tz_name = getattr(device, "time_zone", None)
+    if tz_name is None:
+        return UTC
+    try:
+        return ZoneInfo(tz_name)
+    except ZoneInfoNotFoundError:
+        return UTC
+
+
+def auto_schedule_exclusion_days(device: DeviceHandler) -> list[dict]:
+    """Return the seven exclusion-scheduler days, indexed like `DAY_MAP`."""
+    exclusion = auto_schedule_settings(device).get("exclusion_scheduler")
+    if not isinstance(exclusion, dict):
+        return [{"exclude_day": False, "slots": []} for _ in range(7)]
+
+    raw_days = exclusion.get("days", [])
+    days = raw_days if isinstance(raw_days, list) else []
+    normalized_days: list[dict] = []
+    for index in range(7):
+        day_entry = days[index] if index < len(days) else {}
+        day = day_entry if isinstance(day_entry, dict) else {}
+        raw_slots = day.get("slots", [])
+        slots = raw_slots if isinstance(raw_slots, list) else []
+        normalized_days.append(
+            {
+                "exclude_day": bool(day.get("exclude_day", False)),
+                "slots": [slot for slot in slots if isinstance(slot, dict)],
+            }
+        )
+    return normalized_days
+
+
+def auto_schedule_exclude_nights(device: DeviceHandler) -> bool | None:
+    """Return the exclusion-scheduler exclude-nights flag, if reported."""
+    exclusion = auto_schedule_settings(device).get("exclusion_scheduler")
+    if not isinstance(exclusion, dict) or exclusion.get("exclude_nights") is None:
+        return None
+    return bool(exclusion["exclude_nights"])
@@ -0,0 +1,279 @@
+"""Account-wide commands for Landroid Cloud mowers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, Final
+
+import voluptuous as vol
+from homeassistant.const import ATTR_AREA_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from pyworxcloud import WorxCloud
+
+from .const import (
+    ATTR_COMMAND,
+    ATTR_MAX_PARALLEL,
+    ATTR_SERIAL_NUMBERS,
+    ATTR_STAGGER,
+    ATTR_VALUE,
+    DEFAULT_FLEET_MAX_PARALLEL,
+    DOMAIN,
+    FLEET_ALL_MOWERS,
+    SERVICE_FLEET_COMMAND,
+)
+from .coordinator import LandroidCloudCoordinator
+
+OFFLINE_MESSAGE: Final = "Mower is offline"
+UNKNOWN_MOWER_MESSAGE: Final = "Mower is not on any loaded account"
+
+
+@dataclass(frozen=True, slots=True)
+class FleetCommand:
+    """A command that can be sent to several mowers at once.
+
+    `key` and `priority` match the entity commands, so a fleet command
+    coalesces with a pending entity write and jumps the queue like it.
+    """
+
+    send: Callable[[WorxCloud, str, Any], Awaitable[object]]
+    value: Callable[[Any], Any] | None = None
+    key: str | None = None
+    priority: bool = False
+
+
+FLEET_COMMANDS: Final[dict[str, FleetCommand]] = {
+    "start": FleetCommand(send=lambda cloud, serial, _: cloud.start(serial)),
+    "pause": FleetCommand(
+        send=lambda cloud, serial, _: cloud.pause(serial), priority=True
+    ),
+    "home": FleetCommand(
+        send=lambda cloud, serial, _: cloud.home(serial), priority=True
+    ),
+    "edgecut": FleetCommand(send=lambda cloud, serial, _: cloud.edgecut(serial)),
+    "raindelay": FleetCommand(
+        send=lambda cloud, serial, value: cloud.raindelay(serial, str(value)),
+        value=vol.All(vol.Coerce(int), vol.Range(min=0, max=1440)),
+        key="rain_delay",
+    ),
+    "set_lock": FleetCommand(
+        send=lambda cloud, serial, value: cloud.set_lock(serial, value),
+        value=cv.boolean,
+        key="lock",
+    ),
+    "set_party_mode": FleetCommand(
+        send=lambda cloud, serial, value: cloud.set_party_mode(serial, value),
+        value=cv.boolean,
+        key="party_mode",
+    ),
+}
+
+# Target fields shared by the services that act on many mowers.
+FLEET_SELECTION_FIELDS: Final = {
+    vol.Optional(ATTR_SERIAL_NUMBERS): vol.Any(
+        FLEET_ALL_MOWERS, vol.All(cv.ensure_list, [cv.string])
+    ),
+    vol.Optional(ATTR_AREA_ID): vol.All(cv.ensure_list, [cv.string]),
+}
+# Target and pacing fields of the services that send commands to many mowers.
+FLEET_TARGET_FIELDS: Final = {
+    **FLEET_SELECTION_FIELDS,
+    vol.Optional(ATTR_MAX_PARALLEL, default=DEFAULT_FLEET_MAX_PARALLEL): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=32)
+    ),
+    vol.Optional(ATTR_STAGGER, default=0): vol.All(
+        vol.Coerce(float), vol.Range(min=0, max=60)
+    ),
+}
+
+FLEET_COMMAND_SCHEMA: Final = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_COMMAND): vol.In(FLEET_COMMANDS),
+            vol.Optional(ATTR_VALUE): vol.Any(bool, int, float, str),
+            **FLEET_TARGET_FIELDS,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_SERIAL_NUMBERS, ATTR_AREA_ID),
+)
+
+
+def _loaded_coordinators(hass: HomeAssistant) -> list[LandroidCloudCoordinator]:
+    """Return the coordinators of all loaded Landroid Cloud accounts."""
+    return [
+        entry.runtime_data.coordinator
+        for entry in hass.config_entries.async_loaded_entries(DOMAIN)
+    ]
+
+
+def _area_serial_numbers(hass: HomeAssistant, area_ids: Iterable[str]) -> set[str]:
+    """Return serial numbers of mower devices assigned to the given areas."""
+    registry = dr.async_get(hass)
+    return {
+        identifier
+        for area_id in area_ids
+        for device in dr.async_entries_for_area(registry, area_id)
+        for domain, identifier in device.identifiers
+        if domain == DOMAIN
+    }
+
+
+def resolve_fleet_targets(
+    hass: HomeAssistant, data: dict[str, Any]
+) -> tuple[list[tuple[LandroidCloudCoordinator, str]], list[str]]:
+    """Return the mowers a fleet command targets, and unknown serial numbers."""
+    coordinators = _loaded_coordinators(hass)
+    owners = {
+        serial_number: coordinator
+        for coordinator in coordinators
+        for serial_number in coordinator.data
+    }
+
+    requested = data.get(ATTR_SERIAL_NUMBERS, [])
+    if requested == FLEET_ALL_MOWERS:
+        wanted = list(owners)
+    else:
+        wanted = list(requested)
+    if area_ids := data.get(ATTR_AREA_ID):
+        wanted.extend(_area_serial_numbers(hass, area_ids))
+
+    targets: list[tuple[LandroidCloudCoordinator, str]] = []
+    unknown: list[str] = []
+    for serial_number in dict.fromkeys(wanted):
+        if serial_number in owners:
+            targets.append((owners[serial_number], serial_number))
+        else:
+            unknown.append(serial_number)
+    return targets, unknown
+
+
+async def async_run_fleet(
+    targets: list[tuple[LandroidCloudCoordinator, str]],
+    action: Callable[[LandroidCloudCoordinator, str], Awaitable[dict[str, Any]]],
+    *,
+    max_parallel: int = DEFAULT_FLEET_MAX_PARALLEL,
+    stagger: float = 0,
+) -> dict[str, dict[str, Any]]:
+    """Run an action for many mowers and return a result per mower.
+
+    At most `max_parallel` actions are in flight at once, and consecutive
+    mowers start at least `stagger` seconds apart. Actions send their
+    commands through the mower's command queue, so rate limiting, retries
+    and the circuit breaker apply as for entity commands. Whatever the
+    action returns is added to the mower's successful result.
+    """
+    # pyworxcloud sends MQTT commands one at a time per account and waits for
+    # each reply under its command lock, so for mowers on one account only the
+    # REST calls and the work around each command overlap.
+    semaphore = asyncio.Semaphore(max_parallel)
+    loop = asyncio.get_running_loop()
+
+    async def _async_run(
+        index: int, coordinator: LandroidCloudCoordinator, serial_number: str
+    ) -> tuple[str, dict[str, Any]]:
+        if stagger:
+            await asyncio.sleep(index * stagger)
+        device = coordinator.data.get(serial_number)
+        if not getattr(device, "online", False):
+            return serial_number, {"success": False, "error": OFFLINE_MESSAGE}
+
+        async with semaphore:
+            started = loop.time()
+            try:
+                result = await action(coordinator, serial_number)
+            except HomeAssistantError as err:
+                return serial_number, {"success": False, "error": str(err)}
+            return serial_number, {
+                "success": True,
+                **result,
+                "elapsed_ms": round((loop.time() - started) * 1000),
+            }
+
+    results = await asyncio.gather(
+        *(
+            _async_run(index, coordinator, serial_number)
+            for index, (coordinator, serial_number) in enumerate(targets)
+        )
+    )
+    return dict(results)
+
+
+async def async_run_fleet_command(
+    targets: list[tuple[LandroidCloudCoordinator, str]],
+    command: FleetCommand,
+    value: Any = None,
+    *,
+    max_parallel: int = DEFAULT_FLEET_MAX_PARALLEL,
+    stagger: float = 0,
+) -> dict[str, dict[str, Any]]:
+    """Send one command to many mowers and return a result per mower."""
+
+    async def _async_send(
+        coordinator: LandroidCloudCoordinator, serial_number: str
+    ) -> dict[str, Any]:
+        await coordinator.command_queue.async_run(
+            serial_number,
+            lambda: command.send(coordinator.cloud, serial_number, value),
+            key=command.key,
+            priority=command.priority,
+        )
+        return {}
+
+    return await async_run_fleet(
+        targets, _async_send, max_parallel=max_parallel, stagger=stagger
+    )
+
+
+async def _async_handle_fleet_command(call: ServiceCall) -> ServiceResponse:
+    """Handle the fleet command service."""
+    command = FLEET_COMMANDS[call.data[ATTR_COMMAND]]
+    value = call.data.get(ATTR_VALUE)
+    if command.value is not None:
+        if value is None:
+            raise ServiceValidationError(f"{call.data[ATTR_COMMAND]} requires a value")
+        try:
+            value = command.value(value)
+        except vol.Invalid as err:
+            raise ServiceValidationError(
+                f"Invalid value for {call.data[ATTR_COMMAND]}: {err}"
+            ) from err
+
+    targets, unknown = resolve_fleet_targets(call.hass, call.data)
+    if not targets:
+        raise ServiceValidationError("No Landroid mowers matched the request")
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await async_run_fleet_command(
+        targets,
+        command,
+        value,
+        max_parallel=call.data[ATTR_MAX_PARALLEL],
+        stagger=call.data[ATTR_STAGGER],
+    )
+    for serial_number in unknown:
+        results[serial_number] = {"success": False, "error": UNKNOWN_MOWER_MESSAGE}
+
+    return {
+        "elapsed_ms": round((loop.time() - started) * 1000),
+        "results": results,
+    }
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the account-wide Landroid Cloud services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FLEET_COMMAND,
+        _async_handle_fleet_command,
+        schema=FLEET_COMMAND_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
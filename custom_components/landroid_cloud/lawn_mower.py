@@ -11,12 +11,17 @@ from homeassistant.components.lawn_mower import (
     LawnMowerEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceResponse
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers import entity_platform
+from pyworxcloud import DeviceHandler
 
-from .commands import async_run_cloud_command
-from .entity import LandroidBaseEntity, device_location_attributes
+from .commands import CommandAck
+from .entity import (
+    LandroidBaseEntity,
+    async_add_device_entities,
+    device_location_attributes,
+)
 from .const import (
     MOWER_STATE_EDGECUT,
     MOWER_STATE_ESCAPED_DIGITAL_FENCE,
@@ -27,6 +32,8 @@ from .const import (
     MOWER_STATE_ZONING,
     SERVICE_ADD_EXCLUSION_SCHEDULE,
     SERVICE_ADD_SCHEDULE,
+    SERVICE_ANALYZE_SCHEDULE,
+    SERVICE_APPLY_SCHEDULE_CHANGES,
     SERVICE_CLEAR_NUTRITION,
     SERVICE_DELETE_EXCLUSION_SCHEDULE,
     SERVICE_DELETE_SCHEDULE,
@@ -35,11 +42,15 @@ from .const import (
     SERVICE_OTS,
     SERVICE_SET_BORDER_CUT_SETTINGS,
     SERVICE_SET_EXCLUSION_DAY,
+    SERVICE_SET_EXCLUSION_WEEK,
     SERVICE_SET_NUTRITION,
+    SERVICE_SET_SCHEDULE,
 )
 from .services import (
     async_handle_add_schedule,
     async_handle_add_exclusion_schedule,
+    async_handle_analyze_schedule,
+    async_handle_apply_schedule_changes,
     async_handle_clear_nutrition,
     async_handle_delete_schedule,
     async_handle_delete_exclusion_schedule,
@@ -48,13 +59,17 @@ from .services import (
     async_handle_ots,
     async_handle_set_border_cut_settings,
     async_handle_set_exclusion_day,
+    async_handle_set_exclusion_week,
     async_handle_set_nutrition,
+    async_handle_set_schedule,
     async_register_entity_services,
 )
 
 __all__ = [
     "SERVICE_ADD_EXCLUSION_SCHEDULE",
     "SERVICE_ADD_SCHEDULE",
+    "SERVICE_ANALYZE_SCHEDULE",
+    "SERVICE_APPLY_SCHEDULE_CHANGES",
     "SERVICE_CLEAR_NUTRITION",
     "SERVICE_DELETE_EXCLUSION_SCHEDULE",
     "SERVICE_DELETE_SCHEDULE",
@@ -63,7 +78,9 @@ __all__ = [
     "SERVICE_OTS",
     "SERVICE_SET_BORDER_CUT_SETTINGS",
     "SERVICE_SET_EXCLUSION_DAY",
+    "SERVICE_SET_EXCLUSION_WEEK",
     "SERVICE_SET_NUTRITION",
+    "SERVICE_SET_SCHEDULE",
 ]
 
 STATUS_ACTIVITY_MAP: Final[dict[int, str]] = {
@@ -89,6 +106,20 @@ STATUS_ACTIVITY_MAP: Final[dict[int, str]] = {
     103: MOWER_STATE_SEARCHING_ZONE,
     104: LawnMowerActivity.RETURNING,
 }
+# Activities that confirm a mower acted on a start, pause or dock command.
+STARTED_ACTIVITIES: Final = frozenset(
+    {
+        LawnMowerActivity.MOWING,
+        MOWER_STATE_EDGECUT,
+        MOWER_STATE_SEARCHING_ZONE,
+        MOWER_STATE_STARTING,
+        MOWER_STATE_ZONING,
+    }
+)
+PAUSED_ACTIVITIES: Final = frozenset({LawnMowerActivity.PAUSED})
+DOCKING_ACTIVITIES: Final = frozenset(
+    {LawnMowerActivity.DOCKED, LawnMowerActivity.RETURNING}
+)
 MOWER_DESCRIPTION: Final = LawnMowerEntityEntityDescription(
     key="mower", translation_key="mower"
 )
@@ -104,9 +135,14 @@ async def async_setup_entry(
     platform = entity_platform.async_get_current_platform()
     async_register_entity_services(platform)
 
-    async_add_entities(
-        LandroidCloudMowerEntity(coordinator, entry, serial_number)
-        for serial_number in coordinator.data
+    def _entities_for_device(
+        serial_number: str, device: DeviceHandler
+    ) -> list[LandroidCloudMowerEntity]:
+        del device
+        return [LandroidCloudMowerEntity(coordinator, entry, serial_number)]
+
+    async_add_device_entities(
+        coordinator, entry, async_add_entities, _entities_for_device
     )
 
 
@@ -135,6 +171,11 @@ class LandroidCloudMowerEntity(LandroidBaseEntity, LawnMowerEntity):
     @property
     def activity(self) -> str | None:
         """Return current mower activity."""
+        return self._optimistic_or(self._reported_activity)
+
+    @property
+    def _reported_activity(self) -> str:
+        """Return the activity last reported by the mower."""
         rain_remaining = getattr(
             getattr(self.device, "rainsensor", {}), "get", lambda *_: None
         )("remaining")
@@ -151,46 +192,62 @@ class LandroidCloudMowerEntity(LandroidBaseEntity, LawnMowerEntity):
         """Return legacy GPS attributes for backwards compatibility."""
         return device_location_attributes(self.device)
 
+    def _activity_ack(self, command: str, activities: frozenset[str]) -> CommandAck:
+        """Return an acknowledgement that waits for one of `activities`."""
+        return CommandAck(command, lambda: self._reported_activity in activities)
+
     async def async_start_mowing(self) -> None:
         """Handle start command."""
-        await async_run_cloud_command(
-            lambda: self.coordinator.cloud.start(str(self.device.serial_number))
+        await self.async_run_command(
+            lambda: self.coordinator.cloud.start(str(self.device.serial_number)),
+            ack=self._activity_ack("start_mowing", STARTED_ACTIVITIES),
+            optimistic=LawnMowerActivity.MOWING,
         )
 
     async def async_pause(self) -> None:
         """Handle pause command."""
-        await async_run_cloud_command(
-            lambda: self.coordinator.cloud.pause(str(self.device.serial_number))
+        await self.async_run_command(
+            lambda: self.coordinator.cloud.pause(str(self.device.serial_number)),
+            priority=True,
+            ack=self._activity_ack("pause", PAUSED_ACTIVITIES),
+            optimistic=LawnMowerActivity.PAUSED,
         )
 
     async def async_dock(self) -> None:
         """Handle return-to-dock command."""
-        await async_run_cloud_command(
-            lambda: self.coordinator.cloud.home(str(self.device.serial_number))
+        await self.async_run_command(
+            lambda: self.coordinator.cloud.home(str(self.device.serial_number)),
+            priority=True,
+            ack=self._activity_ack("dock", DOCKING_ACTIVITIES),
+            optimistic=LawnMowerActivity.RETURNING,
         )
 
     async def _async_service_ots(
         self,
         boundary: bool,
         runtime: int,
+        wait_for_ack: bool = False,
     ) -> None:
         """Handle legacy OTS service call."""
         await async_handle_ots(
             self,
             boundary=boundary,
             runtime=runtime,
+            wait_for_ack=wait_for_ack,
         )
 
     async def _async_service_set_border_cut_settings(
         self,
         cut_over_border: bool,
         border_distance_cm: int,
+        wait_for_ack: bool = False,
     ) -> None:
         """Handle border-cut settings service call."""
         await async_handle_set_border_cut_settings(
             self,
             cut_over_border=cut_over_border,
             border_distance_cm=border_distance_cm,
+            wait_for_ack=wait_for_ack,
         )
 
     async def _async_service_add_schedule(
@@ -201,6 +258,7 @@ class LandroidCloudMowerEntity(LandroidBaseEntity, LawnMowerEntity):
         day: str | None = None,
         start: str | None = None,
         boundary: bool | None = None,
+        wait_for_ack: bool = False,
     ) -> None:
         """Add one or more schedule entries."""
         await async_handle_add_schedule(
@@ -210,6 +268,7 @@ class LandroidCloudMowerEntity(LandroidBaseEntity, LawnMowerEntity):
             start=start,
             duration=duration,
             boundary=boundary,
+            wait_for_ack=wait_for_ack,
         )
 
     async def _async_service_edit_schedule(
@@ -221,6 +280,7 @@ class LandroidCloudMowerEntity(LandroidBaseEntity, LawnMowerEntity):
         duration: int,
         current_start: str | None = None,
         boundary: bool | None = None,
+        wait_for_ack: bool = False,
     ) -> None:
         """Replace one schedule entry."""
         await async_handle_edit_schedule(
@@ -231,6 +291,36 @@ class LandroidCloudMowerEntity(LandroidBaseEntity, LawnMowerEntity):
             duration=duration,
             current_start=current_start,
             boundary=boundary,
+            wait_for_ack=wait_for_ack,
+        )
+
+    async def _async_service_apply_schedule_changes(
+        self,
+        *,
+        changes: list[dict],
+        dry_run: bool = False,
+        wait_for_ack: bool = False,
+    ) -> ServiceResponse:
+        """Apply several schedule changes in one schedule write."""
+        return await async_handle_apply_schedule_changes(
+            self, changes=changes, dry_run=dry_run, wait_for_ack=wait_for_ack
+        )
+
+    async def _async_service_set_schedule(
+        self,
+        *,
+        entries: list[dict],
+        time_extension: int | None = None,
+        dry_run: bool = False,
+        wait_for_ack: bool = False,
+    ) -> ServiceResponse:
+        """Replace the whole schedule with as few writes as possible."""
+        return await async_handle_set_schedule(
+            self,
+            entries=entries,
+            time_extension=time_extension,
+            dry_run=dry_run,
+            wait_for_ack=wait_for_ack,
         )
 
     async def _async_service_delete_schedule(
@@ -239,6 +329,7 @@ class LandroidCloudMowerEntity(LandroidBaseEntity, LawnMowerEntity):
         all_schedules: bool = False,
         day: str | None = None,
         start: str | None = None,
+        wait_for_ack: bool = False,
     ) -> None:
         """Delete one schedule entry."""
         await async_handle_delete_schedule(
@@ -246,21 +337,28 @@ class LandroidCloudMowerEntity(LandroidBaseEntity, LawnMowerEntity):
             all_schedules=all_schedules,
             day=day,
             start=start,
+            wait_for_ack=wait_for_ack,
         )
 
-    async def _async_service_set_nutrition(self, *, n: int, p: int, k: int) -> None:
+    async def _async_service_set_nutrition(
+        self, *, n: int, p: int, k: int, wait_for_ack: bool = False
+    ) -> None:
         """Set auto-schedule nutrition values."""
-        await async_handle_set_nutrition(self, n=n, p=p, k=k)
+        await async_handle_set_nutrition(self, n=n, p=p, k=k, wait_for_ack=wait_for_ack)
 
-    async def _async_service_clear_nutrition(self) -> None:
+    async def _async_service_clear_nutrition(
+        self, *, wait_for_ack: bool = False
+    ) -> None:
         """Clear auto-schedule nutrition values."""
-        await async_handle_clear_nutrition(self)
+        await async_handle_clear_nutrition(self, wait_for_ack=wait_for_ack)
 
     async def _async_service_set_exclusion_day(
-        self, *, day: str, exclude_day: bool
+        self, *, day: str, exclude_day: bool, wait_for_ack: bool = False
     ) -> None:
         """Set whether one weekday is fully excluded."""
-        await async_handle_set_exclusion_day(self, day=day, exclude_day=exclude_day)
+        await async_handle_set_exclusion_day(
+            self, day=day, exclude_day=exclude_day, wait_for_ack=wait_for_ack
+        )
 
     async def _async_service_add_exclusion_schedule(
         self,
@@ -269,6 +367,7 @@ class LandroidCloudMowerEntity(LandroidBaseEntity, LawnMowerEntity):
         start: str,
         duration: int,
         reason: str = "generic",
+        wait_for_ack: bool = False,
     ) -> None:
         """Add one exclusion slot."""
         await async_handle_add_exclusion_schedule(
@@ -277,6 +376,7 @@ class LandroidCloudMowerEntity(LandroidBaseEntity, LawnMowerEntity):
             start=start,
             duration=duration,
             reason=reason,
+            wait_for_ack=wait_for_ack,
         )
 
     async def _async_service_edit_exclusion_schedule(
@@ -288,6 +388,7 @@ class LandroidCloudMowerEntity(LandroidBaseEntity, LawnMowerEntity):
         start: str,
         duration: int,
         reason: str = "generic",
+        wait_for_ack: bool = False,
     ) -> None:
         """Replace one exclusion slot."""
         await async_handle_edit_exclusion_schedule(
@@ -298,6 +399,7 @@ class LandroidCloudMowerEntity(LandroidBaseEntity, LawnMowerEntity):
             start=start,
             duration=duration,
             reason=reason,
+            wait_for_ack=wait_for_ack,
         )
 
     async def _async_service_delete_exclusion_schedule(
@@ -305,10 +407,31 @@ class LandroidCloudMowerEntity(LandroidBaseEntity, LawnMowerEntity):
         *,
         day: str,
         start: str | None = None,
+        wait_for_ack: bool = False,
     ) -> None:
         """Delete one exclusion slot."""
         await async_handle_delete_exclusion_schedule(
             self,
             day=day,
             start=start,
+            wait_for_ack=wait_for_ack,
         )
+
+    async def _async_service_set_exclusion_week(
+        self,
+        *,
+        days: dict[str, dict] | None = None,
+        exclude_nights: bool | None = None,
+        wait_for_ack: bool = False,
+    ) -> None:
+        """Replace the exclusion schedule of several weekdays at once."""
+        await async_handle_set_exclusion_week(
+            self,
+            days=days,
+            exclude_nights=exclude_nights,
+            wait_for_ack=wait_for_ack,
+        )
+
+    async def _async_service_analyze_schedule(self) -> ServiceResponse:
+        """Return conflicts and coverage of the mowing schedule."""
+        return async_handle_analyze_schedule(self)
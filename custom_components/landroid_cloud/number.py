@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import voluptuous as vol
 from homeassistant.components.number import (
     NumberEntity,
     NumberEntityDescription,
@@ -12,12 +13,15 @@ from homeassistant.components.number import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, UnitOfArea, UnitOfLength
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from pyworxcloud import DeviceCapability
+from pyworxcloud import DeviceCapability, DeviceHandler
 from pyworxcloud.exceptions import NoCuttingHeightError
 
-from .commands import async_run_cloud_command
-from .entity import LandroidBaseEntity
+from .commands import CommandAck
+from .const import ATTR_FORCE, ATTR_VALUE, SERVICE_SET_NUMBER_VALUE
+from .entity import LandroidBaseEntity, async_add_device_entities
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -135,25 +139,34 @@ async def async_setup_entry(
 ) -> None:
     """Set up Landroid Cloud number entities."""
     coordinator = entry.runtime_data.coordinator
-    entities: list[LandroidNumber] = []
-
-    for serial_number, device in coordinator.data.items():
-        for description in NUMBERS:
-            if description.capability and not device.capabilities.check(
-                description.capability
-            ):
-                continue
-
-            entities.append(
-                LandroidNumber(
-                    coordinator=coordinator,
-                    config_entry=entry,
-                    serial_number=serial_number,
-                    description=description,
-                )
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_SET_NUMBER_VALUE,
+        {
+            vol.Required(ATTR_VALUE): vol.Coerce(float),
+            vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+        },
+        "_async_service_set_value",
+    )
+
+    def _entities_for_device(
+        serial_number: str, device: DeviceHandler
+    ) -> list[LandroidNumber]:
+        return [
+            LandroidNumber(
+                coordinator=coordinator,
+                config_entry=entry,
+                serial_number=serial_number,
+                description=description,
             )
+            for description in NUMBERS
+            if not description.capability
+            or device.capabilities.check(description.capability)
+        ]
 
-    async_add_entities(entities)
+    async_add_device_entities(
+        coordinator, entry, async_add_entities, _entities_for_device
+    )
 
 
 class LandroidNumber(LandroidBaseEntity, NumberEntity):
@@ -178,6 +191,11 @@ class LandroidNumber(LandroidBaseEntity, NumberEntity):
     @property
     def native_value(self) -> float | None:
         """Return number value."""
+        return self._optimistic_or(self._reported_value)
+
+    @property
+    def _reported_value(self) -> float | None:
+        """Return the number value last reported by the mower."""
         serial_number = str(self.device.serial_number)
 
         if self.entity_description.key == "rain_delay":
@@ -205,35 +223,76 @@ class LandroidNumber(LandroidBaseEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new number value."""
+        await self._async_write_value(value)
+
+    async def _async_service_set_value(
+        self, *, value: float, force: bool = False
+    ) -> None:
+        """Set a number value, optionally resending an unchanged one."""
+        minimum, maximum = self.native_min_value, self.native_max_value
+        if not minimum <= value <= maximum:
+            raise HomeAssistantError(
+                f"Value {value:g} is outside {minimum:g}-{maximum:g}"
+            )
+        await self._async_write_value(value, force=force)
+
+    async def _async_write_value(self, value: float, *, force: bool = False) -> None:
+        """Send a number value unless the mower already shows it."""
+        if self._write_is_noop(self.native_value, float(int(value)), force=force):
+            return
+
         serial_number = str(self.device.serial_number)
+        ack = CommandAck(
+            self.entity_description.key, lambda: self._reported_value == int(value)
+        )
 
         if self.entity_description.key == "rain_delay":
-            await async_run_cloud_command(
-                lambda: self.coordinator.cloud.raindelay(serial_number, str(int(value)))
+            await self.async_run_command(
+                lambda: self.coordinator.cloud.raindelay(
+                    serial_number, str(int(value))
+                ),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=float(int(value)),
             )
         elif self.entity_description.key == "cutting_height":
-            await async_run_cloud_command(
+            await self.async_run_command(
                 lambda: self.coordinator.cloud.set_cutting_height(
                     serial_number, int(value)
-                )
+                ),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=float(int(value)),
             )
         elif self.entity_description.key == "time_extension":
-            await async_run_cloud_command(
+            await self.async_run_command(
                 lambda: self.coordinator.cloud.set_time_extension(
                     serial_number, int(value)
-                )
+                ),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=float(int(value)),
             )
         elif self.entity_description.key == "torque":
-            await async_run_cloud_command(
-                lambda: self.coordinator.cloud.set_torque(serial_number, int(value))
+            await self.async_run_command(
+                lambda: self.coordinator.cloud.set_torque(serial_number, int(value)),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=float(int(value)),
             )
         elif self.entity_description.key == "lawn_size":
-            await async_run_cloud_command(
-                lambda: self.coordinator.cloud.set_lawn_size(serial_number, int(value))
+            await self.async_run_command(
+                lambda: self.coordinator.cloud.set_lawn_size(serial_number, int(value)),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=float(int(value)),
             )
         elif self.entity_description.key == "lawn_perimeter":
-            await async_run_cloud_command(
+            await self.async_run_command(
                 lambda: self.coordinator.cloud.set_lawn_perimeter(
                     serial_number, int(value)
-                )
+                ),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=float(int(value)),
             )
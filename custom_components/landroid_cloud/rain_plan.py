@@ -0,0 +1,370 @@
+"""Rain delay and one-time schedule planning around a rain window."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta, tzinfo
+from typing import Any, Final
+
+import voluptuous as vol
+from homeassistant.const import ATTR_AREA_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+from pyworxcloud import ScheduleModel
+from pyworxcloud.exceptions import NoOneTimeScheduleError
+
+from .calendar import DESCRIPTION_EDGE_CUT, expand_pattern, weekly_pattern
+from .const import (
+    ATTR_DRY_RUN,
+    ATTR_DRYING_TIME,
+    ATTR_HOURS,
+    ATTR_MAX_PARALLEL,
+    ATTR_MODE,
+    ATTR_RAIN_END,
+    ATTR_RAIN_START,
+    ATTR_SERIAL_NUMBERS,
+    ATTR_STAGGER,
+    DOMAIN,
+    SERVICE_PLAN_RAIN,
+)
+from .coordinator import LandroidCloudCoordinator
+from .entity import device_timezone
+from .fleet import (
+    FLEET_COMMANDS,
+    FLEET_TARGET_FIELDS,
+    UNKNOWN_MOWER_MESSAGE,
+    async_run_fleet,
+    resolve_fleet_targets,
+)
+
+ACTION_NONE: Final = "none"
+ACTION_RAIN_DELAY: Final = "raindelay"
+ACTION_OTS: Final = "ots"
+
+MODE_AUTO: Final = "auto"
+MODE_SKIP: Final = "skip"
+MODE_MAKE_UP: Final = "make_up"
+RAIN_PLAN_MODES: Final = (MODE_AUTO, MODE_SKIP, MODE_MAKE_UP)
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_RAIN_DELAY: Final = 1440
+MIN_OTS_RUNTIME: Final = 10
+MAX_OTS_RUNTIME: Final = 120
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduledRun:
+    """One occurrence of a scheduled mowing run."""
+
+    start: datetime
+    end: datetime
+    boundary: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class RainPlan:
+    """The one command that handles a rain window for a mower.
+
+    `value` is the rain delay in minutes, or the runtime of the one-time
+    schedule, depending on `action`. `previous_value` is the rain delay the
+    mower reported when the plan was made, and `restore_at` is when a rain
+    delay raised for the window has run out and can be set back to it.
+    """
+
+    action: str
+    value: int | None = None
+    boundary: bool = False
+    lost_minutes: int = 0
+    runs: tuple[ScheduledRun, ...] = ()
+    previous_value: int | None = None
+    restore_at: datetime | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the plan as service response data."""
+        return {
+            "action": self.action,
+            "value": self.value,
+            "boundary": self.boundary,
+            "lost_minutes": self.lost_minutes,
+            "previous_value": self.previous_value,
+            "restore_at": (
+                self.restore_at.isoformat() if self.restore_at is not None else None
+            ),
+            "runs": [
+                {"start": run.start.isoformat(), "end": run.end.isoformat()}
+                for run in self.runs
+            ],
+        }
+
+
+def scheduled_runs(
+    schedule: ScheduleModel | None, tz: tzinfo, start: datetime, end: datetime
+) -> list[ScheduledRun]:
+    """Return the mowing runs of a schedule overlapping a time range."""
+    return [
+        ScheduledRun(
+            start=event.start,
+            end=event.end,
+            boundary=event.description == DESCRIPTION_EDGE_CUT,
+        )
+        for event in expand_pattern(weekly_pattern(schedule), tz, start, end)
+    ]
+
+
+def _minutes(delta: timedelta) -> int:
+    """Return a duration in whole minutes, rounded up."""
+    return max(0, math.ceil(delta.total_seconds() / 60))
+
+
+def plan_rain(
+    runs: list[ScheduledRun],
+    *,
+    now: datetime,
+    rain_start: datetime,
+    rain_end: datetime,
+    drying_time: int = 0,
+    mode: str = MODE_AUTO,
+    current_rain_delay: int | None = None,
+) -> RainPlan:
+    """Plan the rain delay or one-time schedule for one rain window.
+
+    The rain sensor keeps a mower docked while it rains and for the rain
+    delay after the sensor dries, taken here as the end of the window. The
+    lawn counts as wet for `drying_time` minutes after that.
+
+    To skip, the rain delay is set to the smallest value that keeps the
+    mower docked until the last run the wet lawn overlaps has ended. It is
+    only ever raised: a mower whose current delay already covers the runs is
+    left alone. The rain delay is a persistent mower setting, so the plan
+    says when the raised delay has run out and the previous one can be set
+    back. To make up, the mowing the window cost is sent as one one-time
+    schedule, which only makes sense once the lawn is dry. `auto` skips while the window is
+    still ahead and makes up once it has passed.
+    """
+    wet_until = rain_end + timedelta(minutes=drying_time)
+    if mode == MODE_AUTO:
+        mode = MODE_MAKE_UP if now >= wet_until else MODE_SKIP
+
+    if mode == MODE_SKIP:
+        # Runs that end while it still rains are stopped by the sensor alone.
+        affected = tuple(
+            run for run in runs if run.end > rain_end and run.start < wet_until
+        )
+        if not affected:
+            return RainPlan(ACTION_NONE, previous_value=current_rain_delay)
+        rain_delay = min(
+            MAX_RAIN_DELAY, _minutes(max(run.end for run in affected) - rain_end)
+        )
+        covered = current_rain_delay is not None and rain_delay <= current_rain_delay
+        return RainPlan(
+            ACTION_NONE if covered else ACTION_RAIN_DELAY,
+            value=rain_delay,
+            lost_minutes=sum(
+                _minutes(run.end - max(run.start, rain_start)) for run in affected
+            ),
+            runs=affected,
+            previous_value=current_rain_delay,
+            restore_at=rain_end + timedelta(minutes=rain_delay),
+        )
+
+    affected = tuple(
+        run for run in runs if run.end > rain_start and run.start < wet_until
+    )
+    lost_minutes = sum(
+        _minutes(min(run.end, wet_until) - max(run.start, rain_start))
+        for run in affected
+    )
+    if not lost_minutes:
+        return RainPlan(ACTION_NONE)
+    return RainPlan(
+        ACTION_OTS,
+        value=min(MAX_OTS_RUNTIME, max(MIN_OTS_RUNTIME, lost_minutes)),
+        boundary=any(run.boundary for run in affected),
+        lost_minutes=lost_minutes,
+        runs=affected,
+    )
+
+
+async def async_send_rain_plan(
+    coordinator: LandroidCloudCoordinator, serial_number: str, plan: RainPlan
+) -> None:
+    """Send the command of a rain plan through the mower's command queue.
+
+    A rain delay is written to the mower's settings and outlasts the rain
+    window, so the previous delay is set back at the plan's `restore_at`.
+    A plan whose window is covered by a delay raised earlier keeps that
+    delay in place until the later of the two restore times.
+    """
+    if plan.action == ACTION_RAIN_DELAY:
+        command = FLEET_COMMANDS[ACTION_RAIN_DELAY]
+        await coordinator.command_queue.async_run(
+            serial_number,
+            lambda: command.send(coordinator.cloud, serial_number, plan.value),
+            key=command.key,
+        )
+        if plan.previous_value is not None and plan.restore_at is not None:
+            _schedule_restore(coordinator, serial_number, plan, plan.value)
+    elif plan.action == ACTION_NONE and plan.restore_at is not None:
+        if (pending := coordinator.rain_delay_restore(serial_number)) is not None:
+            _schedule_restore(coordinator, serial_number, plan, pending.raised)
+    elif plan.action == ACTION_OTS:
+        try:
+            await coordinator.command_queue.async_run(
+                serial_number,
+                lambda: coordinator.cloud.ots(serial_number, plan.boundary, plan.value),
+            )
+        except HomeAssistantError as err:
+            if isinstance(err.__cause__, NoOneTimeScheduleError):
+                raise HomeAssistantError(
+                    "Mower does not support one-time schedule"
+                ) from err
+            raise
+        coordinator.record_one_time_run(serial_number, plan.value)
+
+
+def _schedule_restore(
+    coordinator: LandroidCloudCoordinator,
+    serial_number: str,
+    plan: RainPlan,
+    raised: int,
+) -> None:
+    """Set the rain delay back to the plan's previous value at `restore_at`."""
+
+    async def _async_restore(previous: int, raised: int) -> None:
+        device = coordinator.data.get(serial_number)
+        current = getattr(device, "rainsensor", {}).get("delay")
+        if current is None or int(current) != raised:
+            # The delay was changed since it was raised; leave it to the user.
+            _LOGGER.debug(
+                "Not restoring the rain delay of %s: it is now %s",
+                serial_number,
+                current,
+            )
+            return
+        command = FLEET_COMMANDS[ACTION_RAIN_DELAY]
+        try:
+            await coordinator.command_queue.async_run(
+                serial_number,
+                lambda: command.send(coordinator.cloud, serial_number, previous),
+                key=command.key,
+            )
+        except HomeAssistantError as err:
+            _LOGGER.warning(
+                "Could not restore the rain delay of %s to %s minutes: %s",
+                serial_number,
+                previous,
+                err,
+            )
+
+    coordinator.schedule_rain_delay_restore(
+        serial_number,
+        previous=plan.previous_value,
+        raised=raised,
+        when=plan.restore_at,
+        restore=_async_restore,
+    )
+
+
+PLAN_RAIN_SCHEMA: Final = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_RAIN_START): cv.datetime,
+            vol.Required(ATTR_RAIN_END): cv.datetime,
+            vol.Optional(ATTR_HOURS, default=24): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=168)
+            ),
+            vol.Optional(ATTR_DRYING_TIME, default=0): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=MAX_RAIN_DELAY)
+            ),
+            vol.Optional(ATTR_MODE, default=MODE_AUTO): vol.In(RAIN_PLAN_MODES),
+            vol.Optional(ATTR_DRY_RUN, default=False): cv.boolean,
+            **FLEET_TARGET_FIELDS,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_SERIAL_NUMBERS, ATTR_AREA_ID),
+)
+
+
+async def _async_handle_plan_rain(call: ServiceCall) -> ServiceResponse:
+    """Handle the plan rain service."""
+    now = dt_util.utcnow()
+    rain_start = dt_util.as_utc(call.data.get(ATTR_RAIN_START, now))
+    rain_end = dt_util.as_utc(call.data[ATTR_RAIN_END])
+    if rain_end <= rain_start:
+        raise ServiceValidationError("The rain window must end after it starts")
+    drying_time = call.data[ATTR_DRYING_TIME]
+    mode = call.data[ATTR_MODE]
+    if mode == MODE_MAKE_UP and rain_end + timedelta(minutes=drying_time) > now:
+        raise ServiceValidationError(
+            "Mowing can only be made up once the rain window and drying time are over"
+        )
+    horizon = now + timedelta(hours=call.data[ATTR_HOURS])
+    dry_run = call.data[ATTR_DRY_RUN]
+
+    targets, unknown = resolve_fleet_targets(call.hass, call.data)
+    if not targets:
+        raise ServiceValidationError("No Landroid mowers matched the request")
+
+    async def _async_plan(
+        coordinator: LandroidCloudCoordinator, serial_number: str
+    ) -> dict[str, Any]:
+        device = coordinator.data[serial_number]
+        current_rain_delay = getattr(device, "rainsensor", {}).get("delay")
+        plan = plan_rain(
+            scheduled_runs(
+                coordinator.cloud.get_schedule(serial_number),
+                device_timezone(device),
+                min(rain_start, now),
+                horizon,
+            ),
+            now=now,
+            rain_start=rain_start,
+            rain_end=rain_end,
+            drying_time=drying_time,
+            mode=mode,
+            current_rain_delay=(
+                None if current_rain_delay is None else int(current_rain_delay)
+            ),
+        )
+        if not dry_run:
+            await async_send_rain_plan(coordinator, serial_number, plan)
+        return plan.as_dict()
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await async_run_fleet(
+        targets,
+        _async_plan,
+        max_parallel=call.data[ATTR_MAX_PARALLEL],
+        stagger=call.data[ATTR_STAGGER],
+    )
+    for serial_number in unknown:
+        results[serial_number] = {"success": False, "error": UNKNOWN_MOWER_MESSAGE}
+
+    return {
+        "elapsed_ms": round((loop.time() - started) * 1000),
+        "dry_run": dry_run,
+        "results": results,
+    }
+
+
+def async_setup_rain_plan_services(hass: HomeAssistant) -> None:
+    """Register the rain planning service."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PLAN_RAIN,
+        _async_handle_plan_rain,
+        schema=PLAN_RAIN_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,267 @@
+"""Conflict analysis for Landroid mowing and exclusion schedules."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Final
+
+from pyworxcloud import ScheduleEntry, ScheduleModel
+
+from .const import DAY_MAP
+
+MINUTES_PER_DAY: Final = 24 * 60
+MINUTES_PER_WEEK: Final = 7 * MINUTES_PER_DAY
+DAY_INDEX: Final[dict[str, int]] = {name: index for index, name in DAY_MAP.items()}
+
+CONFLICT_EXCEEDS_DAY: Final = "exceeds_day"
+CONFLICT_EXCLUSION: Final = "exclusion_overlap"
+CONFLICT_MIDNIGHT: Final = "midnight_overlap"
+CONFLICT_OVERLAP: Final = "schedule_overlap"
+
+type _Segment = tuple[int, int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleConflict:
+    """One problem found in a weekly mowing schedule.
+
+    `minutes` is the overlap, or for `exceeds_day` the time past 24 hours.
+    `other` names the entry or exclusion the schedule entry collides with.
+    """
+
+    kind: str
+    entry_id: str
+    day: str
+    start: str
+    minutes: int
+    other: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the conflict as service response and attribute data."""
+        conflict: dict[str, Any] = {
+            "type": self.kind,
+            "entry_id": self.entry_id,
+            "day": self.day,
+            "start": self.start,
+            "minutes": self.minutes,
+        }
+        if self.other is not None:
+            conflict["with"] = self.other
+        return conflict
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleAnalysis:
+    """Result of analyzing one mower's weekly schedule."""
+
+    conflicts: tuple[ScheduleConflict, ...]
+    weekly_minutes: int
+    effective_minutes: int
+
+    @property
+    def coverage(self) -> float:
+        """Return the share of scheduled mowing time that can run, in percent."""
+        if not self.weekly_minutes:
+            return 0.0
+        return round(self.effective_minutes / self.weekly_minutes * 100, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the analysis as service response and attribute data."""
+        return {
+            "weekly_minutes": self.weekly_minutes,
+            "effective_minutes": self.effective_minutes,
+            "coverage": self.coverage,
+            "conflicts": [conflict.as_dict() for conflict in self.conflicts],
+        }
+
+
+def week_minute(day_index: int, start: str) -> int:
+    """Return the minute of the week a weekday and HH:MM start fall on."""
+    hour, minute = start.split(":")
+    return day_index * MINUTES_PER_DAY + int(hour) * 60 + int(minute)
+
+
+def _week_segments(start: int, duration: int, ref: int) -> list[_Segment]:
+    """Return an interval as segments, wrapping from Saturday into Sunday."""
+    end = start + min(duration, MINUTES_PER_WEEK)
+    if end <= MINUTES_PER_WEEK:
+        return [(start, end, ref)]
+    return [(start, MINUTES_PER_WEEK, ref), (0, end - MINUTES_PER_WEEK, ref)]
+
+
+def _union(segments: Sequence[_Segment]) -> list[tuple[int, int]]:
+    """Merge sorted segments into disjoint intervals."""
+    merged: list[tuple[int, int]] = []
+    for start, end, _ in segments:
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _uncovered_minutes(
+    intervals: list[tuple[int, int]], removed: list[tuple[int, int]]
+) -> int:
+    """Return the minutes of merged `intervals` outside merged `removed`."""
+    total = 0
+    first = 0
+    for start, end in intervals:
+        while first < len(removed) and removed[first][1] <= start:
+            first += 1
+        covered = 0
+        for removed_start, removed_end in removed[first:]:
+            if removed_start >= end:
+                break
+            covered += min(end, removed_end) - max(start, removed_start)
+        total += end - start - covered
+    return total
+
+
+def extended_duration(entry: ScheduleEntry, time_extension: int) -> int:
+    """Return the entry duration with the schedule time extension applied."""
+    # Same rounding as the slots pyworxcloud reports as `duration_extended`.
+    return int(int(entry.duration) * (1 + time_extension / 100))
+
+
+def _exclusion_segments(
+    exclusion_days: Sequence[dict],
+) -> tuple[list[_Segment], list[str]]:
+    """Return sorted exclusion segments and the label each one refers to."""
+    segments: list[_Segment] = []
+    labels: list[str] = []
+    for index, day in enumerate(exclusion_days[: len(DAY_MAP)]):
+        if day.get("exclude_day"):
+            segments.append(
+                (index * MINUTES_PER_DAY, (index + 1) * MINUTES_PER_DAY, len(labels))
+            )
+            labels.append(f"{DAY_MAP[index]} (excluded day)")
+        for slot in day.get("slots", []):
+            start = int(slot.get("start_time", 0))
+            duration = int(slot.get("duration", 0))
+            if duration <= 0:
+                continue
+            segments.extend(
+                _week_segments(index * MINUTES_PER_DAY + start, duration, len(labels))
+            )
+            labels.append(
+                f"{DAY_MAP[index]} {start // 60:02d}:{start % 60:02d}"
+                f" ({slot.get('reason', 'generic')})"
+            )
+    segments.sort()
+    return segments, labels
+
+
+def analyze_schedule(
+    schedule: ScheduleModel | None, exclusion_days: Sequence[dict] = ()
+) -> ScheduleAnalysis:
+    """Check a weekly schedule against itself and the exclusion schedule.
+
+    Every mowing entry, with the time extension applied, and every exclusion
+    is laid out as an interval of minutes of the week. The intervals are
+    sorted once and each one is only compared with the intervals it can
+    overlap, so the analysis takes O(n log n + k) for n entries and
+    exclusion slots and k overlapping pairs.
+    """
+    entries: list[ScheduleEntry] = []
+    starts: list[int] = []
+    durations: list[int] = []
+    conflicts: list[ScheduleConflict] = []
+    mowing: list[_Segment] = []
+    time_extension = int(getattr(schedule, "time_extension", None) or 0)
+
+    for entry in getattr(schedule, "entries", []):
+        duration = extended_duration(entry, time_extension)
+        if duration <= 0:
+            continue
+        if duration > MINUTES_PER_DAY:
+            conflicts.append(
+                ScheduleConflict(
+                    kind=CONFLICT_EXCEEDS_DAY,
+                    entry_id=entry.entry_id,
+                    day=entry.day,
+                    start=entry.start,
+                    minutes=duration - MINUTES_PER_DAY,
+                )
+            )
+        start = week_minute(DAY_INDEX[entry.day], entry.start)
+        mowing.extend(_week_segments(start, duration, len(entries)))
+        entries.append(entry)
+        starts.append(start)
+        durations.append(duration)
+    mowing.sort()
+
+    overlaps: dict[tuple[int, int], int] = {}
+    for index, (_, end, ref) in enumerate(mowing):
+        for other_start, other_end, other_ref in mowing[index + 1 :]:
+            if other_start >= end:
+                break
+            if other_ref == ref:
+                continue
+            # Report the pair against the entry that runs into the other one.
+            pair = (ref, other_ref)
+            if (starts[other_ref] - starts[ref]) % MINUTES_PER_WEEK >= durations[ref]:
+                pair = (other_ref, ref)
+            overlaps[pair] = overlaps.get(pair, 0) + min(end, other_end) - other_start
+    for (ref, other_ref), minutes in overlaps.items():
+        entry, other = entries[ref], entries[other_ref]
+        conflicts.append(
+            ScheduleConflict(
+                kind=CONFLICT_OVERLAP if entry.day == other.day else CONFLICT_MIDNIGHT,
+                entry_id=entry.entry_id,
+                day=entry.day,
+                start=entry.start,
+                minutes=minutes,
+                other=other.entry_id,
+            )
+        )
+
+    excluded, labels = _exclusion_segments(exclusion_days)
+    excluded_starts = [start for start, _, _ in excluded]
+    longest = max((end - start for start, end, _ in excluded), default=0)
+    blocked: dict[tuple[int, int], int] = {}
+    first = 0
+    for start, end, ref in mowing:
+        # Exclusions starting more than `longest` minutes earlier have ended.
+        while first < len(excluded) and excluded_starts[first] < start - longest:
+            first += 1
+        for excluded_start, excluded_end, label in excluded[
+            first : bisect_left(excluded_starts, end, lo=first)
+        ]:
+            if excluded_end <= start:
+                continue
+            pair = (ref, label)
+            blocked[pair] = (
+                blocked.get(pair, 0)
+                + min(end, excluded_end)
+                - max(start, excluded_start)
+            )
+    for (ref, label), minutes in blocked.items():
+        entry = entries[ref]
+        conflicts.append(
+            ScheduleConflict(
+                kind=CONFLICT_EXCLUSION,
+                entry_id=entry.entry_id,
+                day=entry.day,
+                start=entry.start,
+                minutes=minutes,
+                other=labels[label],
+            )
+        )
+
+    conflicts.sort(
+        key=lambda conflict: (
+            DAY_INDEX[conflict.day],
+            conflict.start,
+            conflict.kind,
+            conflict.other or "",
+        )
+    )
+    return ScheduleAnalysis(
+        conflicts=tuple(conflicts),
+        weekly_minutes=sum(durations),
+        effective_minutes=_uncovered_minutes(_union(mowing), _union(excluded)),
+    )
@@ -0,0 +1,199 @@
+"""Minimal-change write planning for Landroid schedules."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Final
+
+from pyworxcloud import ScheduleEntry, ScheduleModel
+
+from .schedule_analysis import DAY_INDEX
+
+OPERATION_ADD: Final = "add"
+OPERATION_UPDATE: Final = "update"
+OPERATION_DELETE: Final = "delete"
+
+WRITE_NONE: Final = "none"
+WRITE_ENTRY: Final = "entry"
+WRITE_SCHEDULE: Final = "schedule"
+
+_PROTOCOL_ZERO_SOURCES: Final = ("primary", "secondary")
+
+# Entries are paired on the full key first, then on looser keys, so an entry
+# that kept its day and start is never turned into a move of another one.
+_MATCH_KEYS: Final[tuple[Callable[[ScheduleEntry], Hashable], ...]] = (
+    lambda entry: (entry.day, entry.start, entry.source),
+    lambda entry: (entry.day, entry.start),
+    lambda entry: (entry.day, entry.source),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleOperation:
+    """One per-entry change between the current and the desired schedule.
+
+    `entry` is the entry to add, the replacement of `entry_id`, or for a
+    delete the entry being removed.
+    """
+
+    action: str
+    entry: ScheduleEntry
+    entry_id: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the operation as service response data."""
+        return {
+            "action": self.action,
+            "entry_id": self.entry_id,
+            "day": self.entry.day,
+            "start": self.entry.start,
+            "duration": int(self.entry.duration),
+            "boundary": self.entry.boundary,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class SchedulePlan:
+    """The changes needed to reach a schedule and how they will be sent."""
+
+    desired: ScheduleModel
+    operations: tuple[ScheduleOperation, ...]
+    settings_changed: bool
+
+    @property
+    def write(self) -> str:
+        """Return whether nothing, one entry or the whole schedule is sent.
+
+        Each pyworxcloud per-entry helper re-sends the whole schedule, so one
+        operation costs as many round trips as a full write. A lone entry
+        change is still sent on its own, as it is applied to the schedule
+        pyworxcloud holds when it goes out instead of to this snapshot.
+        """
+        if self.settings_changed or len(self.operations) > 1:
+            return WRITE_SCHEDULE
+        if self.operations:
+            return WRITE_ENTRY
+        return WRITE_NONE
+
+    @property
+    def round_trips(self) -> int:
+        """Return the number of cloud writes the plan takes."""
+        return 0 if self.write == WRITE_NONE else 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the plan as service response data."""
+        return {
+            "write": self.write,
+            "round_trips": self.round_trips,
+            "entry_round_trips": len(self.operations) + self.settings_changed,
+            "settings_changed": self.settings_changed,
+            "operations": [operation.as_dict() for operation in self.operations],
+        }
+
+
+def _entry_changed(current: ScheduleEntry, desired: ScheduleEntry) -> bool:
+    """Return whether a matched entry needs to be rewritten."""
+    return (current.day, current.start, int(current.duration), current.boundary) != (
+        desired.day,
+        desired.start,
+        int(desired.duration),
+        desired.boundary,
+    )
+
+
+def _sort_key(entry: ScheduleEntry) -> tuple[int, str]:
+    """Order entries by weekday and start."""
+    return DAY_INDEX[entry.day], entry.start
+
+
+def plan_schedule_write(current: ScheduleModel, desired: ScheduleModel) -> SchedulePlan:
+    """Diff two schedules entry by entry and choose how to send the result.
+
+    Entries are matched on day, start and source, then on day and start,
+    and what is left on the same day and source is paired as a moved entry.
+    Unmatched current entries are deleted and unmatched desired entries are
+    added; matched entries are updated when their timing or edge cut differ.
+    """
+    remaining = sorted(
+        (entry for entry in current.entries if entry.duration > 0), key=_sort_key
+    )
+    wanted = sorted(
+        (entry for entry in desired.entries if entry.duration > 0), key=_sort_key
+    )
+    matches: list[tuple[ScheduleEntry, ScheduleEntry]] = []
+    for match_key in _MATCH_KEYS:
+        candidates: dict[Hashable, list[ScheduleEntry]] = {}
+        for entry in remaining:
+            candidates.setdefault(match_key(entry), []).append(entry)
+        unmatched: list[ScheduleEntry] = []
+        for entry in wanted:
+            if same_key := candidates.get(match_key(entry)):
+                matches.append((same_key.pop(0), entry))
+            else:
+                unmatched.append(entry)
+        remaining = sorted(
+            (entry for entries in candidates.values() for entry in entries),
+            key=_sort_key,
+        )
+        wanted = unmatched
+
+    operations = [
+        ScheduleOperation(
+            OPERATION_UPDATE,
+            ScheduleEntry(
+                entry_id=old.entry_id,
+                day=new.day,
+                start=new.start,
+                duration=new.duration,
+                boundary=new.boundary,
+                source=old.source,
+                secondary=old.secondary,
+            ),
+            old.entry_id,
+        )
+        for old, new in matches
+        if _entry_changed(old, new)
+    ]
+    operations.extend(
+        ScheduleOperation(OPERATION_DELETE, entry, entry.entry_id)
+        for entry in remaining
+    )
+
+    # Added protocol 0 entries take a slot the kept entries leave free.
+    used: dict[str, set[str]] = {}
+    for old, _ in matches:
+        used.setdefault(old.day, set()).add(old.source)
+    for entry in wanted:
+        source = entry.source
+        if current.protocol == 0:
+            day_sources = used.setdefault(entry.day, set())
+            source = next(
+                (slot for slot in _PROTOCOL_ZERO_SOURCES if slot not in day_sources),
+                source,
+            )
+            day_sources.add(source)
+        operations.append(
+            ScheduleOperation(
+                OPERATION_ADD,
+                ScheduleEntry(
+                    entry_id="",
+                    day=entry.day,
+                    start=entry.start,
+                    duration=entry.duration,
+                    boundary=entry.boundary,
+                    source=source,
+                    secondary=source == "secondary",
+                ),
+            )
+        )
+
+    operations.sort(key=lambda operation: _sort_key(operation.entry))
+    return SchedulePlan(
+        desired=desired,
+        operations=tuple(operations),
+        settings_changed=(
+            current.enabled != desired.enabled
+            or current.time_extension != desired.time_extension
+        ),
+    )
@@ -0,0 +1,162 @@
+"""Canonical snapshots of Landroid schedules for storing and comparing them."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping, Sequence
+from typing import Any, Final
+
+from pyworxcloud import ScheduleEntry, ScheduleModel
+from pyworxcloud.utils.schedule_codec import (
+    add_schedule_entry as add_schedule_entry_model,
+)
+
+from .schedule_analysis import DAY_INDEX
+
+AUTO_SCHEDULE_SETTINGS: Final = (
+    "boost",
+    "grass_type",
+    "soil_type",
+    "irrigation",
+    "nutrition",
+)
+
+
+def _entry_sort_key(entry: Mapping[str, Any]) -> tuple[int, str, int]:
+    """Order snapshot entries by weekday, start and duration."""
+    return DAY_INDEX[entry["day"]], entry["start"], entry["duration"]
+
+
+def schedule_snapshot(schedule: ScheduleModel) -> dict[str, Any]:
+    """Return the mowing entries and time extension of a schedule.
+
+    Entry ids, protocol 0 sources and protocol 1 slot metadata are left out,
+    so the same weekly plan has the same snapshot on every mower.
+    """
+    return {
+        "time_extension": schedule.time_extension,
+        "entries": sorted(
+            (
+                {
+                    "day": entry.day,
+                    "start": entry.start,
+                    "duration": int(entry.duration),
+                    "boundary": entry.boundary,
+                }
+                for entry in schedule.entries
+                if entry.duration > 0
+            ),
+            key=_entry_sort_key,
+        ),
+    }
+
+
+def schedule_from_snapshot(
+    current: ScheduleModel, snapshot: Mapping[str, Any]
+) -> ScheduleModel:
+    """Return the schedule a snapshot describes, in the protocol of `current`.
+
+    The enabled flag of `current` is kept. Protocol 0 mowers take at most two
+    entries per day, so a snapshot with more raises ValueError.
+    """
+    if current.protocol == 0:
+        time_extension = snapshot.get("time_extension")
+        if time_extension is None:
+            time_extension = current.time_extension
+    else:
+        time_extension = None
+    schedule = ScheduleModel(
+        enabled=current.enabled,
+        time_extension=time_extension,
+        entries=[],
+        protocol=current.protocol,
+    )
+
+    per_day: dict[str, int] = {}
+    for item in sorted(snapshot["entries"], key=_entry_sort_key):
+        boundary = item.get("boundary")
+        if current.protocol == 0:
+            per_day[item["day"]] = per_day.get(item["day"], 0) + 1
+            if per_day[item["day"]] > 2:
+                raise ValueError(
+                    f"This mower supports at most two schedules on {item['day']}"
+                )
+            source = "primary" if per_day[item["day"]] == 1 else "secondary"
+            boundary = bool(boundary)
+        else:
+            source = "slot"
+        schedule = add_schedule_entry_model(
+            schedule,
+            ScheduleEntry(
+                entry_id="",
+                day=item["day"],
+                start=item["start"],
+                duration=int(item["duration"]),
+                boundary=boundary,
+                source=source,
+                secondary=source == "secondary",
+            ),
+        )
+    return schedule
+
+
+def exclusion_snapshot(
+    days: Sequence[Mapping[str, Any]], exclude_nights: bool | None
+) -> dict[str, Any]:
+    """Return the exclusion week with slots in a canonical order and shape."""
+    return {
+        "exclude_nights": exclude_nights,
+        "days": [
+            {
+                "exclude_day": bool(day.get("exclude_day", False)),
+                "slots": sorted(
+                    (
+                        {
+                            "start_time": int(slot.get("start_time", 0)),
+                            "duration": int(slot.get("duration", 0)),
+                            "reason": str(slot.get("reason", "generic")),
+                        }
+                        for slot in day.get("slots", [])
+                    ),
+                    key=lambda slot: slot["start_time"],
+                ),
+            }
+            for day in days
+        ],
+    }
+
+
+def auto_schedule_snapshot(settings: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the auto-schedule settings a mower reports, in canonical form.
+
+    Settings the mower does not report are left out. Nutrition is either
+    None or its n, p and k values.
+    """
+    snapshot: dict[str, Any] = {}
+    for name in AUTO_SCHEDULE_SETTINGS:
+        if name not in settings:
+            continue
+        value = settings[name]
+        if name == "nutrition":
+            value = (
+                {key: int(value.get(key, 0)) for key in ("n", "p", "k")}
+                if isinstance(value, Mapping)
+                else None
+            )
+        elif name == "boost" and value is not None:
+            value = int(value)
+        elif name == "irrigation" and value is not None:
+            value = bool(value)
+        snapshot[name] = value
+    return snapshot
+
+
+def snapshot_json(snapshot: Mapping[str, Any]) -> str:
+    """Return a snapshot as compact JSON with sorted keys."""
+    return json.dumps(snapshot, sort_keys=True, separators=(",", ":"))
+
+
+def snapshot_hash(snapshot: Mapping[str, Any]) -> str:
+    """Return a stable hash of a snapshot."""
+    return hashlib.blake2b(snapshot_json(snapshot).encode(), digest_size=16).hexdigest()
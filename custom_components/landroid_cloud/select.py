@@ -5,20 +5,30 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Final
 
+import voluptuous as vol
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from pyworxcloud import DeviceHandler
 
-from .commands import async_run_cloud_command
+from .commands import CommandAck
 from .const import (
+    ATTR_FORCE,
+    ATTR_OPTION,
     AUTO_SCHEDULE_BOOST_OPTIONS,
     AUTO_SCHEDULE_GRASS_TYPE_OPTIONS,
     AUTO_SCHEDULE_SOIL_TYPE_OPTIONS,
+    SERVICE_SELECT_OPTION,
+)
+from .entity import (
+    LandroidBaseEntity,
+    async_add_device_entities,
+    auto_schedule_settings,
 )
-from .entity import LandroidBaseEntity, auto_schedule_settings
 
 
 def _configured_legacy_zone_options(device) -> list[str]:
@@ -139,31 +149,40 @@ async def async_setup_entry(
 ) -> None:
     """Set up Landroid Cloud select entities."""
     coordinator = entry.runtime_data.coordinator
-    entities: list[SelectEntity] = []
-
-    for serial_number in coordinator.data:
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_SELECT_OPTION,
+        {
+            vol.Required(ATTR_OPTION): cv.string,
+            vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+        },
+        "_async_service_select_option",
+    )
+
+    def _entities_for_device(
+        serial_number: str, device: DeviceHandler
+    ) -> list[SelectEntity]:
+        del device
+        entities: list[SelectEntity] = []
         for description in SELECTS:
-            if description.key == "zone":
-                entities.append(
-                    LandroidZoneSelect(
-                        coordinator=coordinator,
-                        config_entry=entry,
-                        serial_number=serial_number,
-                        description=description,
-                    )
-                )
-                continue
-
+            entity_class = (
+                LandroidZoneSelect
+                if description.key == "zone"
+                else LandroidAutoScheduleSelect
+            )
             entities.append(
-                LandroidAutoScheduleSelect(
+                entity_class(
                     coordinator=coordinator,
                     config_entry=entry,
                     serial_number=serial_number,
                     description=description,
                 )
             )
+        return entities
 
-    async_add_entities(entities)
+    async_add_device_entities(
+        coordinator, entry, async_add_entities, _entities_for_device
+    )
 
 
 class LandroidZoneSelect(LandroidBaseEntity, SelectEntity):
@@ -193,7 +212,17 @@ class LandroidZoneSelect(LandroidBaseEntity, SelectEntity):
     @property
     def current_option(self) -> str | None:
         """Return current selected zone."""
-        return _current_zone_option(self.device)
+        return self._optimistic_or(_current_zone_option(self.device))
+
+    async def _async_service_select_option(
+        self, *, option: str, force: bool = False
+    ) -> None:
+        """Select a zone.
+
+        Zone writes are never suppressed, so `force` has no effect here.
+        """
+        del force
+        await self.async_select_option(option)
 
     async def async_select_option(self, option: str) -> None:
         """Set selected zone."""
@@ -203,8 +232,11 @@ class LandroidZoneSelect(LandroidBaseEntity, SelectEntity):
             )
         zone = _selected_legacy_zone_index(option)
         serial_number = str(self.device.serial_number)
-        await async_run_cloud_command(
-            lambda: self.coordinator.cloud.setzone(serial_number, zone)
+        await self.async_run_command(
+            lambda: self.coordinator.cloud.setzone(serial_number, zone),
+            key="zone",
+            ack=CommandAck("zone", lambda: _current_zone_option(self.device) == option),
+            optimistic=option,
         )
 
 
@@ -236,6 +268,11 @@ class LandroidAutoScheduleSelect(LandroidBaseEntity, SelectEntity):
     @property
     def current_option(self) -> str | None:
         """Return the current selected option."""
+        return self._optimistic_or(self._reported_option)
+
+    @property
+    def _reported_option(self) -> str | None:
+        """Return the option last reported by the mower."""
         key = self.entity_description.key
         if key == "auto_schedule_boost":
             return _auto_schedule_setting_option(self.device, "boost")
@@ -247,26 +284,50 @@ class LandroidAutoScheduleSelect(LandroidBaseEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Apply the selected option."""
+        await self._async_apply_option(option)
+
+    async def _async_service_select_option(
+        self, *, option: str, force: bool = False
+    ) -> None:
+        """Apply an option, optionally resending an unchanged one."""
+        await self._async_apply_option(option, force=force)
+
+    async def _async_apply_option(self, option: str, *, force: bool = False) -> None:
+        """Send the selected option unless the mower already uses it."""
         serial_number = str(self.device.serial_number)
 
         if option not in self.entity_description.options:
             raise HomeAssistantError(f"Invalid option: {option}")
+        if self._write_is_noop(self.current_option, option, force=force):
+            return
 
+        ack = CommandAck(
+            self.entity_description.key, lambda: self._reported_option == option
+        )
         if self.entity_description.key == "auto_schedule_boost":
-            await async_run_cloud_command(
+            await self.async_run_command(
                 lambda: self.coordinator.cloud.set_auto_schedule_boost(
                     serial_number, int(option)
-                )
+                ),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=option,
             )
         elif self.entity_description.key == "auto_schedule_grass_type":
-            await async_run_cloud_command(
+            await self.async_run_command(
                 lambda: self.coordinator.cloud.set_auto_schedule_grass_type(
                     serial_number, option
-                )
+                ),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=option,
             )
         elif self.entity_description.key == "auto_schedule_soil_type":
-            await async_run_cloud_command(
+            await self.async_run_command(
                 lambda: self.coordinator.cloud.set_auto_schedule_soil_type(
                     serial_number, option
-                )
+                ),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=option,
             )
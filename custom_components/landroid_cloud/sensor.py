@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta, timezone
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from datetime import UTC, datetime, timedelta
+from time import monotonic
 
 from homeassistant.components.sensor import (
+    DOMAIN as SENSOR_DOMAIN,
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
@@ -23,17 +25,33 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from pyworxcloud.day_map import DAY_MAP
 
-from .const import ERROR_STATE_MAP, ERROR_STATE_OPTIONS
+from .const import (
+    CONF_TELEMETRY_AVERAGE_WINDOW,
+    CONF_TELEMETRY_FILTER,
+    CONF_TELEMETRY_MIN_INTERVAL,
+    DEFAULT_TELEMETRY_AVERAGE_WINDOW,
+    DEFAULT_TELEMETRY_FILTER,
+    DEFAULT_TELEMETRY_MIN_INTERVAL,
+    DOMAIN,
+    ERROR_STATE_MAP,
+    ERROR_STATE_OPTIONS,
+)
 from .entity import (
     LandroidBaseEntity,
     auto_schedule,
+    auto_schedule_exclusion_days,
     auto_schedule_settings,
+    device_timezone,
 )
+from .schedule_analysis import ScheduleAnalysis, analyze_schedule
+from .schedule_snapshot import exclusion_snapshot, schedule_snapshot, snapshot_hash
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -42,11 +60,89 @@ class LandroidSensorDescription(SensorEntityDescription):
 
     requires_auto_schedule: bool = False
     requires_online: bool = False
+    deadband: float | None = None
+    deadband_relative: float | None = None
+    section: str | None = None
+
+
+class TelemetryFilter:
+    """Deadband, rate-limit and averaging filter for one noisy sensor."""
+
+    def __init__(
+        self,
+        *,
+        deadband: float | None = None,
+        deadband_relative: float | None = None,
+        min_interval: float = 0,
+        average_window: float = 0,
+    ) -> None:
+        """Initialize the filter."""
+        self._deadband = deadband or 0.0
+        self._deadband_relative = deadband_relative or 0.0
+        self._min_interval = min_interval
+        self._average_window = average_window
+        self._samples: deque[tuple[float, float]] = deque()
+        self._written_at: float | None = None
+        self._held: float | None = None
+        self.value: float | None = None
+
+    def _candidate(self, value: float, now: float) -> float:
+        """Return the raw value, or its mean over the averaging window."""
+        if self._average_window <= 0:
+            return value
+
+        self._samples.append((now, value))
+        while self._samples and now - self._samples[0][0] > self._average_window:
+            self._samples.popleft()
+
+        mean = sum(sample for _, sample in self._samples) / len(self._samples)
+        if isinstance(value, int):
+            return round(mean)
+        return round(mean, 2)
+
+    def update(self, value: float | None, now: float) -> float | None:
+        """Feed one raw reading and return the value that should be published."""
+        self._held = None
+        if value is None:
+            self._samples.clear()
+            self.value = None
+            return None
+
+        candidate = self._candidate(value, now)
+        if self.value is not None:
+            threshold = max(self._deadband, self._deadband_relative * abs(self.value))
+            if abs(candidate - self.value) < threshold:
+                return self.value
+            if (
+                self._written_at is not None
+                and now - self._written_at < self._min_interval
+            ):
+                self._held = candidate
+                return self.value
+
+        self.value = candidate
+        self._written_at = now
+        return self.value
+
+    def retry_in(self, now: float) -> float | None:
+        """Return seconds until a reading held by the rate limit may be written."""
+        if self._held is None or self._written_at is None:
+            return None
+        return max(self._min_interval - (now - self._written_at), 0)
+
+    def flush(self, now: float) -> float | None:
+        """Publish the reading held by the rate limit, without a new sample."""
+        if self._held is not None:
+            self.value = self._held
+            self._written_at = now
+            self._held = None
+        return self.value
 
 
 SCHEDULE_UNRECORDED_ATTRIBUTES = frozenset(
     {
         "active",
+        "conflicts",
         "daily_progress",
         "days",
         "enabled",
@@ -64,6 +160,17 @@ SCHEDULE_UNRECORDED_ATTRIBUTES = frozenset(
 )
 
 
+def _section_reported(device, section: str) -> bool:
+    """Return whether a dotted payload section holds a value for the device."""
+    attribute, *keys = section.split(".")
+    value = getattr(device, attribute, None)
+    for key in keys:
+        if not isinstance(value, dict):
+            return False
+        value = value.get(key)
+    return value is not None and value != {}
+
+
 def _battery_charging_attribute(device) -> dict[str, bool] | None:
     """Return Home Assistant battery charging attribute when available."""
     charging = getattr(device, "battery", {}).get("charging")
@@ -315,17 +422,6 @@ def _schedule_entry_label(
     return label
 
 
-def _resolve_timezone(device) -> timezone | ZoneInfo:
-    """Return the device timezone or UTC fallback."""
-    tz_name = getattr(device, "time_zone", None)
-    if tz_name is None:
-        return UTC
-    try:
-        return ZoneInfo(tz_name)
-    except ZoneInfoNotFoundError:
-        return UTC
-
-
 def _next_schedule_value(device) -> datetime | None:
     """Return the next future slot with a non-zero duration."""
     schedules = getattr(device, "schedules", None)
@@ -336,7 +432,7 @@ def _next_schedule_value(device) -> datetime | None:
     if not isinstance(slots, list):
         return None
 
-    tzinfo = _resolve_timezone(device)
+    tzinfo = device_timezone(device)
     now = datetime.now(tzinfo)
     candidates: list[datetime] = []
 
@@ -390,6 +486,8 @@ SENSORS: tuple[LandroidSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        deadband=3,
+        section="rssi",
     ),
     LandroidSensorDescription(
         key="daily_progress",
@@ -411,6 +509,7 @@ SENSORS: tuple[LandroidSensorDescription, ...] = (
         entity_registry_enabled_default=False,
         icon="mdi:leaf",
         requires_auto_schedule=True,
+        section="schedules.auto_schedule",
     ),
     LandroidSensorDescription(
         key="exclusion_schedules",
@@ -418,6 +517,14 @@ SENSORS: tuple[LandroidSensorDescription, ...] = (
         entity_registry_enabled_default=False,
         icon="mdi:calendar-remove",
         requires_auto_schedule=True,
+        section="schedules.auto_schedule",
+    ),
+    LandroidSensorDescription(
+        key="schedule_conflicts",
+        translation_key="schedule_conflicts",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:calendar-alert",
     ),
     LandroidSensorDescription(
         key="rain_delay_remaining",
@@ -441,6 +548,7 @@ SENSORS: tuple[LandroidSensorDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         icon="mdi:battery-sync",
+        section="battery.cycles.total",
     ),
     LandroidSensorDescription(
         key="battery_charge_cycles_current",
@@ -448,6 +556,7 @@ SENSORS: tuple[LandroidSensorDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         icon="mdi:battery-sync",
+        section="battery.cycles.current",
     ),
     LandroidSensorDescription(
         key="battery_temperature",
@@ -457,6 +566,8 @@ SENSORS: tuple[LandroidSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        deadband=0.5,
+        section="battery.temperature",
     ),
     LandroidSensorDescription(
         key="battery_voltage",
@@ -466,6 +577,9 @@ SENSORS: tuple[LandroidSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        deadband=0.05,
+        deadband_relative=0.002,
+        section="battery.voltage",
     ),
     LandroidSensorDescription(
         key="pitch",
@@ -475,6 +589,8 @@ SENSORS: tuple[LandroidSensorDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         icon="mdi:axis-x-rotate-clockwise",
+        deadband=2,
+        section="orientation.pitch",
     ),
     LandroidSensorDescription(
         key="roll",
@@ -484,6 +600,8 @@ SENSORS: tuple[LandroidSensorDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         icon="mdi:axis-y-rotate-clockwise",
+        deadband=2,
+        section="orientation.roll",
     ),
     LandroidSensorDescription(
         key="yaw",
@@ -493,6 +611,8 @@ SENSORS: tuple[LandroidSensorDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         icon="mdi:axis-z-rotate-clockwise",
+        deadband=2,
+        section="orientation.yaw",
     ),
     LandroidSensorDescription(
         key="blade_runtime_total",
@@ -502,6 +622,7 @@ SENSORS: tuple[LandroidSensorDescription, ...] = (
         device_class=SensorDeviceClass.DURATION,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        section="blades.total_on",
     ),
     LandroidSensorDescription(
         key="blade_runtime_current",
@@ -511,6 +632,7 @@ SENSORS: tuple[LandroidSensorDescription, ...] = (
         device_class=SensorDeviceClass.DURATION,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        section="blades.current_on",
     ),
     LandroidSensorDescription(
         key="blade_runtime_reset_at",
@@ -521,6 +643,7 @@ SENSORS: tuple[LandroidSensorDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         icon="mdi:history",
+        section="blades.reset_at",
     ),
     LandroidSensorDescription(
         key="blade_runtime_reset_time",
@@ -528,6 +651,7 @@ SENSORS: tuple[LandroidSensorDescription, ...] = (
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        section="blades.reset_time",
     ),
     LandroidSensorDescription(
         key="distance_driven_total",
@@ -538,6 +662,7 @@ SENSORS: tuple[LandroidSensorDescription, ...] = (
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        section="statistics.distance",
     ),
     LandroidSensorDescription(
         key="mower_runtime_total",
@@ -548,10 +673,22 @@ SENSORS: tuple[LandroidSensorDescription, ...] = (
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        section="statistics.worktime_total",
     ),
 )
 
 
+def _user_customized(registry_entry: er.RegistryEntry) -> bool:
+    """Return whether the user has customized an entity registry entry."""
+    return bool(
+        registry_entry.name
+        or registry_entry.icon
+        or registry_entry.area_id
+        or registry_entry.labels
+        or registry_entry.aliases
+    )
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -559,26 +696,110 @@ async def async_setup_entry(
 ) -> None:
     """Set up Landroid Cloud sensor entities."""
     coordinator = entry.runtime_data.coordinator
-    entities: list[LandroidSensor] = []
-
-    for serial_number in coordinator.data:
+    entity_registry = er.async_get(hass)
+    # Sensors still waiting for their payload section, by mower and section.
+    pending: dict[str, dict[str, list[LandroidSensorDescription]]] = {}
+    last_reading: dict[str, datetime | None] = {}
+
+    def _first_seen(
+        serial_number: str, device
+    ) -> tuple[
+        list[LandroidSensorDescription], dict[str, list[LandroidSensorDescription]]
+    ]:
+        """Split the sensors of a newly seen mower into supported and pending."""
+        supported: list[LandroidSensorDescription] = []
+        waiting: dict[str, list[LandroidSensorDescription]] = {}
+        persisted = coordinator.reported_sections(serial_number)
         for description in SENSORS:
-            entities.append(
+            section = description.section
+            if (
+                section is None
+                or section in persisted
+                or _section_reported(device, section)
+            ):
+                supported.append(description)
+                continue
+            # Sensors created before capability probing existed are only kept
+            # when the user customized them; the rest were never reported.
+            entity_id = entity_registry.async_get_entity_id(
+                SENSOR_DOMAIN, DOMAIN, f"{serial_number}_{description.key}"
+            )
+            registry_entry = (
+                entity_registry.async_get(entity_id) if entity_id is not None else None
+            )
+            if registry_entry is not None and _user_customized(registry_entry):
+                supported.append(description)
+                continue
+            if entity_id is not None:
+                entity_registry.async_remove(entity_id)
+            waiting.setdefault(section, []).append(description)
+        return supported, waiting
+
+    @callback
+    def _async_add_reported_sensors() -> None:
+        """Add sensors for payload sections that have been reported."""
+        entities: list[LandroidSensor] = []
+        # Mowers removed from the account start over if they come back.
+        for serial_number in pending.keys() - (coordinator.data or {}).keys():
+            del pending[serial_number]
+            last_reading.pop(serial_number, None)
+
+        for serial_number, device in (coordinator.data or {}).items():
+            reading = getattr(device, "updated", None)
+            if serial_number not in pending:
+                supported, pending[serial_number] = _first_seen(serial_number, device)
+            else:
+                waiting = pending[serial_number]
+                # Coordinator updates fire for every mower on the account; only
+                # a new reading of this mower can report a new section.
+                if not waiting or (
+                    reading is not None and reading == last_reading.get(serial_number)
+                ):
+                    continue
+                supported = []
+                for section in [
+                    section for section in waiting if _section_reported(device, section)
+                ]:
+                    supported.extend(waiting.pop(section))
+            last_reading[serial_number] = reading
+            if not supported:
+                continue
+
+            coordinator.record_reported_sections(
+                serial_number,
+                {
+                    description.section
+                    for description in supported
+                    if description.section is not None
+                    and _section_reported(device, description.section)
+                },
+            )
+            entities.extend(
                 LandroidSensor(
                     coordinator=coordinator,
                     config_entry=entry,
                     serial_number=serial_number,
                     description=description,
                 )
+                for description in supported
             )
 
-    async_add_entities(entities)
+        if entities:
+            async_add_entities(entities)
+
+    _async_add_reported_sensors()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_reported_sensors))
 
 
 class LandroidSensor(LandroidBaseEntity, SensorEntity):
     """Representation of a Landroid cloud sensor."""
 
     _unrecorded_attributes = SCHEDULE_UNRECORDED_ATTRIBUTES
+    _telemetry_filter: TelemetryFilter | None = None
+    _telemetry_reading: datetime | None = None
+    _cancel_telemetry_retry: CALLBACK_TYPE | None = None
+    _schedule_revision: str | None = None
+    _analysis: ScheduleAnalysis | None = None
 
     entity_description: LandroidSensorDescription
 
@@ -596,6 +817,75 @@ class LandroidSensor(LandroidBaseEntity, SensorEntity):
         super().__init__(
             coordinator, config_entry, serial_number, self.entity_description.key
         )
+        options = config_entry.options
+        if (
+            description.deadband is not None
+            or description.deadband_relative is not None
+        ) and options.get(CONF_TELEMETRY_FILTER, DEFAULT_TELEMETRY_FILTER):
+            self._telemetry_filter = TelemetryFilter(
+                deadband=description.deadband,
+                deadband_relative=description.deadband_relative,
+                min_interval=options.get(
+                    CONF_TELEMETRY_MIN_INTERVAL, DEFAULT_TELEMETRY_MIN_INTERVAL
+                ),
+                average_window=options.get(
+                    CONF_TELEMETRY_AVERAGE_WINDOW, DEFAULT_TELEMETRY_AVERAGE_WINDOW
+                ),
+            )
+
+    async def async_added_to_hass(self) -> None:
+        """Seed the telemetry filter before the initial state is written."""
+        self._update_telemetry_filter()
+        self._update_schedule_analysis()
+        await super().async_added_to_hass()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending telemetry write."""
+        if self._cancel_telemetry_retry is not None:
+            self._cancel_telemetry_retry()
+            self._cancel_telemetry_retry = None
+        await super().async_will_remove_from_hass()
+
+    def _update_telemetry_filter(self) -> None:
+        """Feed a new reading of this mower to the telemetry filter, if any."""
+        if self._telemetry_filter is None:
+            return
+
+        now = monotonic()
+        if not self.available:
+            self._telemetry_reading = None
+            self._telemetry_filter.update(None, now)
+        else:
+            # Coordinator updates fire for every mower on the account; only a
+            # reading this mower has not reported before is a new sample.
+            reading = getattr(self.device, "updated", None)
+            if reading is not None and reading == self._telemetry_reading:
+                return
+            self._telemetry_reading = reading
+            self._telemetry_filter.update(self._raw_native_value(), now)
+
+        if self._cancel_telemetry_retry is not None:
+            self._cancel_telemetry_retry()
+            self._cancel_telemetry_retry = None
+        if (retry_in := self._telemetry_filter.retry_in(now)) is not None:
+            self._cancel_telemetry_retry = async_call_later(
+                self.hass, retry_in, self._async_telemetry_retry
+            )
+
+    @callback
+    def _async_telemetry_retry(self, _now: datetime) -> None:
+        """Write a reading that was held back by the minimum write interval."""
+        self._cancel_telemetry_retry = None
+        if self._telemetry_filter is not None:
+            self._telemetry_filter.flush(monotonic())
+        super()._handle_coordinator_update()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Filter noisy telemetry before deciding whether to write state."""
+        self._update_telemetry_filter()
+        self._update_schedule_analysis()
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
@@ -615,6 +905,12 @@ class LandroidSensor(LandroidBaseEntity, SensorEntity):
     @property
     def native_value(self):
         """Return the native value for this sensor."""
+        if self._telemetry_filter is not None:
+            return self._telemetry_filter.value
+        return self._raw_native_value()
+
+    def _raw_native_value(self):
+        """Return the unfiltered value from the device payload."""
         device = self.device
         key = self.entity_description.key
 
@@ -632,6 +928,8 @@ class LandroidSensor(LandroidBaseEntity, SensorEntity):
             return _nutrition_value(device)
         if key == "exclusion_schedules":
             return _exclusion_schedule_value(device)
+        if key == "schedule_conflicts":
+            return len(self._schedule_analysis().conflicts)
         if key == "rain_delay_remaining":
             return _rain_delay_remaining_value(device)
         if key == "last_update":
@@ -679,4 +977,29 @@ class LandroidSensor(LandroidBaseEntity, SensorEntity):
             return _nutrition_attributes(self.device)
         if self.entity_description.key == "exclusion_schedules":
             return _exclusion_schedule_attributes(self.device)
+        if self.entity_description.key == "schedule_conflicts":
+            return self._schedule_analysis().as_dict()
         return None
+
+    def _update_schedule_analysis(self) -> None:
+        """Analyze the mower's schedule again if it changed since the last update."""
+        if self.entity_description.key != "schedule_conflicts" or not self.available:
+            return
+
+        schedule = self.coordinator.cloud.get_schedule(str(self.device.serial_number))
+        exclusion_days = auto_schedule_exclusion_days(self.device)
+        revision = snapshot_hash(
+            {
+                "schedule": schedule_snapshot(schedule) if schedule else None,
+                "exclusions": exclusion_snapshot(exclusion_days, None),
+            }
+        )
+        if self._analysis is None or revision != self._schedule_revision:
+            self._analysis = analyze_schedule(schedule, exclusion_days)
+            self._schedule_revision = revision
+
+    def _schedule_analysis(self) -> ScheduleAnalysis:
+        """Return the conflict analysis of the current schedule revision."""
+        if self._analysis is None:
+            self._update_schedule_analysis()
+        return self._analysis or analyze_schedule(None)
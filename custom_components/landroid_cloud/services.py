@@ -2,40 +2,58 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import logging
+from collections.abc import Awaitable, Callable, Mapping
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Final
 
 import voluptuous as vol
+from homeassistant.core import ServiceResponse, SupportsResponse
 from homeassistant.helpers import config_validation as cv
 from homeassistant.exceptions import HomeAssistantError
 from pyworxcloud import ScheduleEntry, ScheduleModel
 from pyworxcloud.exceptions import NoOneTimeScheduleError
 from pyworxcloud.utils.schedule_codec import (
     add_schedule_entry as add_schedule_entry_model,
+    delete_schedule_entry as delete_schedule_entry_model,
+    update_schedule_entry as update_schedule_entry_model,
 )
 
-from .commands import async_run_cloud_command
+from .commands import CommandAck, CommandSkippedError
 from .const import (
+    ATTR_ACTION,
     ATTR_ALL_SCHEDULES,
     ATTR_BORDER_DISTANCE_CM,
     ATTR_BOUNDARY,
+    ATTR_CHANGES,
     ATTR_CURRENT_DAY,
     ATTR_CURRENT_START,
     ATTR_CUT_OVER_BORDER,
     ATTR_DAY,
     ATTR_DAYS,
+    ATTR_DRY_RUN,
     ATTR_DURATION,
+    ATTR_ENTRIES,
     ATTR_EXCLUDE_DAY,
+    ATTR_EXCLUDE_NIGHTS,
     ATTR_K,
     ATTR_N,
     ATTR_P,
     ATTR_REASON,
     ATTR_RUNTIME,
+    ATTR_SLOTS,
     ATTR_START,
+    ATTR_TIME_EXTENSION,
+    ATTR_WAIT_FOR_ACK,
     DAYS,
-    DAY_MAP,
     EXCLUSION_REASONS,
+    SCHEDULE_CHANGE_ADD,
+    SCHEDULE_CHANGE_DELETE,
+    SCHEDULE_CHANGE_EDIT,
     SERVICE_ADD_EXCLUSION_SCHEDULE,
     SERVICE_ADD_SCHEDULE,
+    SERVICE_ANALYZE_SCHEDULE,
+    SERVICE_APPLY_SCHEDULE_CHANGES,
     SERVICE_CLEAR_NUTRITION,
     SERVICE_DELETE_EXCLUSION_SCHEDULE,
     SERVICE_DELETE_SCHEDULE,
@@ -44,50 +62,111 @@ from .const import (
     SERVICE_OTS,
     SERVICE_SET_BORDER_CUT_SETTINGS,
     SERVICE_SET_EXCLUSION_DAY,
+    SERVICE_SET_EXCLUSION_WEEK,
     SERVICE_SET_NUTRITION,
+    SERVICE_SET_SCHEDULE,
     VISION_BORDER_DISTANCE_CM_VALUES,
 )
-from .entity import auto_schedule_enabled, auto_schedule_settings
+from .entity import (
+    auto_schedule_enabled,
+    auto_schedule_exclude_nights,
+    auto_schedule_exclusion_days,
+    auto_schedule_settings,
+)
+from .schedule_analysis import DAY_INDEX, analyze_schedule
+from .schedule_plan import (
+    OPERATION_ADD,
+    OPERATION_DELETE,
+    WRITE_NONE,
+    WRITE_SCHEDULE,
+    SchedulePlan,
+    plan_schedule_write,
+)
+from .schedule_snapshot import (
+    auto_schedule_snapshot,
+    exclusion_snapshot,
+    schedule_from_snapshot,
+    schedule_snapshot,
+)
 
 if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import EntityPlatform
+    from pyworxcloud import WorxCloud
 
     from .lawn_mower import LandroidCloudMowerEntity
 
+_LOGGER = logging.getLogger(__name__)
+
+SCHEDULE_ENTRY_SCHEMA: Final = vol.Schema(
+    {
+        vol.Required(ATTR_DAY): vol.In(DAYS),
+        vol.Required(ATTR_START): vol.All(
+            cv.time, lambda value: value.strftime("%H:%M")
+        ),
+        vol.Required(ATTR_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1440)
+        ),
+        vol.Optional(ATTR_BOUNDARY): vol.Any(bool, None),
+    }
+)
+
+# Fields shared by several services and by schedule change batches.
+_ADD_SCHEDULE_FIELDS: Final = {
+    vol.Optional(ATTR_DAY): cv.string,
+    vol.Optional(ATTR_DAYS): vol.All(cv.ensure_list, [vol.In(DAYS)], vol.Length(min=1)),
+    vol.Required(ATTR_START): vol.Any(cv.string, None),
+    vol.Required(ATTR_DURATION): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Optional(ATTR_BOUNDARY): vol.Any(bool, None),
+}
+_EDIT_SCHEDULE_FIELDS: Final = {
+    vol.Required(ATTR_CURRENT_DAY): vol.In(DAYS),
+    vol.Optional(ATTR_CURRENT_START): vol.Any(cv.string, None),
+    vol.Required(ATTR_DAY): vol.In(DAYS),
+    vol.Required(ATTR_START): vol.Any(cv.string, None),
+    vol.Required(ATTR_DURATION): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Optional(ATTR_BOUNDARY): vol.Any(bool, None),
+}
+_DELETE_SCHEDULE_FIELDS: Final = {
+    vol.Optional(ATTR_ALL_SCHEDULES): vol.Any(bool, None),
+    vol.Optional(ATTR_DAY): vol.In(DAYS),
+    vol.Optional(ATTR_START): vol.Any(cv.string, None),
+}
+_EXCLUSION_ENTRY_FIELDS: Final = {
+    vol.Required(ATTR_START): cv.string,
+    vol.Required(ATTR_DURATION): vol.All(vol.Coerce(int), vol.Range(min=0, max=1440)),
+    vol.Optional(ATTR_REASON, default="generic"): vol.In(EXCLUSION_REASONS),
+}
+
 
 def _normalize_day(day: str | None, field_name: str) -> str:
     """Validate and normalize a weekday value."""
-    if not isinstance(day, str):
+    if not isinstance(day, str) or (normalized_day := day.lower()) not in DAY_INDEX:
         raise HomeAssistantError(f"{field_name} must be one of: {', '.join(DAYS)}")
-
-    normalized_day = day.lower()
-    if normalized_day not in DAYS:
-        raise HomeAssistantError(f"{field_name} must be one of: {', '.join(DAYS)}")
-
     return normalized_day
 
 
-def _normalize_start(start: str | None, field_name: str) -> str:
-    """Validate and normalize a HH:MM start value."""
-    if not isinstance(start, str):
-        raise HomeAssistantError(f"{field_name} must be in HH:MM format")
-
+def _parse_start(start: str) -> str | None:
+    """Return a H:MM or HH:MM start as HH:MM, or None when it is malformed."""
     parts = start.split(":")
     if len(parts) != 2:
-        raise HomeAssistantError(f"{field_name} must be in HH:MM format")
-
+        return None
     try:
         hour = int(parts[0])
         minute = int(parts[1])
-    except ValueError as err:
-        raise HomeAssistantError(f"{field_name} must be in HH:MM format") from err
-
+    except ValueError:
+        return None
     if hour < 0 or hour > 23 or minute < 0 or minute > 59:
-        raise HomeAssistantError(f"{field_name} must be in HH:MM format")
-
+        return None
     return f"{hour:02d}:{minute:02d}"
 
 
+def _normalize_start(start: str | None, field_name: str) -> str:
+    """Validate and normalize a HH:MM start value."""
+    if not isinstance(start, str) or (normalized_start := _parse_start(start)) is None:
+        raise HomeAssistantError(f"{field_name} must be in HH:MM format")
+    return normalized_start
+
+
 def _normalize_add_schedule_days(
     *, day: str | None = None, days: list[str] | None = None
 ) -> list[str]:
@@ -107,6 +186,66 @@ def _normalize_add_schedule_days(
     return normalized_days
 
 
+def _normalize_schedule_change(change: dict) -> dict:
+    """Return a schedule change with its days and start times normalized."""
+    normalized = dict(change)
+    try:
+        if change[ATTR_ACTION] == SCHEDULE_CHANGE_ADD:
+            normalized[ATTR_DAYS] = _normalize_add_schedule_days(
+                day=normalized.pop(ATTR_DAY, None), days=change.get(ATTR_DAYS)
+            )
+            normalized[ATTR_START] = _normalize_start(
+                change.get(ATTR_START), ATTR_START
+            )
+            return normalized
+
+        for day_field in (ATTR_DAY, ATTR_CURRENT_DAY):
+            if change.get(day_field) is not None:
+                normalized[day_field] = _normalize_day(change[day_field], day_field)
+        for start_field in (ATTR_START, ATTR_CURRENT_START):
+            if change.get(start_field) is not None:
+                normalized[start_field] = _normalize_start(
+                    change[start_field], start_field
+                )
+    except HomeAssistantError as err:
+        raise vol.Invalid(str(err)) from err
+    return normalized
+
+
+_SCHEDULE_CHANGE_SCHEMAS: Final = {
+    action: vol.All(
+        vol.Schema({vol.Required(ATTR_ACTION): action, **fields}),
+        _normalize_schedule_change,
+    )
+    for action, fields in (
+        (SCHEDULE_CHANGE_ADD, _ADD_SCHEDULE_FIELDS),
+        (SCHEDULE_CHANGE_EDIT, _EDIT_SCHEDULE_FIELDS),
+        (SCHEDULE_CHANGE_DELETE, _DELETE_SCHEDULE_FIELDS),
+    )
+}
+
+
+def _schedule_change(value: Any) -> dict:
+    """Validate and normalize one schedule change by the schema of its action.
+
+    Picking the schema by action checks each change once, where trying the
+    three schemas in turn would check most changes two or three times.
+    """
+    if (
+        not isinstance(value, dict)
+        or (schema := _SCHEDULE_CHANGE_SCHEMAS.get(str(value.get(ATTR_ACTION)))) is None
+    ):
+        raise vol.Invalid(
+            f"{ATTR_ACTION} must be one of: {', '.join(_SCHEDULE_CHANGE_SCHEMAS)}"
+        )
+    return schema(value)
+
+
+SCHEDULE_CHANGES_SCHEMA: Final = vol.All(
+    cv.ensure_list, [_schedule_change], vol.Length(min=1)
+)
+
+
 def _normalize_reason(reason: str | None) -> str:
     """Validate and normalize an exclusion-schedule reason."""
     if not isinstance(reason, str):
@@ -145,7 +284,25 @@ def _ensure_auto_schedule_enabled(entity: LandroidCloudMowerEntity) -> None:
 
 def async_register_entity_services(platform: EntityPlatform) -> None:
     """Register custom lawn mower entity services."""
-    platform.async_register_entity_service(
+
+    def _register(
+        service: str,
+        schema: dict,
+        method: str,
+        supports_response: SupportsResponse = SupportsResponse.NONE,
+    ) -> None:
+        """Register a service that can also wait for its confirming push."""
+        platform.async_register_entity_service(
+            service,
+            {
+                **schema,
+                vol.Optional(ATTR_WAIT_FOR_ACK, default=False): cv.boolean,
+            },
+            method,
+            supports_response=supports_response,
+        )
+
+    _register(
         SERVICE_OTS,
         {
             vol.Required(ATTR_BOUNDARY): bool,
@@ -155,7 +312,7 @@ def async_register_entity_services(platform: EntityPlatform) -> None:
         },
         "_async_service_ots",
     )
-    platform.async_register_entity_service(
+    _register(
         SERVICE_SET_BORDER_CUT_SETTINGS,
         {
             vol.Required(ATTR_CUT_OVER_BORDER): bool,
@@ -165,50 +322,45 @@ def async_register_entity_services(platform: EntityPlatform) -> None:
         },
         "_async_service_set_border_cut_settings",
     )
-    add_schedule_schema = {
-        vol.Optional(ATTR_DAY): cv.string,
-        vol.Optional(ATTR_DAYS): vol.All(
-            cv.ensure_list, [vol.In(DAYS)], vol.Length(min=1)
-        ),
-        vol.Required(ATTR_START): vol.Any(cv.string, None),
-        vol.Required(ATTR_DURATION): vol.All(vol.Coerce(int), vol.Range(min=0)),
-        vol.Optional(ATTR_BOUNDARY): vol.Any(bool, None),
-    }
-    schedule_entry_schema = {
-        vol.Required(ATTR_START): vol.Any(cv.string, None),
-        vol.Required(ATTR_DURATION): vol.All(vol.Coerce(int), vol.Range(min=0)),
-        vol.Optional(ATTR_BOUNDARY): vol.Any(bool, None),
-    }
-    exclusion_entry_schema = {
-        vol.Required(ATTR_START): cv.string,
-        vol.Required(ATTR_DURATION): vol.All(vol.Coerce(int), vol.Range(min=0)),
-        vol.Optional(ATTR_REASON, default="generic"): vol.In(EXCLUSION_REASONS),
-    }
-    platform.async_register_entity_service(
+    _register(
         SERVICE_ADD_SCHEDULE,
-        add_schedule_schema,
+        _ADD_SCHEDULE_FIELDS,
         "_async_service_add_schedule",
     )
-    platform.async_register_entity_service(
+    _register(
         SERVICE_EDIT_SCHEDULE,
-        {
-            vol.Required(ATTR_CURRENT_DAY): vol.In(DAYS),
-            vol.Optional(ATTR_CURRENT_START): vol.Any(cv.string, None),
-            vol.Required(ATTR_DAY): vol.In(DAYS),
-            **schedule_entry_schema,
-        },
+        _EDIT_SCHEDULE_FIELDS,
         "_async_service_edit_schedule",
     )
-    platform.async_register_entity_service(
+    _register(
         SERVICE_DELETE_SCHEDULE,
+        _DELETE_SCHEDULE_FIELDS,
+        "_async_service_delete_schedule",
+    )
+    _register(
+        SERVICE_APPLY_SCHEDULE_CHANGES,
         {
-            vol.Optional(ATTR_ALL_SCHEDULES): vol.Any(bool, None),
-            vol.Optional(ATTR_DAY): vol.In(DAYS),
-            vol.Optional(ATTR_START): vol.Any(cv.string, None),
+            vol.Required(ATTR_CHANGES): SCHEDULE_CHANGES_SCHEMA,
+            vol.Optional(ATTR_DRY_RUN, default=False): cv.boolean,
         },
-        "_async_service_delete_schedule",
+        "_async_service_apply_schedule_changes",
+        SupportsResponse.OPTIONAL,
     )
-    platform.async_register_entity_service(
+    _register(
+        SERVICE_SET_SCHEDULE,
+        {
+            vol.Required(ATTR_ENTRIES): vol.All(
+                cv.ensure_list, [SCHEDULE_ENTRY_SCHEMA]
+            ),
+            vol.Optional(ATTR_TIME_EXTENSION): vol.All(
+                vol.Coerce(int), vol.Range(min=-100, max=100)
+            ),
+            vol.Optional(ATTR_DRY_RUN, default=False): cv.boolean,
+        },
+        "_async_service_set_schedule",
+        SupportsResponse.OPTIONAL,
+    )
+    _register(
         SERVICE_SET_NUTRITION,
         {
             vol.Required(ATTR_N): vol.All(vol.Coerce(int), vol.Range(min=0)),
@@ -217,12 +369,12 @@ def async_register_entity_services(platform: EntityPlatform) -> None:
         },
         "_async_service_set_nutrition",
     )
-    platform.async_register_entity_service(
+    _register(
         SERVICE_CLEAR_NUTRITION,
         {},
         "_async_service_clear_nutrition",
     )
-    platform.async_register_entity_service(
+    _register(
         SERVICE_SET_EXCLUSION_DAY,
         {
             vol.Required(ATTR_DAY): vol.In(DAYS),
@@ -230,25 +382,25 @@ def async_register_entity_services(platform: EntityPlatform) -> None:
         },
         "_async_service_set_exclusion_day",
     )
-    platform.async_register_entity_service(
+    _register(
         SERVICE_ADD_EXCLUSION_SCHEDULE,
         {
             vol.Required(ATTR_DAY): vol.In(DAYS),
-            **exclusion_entry_schema,
+            **_EXCLUSION_ENTRY_FIELDS,
         },
         "_async_service_add_exclusion_schedule",
     )
-    platform.async_register_entity_service(
+    _register(
         SERVICE_EDIT_EXCLUSION_SCHEDULE,
         {
             vol.Required(ATTR_CURRENT_DAY): vol.In(DAYS),
             vol.Required(ATTR_CURRENT_START): cv.string,
             vol.Required(ATTR_DAY): vol.In(DAYS),
-            **exclusion_entry_schema,
+            **_EXCLUSION_ENTRY_FIELDS,
         },
         "_async_service_edit_exclusion_schedule",
     )
-    platform.async_register_entity_service(
+    _register(
         SERVICE_DELETE_EXCLUSION_SCHEDULE,
         {
             vol.Required(ATTR_DAY): vol.In(DAYS),
@@ -256,38 +408,176 @@ def async_register_entity_services(platform: EntityPlatform) -> None:
         },
         "_async_service_delete_exclusion_schedule",
     )
+    _register(
+        SERVICE_SET_EXCLUSION_WEEK,
+        {
+            vol.Optional(ATTR_DAYS): {
+                vol.In(DAYS): {
+                    vol.Optional(ATTR_EXCLUDE_DAY): cv.boolean,
+                    vol.Optional(ATTR_SLOTS): vol.All(
+                        cv.ensure_list, [_EXCLUSION_ENTRY_FIELDS]
+                    ),
+                }
+            },
+            vol.Optional(ATTR_EXCLUDE_NIGHTS): cv.boolean,
+        },
+        "_async_service_set_exclusion_week",
+    )
+    platform.async_register_entity_service(
+        SERVICE_ANALYZE_SCHEDULE,
+        {},
+        "_async_service_analyze_schedule",
+        supports_response=SupportsResponse.ONLY,
+    )
 
 
 def _auto_schedule_exclusion_days(entity: LandroidCloudMowerEntity) -> list[dict]:
     """Return normalized exclusion-scheduler day entries."""
-    exclusion = auto_schedule_settings(entity.device).get("exclusion_scheduler")
-    if not isinstance(exclusion, dict):
-        return [{"exclude_day": False, "slots": []} for _ in range(7)]
-
-    raw_days = exclusion.get("days", [])
-    days = raw_days if isinstance(raw_days, list) else []
-    normalized_days: list[dict] = []
-    for index in range(7):
-        day_entry = days[index] if index < len(days) else {}
-        day = day_entry if isinstance(day_entry, dict) else {}
-        raw_slots = day.get("slots", [])
-        slots = raw_slots if isinstance(raw_slots, list) else []
-        normalized_days.append(
-            {
-                "exclude_day": bool(day.get("exclude_day", False)),
-                "slots": [slot for slot in slots if isinstance(slot, dict)],
-            }
-        )
-    return normalized_days
+    return auto_schedule_exclusion_days(entity.device)
+
+
+def _auto_schedule_exclude_nights(entity: LandroidCloudMowerEntity) -> bool | None:
+    """Return the exclusion-scheduler exclude-nights flag, if reported."""
+    return auto_schedule_exclude_nights(entity.device)
 
 
 def _day_index(day: str) -> int:
     """Return the pyworxcloud weekday index for a weekday token."""
-    normalized_day = _normalize_day(day, ATTR_DAY)
-    for index, name in DAY_MAP.items():
-        if name == normalized_day:
-            return index
-    raise HomeAssistantError(f"Unsupported weekday: {normalized_day}")
+    return DAY_INDEX[_normalize_day(day, ATTR_DAY)]
+
+
+def _schedule_for_write(entity: LandroidCloudMowerEntity) -> ScheduleModel:
+    """Return the normalized schedule used for service writes."""
+    return entity.coordinator.cloud.get_schedule(str(entity.device.serial_number))
+
+
+_UNSENT: Final = object()
+
+
+class _WriteAck:
+    """Recognize the push showing the state a queued write sent.
+
+    Writes are built from the mower's state when they are sent, so the state
+    to expect is only known then. Until `expect` is called no push confirms
+    the write, not even one that arrived while it was still queued.
+    """
+
+    def __init__(self, command: str, reported: Callable[[], Any]) -> None:
+        """Initialize for a write that has not been sent yet."""
+        self._reported = reported
+        self._expected: Any = _UNSENT
+        self.ack = CommandAck(command, self._check)
+
+    def expect(self, expected: Any) -> None:
+        """Set the state the write is about to send."""
+        self._expected = expected
+
+    def _check(self) -> bool:
+        """Return whether the mower reports the state that was sent."""
+        return self._expected is not _UNSENT and self._reported() == self._expected
+
+
+def _schedule_write_ack(entity: LandroidCloudMowerEntity, command: str) -> _WriteAck:
+    """Return the ack of a write that sends a whole schedule."""
+    return _WriteAck(command, lambda: schedule_snapshot(_schedule_for_write(entity)))
+
+
+def _schedule_snapshot_with(
+    schedule: ScheduleModel, entry_id: str, entry: ScheduleEntry | None = None
+) -> dict[str, Any]:
+    """Return the snapshot of a schedule with one entry replaced or removed."""
+    entries = [
+        existing for existing in schedule.entries if existing.entry_id != entry_id
+    ]
+    if entry is not None:
+        entries.append(entry)
+    return schedule_snapshot(
+        ScheduleModel(
+            enabled=schedule.enabled,
+            time_extension=schedule.time_extension,
+            entries=entries,
+            protocol=schedule.protocol,
+        )
+    )
+
+
+def _exclusion_state(
+    entity: LandroidCloudMowerEntity,
+    days: list[dict] | None = None,
+    exclude_nights: bool | None = None,
+) -> dict[str, Any]:
+    """Return the exclusion week, with `days` or `exclude_nights` applied."""
+    if exclude_nights is None:
+        exclude_nights = _auto_schedule_exclude_nights(entity)
+    return exclusion_snapshot(
+        _auto_schedule_exclusion_days(entity) if days is None else days,
+        exclude_nights,
+    )
+
+
+def _exclusion_write_ack(entity: LandroidCloudMowerEntity, command: str) -> _WriteAck:
+    """Return the ack of a write that changes the exclusion week."""
+    return _WriteAck(command, lambda: _exclusion_state(entity))
+
+
+def _exclusion_days_with(
+    context: _ScheduleContext, slots: Mapping[int, list[dict]]
+) -> list[dict]:
+    """Return the exclusion days with the slots of some weekdays replaced."""
+    return [
+        {**day, "slots": slots[index]} if index in slots else day
+        for index, day in enumerate(context.exclusion_days)
+    ]
+
+
+class _ScheduleContext:
+    """Schedule state shared by all resolvers of one service call.
+
+    The schedule and the auto-schedule exclusion days are each read once, on
+    first use, unless the schedule is passed in. Handlers that change the
+    schedule step by step hand each intermediate model to `replace`, so later
+    lookups see earlier changes.
+    """
+
+    def __init__(
+        self, entity: LandroidCloudMowerEntity, schedule: ScheduleModel | None = None
+    ) -> None:
+        """Initialize the context for one mower."""
+        self._entity = entity
+        if schedule is not None:
+            self.schedule = schedule
+
+    @cached_property
+    def schedule(self) -> ScheduleModel:
+        """Return the schedule snapshot."""
+        return _schedule_for_write(self._entity)
+
+    @property
+    def protocol(self) -> int:
+        """Return the schedule protocol of the mower."""
+        return self.schedule.protocol
+
+    @cached_property
+    def _entries_by_day(self) -> dict[str, list[ScheduleEntry]]:
+        """Return schedule entries grouped by weekday."""
+        by_day: dict[str, list[ScheduleEntry]] = {}
+        for entry in getattr(self.schedule, "entries", []):
+            by_day.setdefault(entry.day, []).append(entry)
+        return by_day
+
+    def entries_for_day(self, day: str) -> list[ScheduleEntry]:
+        """Return the schedule entries of one normalized weekday."""
+        return self._entries_by_day.get(day, [])
+
+    def replace(self, schedule: ScheduleModel) -> None:
+        """Continue from an updated schedule model."""
+        self.schedule = schedule
+        self.__dict__.pop("_entries_by_day", None)
+
+    @cached_property
+    def exclusion_days(self) -> list[dict]:
+        """Return the normalized exclusion-scheduler days."""
+        return _auto_schedule_exclusion_days(self._entity)
 
 
 def _build_exclusion_slot(
@@ -302,9 +592,9 @@ def _build_exclusion_slot(
     }
 
 
-def _slots_for_day(entity: LandroidCloudMowerEntity, day: str) -> list[dict]:
+def _slots_for_day(context: _ScheduleContext, day: str) -> list[dict]:
     """Return normalized exclusion slots for one weekday."""
-    return list(_auto_schedule_exclusion_days(entity)[_day_index(day)]["slots"])
+    return list(context.exclusion_days[_day_index(day)]["slots"])
 
 
 def _sort_exclusion_slots(slots: list[dict]) -> list[dict]:
@@ -313,14 +603,14 @@ def _sort_exclusion_slots(slots: list[dict]) -> list[dict]:
 
 
 def _resolve_exclusion_slot(
-    entity: LandroidCloudMowerEntity,
+    context: _ScheduleContext,
     *,
     day: str,
     start: str | None = None,
     action: str,
 ) -> tuple[int, dict]:
     """Resolve one exclusion slot from a day and optional start time."""
-    slots = _slots_for_day(entity, day)
+    slots = _slots_for_day(context, day)
     if not slots:
         raise HomeAssistantError("No exclusion schedule exists for the selected day")
 
@@ -360,15 +650,18 @@ async def async_handle_ots(
     *,
     boundary: bool,
     runtime: int,
+    wait_for_ack: bool = False,
 ) -> None:
     """Handle legacy OTS service call."""
     try:
-        await async_run_cloud_command(
+        await entity.async_run_command(
             lambda: entity.coordinator.cloud.ots(
                 str(entity.device.serial_number),
                 boundary,
                 runtime,
-            )
+            ),
+            ack=CommandAck(SERVICE_OTS),
+            wait_for_ack=wait_for_ack,
         )
     except HomeAssistantError as err:
         if isinstance(err.__cause__, NoOneTimeScheduleError):
@@ -376,6 +669,7 @@ async def async_handle_ots(
                 "Mower does not support one-time schedule"
             ) from err
         raise
+    entity.coordinator.record_one_time_run(str(entity.device.serial_number), runtime)
 
 
 async def async_handle_set_border_cut_settings(
@@ -383,6 +677,7 @@ async def async_handle_set_border_cut_settings(
     *,
     cut_over_border: bool,
     border_distance_cm: int,
+    wait_for_ack: bool = False,
 ) -> None:
     """Handle border-cut settings service call."""
     serial_number = str(entity.device.serial_number)
@@ -395,27 +690,36 @@ async def async_handle_set_border_cut_settings(
     ) or getattr(cloud, "_set_border_cut_settings", None)
     try:
         if callable(set_border_cut_settings):
-            await async_run_cloud_command(
+            await entity.async_run_command(
                 lambda: set_border_cut_settings(
                     serial_number,
                     cut_over_border=cut_over_border,
                     border_distance=border_distance,
-                )
+                ),
+                key="border_cut",
+                ack=CommandAck(SERVICE_SET_BORDER_CUT_SETTINGS),
+                wait_for_ack=wait_for_ack,
             )
             return
 
         if callable(set_cut_over_border) and callable(set_border_distance):
-            await async_run_cloud_command(
+            await entity.async_run_command(
                 lambda: set_cut_over_border(
                     serial_number,
                     cut_over_border,
-                )
+                ),
+                key="cut_over_border",
+                ack=CommandAck(SERVICE_SET_BORDER_CUT_SETTINGS),
+                wait_for_ack=wait_for_ack,
             )
-            await async_run_cloud_command(
+            await entity.async_run_command(
                 lambda: set_border_distance(
                     serial_number,
                     border_distance,
-                )
+                ),
+                key="border_distance",
+                ack=CommandAck(SERVICE_SET_BORDER_CUT_SETTINGS),
+                wait_for_ack=wait_for_ack,
             )
             return
 
@@ -436,7 +740,7 @@ async def async_handle_set_border_cut_settings(
 
 
 def _build_schedule_entry(
-    entity: LandroidCloudMowerEntity,
+    context: _ScheduleContext,
     *,
     entry_id: str,
     day: str,
@@ -448,10 +752,7 @@ def _build_schedule_entry(
     """Build a normalized schedule entry from service parameters."""
     day = _normalize_day(day, ATTR_DAY)
     start = _normalize_start(start, ATTR_START)
-    protocol = entity.coordinator.cloud.get_schedule(
-        str(entity.device.serial_number)
-    ).protocol
-    if protocol == 0:
+    if context.protocol == 0:
         if boundary is None:
             boundary = False
         resolved_source = source or "primary"
@@ -471,30 +772,21 @@ def _build_schedule_entry(
     )
 
 
-def _schedule_for_write(entity: LandroidCloudMowerEntity) -> ScheduleModel:
-    """Return the normalized schedule used for service writes."""
-    return entity.coordinator.cloud.get_schedule(str(entity.device.serial_number))
-
-
 def _resolve_protocol_zero_source(
-    entity: LandroidCloudMowerEntity,
+    context: _ScheduleContext,
     *,
     day: str,
-    entries: list[ScheduleEntry] | None = None,
     keep_entry_id: str | None = None,
     preferred_source: str | None = None,
 ) -> str | None:
     """Resolve which two-slot source should be used for a day."""
-    schedule = _schedule_for_write(entity)
-    if schedule.protocol != 0:
+    if context.protocol != 0:
         return None
 
-    normalized_day = _normalize_day(day, ATTR_DAY)
-    pool = entries if entries is not None else getattr(schedule, "entries", [])
     day_entries = [
         entry
-        for entry in pool
-        if entry.day == normalized_day and entry.entry_id != keep_entry_id
+        for entry in context.entries_for_day(_normalize_day(day, ATTR_DAY))
+        if entry.entry_id != keep_entry_id
     ]
     has_primary = any(entry.source == "primary" for entry in day_entries)
     has_secondary = any(entry.source == "secondary" for entry in day_entries)
@@ -513,20 +805,15 @@ def _resolve_protocol_zero_source(
 
 
 def _resolve_schedule_entry(
-    entity: LandroidCloudMowerEntity,
+    context: _ScheduleContext,
     *,
     day: str,
     start: str | None = None,
     action: str,
 ) -> ScheduleEntry:
     """Resolve one schedule entry from a day and optional start time."""
-    normalized_day = _normalize_day(day, ATTR_DAY)
     normalized_start = None if start is None else _normalize_start(start, ATTR_START)
-    entries = [
-        entry
-        for entry in getattr(_schedule_for_write(entity), "entries", [])
-        if entry.day == normalized_day
-    ]
+    entries = context.entries_for_day(_normalize_day(day, ATTR_DAY))
 
     if not entries:
         raise HomeAssistantError("No schedule entry exists for the selected day")
@@ -556,23 +843,23 @@ def _resolve_schedule_entry(
 
 
 def _resolve_delete_schedule_entry_id(
-    entity: LandroidCloudMowerEntity,
+    context: _ScheduleContext,
     *,
     day: str,
     start: str | None = None,
 ) -> str:
     """Resolve one entry to delete using simple user-facing selectors."""
     return _resolve_schedule_entry(
-        entity,
+        context,
         day=day,
         start=start,
         action="delete",
     ).entry_id
 
 
-def _build_cleared_schedule(entity: LandroidCloudMowerEntity) -> ScheduleModel:
+def _build_cleared_schedule(context: _ScheduleContext) -> ScheduleModel:
     """Return the current schedule model with all entries removed."""
-    schedule = _schedule_for_write(entity)
+    schedule = context.schedule
     return ScheduleModel(
         enabled=schedule.enabled,
         time_extension=schedule.time_extension,
@@ -581,90 +868,149 @@ def _build_cleared_schedule(entity: LandroidCloudMowerEntity) -> ScheduleModel:
     )
 
 
-async def async_handle_add_schedule(
-    entity: LandroidCloudMowerEntity,
+def _add_schedule_entries(
+    context: _ScheduleContext,
     *,
-    days: list[str] | None = None,
-    day: str | None = None,
-    start: str | None = None,
+    days: list[str],
+    start: str,
     duration: int,
-    boundary: bool | None = None,
+    boundary: bool | None,
 ) -> None:
-    """Add one or more schedule entries."""
-    serial_number = str(entity.device.serial_number)
-    schedule = _schedule_for_write(entity)
-    updated_schedule = schedule
-    normalized_days = _normalize_add_schedule_days(day=day, days=days)
-    normalized_start = _normalize_start(start, ATTR_START)
-
-    try:
-        for resolved_day in normalized_days:
-            source = _resolve_protocol_zero_source(
-                entity,
-                day=resolved_day,
-                entries=updated_schedule.entries,
-            )
-            updated_schedule = add_schedule_entry_model(
-                updated_schedule,
+    """Add one entry per weekday to the context schedule."""
+    for day in days:
+        context.replace(
+            add_schedule_entry_model(
+                context.schedule,
                 _build_schedule_entry(
-                    entity,
+                    context,
                     entry_id="",
-                    day=resolved_day,
-                    start=normalized_start,
+                    day=day,
+                    start=start,
                     duration=duration,
                     boundary=boundary,
-                    source=source,
+                    source=_resolve_protocol_zero_source(context, day=day),
                 ),
             )
-    except ValueError as err:
-        raise HomeAssistantError(str(err)) from err
-
-    await async_run_cloud_command(
-        lambda: entity.coordinator.cloud.set_schedule(serial_number, updated_schedule)
-    )
+        )
 
 
-async def async_handle_edit_schedule(
-    entity: LandroidCloudMowerEntity,
+def _edited_schedule_entry(
+    context: _ScheduleContext,
     *,
     current_day: str,
+    current_start: str | None,
     day: str,
     start: str | None,
     duration: int,
-    current_start: str | None = None,
-    boundary: bool | None = None,
-) -> None:
-    """Replace one schedule entry."""
-    serial_number = str(entity.device.serial_number)
+    boundary: bool | None,
+) -> ScheduleEntry:
+    """Resolve the entry to edit and return its replacement.
+
+    The replacement keeps the entry id of the entry it replaces.
+    """
     current_entry = _resolve_schedule_entry(
-        entity,
+        context,
         day=current_day,
         start=current_start,
         action="edit",
     )
     normalized_day = _normalize_day(day, ATTR_DAY)
     source = _resolve_protocol_zero_source(
-        entity,
+        context,
         day=normalized_day,
         keep_entry_id=current_entry.entry_id,
         preferred_source=(
             current_entry.source if current_entry.day == normalized_day else None
         ),
     )
-    await async_run_cloud_command(
-        lambda: entity.coordinator.cloud.update_schedule_entry(
-            serial_number,
-            current_entry.entry_id,
-            _build_schedule_entry(
-                entity,
-                entry_id=current_entry.entry_id,
-                day=normalized_day,
-                start=start,
+    return _build_schedule_entry(
+        context,
+        entry_id=current_entry.entry_id,
+        day=normalized_day,
+        start=start,
+        duration=duration,
+        boundary=boundary,
+        source=source,
+    )
+
+
+async def async_handle_add_schedule(
+    entity: LandroidCloudMowerEntity,
+    *,
+    days: list[str] | None = None,
+    day: str | None = None,
+    start: str | None = None,
+    duration: int,
+    boundary: bool | None = None,
+    wait_for_ack: bool = False,
+) -> None:
+    """Add one or more schedule entries.
+
+    The entries are added to the schedule as it is when the command is sent,
+    so adds queued behind each other are all kept.
+    """
+    serial_number = str(entity.device.serial_number)
+    normalized_days = _normalize_add_schedule_days(day=day, days=days)
+    normalized_start = _normalize_start(start, ATTR_START)
+    write_ack = _schedule_write_ack(entity, SERVICE_ADD_SCHEDULE)
+
+    async def _async_write() -> None:
+        context = _ScheduleContext(entity)
+        try:
+            _add_schedule_entries(
+                context,
+                days=normalized_days,
+                start=normalized_start,
                 duration=duration,
                 boundary=boundary,
-                source=source,
-            ),
+            )
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+        write_ack.expect(schedule_snapshot(context.schedule))
+        await entity.coordinator.cloud.set_schedule(serial_number, context.schedule)
+
+    await entity.async_run_command(
+        _async_write, ack=write_ack.ack, wait_for_ack=wait_for_ack
+    )
+
+
+async def async_handle_edit_schedule(
+    entity: LandroidCloudMowerEntity,
+    *,
+    current_day: str,
+    day: str,
+    start: str | None,
+    duration: int,
+    current_start: str | None = None,
+    boundary: bool | None = None,
+    wait_for_ack: bool = False,
+) -> None:
+    """Replace one schedule entry, resolved when the command is sent."""
+    serial_number = str(entity.device.serial_number)
+    write_ack = _schedule_write_ack(entity, SERVICE_EDIT_SCHEDULE)
+
+    async def _async_write() -> None:
+        context = _ScheduleContext(entity)
+        updated_entry = _edited_schedule_entry(
+            context,
+            current_day=current_day,
+            current_start=current_start,
+            day=day,
+            start=start,
+            duration=duration,
+            boundary=boundary,
+        )
+        write_ack.expect(
+            _schedule_snapshot_with(
+                context.schedule, updated_entry.entry_id, updated_entry
+            )
         )
+        await entity.coordinator.cloud.update_schedule_entry(
+            serial_number, updated_entry.entry_id, updated_entry
+        )
+
+    await entity.async_run_command(
+        _async_write, ack=write_ack.ack, wait_for_ack=wait_for_ack
     )
 
 
@@ -674,65 +1020,316 @@ async def async_handle_delete_schedule(
     all_schedules: bool = False,
     day: str | None = None,
     start: str | None = None,
+    wait_for_ack: bool = False,
 ) -> None:
-    """Delete one schedule entry."""
+    """Delete one schedule entry, resolved when the command is sent."""
     serial_number = str(entity.device.serial_number)
-    if all_schedules:
-        await async_run_cloud_command(
-            lambda: entity.coordinator.cloud.set_schedule(
-                serial_number, _build_cleared_schedule(entity)
+    cloud = entity.coordinator.cloud
+    if not all_schedules and day is None:
+        raise HomeAssistantError(
+            "Select a day or enable all schedules to delete everything"
+        )
+
+    write_ack = _schedule_write_ack(entity, SERVICE_DELETE_SCHEDULE)
+
+    async def _async_write() -> None:
+        context = _ScheduleContext(entity)
+        if all_schedules:
+            cleared = _build_cleared_schedule(context)
+            write_ack.expect(schedule_snapshot(cleared))
+            await cloud.set_schedule(serial_number, cleared)
+            return
+        entry_id = _resolve_delete_schedule_entry_id(context, day=day, start=start)
+        write_ack.expect(_schedule_snapshot_with(context.schedule, entry_id))
+        await cloud.delete_schedule_entry(serial_number, entry_id)
+
+    await entity.async_run_command(
+        _async_write, ack=write_ack.ack, wait_for_ack=wait_for_ack
+    )
+
+
+def _apply_schedule_change(context: _ScheduleContext, change: dict) -> None:
+    """Apply one normalized add, edit or delete change to the context schedule."""
+    action = change[ATTR_ACTION]
+    if action == SCHEDULE_CHANGE_ADD:
+        _add_schedule_entries(
+            context,
+            days=change[ATTR_DAYS],
+            start=change[ATTR_START],
+            duration=change[ATTR_DURATION],
+            boundary=change.get(ATTR_BOUNDARY),
+        )
+        return
+
+    if action == SCHEDULE_CHANGE_EDIT:
+        updated_entry = _edited_schedule_entry(
+            context,
+            current_day=change[ATTR_CURRENT_DAY],
+            current_start=change.get(ATTR_CURRENT_START),
+            day=change[ATTR_DAY],
+            start=change.get(ATTR_START),
+            duration=change[ATTR_DURATION],
+            boundary=change.get(ATTR_BOUNDARY),
+        )
+        context.replace(
+            update_schedule_entry_model(
+                context.schedule, updated_entry.entry_id, updated_entry
             )
         )
         return
 
-    if day is None:
+    if change.get(ATTR_ALL_SCHEDULES):
+        context.replace(_build_cleared_schedule(context))
+        return
+    if change.get(ATTR_DAY) is None:
         raise HomeAssistantError(
             "Select a day or enable all schedules to delete everything"
         )
-    resolved_entry_id = _resolve_delete_schedule_entry_id(
-        entity,
-        day=day,
-        start=start,
+    context.replace(
+        delete_schedule_entry_model(
+            context.schedule,
+            _resolve_delete_schedule_entry_id(
+                context, day=change[ATTR_DAY], start=change.get(ATTR_START)
+            ),
+        )
     )
-    await async_run_cloud_command(
-        lambda: entity.coordinator.cloud.delete_schedule_entry(
-            serial_number, resolved_entry_id
+
+
+async def async_handle_apply_schedule_changes(
+    entity: LandroidCloudMowerEntity,
+    *,
+    changes: list[dict],
+    dry_run: bool = False,
+    wait_for_ack: bool = False,
+) -> ServiceResponse:
+    """Apply several schedule changes with as few schedule writes as possible.
+
+    `changes` are validated and normalized by `SCHEDULE_CHANGES_SCHEMA`, so
+    the days and start times of the whole batch are checked before the
+    schedule is read. Changes are then applied in order to one snapshot of
+    the schedule, taken when the write is sent, so later changes see the
+    result of earlier ones. Nothing is sent unless every change is valid,
+    and nothing at all with `dry_run`. The write plan is returned either way.
+    """
+
+    def _desired(current: ScheduleModel) -> ScheduleModel:
+        context = _ScheduleContext(entity, current)
+        for index, change in enumerate(changes, start=1):
+            try:
+                _apply_schedule_change(context, change)
+            except (HomeAssistantError, ValueError) as err:
+                raise HomeAssistantError(
+                    f"Change {index} ({change[ATTR_ACTION]}): {err}"
+                ) from err
+        return context.schedule
+
+    return (
+        await _async_write_schedule(
+            entity,
+            _desired,
+            dry_run=dry_run,
+            service=SERVICE_APPLY_SCHEDULE_CHANGES,
+            wait_for_ack=wait_for_ack,
+        )
+    ).as_dict()
+
+
+async def async_handle_set_schedule(
+    entity: LandroidCloudMowerEntity,
+    *,
+    entries: list[dict],
+    time_extension: int | None = None,
+    dry_run: bool = False,
+    wait_for_ack: bool = False,
+) -> ServiceResponse:
+    """Replace the whole schedule, sending only what differs.
+
+    The desired schedule is diffed against the current one and written per
+    entry or in one piece, whichever takes fewer round trips, when the write
+    is sent. With `dry_run` only the plan is returned.
+    """
+
+    def _desired(current: ScheduleModel) -> ScheduleModel:
+        try:
+            return schedule_from_snapshot(
+                current, {"time_extension": time_extension, "entries": entries}
+            )
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+
+    return (
+        await _async_write_schedule(
+            entity,
+            _desired,
+            dry_run=dry_run,
+            service=SERVICE_SET_SCHEDULE,
+            wait_for_ack=wait_for_ack,
+        )
+    ).as_dict()
+
+
+def schedule_write_commands(
+    cloud: WorxCloud, serial_number: str, plan: SchedulePlan
+) -> list[Callable[[], Awaitable[object]]]:
+    """Return the cloud command that carries out a schedule write plan."""
+    if plan.write == WRITE_NONE:
+        return []
+    if plan.write == WRITE_SCHEDULE:
+        return [lambda: cloud.set_schedule(serial_number, plan.desired)]
+
+    (operation,) = plan.operations
+    if operation.action == OPERATION_ADD:
+        return [lambda: cloud.add_schedule_entry(serial_number, operation.entry)]
+    if operation.action == OPERATION_DELETE:
+        return [lambda: cloud.delete_schedule_entry(serial_number, operation.entry_id)]
+    return [
+        lambda: cloud.update_schedule_entry(
+            serial_number, operation.entry_id, operation.entry
         )
+    ]
+
+
+def schedule_write_command(
+    cloud: WorxCloud,
+    serial_number: str,
+    desired: Callable[[ScheduleModel], ScheduleModel],
+    plans: list[SchedulePlan] | None = None,
+) -> Callable[[], Awaitable[None]]:
+    """Return a command that plans and sends a schedule write when it runs.
+
+    `desired` maps the schedule as it is when the command runs to the one
+    to write, so writes queued behind each other build on one another
+    instead of on the schedule each caller saw. The plan that was carried
+    out is appended to `plans`. The command raises `CommandSkippedError`
+    when the mower already has the desired schedule.
+    """
+
+    async def _async_write() -> None:
+        current = cloud.get_schedule(serial_number)
+        plan = plan_schedule_write(current, desired(current))
+        if plans is not None:
+            plans.append(plan)
+        commands = schedule_write_commands(cloud, serial_number, plan)
+        if not commands:
+            raise CommandSkippedError("The schedule is already up to date")
+        for command in commands:
+            await command()
+
+    return _async_write
+
+
+async def _async_write_schedule(
+    entity: LandroidCloudMowerEntity,
+    desired: Callable[[ScheduleModel], ScheduleModel],
+    *,
+    dry_run: bool,
+    service: str,
+    wait_for_ack: bool,
+) -> SchedulePlan:
+    """Plan a schedule write and, unless `dry_run`, send it through the queue.
+
+    The write is confirmed by the push showing the schedule it sent.
+    """
+    if dry_run:
+        current = _schedule_for_write(entity)
+        return plan_schedule_write(current, desired(current))
+
+    serial_number = str(entity.device.serial_number)
+    write_ack = _schedule_write_ack(entity, service)
+    plans: list[SchedulePlan] = []
+
+    def _expected(current: ScheduleModel) -> ScheduleModel:
+        schedule = desired(current)
+        write_ack.expect(schedule_snapshot(schedule))
+        return schedule
+
+    try:
+        await entity.async_run_command(
+            schedule_write_command(
+                entity.coordinator.cloud, serial_number, _expected, plans
+            ),
+            idempotent=True,
+            ack=write_ack.ack,
+            wait_for_ack=wait_for_ack,
+        )
+    except CommandSkippedError:
+        _LOGGER.debug("Schedule of %s is already up to date", serial_number)
+    return plans[-1]
+
+
+def _nutrition_ack(
+    entity: LandroidCloudMowerEntity, command: str, nutrition: dict[str, int] | None
+) -> CommandAck:
+    """Return the ack of a nutrition write, confirmed once the mower reports it."""
+    return CommandAck(
+        command,
+        lambda: (
+            auto_schedule_snapshot(auto_schedule_settings(entity.device)).get(
+                "nutrition"
+            )
+            == nutrition
+        ),
     )
 
 
 async def async_handle_set_nutrition(
-    entity: LandroidCloudMowerEntity, *, n: int, p: int, k: int
+    entity: LandroidCloudMowerEntity,
+    *,
+    n: int,
+    p: int,
+    k: int,
+    wait_for_ack: bool = False,
 ) -> None:
     """Set auto-schedule nutrition values."""
     _ensure_auto_schedule_enabled(entity)
     serial_number = str(entity.device.serial_number)
-    await async_run_cloud_command(
+    await entity.async_run_command(
         lambda: entity.coordinator.cloud.set_auto_schedule_nutrition(
             serial_number, n, p, k
-        )
+        ),
+        key="nutrition",
+        ack=_nutrition_ack(entity, SERVICE_SET_NUTRITION, {"n": n, "p": p, "k": k}),
+        wait_for_ack=wait_for_ack,
     )
 
 
-async def async_handle_clear_nutrition(entity: LandroidCloudMowerEntity) -> None:
+async def async_handle_clear_nutrition(
+    entity: LandroidCloudMowerEntity, *, wait_for_ack: bool = False
+) -> None:
     """Clear auto-schedule nutrition values."""
     _ensure_auto_schedule_enabled(entity)
     serial_number = str(entity.device.serial_number)
-    await async_run_cloud_command(
-        lambda: entity.coordinator.cloud.clear_auto_schedule_nutrition(serial_number)
+    await entity.async_run_command(
+        lambda: entity.coordinator.cloud.clear_auto_schedule_nutrition(serial_number),
+        key="nutrition",
+        ack=_nutrition_ack(entity, SERVICE_CLEAR_NUTRITION, None),
+        wait_for_ack=wait_for_ack,
     )
 
 
 async def async_handle_set_exclusion_day(
-    entity: LandroidCloudMowerEntity, *, day: str, exclude_day: bool
+    entity: LandroidCloudMowerEntity,
+    *,
+    day: str,
+    exclude_day: bool,
+    wait_for_ack: bool = False,
 ) -> None:
     """Set whether one weekday is fully excluded from auto schedule."""
     _ensure_auto_schedule_enabled(entity)
     serial_number = str(entity.device.serial_number)
-    await async_run_cloud_command(
+    await entity.async_run_command(
         lambda: entity.coordinator.cloud.set_auto_schedule_exclusion_day(
             serial_number, _day_index(day), exclude_day
-        )
+        ),
+        key=f"exclusion_day_{_day_index(day)}",
+        ack=CommandAck(
+            SERVICE_SET_EXCLUSION_DAY,
+            lambda: (
+                _auto_schedule_exclusion_days(entity)[_day_index(day)]["exclude_day"]
+                == exclude_day
+            ),
+        ),
+        wait_for_ack=wait_for_ack,
     )
 
 
@@ -743,19 +1340,31 @@ async def async_handle_add_exclusion_schedule(
     start: str,
     duration: int,
     reason: str = "generic",
+    wait_for_ack: bool = False,
 ) -> None:
-    """Add one exclusion slot to the selected weekday."""
+    """Add one exclusion slot to the selected weekday.
+
+    The slot is added to the weekday's slots as they are when the command
+    is sent, so adds queued behind each other are all kept.
+    """
     _ensure_auto_schedule_enabled(entity)
     serial_number = str(entity.device.serial_number)
     day_index = _day_index(day)
-    updated_slots = _sort_exclusion_slots(
-        _slots_for_day(entity, day)
-        + [_build_exclusion_slot(start=start, duration=duration, reason=reason)]
-    )
-    await async_run_cloud_command(
-        lambda: entity.coordinator.cloud.set_auto_schedule_exclusion_slots(
-            serial_number, day_index, updated_slots
+    added_slot = _build_exclusion_slot(start=start, duration=duration, reason=reason)
+    write_ack = _exclusion_write_ack(entity, SERVICE_ADD_EXCLUSION_SCHEDULE)
+
+    async def _async_write() -> None:
+        context = _ScheduleContext(entity)
+        slots = _sort_exclusion_slots(_slots_for_day(context, day) + [added_slot])
+        write_ack.expect(
+            _exclusion_state(entity, _exclusion_days_with(context, {day_index: slots}))
         )
+        await entity.coordinator.cloud.set_auto_schedule_exclusion_slots(
+            serial_number, day_index, slots
+        )
+
+    await entity.async_run_command(
+        _async_write, ack=write_ack.ack, wait_for_ack=wait_for_ack
     )
 
 
@@ -768,43 +1377,65 @@ async def async_handle_edit_exclusion_schedule(
     start: str,
     duration: int,
     reason: str = "generic",
+    wait_for_ack: bool = False,
 ) -> None:
-    """Replace one exclusion slot."""
+    """Replace one exclusion slot, resolved when the command is sent."""
     _ensure_auto_schedule_enabled(entity)
     serial_number = str(entity.device.serial_number)
-    current_index, _ = _resolve_exclusion_slot(
-        entity,
-        day=current_day,
-        start=current_start,
-        action="edit",
-    )
+    cloud = entity.coordinator.cloud
     updated_slot = _build_exclusion_slot(start=start, duration=duration, reason=reason)
+    same_day = _normalize_day(current_day, ATTR_CURRENT_DAY) == _normalize_day(
+        day, ATTR_DAY
+    )
+    write_ack = _exclusion_write_ack(entity, SERVICE_EDIT_EXCLUSION_SCHEDULE)
+
+    async def _async_write() -> None:
+        context = _ScheduleContext(entity)
+        current_index, _ = _resolve_exclusion_slot(
+            context,
+            day=current_day,
+            start=current_start,
+            action="edit",
+        )
+        current_slots = _slots_for_day(context, current_day)
+        if same_day:
+            current_slots[current_index] = updated_slot
+            slots = _sort_exclusion_slots(current_slots)
+            write_ack.expect(
+                _exclusion_state(
+                    entity, _exclusion_days_with(context, {_day_index(day): slots})
+                )
+            )
+            await cloud.set_auto_schedule_exclusion_slots(
+                serial_number, _day_index(day), slots
+            )
+            return
 
-    if _normalize_day(current_day, ATTR_CURRENT_DAY) == _normalize_day(day, ATTR_DAY):
-        updated_slots = _slots_for_day(entity, day)
-        updated_slots[current_index] = updated_slot
-        updated_slots = _sort_exclusion_slots(updated_slots)
-        await async_run_cloud_command(
-            lambda: entity.coordinator.cloud.set_auto_schedule_exclusion_slots(
-                serial_number, _day_index(day), updated_slots
+        del current_slots[current_index]
+        target_slots = _sort_exclusion_slots(
+            _slots_for_day(context, day) + [updated_slot]
+        )
+        write_ack.expect(
+            _exclusion_state(
+                entity,
+                _exclusion_days_with(
+                    context,
+                    {
+                        _day_index(current_day): current_slots,
+                        _day_index(day): target_slots,
+                    },
+                ),
             )
         )
-        return
-
-    current_slots = _slots_for_day(entity, current_day)
-    del current_slots[current_index]
-    target_slots = _sort_exclusion_slots(_slots_for_day(entity, day) + [updated_slot])
-    await async_run_cloud_command(
-        lambda: entity.coordinator.cloud.set_auto_schedule_exclusion_slots(
-            serial_number,
-            _day_index(current_day),
-            current_slots,
+        await cloud.set_auto_schedule_exclusion_slots(
+            serial_number, _day_index(current_day), current_slots
         )
-    )
-    await async_run_cloud_command(
-        lambda: entity.coordinator.cloud.set_auto_schedule_exclusion_slots(
+        await cloud.set_auto_schedule_exclusion_slots(
             serial_number, _day_index(day), target_slots
         )
+
+    await entity.async_run_command(
+        _async_write, ack=write_ack.ack, wait_for_ack=wait_for_ack
     )
 
 
@@ -813,21 +1444,165 @@ async def async_handle_delete_exclusion_schedule(
     *,
     day: str,
     start: str | None = None,
+    wait_for_ack: bool = False,
 ) -> None:
-    """Delete one exclusion slot."""
+    """Delete one exclusion slot, resolved when the command is sent."""
     _ensure_auto_schedule_enabled(entity)
     serial_number = str(entity.device.serial_number)
     day_index = _day_index(day)
-    slot_index, _ = _resolve_exclusion_slot(
-        entity,
-        day=day,
-        start=start,
-        action="delete",
-    )
-    updated_slots = _slots_for_day(entity, day)
-    del updated_slots[slot_index]
-    await async_run_cloud_command(
-        lambda: entity.coordinator.cloud.set_auto_schedule_exclusion_slots(
+    write_ack = _exclusion_write_ack(entity, SERVICE_DELETE_EXCLUSION_SCHEDULE)
+
+    async def _async_write() -> None:
+        context = _ScheduleContext(entity)
+        slot_index, _ = _resolve_exclusion_slot(
+            context,
+            day=day,
+            start=start,
+            action="delete",
+        )
+        updated_slots = _slots_for_day(context, day)
+        del updated_slots[slot_index]
+        write_ack.expect(
+            _exclusion_state(
+                entity, _exclusion_days_with(context, {day_index: updated_slots})
+            )
+        )
+        await entity.coordinator.cloud.set_auto_schedule_exclusion_slots(
             serial_number, day_index, updated_slots
         )
+
+    await entity.async_run_command(
+        _async_write, ack=write_ack.ack, wait_for_ack=wait_for_ack
     )
+
+
+async def async_handle_set_exclusion_week(
+    entity: LandroidCloudMowerEntity,
+    *,
+    days: dict[str, dict] | None = None,
+    exclude_nights: bool | None = None,
+    wait_for_ack: bool = False,
+) -> None:
+    """Replace the exclusion schedule of several weekdays at once.
+
+    Weekdays and fields that are left out keep their current value. Only
+    the parts that differ from the exclusion schedule reported when the
+    command is sent go out.
+    """
+    _ensure_auto_schedule_enabled(entity)
+    serial_number = str(entity.device.serial_number)
+    updates: dict[int, dict[str, Any]] = {}
+    for day, settings in (days or {}).items():
+        update = updates[_day_index(day)] = {}
+        if ATTR_EXCLUDE_DAY in settings:
+            update["exclude_day"] = settings[ATTR_EXCLUDE_DAY]
+        if ATTR_SLOTS in settings:
+            update["slots"] = _sort_exclusion_slots(
+                [_build_exclusion_slot(**slot) for slot in settings[ATTR_SLOTS]]
+            )
+    write_ack = _exclusion_write_ack(entity, SERVICE_SET_EXCLUSION_WEEK)
+
+    async def _async_write() -> None:
+        current_days = _ScheduleContext(entity).exclusion_days
+        updated_days = [
+            {**day, **updates.get(index, {})} for index, day in enumerate(current_days)
+        ]
+        update_nights = (
+            exclude_nights is not None
+            and exclude_nights != _auto_schedule_exclude_nights(entity)
+        )
+        if updated_days == current_days and not update_nights:
+            raise CommandSkippedError("The exclusion schedule is already up to date")
+        write_ack.expect(_exclusion_state(entity, updated_days, exclude_nights))
+        for command in auto_schedule_commands(
+            entity.coordinator.cloud,
+            serial_number,
+            current_days=current_days,
+            updated_days=updated_days,
+            exclude_nights=exclude_nights if update_nights else None,
+        ):
+            await command()
+
+    try:
+        await entity.async_run_command(
+            _async_write,
+            idempotent=True,
+            ack=write_ack.ack,
+            wait_for_ack=wait_for_ack,
+        )
+    except CommandSkippedError:
+        _LOGGER.debug("Exclusion schedule of %s is already up to date", serial_number)
+
+
+def auto_schedule_commands(
+    cloud: WorxCloud,
+    serial_number: str,
+    *,
+    settings: Mapping[str, Any] | None = None,
+    current_days: list[dict] | None = None,
+    updated_days: list[dict] | None = None,
+    exclude_nights: bool | None = None,
+) -> list[Callable[[], Awaitable[object]]]:
+    """Return the cloud commands that apply auto-schedule changes.
+
+    `settings` maps auto-schedule settings (boost, grass_type, soil_type,
+    irrigation, nutrition) to their new values. The exclusion week is only
+    written when `updated_days` is given, and `exclude_nights` only when it
+    is not None. The commands must be sent one after another.
+    """
+    settings = settings or {}
+    # Every per-setting helper rewrites the whole settings object from
+    # pyworxcloud's cache, so the writes must not overlap.
+    commands = [
+        _auto_schedule_setting_command(cloud, serial_number, name, value)
+        for name, value in settings.items()
+    ]
+    for index, (current, updated) in enumerate(
+        zip(current_days or [], updated_days or [], strict=True)
+    ):
+        if current["exclude_day"] != updated["exclude_day"]:
+            commands.append(
+                lambda index=index, value=updated["exclude_day"]: (
+                    cloud.set_auto_schedule_exclusion_day(serial_number, index, value)
+                )
+            )
+        if current["slots"] != updated["slots"]:
+            commands.append(
+                lambda index=index, slots=updated["slots"]: (
+                    cloud.set_auto_schedule_exclusion_slots(serial_number, index, slots)
+                )
+            )
+    if exclude_nights is not None:
+        commands.append(
+            lambda: cloud.set_auto_schedule_exclude_nights(
+                serial_number, exclude_nights
+            )
+        )
+    return commands
+
+
+def _auto_schedule_setting_command(
+    cloud: WorxCloud, serial_number: str, name: str, value: Any
+) -> Callable[[], Awaitable[object]]:
+    """Return the cloud command that changes one setting."""
+    if name == "boost":
+        return lambda: cloud.set_auto_schedule_boost(serial_number, value)
+    if name == "grass_type":
+        return lambda: cloud.set_auto_schedule_grass_type(serial_number, value)
+    if name == "soil_type":
+        return lambda: cloud.set_auto_schedule_soil_type(serial_number, value)
+    if name == "irrigation":
+        return lambda: cloud.set_auto_schedule_irrigation(serial_number, value)
+    if name == "nutrition":
+        if value is None:
+            return lambda: cloud.clear_auto_schedule_nutrition(serial_number)
+        return lambda: cloud.set_auto_schedule_nutrition(
+            serial_number, value["n"], value["p"], value["k"]
+        )
+    raise HomeAssistantError(f"Unsupported auto-schedule setting: {name}")
+
+
+def async_handle_analyze_schedule(entity: LandroidCloudMowerEntity) -> ServiceResponse:
+    """Return schedule conflicts, weekly mowing minutes and coverage."""
+    context = _ScheduleContext(entity)
+    return analyze_schedule(context.schedule, context.exclusion_days).as_dict()
@@ -4,15 +4,23 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import voluptuous as vol
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from pyworxcloud import DeviceCapability
+from pyworxcloud import DeviceCapability, DeviceHandler
 
-from .commands import async_run_cloud_command
-from .entity import LandroidBaseEntity, auto_schedule, auto_schedule_settings
+from .commands import CommandAck
+from .const import ATTR_FORCE, ATTR_STATE, SERVICE_SET_SWITCH_STATE
+from .entity import (
+    LandroidBaseEntity,
+    async_add_device_entities,
+    auto_schedule,
+    auto_schedule_settings,
+)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -103,25 +111,34 @@ async def async_setup_entry(
 ) -> None:
     """Set up Landroid Cloud switch entities."""
     coordinator = entry.runtime_data.coordinator
-    entities: list[LandroidSwitch] = []
-
-    for serial_number, device in coordinator.data.items():
-        for description in SWITCHES:
-            if description.capability and not device.capabilities.check(
-                description.capability
-            ):
-                continue
-
-            entities.append(
-                LandroidSwitch(
-                    coordinator=coordinator,
-                    config_entry=entry,
-                    serial_number=serial_number,
-                    description=description,
-                )
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_SET_SWITCH_STATE,
+        {
+            vol.Required(ATTR_STATE): cv.boolean,
+            vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+        },
+        "_async_service_set_state",
+    )
+
+    def _entities_for_device(
+        serial_number: str, device: DeviceHandler
+    ) -> list[LandroidSwitch]:
+        return [
+            LandroidSwitch(
+                coordinator=coordinator,
+                config_entry=entry,
+                serial_number=serial_number,
+                description=description,
             )
+            for description in SWITCHES
+            if not description.capability
+            or device.capabilities.check(description.capability)
+        ]
 
-    async_add_entities(entities)
+    async_add_device_entities(
+        coordinator, entry, async_add_entities, _entities_for_device
+    )
 
 
 class LandroidSwitch(LandroidBaseEntity, SwitchEntity):
@@ -147,6 +164,11 @@ class LandroidSwitch(LandroidBaseEntity, SwitchEntity):
     @property
     def is_on(self) -> bool | None:
         """Return true if switch is on."""
+        return self._optimistic_or(self._reported_is_on)
+
+    @property
+    def _reported_is_on(self) -> bool | None:
+        """Return the switch state last reported by the mower."""
         key = self.entity_description.key
         if key == "auto_schedule":
             return bool(auto_schedule(self.device).get("enabled", False))
@@ -187,53 +209,92 @@ class LandroidSwitch(LandroidBaseEntity, SwitchEntity):
         """Turn off switch."""
         await self._async_set_state(False)
 
-    async def _async_set_state(self, state: bool) -> None:
+    async def _async_service_set_state(
+        self, *, state: bool, force: bool = False
+    ) -> None:
+        """Set the switch state, optionally resending an unchanged one."""
+        await self._async_set_state(state, force=force)
+
+    async def _async_set_state(self, state: bool, *, force: bool = False) -> None:
         """Apply the selected switch state in the cloud API."""
+        if self._write_is_noop(self.is_on, state, force=force):
+            return
+
         serial_number = str(self.device.serial_number)
+        ack = CommandAck(
+            self.entity_description.key, lambda: self._reported_is_on is state
+        )
 
         if self.entity_description.key == "auto_schedule":
-            await async_run_cloud_command(
+            await self.async_run_command(
                 lambda: self.coordinator.cloud.toggle_auto_schedule(
                     serial_number, state
-                )
+                ),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=state,
             )
         elif self.entity_description.key == "party_mode":
-            await async_run_cloud_command(
-                lambda: self.coordinator.cloud.set_party_mode(serial_number, state)
+            await self.async_run_command(
+                lambda: self.coordinator.cloud.set_party_mode(serial_number, state),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=state,
             )
         elif self.entity_description.key == "firmware_auto_update":
-            await async_run_cloud_command(
+            await self.async_run_command(
                 lambda: self.coordinator.cloud.set_firmware_auto_upgrade(
                     serial_number, state
-                )
+                ),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=state,
             )
         elif self.entity_description.key == "irrigation":
-            await async_run_cloud_command(
+            await self.async_run_command(
                 lambda: self.coordinator.cloud.set_auto_schedule_irrigation(
                     serial_number, state
-                )
+                ),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=state,
             )
         elif self.entity_description.key == "exclude_nights":
-            await async_run_cloud_command(
+            await self.async_run_command(
                 lambda: self.coordinator.cloud.set_auto_schedule_exclude_nights(
                     serial_number, state
-                )
+                ),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=state,
             )
         elif self.entity_description.key == "lock":
-            await async_run_cloud_command(
-                lambda: self.coordinator.cloud.set_lock(serial_number, state)
+            await self.async_run_command(
+                lambda: self.coordinator.cloud.set_lock(serial_number, state),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=state,
             )
         elif self.entity_description.key == "off_limits":
-            await async_run_cloud_command(
-                lambda: self.coordinator.cloud.set_offlimits(serial_number, state)
+            await self.async_run_command(
+                lambda: self.coordinator.cloud.set_offlimits(serial_number, state),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=state,
             )
         elif self.entity_description.key == "off_limits_shortcut":
-            await async_run_cloud_command(
+            await self.async_run_command(
                 lambda: self.coordinator.cloud.set_offlimits_shortcut(
                     serial_number, state
-                )
+                ),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=state,
             )
         elif self.entity_description.key == "acs":
-            await async_run_cloud_command(
-                lambda: self.coordinator.cloud.set_acs(serial_number, state)
+            await self.async_run_command(
+                lambda: self.coordinator.cloud.set_acs(serial_number, state),
+                key=self.entity_description.key,
+                ack=ack,
+                optimistic=state,
             )
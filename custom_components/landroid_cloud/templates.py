@@ -0,0 +1,587 @@
+"""Stored schedule templates and schedule export and import for Landroid Cloud."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from datetime import time
+from functools import partial
+from typing import Any, Final
+
+import voluptuous as vol
+from homeassistant.const import ATTR_AREA_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
+from pyworxcloud import DeviceHandler, ScheduleModel
+
+from .commands import CommandSkippedError
+from .const import (
+    ATTR_BOUNDARY,
+    ATTR_DAY,
+    ATTR_DAYS,
+    ATTR_DURATION,
+    ATTR_ENTRIES,
+    ATTR_EXCLUDE_DAY,
+    ATTR_EXCLUDE_NIGHTS,
+    ATTR_MAX_PARALLEL,
+    ATTR_REASON,
+    ATTR_SERIAL_NUMBER,
+    ATTR_SERIAL_NUMBERS,
+    ATTR_SLOTS,
+    ATTR_SNAPSHOT,
+    ATTR_SNAPSHOTS,
+    ATTR_STAGGER,
+    ATTR_START,
+    ATTR_TEMPLATE,
+    ATTR_TIME_EXTENSION,
+    AUTO_SCHEDULE_GRASS_TYPE_OPTIONS,
+    AUTO_SCHEDULE_SOIL_TYPE_OPTIONS,
+    DAYS,
+    DOMAIN,
+    EXCLUSION_REASONS,
+    SERVICE_APPLY_SCHEDULE_TEMPLATE,
+    SERVICE_DELETE_SCHEDULE_TEMPLATE,
+    SERVICE_EXPORT_SCHEDULES,
+    SERVICE_IMPORT_SCHEDULES,
+    SERVICE_SAVE_SCHEDULE_TEMPLATE,
+)
+from .coordinator import LandroidCloudCoordinator
+from .entity import (
+    auto_schedule_enabled,
+    auto_schedule_exclude_nights,
+    auto_schedule_exclusion_days,
+    auto_schedule_settings,
+)
+from .fleet import (
+    FLEET_SELECTION_FIELDS,
+    FLEET_TARGET_FIELDS,
+    UNKNOWN_MOWER_MESSAGE,
+    async_run_fleet,
+    resolve_fleet_targets,
+)
+from .schedule_snapshot import (
+    auto_schedule_snapshot,
+    exclusion_snapshot,
+    schedule_from_snapshot,
+    schedule_snapshot,
+    snapshot_hash,
+    snapshot_json,
+)
+from .services import (
+    SCHEDULE_ENTRY_SCHEMA,
+    auto_schedule_commands,
+    schedule_write_command,
+)
+
+_TEMPLATE_STORAGE_VERSION = 1
+
+
+def _minutes(value: time) -> int:
+    """Return minutes since midnight for a validated time."""
+    return value.hour * 60 + value.minute
+
+
+TEMPLATE_EXCLUSION_SLOT_SCHEMA: Final = vol.Schema(
+    {
+        vol.Required(ATTR_START): vol.All(cv.time, _minutes),
+        vol.Required(ATTR_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=1440)
+        ),
+        vol.Optional(ATTR_REASON, default="generic"): vol.In(EXCLUSION_REASONS),
+    }
+)
+SAVE_TEMPLATE_SCHEMA: Final = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_TEMPLATE): cv.string,
+            vol.Exclusive(ATTR_SERIAL_NUMBER, "source"): cv.string,
+            vol.Exclusive(ATTR_ENTRIES, "source"): vol.All(
+                cv.ensure_list, [SCHEDULE_ENTRY_SCHEMA]
+            ),
+            vol.Optional(ATTR_TIME_EXTENSION): vol.All(
+                vol.Coerce(int), vol.Range(min=-100, max=100)
+            ),
+            vol.Optional(ATTR_DAYS): {
+                vol.In(DAYS): {
+                    vol.Optional(ATTR_EXCLUDE_DAY, default=False): cv.boolean,
+                    vol.Optional(ATTR_SLOTS, default=[]): vol.All(
+                        cv.ensure_list, [TEMPLATE_EXCLUSION_SLOT_SCHEMA]
+                    ),
+                }
+            },
+            vol.Optional(ATTR_EXCLUDE_NIGHTS): cv.boolean,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_SERIAL_NUMBER, ATTR_ENTRIES),
+)
+DELETE_TEMPLATE_SCHEMA: Final = vol.Schema({vol.Required(ATTR_TEMPLATE): cv.string})
+APPLY_TEMPLATE_SCHEMA: Final = vol.All(
+    vol.Schema({vol.Required(ATTR_TEMPLATE): cv.string, **FLEET_TARGET_FIELDS}),
+    cv.has_at_least_one_key(ATTR_SERIAL_NUMBERS, ATTR_AREA_ID),
+)
+
+
+def _parse_snapshot(value: Any) -> Any:
+    """Return snapshot data given as a JSON string or as a mapping."""
+    if not isinstance(value, str):
+        return value
+    try:
+        return json.loads(value)
+    except ValueError as err:
+        raise vol.Invalid(f"Invalid schedule snapshot JSON: {err}") from err
+
+
+def _canonical_snapshot(snapshot: dict[str, Any]) -> dict[str, Any]:
+    """Return validated snapshot data in the form exports produce."""
+    canonical = dict(snapshot)
+    if (exclusions := snapshot.get("exclusions")) is not None:
+        canonical["exclusions"] = exclusion_snapshot(
+            exclusions[ATTR_DAYS], exclusions.get(ATTR_EXCLUDE_NIGHTS)
+        )
+    if (settings := snapshot.get("auto_schedule")) is not None:
+        canonical["auto_schedule"] = auto_schedule_snapshot(settings)
+    return canonical
+
+
+SNAPSHOT_SCHEMA: Final = vol.All(
+    _parse_snapshot,
+    vol.Schema(
+        {
+            vol.Optional("schedule"): {
+                vol.Optional(ATTR_TIME_EXTENSION): vol.Any(
+                    None, vol.All(vol.Coerce(int), vol.Range(min=-100, max=100))
+                ),
+                vol.Required(ATTR_ENTRIES): [SCHEDULE_ENTRY_SCHEMA],
+            },
+            vol.Optional("exclusions"): {
+                vol.Optional(ATTR_EXCLUDE_NIGHTS): vol.Any(None, cv.boolean),
+                vol.Required(ATTR_DAYS): vol.All(
+                    [
+                        {
+                            vol.Optional(ATTR_EXCLUDE_DAY, default=False): cv.boolean,
+                            vol.Optional(ATTR_SLOTS, default=[]): [
+                                {
+                                    vol.Required("start_time"): vol.All(
+                                        vol.Coerce(int), vol.Range(min=0, max=1439)
+                                    ),
+                                    vol.Required(ATTR_DURATION): vol.All(
+                                        vol.Coerce(int), vol.Range(min=0, max=1440)
+                                    ),
+                                    vol.Optional(
+                                        ATTR_REASON, default="generic"
+                                    ): vol.In(EXCLUSION_REASONS),
+                                }
+                            ],
+                        }
+                    ],
+                    vol.Length(min=len(DAYS), max=len(DAYS)),
+                ),
+            },
+            vol.Optional("auto_schedule"): {
+                vol.Optional("boost"): vol.Any(None, vol.In((0, 1, 2))),
+                vol.Optional("grass_type"): vol.Any(
+                    None, vol.In(AUTO_SCHEDULE_GRASS_TYPE_OPTIONS)
+                ),
+                vol.Optional("soil_type"): vol.Any(
+                    None, vol.In(AUTO_SCHEDULE_SOIL_TYPE_OPTIONS)
+                ),
+                vol.Optional("irrigation"): vol.Any(None, cv.boolean),
+                vol.Optional("nutrition"): vol.Any(
+                    None,
+                    {
+                        vol.Required(key): vol.All(vol.Coerce(int), vol.Range(min=0))
+                        for key in ("n", "p", "k")
+                    },
+                ),
+            },
+        }
+    ),
+    _canonical_snapshot,
+)
+EXPORT_SCHEDULES_SCHEMA: Final = vol.All(
+    vol.Schema(FLEET_SELECTION_FIELDS),
+    cv.has_at_least_one_key(ATTR_SERIAL_NUMBERS, ATTR_AREA_ID),
+)
+IMPORT_SCHEDULES_SCHEMA: Final = vol.All(
+    vol.Schema(
+        {
+            vol.Exclusive(ATTR_SNAPSHOT, "source"): SNAPSHOT_SCHEMA,
+            vol.Exclusive(ATTR_SNAPSHOTS, "source"): {cv.string: SNAPSHOT_SCHEMA},
+            **FLEET_TARGET_FIELDS,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_SNAPSHOT, ATTR_SNAPSHOTS),
+)
+
+
+class ScheduleTemplates:
+    """Named schedule templates kept in Home Assistant storage.
+
+    A template holds a `schedule` snapshot and, optionally, an `exclusions`
+    snapshot, both in the canonical form of `schedule_snapshot`.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the template store."""
+        self._store: Store[dict[str, dict]] = Store(
+            hass, _TEMPLATE_STORAGE_VERSION, f"{DOMAIN}.schedule_templates"
+        )
+        self._templates: dict[str, dict] | None = None
+
+    async def async_load(self) -> dict[str, dict]:
+        """Return all templates, loading them on first use."""
+        if self._templates is None:
+            self._templates = await self._store.async_load() or {}
+        return self._templates
+
+    async def async_get(self, name: str) -> dict:
+        """Return one template."""
+        templates = await self.async_load()
+        if name not in templates:
+            raise ServiceValidationError(f"Unknown schedule template: {name}")
+        return templates[name]
+
+    async def async_save(self, name: str, template: dict) -> None:
+        """Store a template, replacing one with the same name."""
+        templates = await self.async_load()
+        templates[name] = template
+        await self._store.async_save(templates)
+
+    async def async_delete(self, name: str) -> None:
+        """Remove a template."""
+        templates = await self.async_load()
+        if templates.pop(name, None) is None:
+            raise ServiceValidationError(f"Unknown schedule template: {name}")
+        await self._store.async_save(templates)
+
+
+def _template_from_mower(
+    coordinator: LandroidCloudCoordinator,
+    serial_number: str,
+    *,
+    include_settings: bool = False,
+) -> dict:
+    """Return a template copying a mower's schedule and exclusions.
+
+    With `include_settings`, the auto-schedule settings are copied as well.
+    """
+    device = coordinator.data[serial_number]
+    settings = auto_schedule_settings(device)
+    template: dict[str, Any] = {
+        "schedule": schedule_snapshot(coordinator.cloud.get_schedule(serial_number))
+    }
+    if isinstance(settings.get("exclusion_scheduler"), dict):
+        template["exclusions"] = exclusion_snapshot(
+            auto_schedule_exclusion_days(device), auto_schedule_exclude_nights(device)
+        )
+    if include_settings and (auto_schedule := auto_schedule_snapshot(settings)):
+        template["auto_schedule"] = auto_schedule
+    return template
+
+
+def _template_from_call(data: dict[str, Any]) -> dict:
+    """Return a template described by service call data."""
+    template: dict[str, Any] = {
+        "schedule": {
+            "time_extension": data.get(ATTR_TIME_EXTENSION),
+            "entries": [
+                {
+                    "day": entry[ATTR_DAY],
+                    "start": entry[ATTR_START],
+                    "duration": entry[ATTR_DURATION],
+                    "boundary": entry.get(ATTR_BOUNDARY),
+                }
+                for entry in data[ATTR_ENTRIES]
+            ],
+        }
+    }
+    if ATTR_DAYS in data or ATTR_EXCLUDE_NIGHTS in data:
+        days = data.get(ATTR_DAYS, {})
+        template["exclusions"] = exclusion_snapshot(
+            [
+                {
+                    "exclude_day": days.get(day, {}).get(ATTR_EXCLUDE_DAY, False),
+                    "slots": [
+                        {
+                            "start_time": slot[ATTR_START],
+                            "duration": slot[ATTR_DURATION],
+                            "reason": slot[ATTR_REASON],
+                        }
+                        for slot in days.get(day, {}).get(ATTR_SLOTS, [])
+                    ],
+                }
+                for day in DAYS
+            ],
+            data.get(ATTR_EXCLUDE_NIGHTS),
+        )
+    return template
+
+
+def _auto_schedule_changes(
+    template: dict, device: DeviceHandler
+) -> dict[str, Any] | None:
+    """Return the auto-schedule changes that bring a mower in line, if any."""
+    changes: dict[str, Any] = {}
+    if (exclusions := template.get("exclusions")) is not None:
+        exclude_nights = exclusions["exclude_nights"]
+        current_nights = auto_schedule_exclude_nights(device)
+        current_exclusions = exclusion_snapshot(
+            auto_schedule_exclusion_days(device),
+            None if exclude_nights is None else current_nights,
+        )
+        if snapshot_hash(current_exclusions) != snapshot_hash(exclusions):
+            changes.update(
+                current_days=current_exclusions["days"],
+                updated_days=exclusions["days"],
+                exclude_nights=(
+                    None if exclude_nights == current_nights else exclude_nights
+                ),
+            )
+    if (settings := template.get("auto_schedule")) is not None:
+        current_settings = auto_schedule_snapshot(auto_schedule_settings(device))
+        if changed := {
+            name: value
+            for name, value in settings.items()
+            if current_settings.get(name) != value
+        }:
+            changes["settings"] = changed
+    return changes or None
+
+
+async def _async_send(
+    coordinator: LandroidCloudCoordinator,
+    serial_number: str,
+    command: Callable[[], Awaitable[object]],
+) -> bool:
+    """Queue one command and return whether it sent anything.
+
+    Template commands write the template's state, so they are safe to retry.
+    """
+    try:
+        await coordinator.command_queue.async_run(
+            serial_number, command, idempotent=True
+        )
+    except CommandSkippedError:
+        return False
+    return True
+
+
+async def async_apply_template(
+    template: dict, coordinator: LandroidCloudCoordinator, serial_number: str
+) -> dict[str, Any]:
+    """Bring one mower in line with a template.
+
+    When its commands are sent, the mower's schedule is diffed against the
+    template with `plan_schedule_write`, and its exclusions and auto-schedule
+    settings are compared with the template's, so only the parts that
+    differ go out.
+    """
+    cloud = coordinator.cloud
+    commands: list[Callable[[], Awaitable[object]]] = []
+
+    if (snapshot := template.get("schedule")) is not None:
+
+        def _desired(current: ScheduleModel) -> ScheduleModel:
+            try:
+                return schedule_from_snapshot(current, snapshot)
+            except ValueError as err:
+                raise HomeAssistantError(str(err)) from err
+
+        commands.append(schedule_write_command(cloud, serial_number, _desired))
+
+    if "exclusions" in template or "auto_schedule" in template:
+
+        async def _async_write_auto_schedule() -> None:
+            device = coordinator.data[serial_number]
+            if (changes := _auto_schedule_changes(template, device)) is None:
+                raise CommandSkippedError("Auto schedule is already up to date")
+            if not auto_schedule_enabled(device):
+                raise HomeAssistantError(
+                    "Enable auto schedule before applying exclusions or settings"
+                )
+            for command in auto_schedule_commands(cloud, serial_number, **changes):
+                await command()
+
+        commands.append(_async_write_auto_schedule)
+
+    sent = await asyncio.gather(
+        *(_async_send(coordinator, serial_number, command) for command in commands)
+    )
+    return {"skipped": not any(sent)}
+
+
+async def _async_handle_save_template(
+    templates: ScheduleTemplates, call: ServiceCall
+) -> ServiceResponse:
+    """Handle the save schedule template service."""
+    if serial_number := call.data.get(ATTR_SERIAL_NUMBER):
+        if any(
+            key in call.data
+            for key in (ATTR_DAYS, ATTR_EXCLUDE_NIGHTS, ATTR_TIME_EXTENSION)
+        ):
+            raise ServiceValidationError(
+                "Copy a mower's schedule or describe one, not both"
+            )
+        targets, _ = resolve_fleet_targets(
+            call.hass, {ATTR_SERIAL_NUMBERS: [serial_number]}
+        )
+        if not targets:
+            raise ServiceValidationError(UNKNOWN_MOWER_MESSAGE)
+        template = _template_from_mower(*targets[0])
+    else:
+        template = _template_from_call(call.data)
+
+    await templates.async_save(call.data[ATTR_TEMPLATE], template)
+    return {"template": call.data[ATTR_TEMPLATE], **template}
+
+
+async def _async_handle_delete_template(
+    templates: ScheduleTemplates, call: ServiceCall
+) -> None:
+    """Handle the delete schedule template service."""
+    await templates.async_delete(call.data[ATTR_TEMPLATE])
+
+
+async def _async_apply_to_fleet(
+    targets: list[tuple[LandroidCloudCoordinator, str]],
+    unknown: list[str],
+    action: Callable[[LandroidCloudCoordinator, str], Awaitable[dict[str, Any]]],
+    data: dict[str, Any],
+) -> ServiceResponse:
+    """Apply templates to many mowers and summarize the results."""
+    if not targets:
+        raise ServiceValidationError("No Landroid mowers matched the request")
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await async_run_fleet(
+        targets,
+        action,
+        max_parallel=data[ATTR_MAX_PARALLEL],
+        stagger=data[ATTR_STAGGER],
+    )
+    for serial_number in unknown:
+        results[serial_number] = {"success": False, "error": UNKNOWN_MOWER_MESSAGE}
+
+    return {
+        "elapsed_ms": round((loop.time() - started) * 1000),
+        "applied": sum(
+            1
+            for result in results.values()
+            if result["success"] and not result["skipped"]
+        ),
+        "skipped": sum(1 for result in results.values() if result.get("skipped")),
+        "results": results,
+    }
+
+
+async def _async_handle_apply_template(
+    templates: ScheduleTemplates, call: ServiceCall
+) -> ServiceResponse:
+    """Handle the apply schedule template service."""
+    template = await templates.async_get(call.data[ATTR_TEMPLATE])
+    targets, unknown = resolve_fleet_targets(call.hass, call.data)
+    return await _async_apply_to_fleet(
+        targets, unknown, partial(async_apply_template, template), call.data
+    )
+
+
+async def _async_handle_export_schedules(call: ServiceCall) -> ServiceResponse:
+    """Handle the export schedules service.
+
+    Snapshots are built from the state pyworxcloud already holds, so the
+    export makes no cloud calls however many mowers it covers.
+    """
+    targets, unknown = resolve_fleet_targets(call.hass, call.data)
+    if not targets:
+        raise ServiceValidationError("No Landroid mowers matched the request")
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    snapshots = {
+        serial_number: snapshot_json(
+            _template_from_mower(coordinator, serial_number, include_settings=True)
+        )
+        for coordinator, serial_number in targets
+    }
+    return {
+        "elapsed_ms": round((loop.time() - started) * 1000),
+        "snapshots": snapshots,
+        "unknown": unknown,
+    }
+
+
+async def _async_handle_import_schedules(call: ServiceCall) -> ServiceResponse:
+    """Handle the import schedules service."""
+    if ATTR_SNAPSHOTS in call.data:
+        snapshots = call.data[ATTR_SNAPSHOTS]
+        targets, unknown = resolve_fleet_targets(
+            call.hass, {ATTR_SERIAL_NUMBERS: list(snapshots)}
+        )
+
+        async def _apply(
+            coordinator: LandroidCloudCoordinator, serial_number: str
+        ) -> dict[str, Any]:
+            """Apply the snapshot exported from this mower."""
+            return await async_apply_template(
+                snapshots[serial_number], coordinator, serial_number
+            )
+
+        return await _async_apply_to_fleet(targets, unknown, _apply, call.data)
+
+    if ATTR_SERIAL_NUMBERS not in call.data and ATTR_AREA_ID not in call.data:
+        raise ServiceValidationError("Select the mowers to import the snapshot to")
+    targets, unknown = resolve_fleet_targets(call.hass, call.data)
+    return await _async_apply_to_fleet(
+        targets,
+        unknown,
+        partial(async_apply_template, call.data[ATTR_SNAPSHOT]),
+        call.data,
+    )
+
+
+def async_setup_template_services(hass: HomeAssistant) -> None:
+    """Register the schedule template services."""
+    templates = ScheduleTemplates(hass)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SAVE_SCHEDULE_TEMPLATE,
+        partial(_async_handle_save_template, templates),
+        schema=SAVE_TEMPLATE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DELETE_SCHEDULE_TEMPLATE,
+        partial(_async_handle_delete_template, templates),
+        schema=DELETE_TEMPLATE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_SCHEDULE_TEMPLATE,
+        partial(_async_handle_apply_template, templates),
+        schema=APPLY_TEMPLATE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_SCHEDULES,
+        _async_handle_export_schedules,
+        schema=EXPORT_SCHEDULES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_SCHEDULES,
+        _async_handle_import_schedules,
+        schema=IMPORT_SCHEDULES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
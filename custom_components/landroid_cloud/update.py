@@ -13,7 +13,7 @@ from homeassistant.components.update import (
     UpdateEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from pyworxcloud.exceptions import APIException, NoConnectionError, OfflineError
@@ -29,7 +29,11 @@ except ImportError:
         """Fallback for older pyworxcloud versions without OTA exception support."""
 
 
-from .commands import cloud_connection_error_message, is_mqtt_connection_not_ready
+from .commands import (
+    CircuitOpenError,
+    cloud_connection_error_message,
+    is_mqtt_connection_not_ready,
+)
 from .entity import LandroidBaseEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -154,15 +158,16 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up Landroid Cloud update entities."""
-    del hass
     coordinator = entry.runtime_data.coordinator
-    entities: list[LandroidFirmwareUpdateEntity] = []
 
-    for serial_number in coordinator.data:
+    async def _async_entities_for_device(
+        serial_number: str,
+    ) -> list[LandroidFirmwareUpdateEntity]:
         try:
             info = await coordinator.async_get_firmware_update_info(serial_number)
         except (
             APIException,
+            CircuitOpenError,
             NoConnectionError,
             OfflineError,
             ValueError,
@@ -175,9 +180,9 @@ async def async_setup_entry(
             info = {}
 
         if info.get("ota_supported") is False:
-            continue
+            return []
 
-        entities.extend(
+        return [
             LandroidFirmwareUpdateEntity(
                 coordinator=coordinator,
                 config_entry=entry,
@@ -185,10 +190,23 @@ async def async_setup_entry(
                 description=description,
             )
             for description in UPDATES
-        )
+        ]
+
+    async def _async_add_device(serial_number: str) -> None:
+        if entities := await _async_entities_for_device(serial_number):
+            async_add_entities(entities)
 
+    entities: list[LandroidFirmwareUpdateEntity] = []
+    for serial_number in coordinator.data:
+        entities.extend(await _async_entities_for_device(serial_number))
     async_add_entities(entities)
 
+    @callback
+    def _async_device_added(serial_number: str) -> None:
+        entry.async_create_task(hass, _async_add_device(serial_number))
+
+    entry.async_on_unload(coordinator.async_add_device_listener(_async_device_added))
+
 
 class LandroidFirmwareUpdateEntity(LandroidBaseEntity, UpdateEntity):
     """Representation of a Landroid firmware update entity."""
@@ -222,6 +240,7 @@ class LandroidFirmwareUpdateEntity(LandroidBaseEntity, UpdateEntity):
                 )
             except (
                 APIException,
+                CircuitOpenError,
                 NoConnectionError,
                 OfflineError,
                 ValueError,
@@ -282,6 +301,7 @@ class LandroidFirmwareUpdateEntity(LandroidBaseEntity, UpdateEntity):
             )
         except (
             APIException,
+            CircuitOpenError,
             NoConnectionError,
             OfflineError,
             ValueError,
@@ -326,8 +346,11 @@ class LandroidFirmwareUpdateEntity(LandroidBaseEntity, UpdateEntity):
             latest_version,
         )
 
+        await self.coordinator.rate_limiter.async_acquire()
         try:
-            await self.coordinator.cloud.start_firmware_upgrade(serial_number)
+            await self.coordinator.circuit_breaker.async_call(
+                lambda: self.coordinator.cloud.start_firmware_upgrade(serial_number)
+            )
         except NoFirmwareOtaError as err:
             raise HomeAssistantError(
                 "This mower does not support OTA firmware upgrades"
@@ -1,13 +1,21 @@
 """Tests for Landroid binary sensors."""
 
 from types import SimpleNamespace
+from unittest.mock import Mock
 
+import pytest
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import EntityCategory
+from pyworxcloud.exceptions import ServiceUnavailableError
 
 from custom_components.landroid_cloud.binary_sensor import (
     BINARY_SENSORS,
+    CLOUD_DEGRADED_SENSOR,
     LandroidBinarySensor,
+    LandroidCloudDegradedSensor,
+    async_setup_entry,
 )
+from custom_components.landroid_cloud.commands import CloudCircuitBreaker
 
 
 def test_binary_sensors_are_diagnostic_entities() -> None:
@@ -102,3 +110,77 @@ def test_charging_binary_sensor_is_unavailable_when_mower_is_offline() -> None:
     entity._attr_requires_online = entity.entity_description.requires_online
 
     assert entity.available is False
+
+
+@pytest.mark.asyncio
+async def test_cloud_degraded_reports_open_circuit_breaker() -> None:
+    """The cloud health sensor should turn on while the breaker is open."""
+    breaker = CloudCircuitBreaker(failure_threshold=1, cooldown=60)
+    coordinator = SimpleNamespace(
+        circuit_breaker=breaker,
+        account_device_info=lambda: {"identifiers": {("landroid_cloud", "entry")}},
+    )
+    entity = LandroidCloudDegradedSensor(coordinator, SimpleNamespace(entry_id="entry"))
+
+    assert entity.unique_id == "entry_cloud_degraded"
+    assert entity.available is True
+    assert entity.is_on is False
+
+    async def _unavailable() -> None:
+        raise ServiceUnavailableError("503")
+
+    with pytest.raises(ServiceUnavailableError):
+        await breaker.async_call(_unavailable)
+
+    assert entity.is_on is True
+    assert entity.extra_state_attributes == {
+        "circuit_state": "open",
+        "consecutive_failures": 1,
+    }
+    assert entity.entity_description.entity_category is EntityCategory.DIAGNOSTIC
+
+
+@pytest.mark.asyncio
+async def test_cloud_degraded_is_created_once_per_account(monkeypatch) -> None:
+    """One cloud health sensor per entry should replace the per-mower ones."""
+    registry = SimpleNamespace(async_remove=Mock())
+    monkeypatch.setattr(er, "async_get", lambda hass: registry)
+    monkeypatch.setattr(
+        er,
+        "async_entries_for_config_entry",
+        lambda registry, entry_id: [
+            SimpleNamespace(
+                domain="binary_sensor",
+                unique_id=unique_id,
+                entity_id=f"binary_sensor.{unique_id}",
+            )
+            for unique_id in (
+                "entry_cloud_degraded",
+                "serial_cloud_degraded",
+                "serial_charging",
+            )
+        ],
+    )
+    coordinator = SimpleNamespace(
+        data={"serial": SimpleNamespace(), "other": SimpleNamespace()},
+        circuit_breaker=CloudCircuitBreaker(failure_threshold=1, cooldown=60),
+        account_device_info=lambda: {},
+        async_add_device_listener=lambda listener: Mock(),
+    )
+    entry = SimpleNamespace(
+        entry_id="entry",
+        runtime_data=SimpleNamespace(coordinator=coordinator),
+        async_on_unload=Mock(),
+    )
+    added: list = []
+
+    await async_setup_entry(SimpleNamespace(), entry, added.extend)
+
+    degraded = [
+        entity
+        for entity in added
+        if entity.entity_description.key == CLOUD_DEGRADED_SENSOR.key
+    ]
+    assert [entity.unique_id for entity in degraded] == ["entry_cloud_degraded"]
+    assert len(added) == 1 + 2 * len(BINARY_SENSORS)
+    registry.async_remove.assert_called_once_with("binary_sensor.serial_cloud_degraded")
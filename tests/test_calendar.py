@@ -0,0 +1,181 @@
+"""Tests for the Landroid schedule calendar."""
+
+from datetime import UTC, date, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock
+from zoneinfo import ZoneInfo
+
+import pytest
+from pyworxcloud import ScheduleEntry, ScheduleModel
+
+from custom_components.landroid_cloud.calendar import (
+    DESCRIPTION_EDGE_CUT,
+    SUMMARY_EXCLUDED,
+    SUMMARY_EXCLUDED_DAY,
+    SUMMARY_MOWING,
+    SUMMARY_ONE_TIME,
+    LandroidScheduleCalendar,
+    WeeklyEvent,
+    expand_pattern,
+    weekly_pattern,
+)
+
+COPENHAGEN = ZoneInfo("Europe/Copenhagen")
+
+
+def _schedule(
+    *entries: tuple[str, str, int, bool], time_extension: int = 0, enabled=True
+) -> ScheduleModel:
+    return ScheduleModel(
+        enabled=enabled,
+        time_extension=time_extension,
+        entries=[
+            ScheduleEntry(
+                entry_id=f"p0:{day}:primary",
+                day=day,
+                start=start,
+                duration=duration,
+                boundary=boundary,
+                source="primary",
+                secondary=False,
+            )
+            for day, start, duration, boundary in entries
+        ],
+        protocol=0,
+    )
+
+
+def _exclusions(**days: dict) -> list[dict]:
+    names = ("sunday", "monday", "tuesday", "wednesday", "thursday", "friday")
+    names += ("saturday",)
+    return [days.get(name, {"exclude_day": False, "slots": []}) for name in names]
+
+
+def test_weekly_pattern_places_entries_and_exclusions_in_the_week() -> None:
+    """Entries carry the time extension and exclusions become their own events."""
+    pattern = weekly_pattern(
+        _schedule(("monday", "10:00", 60, True), time_extension=50),
+        _exclusions(
+            sunday={"exclude_day": True, "slots": []},
+            monday={
+                "exclude_day": False,
+                "slots": [{"start_time": 480, "duration": 30, "reason": "irrigation"}],
+            },
+        ),
+    )
+
+    assert pattern == (
+        WeeklyEvent(0, 1440, SUMMARY_EXCLUDED_DAY, all_day=True),
+        WeeklyEvent(1440 + 480, 30, SUMMARY_EXCLUDED, "irrigation"),
+        WeeklyEvent(1440 + 600, 90, SUMMARY_MOWING, DESCRIPTION_EDGE_CUT),
+    )
+
+
+def test_disabled_schedule_has_no_mowing_events() -> None:
+    """A disabled schedule should not show mowing on the calendar."""
+    assert (
+        weekly_pattern(_schedule(("monday", "10:00", 60, False), enabled=False)) == ()
+    )
+
+
+def test_expand_pattern_steps_weeks_over_long_ranges() -> None:
+    """A quarter-year range should hold one occurrence per entry and week."""
+    pattern = weekly_pattern(
+        _schedule(("monday", "10:00", 60, False), ("thursday", "14:00", 30, False))
+    )
+
+    events = expand_pattern(
+        pattern,
+        UTC,
+        datetime(2026, 1, 4, tzinfo=UTC),
+        datetime(2026, 4, 5, tzinfo=UTC),
+    )
+
+    assert len(events) == 26
+    assert events[0].start == datetime(2026, 1, 5, 10, 0, tzinfo=UTC)
+    assert events[-1].start == datetime(2026, 4, 2, 14, 0, tzinfo=UTC)
+    assert all(a.start < b.start for a, b in zip(events, events[1:], strict=False))
+
+
+def test_expand_pattern_keeps_wall_clock_times_across_dst() -> None:
+    """Occurrences should start at the same local time before and after DST."""
+    pattern = weekly_pattern(_schedule(("monday", "10:00", 60, False)))
+
+    events = expand_pattern(
+        pattern,
+        COPENHAGEN,
+        datetime(2026, 3, 22, tzinfo=COPENHAGEN),
+        datetime(2026, 4, 5, tzinfo=COPENHAGEN),
+    )
+
+    assert [(event.start.hour, event.start.utcoffset()) for event in events] == [
+        (10, timedelta(hours=1)),
+        (10, timedelta(hours=2)),
+    ]
+
+
+def test_expand_pattern_includes_events_running_into_the_range() -> None:
+    """A Saturday night run should still show on a range starting Sunday."""
+    pattern = weekly_pattern(
+        _schedule(("saturday", "23:00", 120, False)),
+        _exclusions(sunday={"exclude_day": True, "slots": []}),
+    )
+
+    events = expand_pattern(
+        pattern,
+        UTC,
+        datetime(2026, 1, 4, 0, 30, tzinfo=UTC),
+        datetime(2026, 1, 4, 12, 0, tzinfo=UTC),
+    )
+
+    assert [(event.summary, event.start) for event in events] == [
+        (SUMMARY_MOWING, datetime(2026, 1, 3, 23, 0, tzinfo=UTC)),
+        (SUMMARY_EXCLUDED_DAY, date(2026, 1, 4)),
+    ]
+
+
+def _calendar(schedule: ScheduleModel) -> LandroidScheduleCalendar:
+    entity = object.__new__(LandroidScheduleCalendar)
+    entity._serial_number = "serial"
+    entity._pattern = None
+    entity._expansions = {}
+    entity.coordinator = SimpleNamespace(
+        cloud=SimpleNamespace(get_schedule=Mock(return_value=schedule)),
+        data={"serial": SimpleNamespace(serial_number="serial", time_zone="UTC")},
+        one_time_run=Mock(return_value=None),
+    )
+    return entity
+
+
+@pytest.mark.asyncio
+async def test_get_events_is_cached_until_the_schedule_changes() -> None:
+    """Repeated ranges should reuse the expansion of the same schedule."""
+    entity = _calendar(_schedule(("monday", "10:00", 60, False)))
+    start, end = datetime(2026, 1, 1, tzinfo=UTC), datetime(2026, 2, 1, tzinfo=UTC)
+
+    first = await entity.async_get_events(None, start, end)
+    assert await entity.async_get_events(None, start, end) == first
+    assert entity._expansions[(start, end)] == first
+
+    entity.coordinator.cloud.get_schedule.return_value = _schedule(
+        ("tuesday", "10:00", 60, False)
+    )
+    changed = await entity.async_get_events(None, start, end)
+
+    assert [event.start.weekday() for event in changed] == [1] * 4
+
+
+@pytest.mark.asyncio
+async def test_one_time_schedule_is_shown_for_its_runtime() -> None:
+    """A one-time schedule sent through the integration should be an event."""
+    entity = _calendar(_schedule())
+    started = datetime(2026, 1, 5, 9, 0, tzinfo=UTC)
+    entity.coordinator.one_time_run.return_value = (started, 45)
+
+    events = await entity.async_get_events(
+        None, datetime(2026, 1, 5, tzinfo=UTC), datetime(2026, 1, 6, tzinfo=UTC)
+    )
+
+    assert [(e.summary, e.start, e.end) for e in events] == [
+        (SUMMARY_ONE_TIME, started, started + timedelta(minutes=45))
+    ]
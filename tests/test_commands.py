@@ -1,12 +1,32 @@
 """Tests for cloud command error handling."""
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 from homeassistant.exceptions import HomeAssistantError
-from pyworxcloud.exceptions import APIException, NoConnectionError, OfflineError
+from pyworxcloud.exceptions import (
+    APIException,
+    NoConnectionError,
+    OfflineError,
+    ServiceUnavailableError,
+    TimeoutException,
+)
 
-from custom_components.landroid_cloud.commands import async_run_cloud_command
+from custom_components.landroid_cloud.commands import (
+    ACK_TIMEOUT_MESSAGE,
+    AckTracker,
+    AdaptiveTimeout,
+    CircuitOpenError,
+    CircuitState,
+    CloudCircuitBreaker,
+    CloudRateLimiter,
+    CommandAck,
+    LandroidCommandQueue,
+    MOWER_REMOVED_MESSAGE,
+    RetryPolicy,
+    async_run_cloud_command,
+)
 
 
 @pytest.mark.asyncio
@@ -37,3 +57,644 @@ async def test_async_run_cloud_command_maps_api_errors() -> None:
 
     with pytest.raises(HomeAssistantError, match="Cloud command failed"):
         await async_run_cloud_command(command)
+
+
+class _GatedCommands:
+    """Record command order and hold each command until released."""
+
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self.release = asyncio.Event()
+
+    def command(self, name: str):
+        async def _command() -> None:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.sent.append(name)
+            await self.release.wait()
+            self.active -= 1
+
+        return _command
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_command_queue_runs_one_command_at_a_time_per_mower() -> None:
+    """Commands for the same mower must not overlap."""
+    queue = LandroidCommandQueue()
+    gated = _GatedCommands()
+
+    tasks = [
+        asyncio.create_task(queue.async_run("serial", gated.command(name)))
+        for name in ("start", "edgecut", "reset")
+    ]
+    await _settle()
+    gated.release.set()
+    await asyncio.gather(*tasks)
+
+    assert gated.sent == ["start", "edgecut", "reset"]
+    assert gated.max_active == 1
+
+
+@pytest.mark.asyncio
+async def test_command_queue_coalesces_setpoints_with_the_same_key() -> None:
+    """Only the latest queued value for one key should be sent."""
+    queue = LandroidCommandQueue()
+    gated = _GatedCommands()
+
+    running = asyncio.create_task(queue.async_run("serial", gated.command("start")))
+    await _settle()
+    queued = [
+        asyncio.create_task(
+            queue.async_run("serial", gated.command(f"height={value}"), key="height")
+        )
+        for value in (30, 40, 50)
+    ]
+    await _settle()
+    assert queue.diagnostics()["depth"] == {"serial": 1}
+
+    gated.release.set()
+    await asyncio.gather(running, *queued)
+
+    assert gated.sent == ["start", "height=50"]
+    assert queue.diagnostics()["coalesced"] == 2
+    assert queue.diagnostics()["executed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_command_queue_runs_priority_commands_before_setpoints() -> None:
+    """Pause and home should skip ahead of queued setpoints."""
+    queue = LandroidCommandQueue()
+    gated = _GatedCommands()
+
+    running = asyncio.create_task(queue.async_run("serial", gated.command("start")))
+    await _settle()
+    setpoint = asyncio.create_task(
+        queue.async_run("serial", gated.command("torque"), key="torque")
+    )
+    await _settle()
+    pause = asyncio.create_task(
+        queue.async_run("serial", gated.command("pause"), priority=True)
+    )
+    await _settle()
+
+    gated.release.set()
+    await asyncio.gather(running, setpoint, pause)
+
+    assert gated.sent == ["start", "pause", "torque"]
+
+
+@pytest.mark.asyncio
+async def test_command_queue_coalescing_keeps_a_newer_priority() -> None:
+    """A priority setpoint replacing a queued one should still skip ahead."""
+    queue = LandroidCommandQueue()
+    gated = _GatedCommands()
+
+    running = asyncio.create_task(queue.async_run("serial", gated.command("start")))
+    await _settle()
+    tasks = [
+        asyncio.create_task(
+            queue.async_run("serial", gated.command("torque"), key="torque")
+        ),
+        asyncio.create_task(
+            queue.async_run("serial", gated.command("lock"), key="lock")
+        ),
+        asyncio.create_task(
+            queue.async_run(
+                "serial", gated.command("unlock"), key="lock", priority=True
+            )
+        ),
+    ]
+    await _settle()
+
+    gated.release.set()
+    await asyncio.gather(running, *tasks)
+
+    assert gated.sent == ["start", "unlock", "torque"]
+
+
+@pytest.mark.asyncio
+async def test_command_queue_reports_errors_and_keeps_draining() -> None:
+    """A failing command should raise for its caller only."""
+    queue = LandroidCommandQueue()
+    follow_up = AsyncMock()
+
+    failing = asyncio.create_task(
+        queue.async_run("serial", AsyncMock(side_effect=OfflineError("offline")))
+    )
+    succeeding = asyncio.create_task(queue.async_run("serial", follow_up))
+
+    with pytest.raises(HomeAssistantError, match="Mower is unavailable"):
+        await failing
+    await succeeding
+
+    follow_up.assert_awaited_once_with()
+    assert queue.diagnostics()["depth"] == {}
+
+
+@pytest.mark.asyncio
+async def test_command_queue_runs_mowers_independently() -> None:
+    """A slow command for one mower must not block another mower."""
+    queue = LandroidCommandQueue()
+    gated = _GatedCommands()
+    other = AsyncMock()
+
+    blocked = asyncio.create_task(queue.async_run("a", gated.command("start")))
+    await _settle()
+    await asyncio.wait_for(queue.async_run("b", other), timeout=1)
+
+    other.assert_awaited_once_with()
+    gated.release.set()
+    await blocked
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_allows_a_burst_then_waits_for_tokens() -> None:
+    """Calls beyond the burst should wait for a token instead of failing."""
+    limiter = CloudRateLimiter(rate_per_minute=1200, burst=2)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    for _ in range(3):
+        await limiter.async_acquire()
+
+    diagnostics = limiter.diagnostics()
+    assert loop.time() - started >= 0.04
+    assert diagnostics["acquired"] == 3
+    assert diagnostics["throttled"] == 1
+    assert diagnostics["throttled_seconds"] == pytest.approx(0.05, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_command_queue_takes_a_token_per_command() -> None:
+    """Queued commands should be spread out by the shared limiter."""
+    limiter = CloudRateLimiter(rate_per_minute=1200, burst=1)
+    queue = LandroidCommandQueue(limiter)
+    first = AsyncMock()
+    second = AsyncMock()
+
+    await asyncio.gather(queue.async_run("a", first), queue.async_run("b", second))
+
+    first.assert_awaited_once_with()
+    second.assert_awaited_once_with()
+    assert limiter.diagnostics()["throttled"] == 1
+
+
+_FAST_RETRY = RetryPolicy(max_attempts=3, base_delay=0.001, jitter=0.5, deadline=5)
+
+
+def test_retry_policy_backs_off_exponentially_within_jitter() -> None:
+    """Each retry should wait roughly twice as long as the previous one."""
+    policy = RetryPolicy(max_attempts=5, base_delay=1.0, jitter=0.2, deadline=30)
+
+    for attempt, backoff in ((1, 1.0), (2, 2.0), (3, 4.0)):
+        assert backoff * 0.8 <= policy.delay(attempt) <= backoff * 1.2
+
+
+@pytest.mark.asyncio
+async def test_command_queue_retries_keyed_commands_on_transient_errors() -> None:
+    """Setpoints should be resent after a transient cloud failure."""
+    queue = LandroidCommandQueue(retry_policy=_FAST_RETRY)
+    command = AsyncMock(side_effect=[ServiceUnavailableError("503"), None])
+
+    await queue.async_run("serial", command, key="cutting_height")
+
+    assert command.await_count == 2
+    assert queue.diagnostics()["retries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_command_queue_retries_idempotent_unkeyed_commands() -> None:
+    """Full-state writes should be retried without being coalesced."""
+    queue = LandroidCommandQueue(retry_policy=_FAST_RETRY)
+    command = AsyncMock(side_effect=[ServiceUnavailableError("503"), None])
+    other = AsyncMock()
+
+    await asyncio.gather(
+        queue.async_run("serial", command, idempotent=True),
+        queue.async_run("serial", other, idempotent=True),
+    )
+
+    assert command.await_count == 2
+    other.assert_awaited_once()
+    assert queue.diagnostics()["retries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_command_queue_gives_up_after_max_attempts() -> None:
+    """Retries should stop at the configured number of attempts."""
+    queue = LandroidCommandQueue(retry_policy=_FAST_RETRY)
+    command = AsyncMock(side_effect=NoConnectionError("MQTT connection is not ready"))
+
+    with pytest.raises(HomeAssistantError, match="MQTT is not connected"):
+        await queue.async_run("serial", command, key="torque")
+
+    assert command.await_count == 3
+    assert queue.diagnostics()["retries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_command_queue_does_not_retry_toggles_or_permanent_errors() -> None:
+    """Unkeyed commands and non-transient errors must be sent only once."""
+    queue = LandroidCommandQueue(retry_policy=_FAST_RETRY)
+    edgecut = AsyncMock(side_effect=NoConnectionError("MQTT connection is not ready"))
+    offline = AsyncMock(side_effect=OfflineError("offline"))
+
+    with pytest.raises(HomeAssistantError):
+        await queue.async_run("serial", edgecut)
+    with pytest.raises(HomeAssistantError):
+        await queue.async_run("serial", offline, key="torque")
+
+    assert edgecut.await_count == 1
+    assert offline.await_count == 1
+    assert queue.diagnostics()["retries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_command_queue_stops_retrying_at_the_deadline() -> None:
+    """Retries should not outlast the command timeout."""
+    policy = RetryPolicy(max_attempts=10, base_delay=1.0, jitter=0, deadline=0.5)
+    queue = LandroidCommandQueue(retry_policy=policy)
+    command = AsyncMock(side_effect=ServiceUnavailableError("503"))
+
+    with pytest.raises(ServiceUnavailableError):
+        await queue.async_run("serial", command, key="torque")
+
+    assert command.await_count == 1
+
+
+def _mqtt_down_command(connection: dict, sent: list[str], name: str):
+    async def _command() -> None:
+        if not connection["up"]:
+            raise NoConnectionError("MQTT connection is not ready")
+        sent.append(name)
+
+    return _command
+
+
+@pytest.mark.asyncio
+async def test_command_queue_holds_commands_until_mqtt_reconnects() -> None:
+    """Commands issued while MQTT is down should be sent in order on reconnect."""
+    queue = LandroidCommandQueue(offline_ttl=5)
+    connection = {"up": False}
+    sent: list[str] = []
+
+    def _run(name: str, key: str | None) -> asyncio.Task:
+        return asyncio.create_task(
+            queue.async_run(
+                "serial", _mqtt_down_command(connection, sent, name), key=key
+            )
+        )
+
+    tasks = [_run("height=30", "height"), _run("start", None)]
+    await _settle()
+    tasks.append(_run("height=40", "height"))
+    await _settle()
+    assert not any(task.done() for task in tasks)
+    assert queue.diagnostics()["offline_held"] == {"serial": 2}
+
+    connection["up"] = True
+    queue.flush_offline()
+    await asyncio.gather(*tasks)
+
+    assert sent == ["start", "height=40"]
+    assert queue.diagnostics()["offline_flushed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_command_queue_fails_held_commands_after_ttl() -> None:
+    """Held commands should fail once the TTL passes without a reconnect."""
+    queue = LandroidCommandQueue(offline_ttl=0.01)
+    command = AsyncMock(side_effect=NoConnectionError("MQTT connection is not ready"))
+
+    with pytest.raises(HomeAssistantError, match="did not reconnect in time"):
+        await queue.async_run("serial", command, key="torque")
+
+    assert queue.diagnostics()["offline_expired"] == 1
+    assert queue.diagnostics()["offline_held"] == {}
+
+
+@pytest.mark.asyncio
+async def test_command_queue_forgets_removed_mowers() -> None:
+    """Queued and held commands for a removed mower should fail, not linger."""
+    queue = LandroidCommandQueue(offline_ttl=5)
+    release = asyncio.Event()
+    sent: list[str] = []
+
+    async def _blocking() -> None:
+        await release.wait()
+        sent.append("running")
+
+    running = asyncio.create_task(queue.async_run("serial", _blocking))
+    queued = asyncio.create_task(queue.async_run("serial", AsyncMock(), key="height"))
+    held = asyncio.create_task(
+        queue.async_run(
+            "other",
+            AsyncMock(side_effect=NoConnectionError("MQTT connection is not ready")),
+        )
+    )
+    await _settle()
+
+    queue.forget("serial")
+    queue.forget("other")
+    release.set()
+    await running
+
+    for task in (queued, held):
+        with pytest.raises(HomeAssistantError, match=MOWER_REMOVED_MESSAGE):
+            await task
+    assert sent == ["running"]
+    assert queue.diagnostics()["offline_held"] == {}
+    await queue.async_run("serial", AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_command_queue_without_offline_ttl_fails_immediately() -> None:
+    """Holding is opt-in; by default MQTT disconnects still fail fast."""
+    queue = LandroidCommandQueue()
+    command = AsyncMock(side_effect=NoConnectionError("MQTT connection is not ready"))
+
+    with pytest.raises(HomeAssistantError, match="MQTT is not connected"):
+        await queue.async_run("serial", command)
+
+
+class _Clock:
+    """Controllable stand-in for time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    """Freeze the breaker clock so cooldowns can be stepped through."""
+    clock = _Clock()
+    monkeypatch.setattr(
+        "custom_components.landroid_cloud.commands.time.monotonic", clock
+    )
+    return clock
+
+
+async def _fail_with(err: Exception) -> None:
+    raise err
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_opens_after_consecutive_degraded_responses(
+    clock,
+) -> None:
+    """Repeated 5xx responses and timeouts should make calls fail fast."""
+    changes: list[CircuitState] = []
+    breaker = CloudCircuitBreaker(
+        failure_threshold=3,
+        cooldown=60,
+        state_changed=lambda: changes.append(breaker.state),
+    )
+
+    for err in (ServiceUnavailableError("503"), TimeoutError(), TimeoutError()):
+        with pytest.raises(type(err)):
+            await breaker.async_call(lambda err=err: _fail_with(err))
+
+    command = AsyncMock()
+    with pytest.raises(CircuitOpenError, match="paused for 60 seconds"):
+        await breaker.async_call(command)
+
+    command.assert_not_awaited()
+    assert breaker.state is CircuitState.OPEN
+    assert changes == [CircuitState.OPEN]
+    assert breaker.diagnostics()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_ignores_errors_that_are_not_cloud_degradation(
+    clock,
+) -> None:
+    """Rejected commands and MQTT hiccups should not trip the breaker."""
+    breaker = CloudCircuitBreaker(failure_threshold=2, cooldown=60)
+
+    with pytest.raises(TimeoutError):
+        await breaker.async_call(lambda: _fail_with(TimeoutError()))
+    with pytest.raises(OfflineError):
+        await breaker.async_call(lambda: _fail_with(OfflineError("offline")))
+    with pytest.raises(TimeoutError):
+        await breaker.async_call(lambda: _fail_with(TimeoutError()))
+    with pytest.raises(NoConnectionError):
+        await breaker.async_call(
+            lambda: _fail_with(NoConnectionError("MQTT connection is not ready"))
+        )
+
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.diagnostics()["consecutive_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_half_open_probe_closes_or_reopens(clock) -> None:
+    """After the cooldown one probe decides whether the breaker closes."""
+    breaker = CloudCircuitBreaker(failure_threshold=1, cooldown=60)
+    with pytest.raises(TimeoutError):
+        await breaker.async_call(lambda: _fail_with(TimeoutError()))
+
+    clock.now += 61
+    assert breaker.state is CircuitState.HALF_OPEN
+    with pytest.raises(TimeoutError):
+        await breaker.async_call(lambda: _fail_with(TimeoutError()))
+    assert breaker.state is CircuitState.OPEN
+
+    clock.now += 61
+    probe = AsyncMock(return_value="ok")
+    assert await breaker.async_call(probe) == "ok"
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.diagnostics()["trips"] == 1
+
+
+@pytest.mark.asyncio
+async def test_command_queue_fails_fast_while_circuit_is_open() -> None:
+    """Queued commands should not wait out timeouts while the cloud is down."""
+    breaker = CloudCircuitBreaker(failure_threshold=1, cooldown=60)
+    queue = LandroidCommandQueue(retry_policy=_FAST_RETRY, breaker=breaker)
+    command = AsyncMock(side_effect=ServiceUnavailableError("503"))
+
+    with pytest.raises(CircuitOpenError):
+        await queue.async_run("serial", command, key="torque")
+
+    assert command.await_count == 1
+
+
+def test_adaptive_timeout_uses_maximum_until_enough_samples() -> None:
+    """A mower without latency history keeps the configured timeout."""
+    timeouts = AdaptiveTimeout(minimum=1.0, maximum=30.0)
+    for _ in range(4):
+        timeouts.record("serial", 0.2)
+
+    assert timeouts.timeout("serial") == 30.0
+    assert timeouts.timeout("other") == 30.0
+
+
+def test_adaptive_timeout_follows_high_latency_percentile_within_bounds() -> None:
+    """The timeout should track each mower's own latency, clamped to bounds."""
+    timeouts = AdaptiveTimeout(minimum=1.0, maximum=30.0)
+    for latency in (2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 4.0):
+        timeouts.record("weak_wifi", latency)
+    for _ in range(10):
+        timeouts.record("healthy", 0.1)
+        timeouts.record("offline_prone", 60.0)
+
+    assert timeouts.timeout("weak_wifi") == pytest.approx(6.0)
+    assert timeouts.timeout("healthy") == 1.0
+    assert timeouts.timeout("offline_prone") == 30.0
+
+
+def test_adaptive_timeout_counts_misses_as_worst_case_samples() -> None:
+    """Timeouts should push the adaptive timeout back up."""
+    timeouts = AdaptiveTimeout(minimum=1.0, maximum=30.0)
+    for _ in range(10):
+        timeouts.record("serial", 0.5)
+    timeouts.record_timeout("serial")
+
+    assert timeouts.timeout("serial") == 30.0
+    assert timeouts.diagnostics()["serial"]["timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_command_queue_fails_fast_on_healthy_mowers() -> None:
+    """A command slower than the learned timeout should be cut off."""
+    timeouts = AdaptiveTimeout(minimum=0.01, maximum=30.0)
+    for _ in range(5):
+        timeouts.record("healthy", 0.001)
+    queue = LandroidCommandQueue(timeouts=timeouts)
+
+    async def _slow() -> None:
+        await asyncio.sleep(30)
+
+    with pytest.raises(HomeAssistantError, match=ACK_TIMEOUT_MESSAGE):
+        await queue.async_run("healthy", _slow)
+    await queue.async_run("healthy", AsyncMock())
+
+    assert timeouts.diagnostics()["healthy"]["samples"] == 6
+    assert timeouts.diagnostics()["healthy"]["timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_adaptive_timeouts_do_not_trip_the_circuit_breaker() -> None:
+    """Only a miss at the configured timeout should count as cloud trouble."""
+    breaker = CloudCircuitBreaker(failure_threshold=1, cooldown=60)
+    timeouts = AdaptiveTimeout(minimum=1.0, maximum=30.0)
+    for _ in range(5):
+        timeouts.record("healthy", 0.1)
+    queue = LandroidCommandQueue(breaker=breaker, timeouts=timeouts)
+    command = AsyncMock(side_effect=TimeoutException("no response"))
+
+    with pytest.raises(HomeAssistantError, match=ACK_TIMEOUT_MESSAGE):
+        await queue.async_run("healthy", command)
+    assert breaker.state is CircuitState.CLOSED
+    assert timeouts.diagnostics()["healthy"]["timeouts"] == 1
+
+    with pytest.raises(HomeAssistantError, match=ACK_TIMEOUT_MESSAGE):
+        await queue.async_run("new", command)
+    assert breaker.state is CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_ack_tracker_confirms_on_the_push_that_reflects_the_change() -> None:
+    """Only a push where the check passes should acknowledge the command."""
+    tracker = AckTracker()
+    state = {"status": "docked"}
+    pending = tracker.expect(
+        "serial", CommandAck("start_mowing", lambda: state["status"] == "mowing")
+    )
+
+    tracker.process("serial")
+    assert not pending.future.done()
+
+    state["status"] = "mowing"
+    tracker.process("other")
+    assert not pending.future.done()
+    tracker.process("serial")
+
+    assert await tracker.async_wait(pending) >= 0
+    diagnostics = tracker.diagnostics()["start_mowing"]
+    assert diagnostics["acknowledged"] == 1
+    assert diagnostics["histogram"]["<=1s"] == 1
+
+
+@pytest.mark.asyncio
+async def test_ack_tracker_without_check_confirms_on_next_push_after_sending() -> None:
+    """A push from before a command without a check ran should not confirm it."""
+    tracker = AckTracker()
+    pending = tracker.expect("serial", CommandAck("set_nutrition"))
+
+    tracker.process("serial")
+    assert not pending.future.done()
+
+    pending.published = asyncio.get_running_loop().time()
+    tracker.process("serial")
+
+    assert pending.future.done()
+    assert tracker.latest("serial", "set_nutrition") is pending
+
+
+@pytest.mark.asyncio
+async def test_ack_tracker_feeds_publish_to_push_latency_to_timeouts() -> None:
+    """Only commands the queue published should add a latency sample."""
+    timeouts = AdaptiveTimeout(minimum=1.0, maximum=30.0)
+    tracker = AckTracker(timeouts=timeouts)
+    published = tracker.expect("serial", CommandAck("dock"))
+    published.published = asyncio.get_running_loop().time()
+    tracker.expect("other", CommandAck("dock")).published = None
+
+    tracker.process("serial")
+    tracker.process("other")
+
+    assert published.future.done()
+    assert timeouts.diagnostics()["serial"]["samples"] == 1
+    assert "other" not in timeouts.diagnostics()
+
+
+@pytest.mark.asyncio
+async def test_ack_tracker_counts_unconfirmed_commands() -> None:
+    """Waiting callers should get an error when no push confirms the command."""
+    tracker = AckTracker(timeout=0.01)
+    pending = tracker.expect("serial", CommandAck("pause", lambda: False))
+
+    with pytest.raises(HomeAssistantError, match="did not confirm pause"):
+        await tracker.async_wait(pending)
+
+    assert tracker.diagnostics()["pause"]["unacknowledged"] == 1
+    assert tracker.diagnostics()["pause"]["acknowledged"] == 0
+
+
+@pytest.mark.asyncio
+async def test_ack_tracker_forgets_removed_mowers() -> None:
+    """Commands to a removed mower should stop waiting for a push."""
+    tracker = AckTracker()
+    pending = tracker.expect("serial", CommandAck("dock"))
+    other = tracker.expect("other", CommandAck("dock"))
+
+    tracker.forget("serial")
+
+    assert pending.future.cancelled()
+    assert tracker.latest("serial", "dock") is None
+    assert tracker.latest("other", "dock") is other
+
+
+@pytest.mark.asyncio
+async def test_ack_tracker_discards_commands_that_were_not_sent() -> None:
+    """A failed send should not wait for or count an acknowledgement."""
+    tracker = AckTracker()
+    pending = tracker.expect("serial", CommandAck("dock"))
+
+    tracker.discard("serial", pending)
+    tracker.process("serial")
+
+    assert pending.future.cancelled()
+    assert tracker.latest("serial", "dock") is None
+    assert tracker.diagnostics() == {}
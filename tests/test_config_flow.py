@@ -12,7 +12,20 @@ from custom_components.landroid_cloud.config_flow import (
     STEP_USER_DATA_SCHEMA,
     LandroidCloudOptionsFlow,
 )
-from custom_components.landroid_cloud.const import CONF_CLOUD, CONF_COMMAND_TIMEOUT
+from custom_components.landroid_cloud.const import (
+    CONF_CLOUD,
+    CONF_COMMAND_TIMEOUT,
+    CONF_OFFLINE_TTL,
+    CONF_RATE_LIMIT,
+    CONF_RATE_LIMIT_BURST,
+    CONF_RETRY,
+    CONF_RETRY_BASE_DELAY,
+    CONF_RETRY_JITTER,
+    CONF_RETRY_MAX_ATTEMPTS,
+    CONF_TELEMETRY_AVERAGE_WINDOW,
+    CONF_TELEMETRY_FILTER,
+    CONF_TELEMETRY_MIN_INTERVAL,
+)
 
 
 def test_cloud_selector_uses_translated_labels() -> None:
@@ -55,9 +68,9 @@ async def test_options_flow_shows_account_fields_without_command_timeout() -> No
     )
     flow = LandroidCloudOptionsFlow(entry)
 
-    result = await flow.async_step_init()
+    result = await flow.async_step_account()
 
-    assert result["step_id"] == "init"
+    assert result["step_id"] == "account"
     schema_keys = {key.schema for key in result["data_schema"].schema}
     assert schema_keys == {CONF_EMAIL, CONF_PASSWORD}
     assert CONF_COMMAND_TIMEOUT not in schema_keys
@@ -105,7 +118,7 @@ async def test_options_flow_updates_account_credentials(monkeypatch) -> None:
     flow = LandroidCloudOptionsFlow(entry)
     flow.hass = SimpleNamespace(config_entries=ConfigEntries())
 
-    result = await flow.async_step_init(
+    result = await flow.async_step_account(
         {
             CONF_EMAIL: "new@example.com",
             CONF_PASSWORD: "new-secret",
@@ -113,7 +126,7 @@ async def test_options_flow_updates_account_credentials(monkeypatch) -> None:
     )
 
     assert result["type"] == "create_entry"
-    assert result["data"] == {}
+    assert result["data"] == {CONF_COMMAND_TIMEOUT: 12.0}
     assert updates == [
         {
             "data": {
@@ -125,3 +138,92 @@ async def test_options_flow_updates_account_credentials(monkeypatch) -> None:
             "unique_id": "new@example.com::worx",
         }
     ]
+
+
+def _options_entry(options: dict | None = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        data={
+            CONF_EMAIL: "user@example.com",
+            CONF_PASSWORD: "secret",
+            CONF_CLOUD: "worx",
+        },
+        options=options or {},
+        entry_id="entry-1",
+        unique_id="user@example.com::worx",
+    )
+
+
+@pytest.mark.asyncio
+async def test_options_flow_starts_with_menu() -> None:
+    """Options flow should offer account, telemetry and command settings."""
+    flow = LandroidCloudOptionsFlow(_options_entry())
+
+    result = await flow.async_step_init()
+
+    assert result["type"] == "menu"
+    assert result["menu_options"] == ["account", "telemetry", "commands"]
+
+
+@pytest.mark.asyncio
+async def test_options_flow_shows_telemetry_defaults() -> None:
+    """Telemetry step should expose the filter defaults."""
+    flow = LandroidCloudOptionsFlow(_options_entry())
+
+    result = await flow.async_step_telemetry()
+
+    assert result["step_id"] == "telemetry"
+    defaults = {key.schema: key.default() for key in result["data_schema"].schema}
+    assert defaults == {
+        CONF_TELEMETRY_FILTER: True,
+        CONF_TELEMETRY_MIN_INTERVAL: 0,
+        CONF_TELEMETRY_AVERAGE_WINDOW: 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_options_flow_saves_telemetry_without_dropping_other_options() -> None:
+    """Submitting telemetry settings should keep unrelated options."""
+    flow = LandroidCloudOptionsFlow(_options_entry({CONF_COMMAND_TIMEOUT: 12.0}))
+
+    result = await flow.async_step_telemetry(
+        {
+            CONF_TELEMETRY_FILTER: False,
+            CONF_TELEMETRY_MIN_INTERVAL: 10,
+            CONF_TELEMETRY_AVERAGE_WINDOW: 60,
+        }
+    )
+
+    assert result["type"] == "create_entry"
+    assert result["data"] == {
+        CONF_COMMAND_TIMEOUT: 12.0,
+        CONF_TELEMETRY_FILTER: False,
+        CONF_TELEMETRY_MIN_INTERVAL: 10,
+        CONF_TELEMETRY_AVERAGE_WINDOW: 60,
+    }
+
+
+@pytest.mark.asyncio
+async def test_options_flow_saves_command_rate_limit() -> None:
+    """Command step should default to the shipped limits and keep other options."""
+    flow = LandroidCloudOptionsFlow(_options_entry({CONF_TELEMETRY_FILTER: False}))
+
+    form = await flow.async_step_commands()
+    defaults = {key.schema: key.default() for key in form["data_schema"].schema}
+    result = await flow.async_step_commands(
+        {CONF_RATE_LIMIT: 12, CONF_RATE_LIMIT_BURST: 3}
+    )
+
+    assert defaults == {
+        CONF_RATE_LIMIT: 30,
+        CONF_RATE_LIMIT_BURST: 10,
+        CONF_RETRY: False,
+        CONF_RETRY_MAX_ATTEMPTS: 3,
+        CONF_RETRY_BASE_DELAY: 1.0,
+        CONF_RETRY_JITTER: 20,
+        CONF_OFFLINE_TTL: 0,
+    }
+    assert result["data"] == {
+        CONF_TELEMETRY_FILTER: False,
+        CONF_RATE_LIMIT: 12,
+        CONF_RATE_LIMIT_BURST: 3,
+    }
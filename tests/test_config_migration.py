@@ -7,7 +7,11 @@ from types import MappingProxyType, SimpleNamespace
 import pytest
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 
-from custom_components.landroid_cloud import async_migrate_entry, async_setup_entry
+from custom_components.landroid_cloud import (
+    async_migrate_entry,
+    async_remove_config_entry_device,
+    async_setup_entry,
+)
 from custom_components.landroid_cloud.const import CONF_CLOUD, DEFAULT_CLOUD, DOMAIN
 
 
@@ -182,11 +186,15 @@ async def test_async_setup_entry_falls_back_to_legacy_type_field(monkeypatch) ->
     class FakeCoordinator:
         """Avoid touching the real coordinator in the setup test."""
 
-        def __init__(self, hass, cloud) -> None:
+        def __init__(self, hass, config_entry, cloud) -> None:
             self.hass = hass
+            self.config_entry = config_entry
             self.cloud = cloud
             self.data = {}
 
+        async def async_load_capabilities(self) -> None:
+            return None
+
         async def async_setup(self) -> None:
             return None
 
@@ -241,3 +249,22 @@ async def test_async_setup_entry_falls_back_to_legacy_type_field(monkeypatch) ->
     }
     assert entry.runtime_data.cloud is not None
     assert entry.runtime_data.coordinator.cloud is entry.runtime_data.cloud
+
+
+@pytest.mark.asyncio
+async def test_remove_config_entry_device_only_allows_departed_mowers() -> None:
+    """Users may delete devices only for mowers no longer on the account."""
+    entry = SimpleNamespace(
+        entry_id="entry",
+        runtime_data=SimpleNamespace(coordinator=SimpleNamespace(data={"active": {}})),
+    )
+
+    assert not await async_remove_config_entry_device(
+        None, entry, SimpleNamespace(identifiers={(DOMAIN, "active")})
+    )
+    assert await async_remove_config_entry_device(
+        None, entry, SimpleNamespace(identifiers={(DOMAIN, "gone")})
+    )
+    assert not await async_remove_config_entry_device(
+        None, entry, SimpleNamespace(identifiers={(DOMAIN, "entry")})
+    )
@@ -17,4 +17,5 @@ def test_platforms_use_home_assistant_platform_enum() -> None:
         Platform.SWITCH,
         Platform.BINARY_SENSOR,
         Platform.UPDATE,
+        Platform.CALENDAR,
     ]
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from types import SimpleNamespace
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
+
+import asyncio
 
 import pytest
 from pyworxcloud import LandroidEvent
@@ -12,7 +15,18 @@ from custom_components.landroid_cloud.binary_sensor import (
     BINARY_SENSORS,
     LandroidBinarySensor,
 )
-from custom_components.landroid_cloud.coordinator import LandroidCloudCoordinator
+from custom_components.landroid_cloud.commands import (
+    AckTracker,
+    AdaptiveTimeout,
+    CloudCircuitBreaker,
+    CloudRateLimiter,
+    CommandAck,
+    LandroidCommandQueue,
+)
+from custom_components.landroid_cloud.coordinator import (
+    LandroidCloudCoordinator,
+    _retry_policy,
+)
 
 
 class _RecordingCloud:
@@ -42,6 +56,20 @@ def _make_coordinator(cloud: _RecordingCloud) -> LandroidCloudCoordinator:
     coordinator.cloud = cloud
     coordinator.hass = SimpleNamespace(loop=_ImmediateLoop())
     coordinator.async_update_listeners = Mock()
+    coordinator._state_writes = Counter()
+    coordinator._suppressed_state_writes = Counter()
+    coordinator._device_info = {}
+    coordinator._device_listeners = []
+    coordinator.rate_limiter = CloudRateLimiter(60, 10)
+    coordinator.circuit_breaker = CloudCircuitBreaker(5, 60)
+    coordinator.command_timeouts = AdaptiveTimeout(1.0, 30.0)
+    coordinator.command_queue = LandroidCommandQueue(
+        coordinator.rate_limiter,
+        breaker=coordinator.circuit_breaker,
+        timeouts=coordinator.command_timeouts,
+    )
+    coordinator.ack_tracker = AckTracker()
+    coordinator._rain_delay_restores = {}
     return coordinator
 
 
@@ -132,3 +160,275 @@ def test_schedule_connection_update_survives_loop_shutdown() -> None:
     coordinator._schedule_connection_update()
 
     coordinator.async_update_listeners.assert_not_called()
+
+
+def test_runtime_diagnostics_report_state_writes_per_platform() -> None:
+    """Written and suppressed entity state writes should be counted per platform."""
+    coordinator = _make_coordinator(_RecordingCloud())
+
+    coordinator.record_state_write("sensor", False)
+    coordinator.record_state_write("sensor", True)
+    coordinator.record_state_write("sensor", True)
+    coordinator.record_state_write("switch", True)
+
+    assert coordinator.runtime_diagnostics()["state_writes"] == {
+        "sensor": {"written": 1, "suppressed": 2},
+        "switch": {"written": 0, "suppressed": 1},
+    }
+
+
+@pytest.mark.asyncio
+async def test_reported_sections_are_loaded_and_persisted() -> None:
+    """Reported payload sections should survive restarts via the store."""
+    coordinator = _make_coordinator(_RecordingCloud())
+    coordinator._capability_store = Mock(
+        async_load=AsyncMock(return_value={"serial": ["orientation.pitch"]})
+    )
+
+    await coordinator.async_load_capabilities()
+    coordinator.record_reported_sections("serial", {"orientation.pitch"})
+    coordinator._capability_store.async_delay_save.assert_not_called()
+
+    coordinator.record_reported_sections("serial", {"statistics.distance"})
+
+    assert coordinator.reported_sections("serial") == {
+        "orientation.pitch",
+        "statistics.distance",
+    }
+    data_func, _delay = coordinator._capability_store.async_delay_save.call_args.args
+    assert data_func() == {"serial": ["orientation.pitch", "statistics.distance"]}
+
+
+def _device_info_coordinator(device) -> LandroidCloudCoordinator:
+    coordinator = _make_coordinator(_RecordingCloud())
+    coordinator.data = {"serial": device}
+    coordinator.config_entry = SimpleNamespace(
+        data={"cloud": "worx", "email": "user@example.com"}
+    )
+    return coordinator
+
+
+def test_device_info_is_cached_per_serial() -> None:
+    """All entities of a mower should share one device info instance."""
+    device = SimpleNamespace(
+        serial_number="serial",
+        name="Garden",
+        model="WR147E",
+        firmware={"version": "3.30"},
+        mac_address="AA:BB:CC:DD:EE:FF",
+    )
+    coordinator = _device_info_coordinator(device)
+
+    info = coordinator.device_info("serial")
+
+    assert coordinator.device_info("serial") is info
+    assert info["manufacturer"] == "Worx"
+    assert info["sw_version"] == "3.30"
+    assert info["connections"] == {("mac", "AA:BB:CC:DD:EE:FF")}
+
+
+def test_sync_device_info_skips_registry_when_identity_is_unchanged(
+    monkeypatch,
+) -> None:
+    """Payload updates without identity changes must not touch the registry."""
+    device = SimpleNamespace(
+        serial_number="serial", name="Garden", model="WR147E", mac_address=None
+    )
+    coordinator = _device_info_coordinator(device)
+    info = coordinator.device_info("serial")
+    registry_lookup = Mock()
+    monkeypatch.setattr(
+        "custom_components.landroid_cloud.coordinator.dr.async_get", registry_lookup
+    )
+
+    coordinator._sync_device_info("serial", device)
+
+    registry_lookup.assert_not_called()
+    assert coordinator.device_info("serial") is info
+    assert "connections" not in info
+
+
+def test_sync_device_info_updates_registry_on_firmware_change(monkeypatch) -> None:
+    """A firmware change should rebuild device info and update the registry."""
+    device = SimpleNamespace(
+        serial_number="serial",
+        name="Garden",
+        model="WR147E",
+        firmware={"version": "3.30"},
+        mac_address="__UUID__",
+    )
+    coordinator = _device_info_coordinator(device)
+    coordinator.device_info("serial")
+    registry = Mock()
+    registry.async_get_device.return_value = SimpleNamespace(
+        id="device-id",
+        name="Garden",
+        model="WR147E",
+        sw_version="3.30",
+        connections=set(),
+    )
+    monkeypatch.setattr(
+        "custom_components.landroid_cloud.coordinator.dr.async_get",
+        lambda hass: registry,
+    )
+
+    device.firmware = {"version": "3.31"}
+    coordinator._sync_device_info("serial", device)
+
+    assert coordinator.device_info("serial")["sw_version"] == "3.31"
+    registry.async_update_device.assert_called_once_with("device-id", sw_version="3.31")
+
+
+def _device_sync_coordinator(
+    devices: dict[str, SimpleNamespace],
+) -> LandroidCloudCoordinator:
+    cloud = _RecordingCloud()
+    cloud.devices = devices
+    coordinator = _make_coordinator(cloud)
+    coordinator.data = {}
+    coordinator.config_entry = SimpleNamespace(entry_id="entry-1")
+    coordinator._event_lock = asyncio.Lock()
+    coordinator._firmware_update_info = {}
+
+    def _set_updated_data(data) -> None:
+        coordinator.data = data
+
+    coordinator.async_set_updated_data = _set_updated_data
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_refresh_announces_mowers_added_to_the_account() -> None:
+    """New serials should be announced once to device listeners."""
+    devices = {"a": SimpleNamespace(serial_number="a", name="A")}
+    coordinator = _device_sync_coordinator(devices)
+    added: list[str] = []
+    remove_listener = coordinator.async_add_device_listener(added.append)
+
+    await coordinator._refresh_from_cloud()
+    devices["b"] = SimpleNamespace(serial_number="b", name="B")
+    await coordinator._refresh_from_cloud()
+    remove_listener()
+    devices["c"] = SimpleNamespace(serial_number="c", name="C")
+    await coordinator._refresh_from_cloud()
+
+    assert added == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_push_update_confirms_pending_commands_after_applying_data() -> None:
+    """Acknowledgement checks should see the pushed state, not the old one."""
+    coordinator = _device_sync_coordinator({})
+    coordinator.data = {"a": SimpleNamespace(serial_number="a", name="A", locked=False)}
+    pending = coordinator.ack_tracker.expect(
+        "a", CommandAck("lock", lambda: coordinator.data["a"].locked)
+    )
+
+    await coordinator._handle_push_update(
+        SimpleNamespace(serial_number="a", name="A", locked=True)
+    )
+
+    assert pending.future.done()
+
+
+@pytest.mark.asyncio
+async def test_refresh_removes_devices_no_longer_on_the_account(monkeypatch) -> None:
+    """Removed serials should be detached and their per-mower state cleared."""
+    devices = {
+        "a": SimpleNamespace(serial_number="a", name="A"),
+        "b": SimpleNamespace(serial_number="b", name="B"),
+    }
+    coordinator = _device_sync_coordinator(devices)
+    coordinator._reported_sections = {"a": {"rssi"}, "b": {"rssi"}}
+    coordinator._one_time_runs = {"b": (Mock(), 30)}
+    restore = SimpleNamespace(cancel=Mock())
+    coordinator._rain_delay_restores = {"b": restore}
+    coordinator._capability_store = Mock()
+    await coordinator._refresh_from_cloud()
+    coordinator._device_info["b"] = (("B", "", "", None), {})
+    pending = coordinator.ack_tracker.expect("b", CommandAck("dock"))
+    coordinator.command_timeouts.record("b", 1.0)
+    registry = Mock()
+    registry.async_get_device.return_value = SimpleNamespace(id="device-b")
+    monkeypatch.setattr(
+        "custom_components.landroid_cloud.coordinator.dr.async_get",
+        lambda hass: registry,
+    )
+
+    del devices["b"]
+    await coordinator._refresh_from_cloud()
+
+    registry.async_get_device.assert_called_once_with(
+        identifiers={("landroid_cloud", "b")}
+    )
+    registry.async_update_device.assert_called_once_with(
+        "device-b", remove_config_entry_id="entry-1"
+    )
+    assert "b" not in coordinator._device_info
+    assert coordinator._reported_sections == {"a": {"rssi"}}
+    assert coordinator._one_time_runs == {}
+    assert coordinator.rain_delay_restore("b") is None
+    restore.cancel.assert_called_once()
+    assert pending.future.cancelled()
+    assert "b" not in coordinator.command_timeouts.diagnostics()
+    coordinator._capability_store.async_delay_save.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_refresh_keeps_devices_when_cloud_returns_no_mowers(monkeypatch) -> None:
+    """An empty device list should not wipe every mower from the registry."""
+    devices = {"a": SimpleNamespace(serial_number="a", name="A")}
+    coordinator = _device_sync_coordinator(devices)
+    await coordinator._refresh_from_cloud()
+    registry_lookup = Mock()
+    monkeypatch.setattr(
+        "custom_components.landroid_cloud.coordinator.dr.async_get", registry_lookup
+    )
+
+    devices.clear()
+    await coordinator._refresh_from_cloud()
+
+    registry_lookup.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_firmware_info_fetch_takes_a_rate_limiter_token() -> None:
+    """Firmware metadata fetches should share the account-wide limiter."""
+    cloud = _RecordingCloud()
+    cloud.get_firmware_upgrade_info = AsyncMock(return_value={"ota_supported": True})
+    coordinator = _make_coordinator(cloud)
+    coordinator.data = {}
+    coordinator._event_lock = asyncio.Lock()
+    coordinator._firmware_update_info = {}
+
+    await coordinator.async_refresh_firmware_update_info("serial")
+
+    assert coordinator.rate_limiter.diagnostics()["acquired"] == 1
+
+
+def test_retry_policy_is_opt_in_and_bounded_by_command_timeout() -> None:
+    """Retries should be disabled by default and use the command timeout."""
+    assert _retry_policy({}) is None
+
+    policy = _retry_policy({"retry": True, "retry_jitter": 50, "command_timeout": 12.0})
+
+    assert policy.max_attempts == 3
+    assert policy.base_delay == 1.0
+    assert policy.jitter == 0.5
+    assert policy.deadline == 12.0
+
+
+@pytest.mark.asyncio
+async def test_mqtt_reconnect_flushes_held_commands() -> None:
+    """A connected MQTT event should release commands held while offline."""
+    cloud = _RecordingCloud(mqtt_connected=False)
+    coordinator = _make_coordinator(cloud)
+    coordinator.command_queue = Mock()
+    await coordinator.async_setup()
+
+    cloud.callbacks[LandroidEvent.MQTT_CONNECTION](state=False)
+    coordinator.command_queue.flush_offline.assert_not_called()
+
+    cloud.mqtt_connected = True
+    cloud.callbacks[LandroidEvent.MQTT_CONNECTION](state=True)
+    coordinator.command_queue.flush_offline.assert_called_once_with()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
@@ -16,6 +17,7 @@ from homeassistant.const import (
 import pytest
 
 from custom_components.landroid_cloud import DOMAIN
+from custom_components.landroid_cloud.commands import AckTracker, CommandAck
 from custom_components.landroid_cloud.device_action import (
     async_call_action_from_config,
     async_get_actions,
@@ -153,3 +155,63 @@ async def test_call_action_from_config_calls_lawn_mower_service(
         blocking=True,
         context=None,
     )
+
+
+@pytest.mark.asyncio
+async def test_call_action_from_config_can_wait_for_ack(monkeypatch) -> None:
+    """With wait_for_ack the action should wait for the confirming push."""
+    tracker = AckTracker()
+    confirmed = {"value": False}
+
+    async def _start_mowing(*args, **kwargs) -> None:
+        tracker.expect("serial", CommandAck("start_mowing", lambda: confirmed["value"]))
+
+    hass = SimpleNamespace(
+        services=SimpleNamespace(async_call=AsyncMock(side_effect=_start_mowing)),
+        config_entries=SimpleNamespace(
+            async_get_entry=lambda entry_id: SimpleNamespace(
+                runtime_data=SimpleNamespace(
+                    coordinator=SimpleNamespace(ack_tracker=tracker)
+                )
+            )
+        ),
+    )
+    monkeypatch.setattr(
+        "custom_components.landroid_cloud.device_action.er.async_get",
+        lambda hass: SimpleNamespace(
+            async_get=lambda entity_id: SimpleNamespace(
+                device_id="device-123", config_entry_id="entry-1"
+            )
+        ),
+    )
+    monkeypatch.setattr(
+        "custom_components.landroid_cloud.device_action.dr.async_get",
+        lambda hass: SimpleNamespace(
+            async_get=lambda device_id: SimpleNamespace(
+                identifiers={(DOMAIN, "serial")}
+            )
+        ),
+    )
+
+    task = asyncio.create_task(
+        async_call_action_from_config(
+            hass,
+            {
+                CONF_DEVICE_ID: "device-123",
+                CONF_DOMAIN: DOMAIN,
+                CONF_ENTITY_ID: "lawn_mower.front_yard",
+                CONF_TYPE: "start_mowing",
+                "wait_for_ack": True,
+            },
+            variables={},
+            context=None,
+        )
+    )
+    await asyncio.sleep(0)
+    tracker.process("serial")
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    confirmed["value"] = True
+    tracker.process("serial")
+    await task
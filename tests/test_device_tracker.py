@@ -1,6 +1,7 @@
 """Tests for mower device tracker entities."""
 
 from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
@@ -53,9 +54,13 @@ async def test_async_setup_entry_only_adds_trackers_for_gps_capable_mowers() ->
             "gps": SimpleNamespace(gps={"latitude": 1.0, "longitude": 2.0}),
             "module": SimpleNamespace(module_config={"4G": {}}),
             "plain": SimpleNamespace(),
-        }
+        },
+        async_add_device_listener=lambda listener: Mock(),
+    )
+    entry = SimpleNamespace(
+        runtime_data=SimpleNamespace(coordinator=coordinator),
+        async_on_unload=Mock(),
     )
-    entry = SimpleNamespace(runtime_data=SimpleNamespace(coordinator=coordinator))
 
     def _async_add_entities(entities) -> None:
         added_entities.extend(list(entities))
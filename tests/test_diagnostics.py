@@ -44,7 +44,12 @@ async def test_diagnostics_include_raw_device_data_and_redact_secrets() -> None:
     )
     entry = SimpleNamespace(
         runtime_data=SimpleNamespace(
-            coordinator=SimpleNamespace(data={"SN123": device})
+            coordinator=SimpleNamespace(
+                data={"SN123": device},
+                runtime_diagnostics=lambda: {
+                    "state_writes": {"sensor": {"written": 3, "suppressed": 9}}
+                },
+            )
         ),
         as_dict=lambda: {
             "data": {
@@ -74,6 +79,9 @@ async def test_diagnostics_include_raw_device_data_and_redact_secrets() -> None:
     assert result["devices"]["SN123"]["last_status"]["timestamp"] == (
         "2026-04-10T12:30:00+00:00"
     )
+    assert result["runtime"]["state_writes"] == {
+        "sensor": {"written": 3, "suppressed": 9}
+    }
 
 
 @pytest.mark.asyncio
@@ -96,7 +104,9 @@ async def test_diagnostics_handle_capability_objects() -> None:
     )
     entry = SimpleNamespace(
         runtime_data=SimpleNamespace(
-            coordinator=SimpleNamespace(data={"SN123": device})
+            coordinator=SimpleNamespace(
+                data={"SN123": device}, runtime_diagnostics=lambda: {}
+            )
         ),
         as_dict=lambda: {"data": {}},
     )
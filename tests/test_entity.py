@@ -1,14 +1,25 @@
 """Tests for shared entity helpers."""
 
+import asyncio
 from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
 
+import pytest
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.landroid_cloud.commands import (
+    AckTracker,
+    CommandAck,
+    LandroidCommandQueue,
+)
 from custom_components.landroid_cloud.entity import (
     LandroidBaseEntity,
+    async_add_device_entities,
     device_coordinates,
     device_location_attributes,
     device_supports_location,
-    _firmware_version,
 )
+from custom_components.landroid_cloud.coordinator import _firmware_version
 
 
 def test_firmware_version_from_dict() -> None:
@@ -97,3 +108,238 @@ def test_entities_are_unavailable_when_coordinator_data_is_stale() -> None:
     entity._serial_number = "serial"
 
     assert entity.available is False
+
+
+class _RenderedEntity(LandroidBaseEntity):
+    """Minimal entity whose rendered state follows one payload field."""
+
+    @property
+    def state(self):
+        return self.device.battery["percent"]
+
+
+def _rendered_entity(device) -> _RenderedEntity:
+    entity = object.__new__(_RenderedEntity)
+    entity.coordinator = SimpleNamespace(
+        last_update_success=True,
+        data={"serial": device},
+        record_state_write=Mock(),
+    )
+    entity._serial_number = "serial"
+    entity.platform = SimpleNamespace(domain="sensor")
+    entity.async_write_ha_state = Mock()
+    return entity
+
+
+def test_coordinator_update_skips_write_when_rendered_state_is_unchanged() -> None:
+    """Identical rendered state should not be written to Home Assistant again."""
+    device = SimpleNamespace(name="Garden", model="WR147E", battery={"percent": 80})
+    entity = _rendered_entity(device)
+
+    entity._handle_coordinator_update()
+    entity._handle_coordinator_update()
+
+    entity.async_write_ha_state.assert_called_once_with()
+    assert entity.coordinator.record_state_write.call_args_list[-1].args == (
+        "sensor",
+        True,
+    )
+
+
+def test_coordinator_update_writes_when_payload_is_mutated_in_place() -> None:
+    """In-place payload mutations must still be detected as state changes."""
+    device = SimpleNamespace(name="Garden", model="WR147E", battery={"percent": 80})
+    entity = _rendered_entity(device)
+
+    entity._handle_coordinator_update()
+    device.battery["percent"] = 79
+    entity._handle_coordinator_update()
+
+    assert entity.async_write_ha_state.call_count == 2
+
+
+def test_device_info_is_shared_from_coordinator() -> None:
+    """Entities should return the coordinator's cached device info."""
+    info = {"identifiers": {("landroid_cloud", "serial")}}
+    entity = object.__new__(LandroidBaseEntity)
+    entity.coordinator = SimpleNamespace(device_info=Mock(return_value=info))
+    entity._serial_number = "serial"
+
+    assert entity.device_info is info
+    entity.coordinator.device_info.assert_called_once_with("serial")
+
+
+def test_async_add_device_entities_adds_current_and_discovered_mowers() -> None:
+    """Entities should be created at setup and for mowers discovered later."""
+    listeners: list = []
+    coordinator = SimpleNamespace(
+        data={"a": SimpleNamespace(), "b": SimpleNamespace()},
+        async_add_device_listener=lambda listener: listeners.append(listener) or Mock(),
+    )
+    entry = SimpleNamespace(async_on_unload=Mock())
+    batches: list[list[str]] = []
+
+    async_add_device_entities(
+        coordinator,
+        entry,
+        lambda entities: batches.append(list(entities)),
+        lambda serial_number, device: [] if serial_number == "b" else [serial_number],
+    )
+    coordinator.data["c"] = SimpleNamespace()
+    listeners[0]("c")
+    coordinator.data["b"] = SimpleNamespace()
+    listeners[0]("b")
+
+    assert batches == [["a"], ["c"]]
+    entry.async_on_unload.assert_called_once()
+
+
+class _OptimisticEntity(LandroidBaseEntity):
+    """Minimal entity showing an optimistic level while a command is pending."""
+
+    @property
+    def state(self):
+        return self._optimistic_or(self.device.level)
+
+
+def _optimistic_entity(tracker: AckTracker | None = None) -> _OptimisticEntity:
+    entity = object.__new__(_OptimisticEntity)
+    entity.coordinator = SimpleNamespace(
+        last_update_success=True,
+        data={"serial": SimpleNamespace(level=1)},
+        record_state_write=Mock(),
+        command_queue=LandroidCommandQueue(),
+        ack_tracker=tracker or AckTracker(),
+    )
+    entity._serial_number = "serial"
+    entity.hass = SimpleNamespace()
+    entity.platform = SimpleNamespace(domain="number")
+    entity.async_write_ha_state = Mock()
+    return entity
+
+
+def _push(entity: _OptimisticEntity, level: int) -> None:
+    """Apply a push the way the coordinator does."""
+    entity.coordinator.data = {"serial": SimpleNamespace(level=level)}
+    entity.coordinator.ack_tracker.process("serial")
+    entity._handle_coordinator_update()
+
+
+def _set_level(entity: _OptimisticEntity, level: int, command=None):
+    return entity.async_run_command(
+        command or AsyncMock(),
+        ack=CommandAck("level", lambda: entity.device.level == level),
+        optimistic=level,
+    )
+
+
+@pytest.mark.asyncio
+async def test_optimistic_value_is_shown_until_a_push_confirms_it() -> None:
+    """The requested value should render immediately and settle on confirmation."""
+    entity = _optimistic_entity()
+
+    await _set_level(entity, 5)
+    assert entity.state == 5
+    entity.async_write_ha_state.assert_called_once_with()
+
+    _push(entity, 5)
+    await asyncio.sleep(0)
+
+    assert entity._optimistic is None
+    assert entity.state == 5
+    assert entity.async_write_ha_state.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_acknowledged_commands_record_when_they_were_published() -> None:
+    """The queue should stamp the publish time the adaptive timeout learns from."""
+    entity = _optimistic_entity()
+    loop = asyncio.get_running_loop()
+    before = loop.time()
+
+    await _set_level(entity, 5)
+
+    pending = entity.coordinator.ack_tracker.latest("serial", "level")
+    assert before <= pending.published <= loop.time()
+
+
+@pytest.mark.asyncio
+async def test_coalesced_commands_complete_with_the_ack_of_the_command_sent() -> None:
+    """A write replaced in the queue should not wait for its own push."""
+    entity = _optimistic_entity()
+    tracker = entity.coordinator.ack_tracker
+    gate = asyncio.Event()
+    first, second = AsyncMock(), AsyncMock()
+
+    async def _busy() -> None:
+        await gate.wait()
+
+    blocker = asyncio.create_task(
+        entity.coordinator.command_queue.async_run("serial", _busy)
+    )
+    await asyncio.sleep(0)
+
+    async def _write(level: int, command: AsyncMock) -> None:
+        await entity.async_run_command(
+            command,
+            key="level",
+            ack=CommandAck("level", lambda: entity.device.level == level),
+            wait_for_ack=True,
+        )
+
+    writes = asyncio.gather(_write(5, first), _write(7, second))
+    await asyncio.sleep(0)
+    superseded, sent = tracker._pending["serial"]
+    gate.set()
+    await blocker
+    for _ in range(5):
+        await asyncio.sleep(0)
+    _push(entity, 7)
+    async with asyncio.timeout(1):
+        await writes
+
+    first.assert_not_awaited()
+    second.assert_awaited_once()
+    assert superseded.future.result() == sent.future.result()
+    assert not tracker._pending["serial"]
+    assert tracker.diagnostics()["level"]["acknowledged"] == 1
+
+
+@pytest.mark.asyncio
+async def test_optimistic_value_is_dropped_when_a_push_contradicts_it() -> None:
+    """A push after sending that shows another value should win."""
+    entity = _optimistic_entity()
+
+    await _set_level(entity, 5)
+    _push(entity, 2)
+
+    assert entity.state == 2
+    assert entity.async_write_ha_state.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_optimistic_value_rolls_back_when_sending_fails() -> None:
+    """A failed command should restore the reported value."""
+    entity = _optimistic_entity()
+
+    with pytest.raises(HomeAssistantError):
+        await _set_level(
+            entity, 5, AsyncMock(side_effect=HomeAssistantError("rejected"))
+        )
+    await asyncio.sleep(0)
+
+    assert entity.state == 1
+    assert entity.async_write_ha_state.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_optimistic_value_rolls_back_after_ack_timeout() -> None:
+    """Without any confirming push the optimistic value should expire."""
+    entity = _optimistic_entity(AckTracker(timeout=0.01))
+
+    await _set_level(entity, 5)
+    assert entity.state == 5
+    await asyncio.sleep(0.05)
+
+    assert entity.state == 1
+    assert entity.async_write_ha_state.call_count == 2
@@ -0,0 +1,130 @@
+"""Tests for account-wide Landroid commands."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from pyworxcloud.exceptions import OfflineError
+
+from custom_components.landroid_cloud import fleet
+from custom_components.landroid_cloud.commands import LandroidCommandQueue
+from custom_components.landroid_cloud.fleet import (
+    FLEET_COMMANDS,
+    OFFLINE_MESSAGE,
+    async_run_fleet_command,
+    resolve_fleet_targets,
+)
+
+LATENCY = 0.05
+
+
+class _SlowCloud:
+    """Fake cloud that answers every command after a fixed latency."""
+
+    def __init__(self, failing: frozenset[str] = frozenset()) -> None:
+        self.failing = failing
+        self.calls: list[tuple[str, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _command(self, name: str, serial_number: str) -> None:
+        self.calls.append((name, serial_number))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(LATENCY)
+        finally:
+            self.in_flight -= 1
+        if serial_number in self.failing:
+            raise OfflineError("offline")
+
+    async def start(self, serial_number: str) -> None:
+        await self._command("start", serial_number)
+
+    async def raindelay(self, serial_number: str, value: str) -> None:
+        await self._command(f"raindelay:{value}", serial_number)
+
+
+def _fleet(count: int, cloud: _SlowCloud, offline: frozenset[str] = frozenset()):
+    """Return targets for `count` mowers on one account."""
+    coordinator = SimpleNamespace(
+        cloud=cloud,
+        command_queue=LandroidCommandQueue(),
+        data={
+            f"serial{index}": SimpleNamespace(online=f"serial{index}" not in offline)
+            for index in range(count)
+        },
+    )
+    return [(coordinator, serial_number) for serial_number in coordinator.data]
+
+
+@pytest.mark.asyncio
+async def test_fleet_command_runs_mowers_in_parallel_within_the_cap() -> None:
+    """At most `max_parallel` mowers should have a command in flight at once."""
+    cloud = _SlowCloud()
+    targets = _fleet(12, cloud)
+
+    results = await async_run_fleet_command(
+        targets, FLEET_COMMANDS["start"], max_parallel=4
+    )
+
+    assert all(result["success"] for result in results.values())
+    assert len(cloud.calls) == 12
+    assert cloud.max_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_fleet_command_staggers_mower_starts() -> None:
+    """Consecutive mowers should start at least the stagger apart."""
+    cloud = _SlowCloud()
+    targets = _fleet(3, cloud)
+
+    started = time.perf_counter()
+    await async_run_fleet_command(
+        targets, FLEET_COMMANDS["start"], max_parallel=3, stagger=0.05
+    )
+
+    assert time.perf_counter() - started >= 0.1 + LATENCY
+    assert cloud.max_in_flight < 3
+
+
+@pytest.mark.asyncio
+async def test_fleet_command_reports_a_result_per_mower() -> None:
+    """Failures and offline mowers should not stop the rest of the fleet."""
+    cloud = _SlowCloud(failing=frozenset({"serial1"}))
+    targets = _fleet(3, cloud, offline=frozenset({"serial2"}))
+
+    results = await async_run_fleet_command(targets, FLEET_COMMANDS["raindelay"], 60)
+
+    assert results["serial0"]["success"] is True
+    assert results["serial1"]["success"] is False
+    assert results["serial2"] == {"success": False, "error": OFFLINE_MESSAGE}
+    assert cloud.calls == [("raindelay:60", "serial0"), ("raindelay:60", "serial1")]
+
+
+def test_resolve_fleet_targets_combines_serials_and_areas(monkeypatch) -> None:
+    """Serials and areas should be merged without duplicates."""
+    first = SimpleNamespace(data={"a": None, "b": None})
+    second = SimpleNamespace(data={"c": None})
+    monkeypatch.setattr(fleet, "_loaded_coordinators", lambda hass: [first, second])
+    monkeypatch.setattr(fleet, "_area_serial_numbers", lambda hass, areas: {"c"})
+
+    targets, unknown = resolve_fleet_targets(
+        None, {"serial_numbers": ["a", "c", "x"], "area_id": ["garden"]}
+    )
+
+    assert targets == [(first, "a"), (second, "c")]
+    assert unknown == ["x"]
+
+
+def test_resolve_fleet_targets_all(monkeypatch) -> None:
+    """'all' should target every mower on every loaded account."""
+    first = SimpleNamespace(data={"a": None})
+    second = SimpleNamespace(data={"b": None})
+    monkeypatch.setattr(fleet, "_loaded_coordinators", lambda hass: [first, second])
+
+    targets, unknown = resolve_fleet_targets(None, {"serial_numbers": "all"})
+
+    assert targets == [(first, "a"), (second, "b")]
+    assert unknown == []
@@ -1,15 +1,24 @@
 """Tests for mower activity mapping."""
 
+import asyncio
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 from homeassistant.components.lawn_mower import LawnMowerActivity
 from homeassistant.exceptions import HomeAssistantError
 import pytest
 from pyworxcloud import ScheduleEntry, ScheduleModel
-from pyworxcloud.exceptions import NoOneTimeScheduleError
-
+import voluptuous as vol
+from pyworxcloud.exceptions import NoOneTimeScheduleError, ServiceUnavailableError
+
+from custom_components.landroid_cloud import services
+from custom_components.landroid_cloud.commands import (
+    AckTracker,
+    LandroidCommandQueue,
+    RetryPolicy,
+)
 from custom_components.landroid_cloud.const import (
+    DAYS,
     MOWER_STATE_EDGECUT,
     MOWER_STATE_ESCAPED_DIGITAL_FENCE,
     MOWER_STATE_IDLE,
@@ -22,6 +31,8 @@ from custom_components.landroid_cloud.lawn_mower import (
     LandroidCloudMowerEntity,
     STATUS_ACTIVITY_MAP,
     SERVICE_ADD_SCHEDULE,
+    SERVICE_ANALYZE_SCHEDULE,
+    SERVICE_APPLY_SCHEDULE_CHANGES,
     SERVICE_ADD_EXCLUSION_SCHEDULE,
     SERVICE_CLEAR_NUTRITION,
     SERVICE_DELETE_SCHEDULE,
@@ -31,9 +42,12 @@ from custom_components.landroid_cloud.lawn_mower import (
     SERVICE_OTS,
     SERVICE_SET_BORDER_CUT_SETTINGS,
     SERVICE_SET_EXCLUSION_DAY,
+    SERVICE_SET_EXCLUSION_WEEK,
     SERVICE_SET_NUTRITION,
+    SERVICE_SET_SCHEDULE,
     async_setup_entry,
 )
+from custom_components.landroid_cloud.services import SCHEDULE_CHANGES_SCHEMA
 
 
 def test_start_sequence_states_map_to_starting() -> None:
@@ -100,13 +114,74 @@ async def test_ots_service_calls_cloud_ots() -> None:
     entity = object.__new__(LandroidCloudMowerEntity)
     entity._serial_number = "serial"
     entity.coordinator = SimpleNamespace(
+        command_queue=LandroidCommandQueue(),
+        ack_tracker=AckTracker(),
         cloud=SimpleNamespace(ots=AsyncMock()),
         data={"serial": SimpleNamespace(serial_number="serial")},
+        record_one_time_run=Mock(),
     )
 
     await entity._async_service_ots(boundary=True, runtime=45)
 
     entity.coordinator.cloud.ots.assert_awaited_once_with("serial", True, 45)
+    entity.coordinator.record_one_time_run.assert_called_once_with("serial", 45)
+
+
+@pytest.mark.asyncio
+async def test_service_wait_for_ack_returns_after_the_confirming_push() -> None:
+    """Services should optionally wait for the push confirming the change."""
+    entity = object.__new__(LandroidCloudMowerEntity)
+    entity._serial_number = "serial"
+    tracker = AckTracker()
+    entity.coordinator = SimpleNamespace(
+        command_queue=LandroidCommandQueue(),
+        ack_tracker=tracker,
+        cloud=SimpleNamespace(ots=AsyncMock()),
+        data={"serial": SimpleNamespace(serial_number="serial")},
+        record_one_time_run=Mock(),
+    )
+
+    task = asyncio.create_task(
+        entity._async_service_ots(boundary=True, runtime=45, wait_for_ack=True)
+    )
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    tracker.process("serial")
+    await task
+
+    assert tracker.diagnostics()[SERVICE_OTS]["acknowledged"] == 1
+
+
+@pytest.mark.asyncio
+async def test_start_mowing_is_acknowledged_once_the_mower_starts() -> None:
+    """A start command should only be confirmed by a push showing it mowing."""
+    device = SimpleNamespace(
+        serial_number="serial",
+        raindelay_active=False,
+        rainsensor={},
+        status=SimpleNamespace(id=1),
+    )
+    entity = object.__new__(LandroidCloudMowerEntity)
+    entity._serial_number = "serial"
+    tracker = AckTracker()
+    entity.coordinator = SimpleNamespace(
+        command_queue=LandroidCommandQueue(),
+        ack_tracker=tracker,
+        cloud=SimpleNamespace(start=AsyncMock()),
+        data={"serial": device},
+    )
+
+    await entity.async_start_mowing()
+    pending = tracker.latest("serial", "start_mowing")
+    tracker.process("serial")
+    assert not pending.future.done()
+
+    device.status = SimpleNamespace(id=7)
+    tracker.process("serial")
+
+    assert pending.future.done()
 
 
 @pytest.mark.asyncio
@@ -115,6 +190,8 @@ async def test_set_border_cut_settings_service_prefers_combined_cloud_helper() -
     entity = object.__new__(LandroidCloudMowerEntity)
     entity._serial_number = "serial"
     entity.coordinator = SimpleNamespace(
+        command_queue=LandroidCommandQueue(),
+        ack_tracker=AckTracker(),
         cloud=SimpleNamespace(
             set_border_cut_settings=AsyncMock(),
             set_cut_over_border=AsyncMock(),
@@ -143,6 +220,8 @@ async def test_set_border_cut_settings_service_supports_private_beta_helper() ->
     entity = object.__new__(LandroidCloudMowerEntity)
     entity._serial_number = "serial"
     entity.coordinator = SimpleNamespace(
+        command_queue=LandroidCommandQueue(),
+        ack_tracker=AckTracker(),
         cloud=SimpleNamespace(_set_border_cut_settings=AsyncMock()),
         data={"serial": SimpleNamespace(serial_number="serial")},
     )
@@ -165,6 +244,8 @@ async def test_set_border_cut_settings_service_falls_back_to_separate_helpers()
     entity = object.__new__(LandroidCloudMowerEntity)
     entity._serial_number = "serial"
     entity.coordinator = SimpleNamespace(
+        command_queue=LandroidCommandQueue(),
+        ack_tracker=AckTracker(),
         cloud=SimpleNamespace(
             set_cut_over_border=AsyncMock(),
             set_border_distance=AsyncMock(),
@@ -195,6 +276,8 @@ async def test_set_border_cut_settings_service_raises_clear_error_when_unsupport
     entity = object.__new__(LandroidCloudMowerEntity)
     entity._serial_number = "serial"
     entity.coordinator = SimpleNamespace(
+        command_queue=LandroidCommandQueue(),
+        ack_tracker=AckTracker(),
         cloud=SimpleNamespace(
             set_cut_over_border=AsyncMock(
                 side_effect=ValueError(
@@ -226,6 +309,8 @@ async def test_set_border_cut_settings_service_raises_clear_error_when_helper_mi
     entity = object.__new__(LandroidCloudMowerEntity)
     entity._serial_number = "serial"
     entity.coordinator = SimpleNamespace(
+        command_queue=LandroidCommandQueue(),
+        ack_tracker=AckTracker(),
         cloud=SimpleNamespace(),
         data={"serial": SimpleNamespace(serial_number="serial")},
     )
@@ -248,6 +333,8 @@ async def test_set_border_cut_settings_service_handles_no_one_time_schedule_erro
     entity = object.__new__(LandroidCloudMowerEntity)
     entity._serial_number = "serial"
     entity.coordinator = SimpleNamespace(
+        command_queue=LandroidCommandQueue(),
+        ack_tracker=AckTracker(),
         cloud=SimpleNamespace(
             set_cut_over_border=AsyncMock(
                 side_effect=NoOneTimeScheduleError(
@@ -275,6 +362,8 @@ def _entity_with_cloud(protocol: int = 0) -> LandroidCloudMowerEntity:
     entity = object.__new__(LandroidCloudMowerEntity)
     entity._serial_number = "serial"
     entity.coordinator = SimpleNamespace(
+        command_queue=LandroidCommandQueue(),
+        ack_tracker=AckTracker(),
         cloud=SimpleNamespace(
             ots=AsyncMock(),
             add_schedule_entry=AsyncMock(),
@@ -310,6 +399,50 @@ def _entity_with_cloud(protocol: int = 0) -> LandroidCloudMowerEntity:
     return entity
 
 
+@pytest.mark.asyncio
+async def test_schedule_writes_are_acknowledged_by_the_schedule_they_sent() -> None:
+    """Only a push showing the written schedule should confirm an add."""
+    entity = _entity_with_cloud(protocol=0)
+    cloud = entity.coordinator.cloud
+    tracker = entity.coordinator.ack_tracker
+
+    await entity._async_service_add_schedule(
+        days=["monday"], start="09:00", duration=60
+    )
+    pending = tracker.latest("serial", SERVICE_ADD_SCHEDULE)
+    tracker.process("serial")
+    assert not pending.future.done()
+
+    written = cloud.set_schedule.await_args.args[1]
+    cloud.get_schedule = lambda serial_number: written
+    tracker.process("serial")
+
+    assert pending.future.done()
+
+
+@pytest.mark.asyncio
+async def test_exclusion_writes_are_acknowledged_by_the_slots_they_sent() -> None:
+    """Only a push showing the added slot should confirm the exclusion write."""
+    entity = _entity_with_cloud()
+    tracker = entity.coordinator.ack_tracker
+
+    await entity._async_service_add_exclusion_schedule(
+        day="monday", start="10:00", duration=30
+    )
+    pending = tracker.latest("serial", SERVICE_ADD_EXCLUSION_SCHEDULE)
+    tracker.process("serial")
+    assert not pending.future.done()
+
+    _, day_index, slots = (
+        entity.coordinator.cloud.set_auto_schedule_exclusion_slots.await_args.args
+    )
+    settings = entity.device.schedules["auto_schedule"]["settings"]
+    settings["exclusion_scheduler"]["days"][day_index]["slots"] = slots
+    tracker.process("serial")
+
+    assert pending.future.done()
+
+
 def _schedule_model(*, protocol: int, entries: list[ScheduleEntry]) -> ScheduleModel:
     """Build a normalized schedule model for tests."""
     return ScheduleModel(
@@ -565,6 +698,57 @@ async def test_add_schedule_service_supports_multiple_days_in_one_call() -> None
     ]
 
 
+@pytest.mark.asyncio
+async def test_add_schedule_service_reads_the_schedule_once() -> None:
+    """A week-long add should resolve every day from a single schedule snapshot."""
+    entity = _entity_with_cloud(protocol=0)
+    snapshots: list[str] = []
+    get_schedule = entity.coordinator.cloud.get_schedule
+
+    def _counting_get_schedule(serial_number: str) -> ScheduleModel:
+        snapshots.append(serial_number)
+        return get_schedule(serial_number)
+
+    entity.coordinator.cloud.get_schedule = _counting_get_schedule
+
+    await entity._async_service_add_schedule(
+        days=list(DAYS),
+        start="09:00",
+        duration=60,
+        boundary=False,
+    )
+
+    assert snapshots == ["serial"]
+    _, schedule = entity.coordinator.cloud.set_schedule.await_args.args
+    assert [entry.day for entry in schedule.entries] == list(DAYS)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_add_schedule_calls_keep_every_entry() -> None:
+    """Adds queued behind each other should build on the previous write."""
+    entity = _entity_with_cloud(protocol=1)
+    cloud = entity.coordinator.cloud
+    schedules = [cloud.get_schedule("serial")]
+
+    async def _set_schedule(serial_number: str, schedule: ScheduleModel) -> None:
+        await asyncio.sleep(0)
+        schedules.append(schedule)
+
+    cloud.set_schedule = AsyncMock(side_effect=_set_schedule)
+    cloud.get_schedule = lambda serial_number: schedules[-1]
+
+    await asyncio.gather(
+        entity._async_service_add_schedule(days=["monday"], start="09:00", duration=30),
+        entity._async_service_add_schedule(days=["friday"], start="17:00", duration=45),
+    )
+
+    assert cloud.set_schedule.await_count == 2
+    assert [(entry.day, entry.start) for entry in schedules[-1].entries] == [
+        ("monday", "09:00"),
+        ("friday", "17:00"),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_edit_schedule_service_calls_cloud_update_schedule_entry() -> None:
     """Edit schedule should resolve the current entry from day and start."""
@@ -925,6 +1109,248 @@ async def test_delete_schedule_service_raises_for_duplicate_same_day_and_start()
         await entity._async_service_delete_schedule(day="monday", start="09:00")
 
 
+@pytest.mark.asyncio
+async def test_apply_schedule_changes_sends_one_schedule_write() -> None:
+    """Adds, edits and deletes should be applied in order and sent together."""
+    entity = _entity_with_cloud(protocol=0)
+    entity.coordinator.cloud.get_schedule = lambda serial_number: _schedule_model(
+        protocol=0,
+        entries=[
+            ScheduleEntry(
+                entry_id="p0:wednesday:primary",
+                day="wednesday",
+                start="08:00",
+                duration=30,
+                boundary=False,
+                source="primary",
+                secondary=False,
+            )
+        ],
+    )
+
+    await entity._async_service_apply_schedule_changes(
+        changes=SCHEDULE_CHANGES_SCHEMA(
+            [
+                {
+                    "action": "add",
+                    "days": ["monday", "tuesday"],
+                    "start": "09:00",
+                    "duration": 60,
+                    "boundary": False,
+                },
+                {
+                    "action": "edit",
+                    "current_day": "monday",
+                    "day": "monday",
+                    "start": "10:00",
+                    "duration": 30,
+                },
+                {"action": "delete", "day": "wednesday"},
+            ]
+        )
+    )
+
+    entity.coordinator.cloud.set_schedule.assert_awaited_once()
+    entity.coordinator.cloud.update_schedule_entry.assert_not_awaited()
+    entity.coordinator.cloud.delete_schedule_entry.assert_not_awaited()
+    _, schedule = entity.coordinator.cloud.set_schedule.await_args.args
+    assert schedule.entries == [
+        ScheduleEntry(
+            entry_id="p0:monday:primary",
+            day="monday",
+            start="10:00",
+            duration=30,
+            boundary=False,
+            source="primary",
+            secondary=False,
+        ),
+        ScheduleEntry(
+            entry_id="p0:tuesday:primary",
+            day="tuesday",
+            start="09:00",
+            duration=60,
+            boundary=False,
+            source="primary",
+            secondary=False,
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_apply_schedule_changes_sends_nothing_when_one_change_is_invalid() -> (
+    None
+):
+    """Protocol 0 slot limits should be checked across the whole batch."""
+    entity = _entity_with_cloud(protocol=0)
+    add = {"action": "add", "days": ["monday"], "duration": 30}
+
+    with pytest.raises(HomeAssistantError, match="Change 3 \\(add\\): This day"):
+        await entity._async_service_apply_schedule_changes(
+            changes=SCHEDULE_CHANGES_SCHEMA(
+                [
+                    {**add, "start": "08:00"},
+                    {**add, "start": "12:00"},
+                    {**add, "start": "16:00"},
+                ]
+            )
+        )
+
+    entity.coordinator.cloud.set_schedule.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_apply_schedule_changes_dry_run_returns_the_plan_only() -> None:
+    """A dry run should describe the write without sending it."""
+    entity = _entity_with_cloud(protocol=0)
+
+    response = await entity._async_service_apply_schedule_changes(
+        changes=SCHEDULE_CHANGES_SCHEMA(
+            [{"action": "add", "days": ["monday"], "start": "09:00", "duration": 60}]
+        ),
+        dry_run=True,
+    )
+
+    assert response["write"] == "entry"
+    assert response["operations"] == [
+        {
+            "action": "add",
+            "entry_id": None,
+            "day": "monday",
+            "start": "09:00",
+            "duration": 60,
+            "boundary": False,
+        }
+    ]
+    entity.coordinator.cloud.add_schedule_entry.assert_not_awaited()
+    entity.coordinator.cloud.set_schedule.assert_not_awaited()
+
+
+def _schedule_change_batch(size: int) -> list[dict]:
+    """Return add, edit and delete changes that leave the schedule empty."""
+    changes: list[dict] = []
+    for index in range(size // 5):
+        day = DAYS[index % len(DAYS)]
+        changes += [
+            {"action": "add", "days": [day], "start": "8:00", "duration": 30},
+            {"action": "add", "day": day.upper(), "start": "16:00", "duration": 30},
+            {
+                "action": "edit",
+                "current_day": day,
+                "current_start": "16:00",
+                "day": day,
+                "start": "17:30",
+                "duration": 45,
+            },
+            {"action": "delete", "day": day, "start": "08:00"},
+            {"action": "delete", "day": day},
+        ]
+    return changes
+
+
+@pytest.mark.asyncio
+async def test_apply_schedule_changes_handles_a_thousand_changes() -> None:
+    """A batch of 1000 changes should validate and apply as one plan."""
+    entity = _entity_with_cloud(protocol=0)
+
+    changes = SCHEDULE_CHANGES_SCHEMA(_schedule_change_batch(1000))
+    response = await entity._async_service_apply_schedule_changes(
+        changes=changes, dry_run=True
+    )
+
+    assert len(changes) == 1000
+    assert response["write"] == "none"
+
+
+def test_schedule_changes_schema_normalizes_the_batch() -> None:
+    """Days and starts should be normalized, and a malformed one rejected."""
+    changes = _schedule_change_batch(5)
+
+    assert SCHEDULE_CHANGES_SCHEMA(changes)[:2] == [
+        {"action": "add", "days": ["sunday"], "start": "08:00", "duration": 30},
+        {"action": "add", "days": ["sunday"], "start": "16:00", "duration": 30},
+    ]
+
+    changes = _schedule_change_batch(1000)
+    changes[-2]["start"] = "25:00"
+    with pytest.raises(vol.Invalid, match="start must be in HH:MM") as err:
+        SCHEDULE_CHANGES_SCHEMA(changes)
+    assert err.value.path == [998]
+
+
+@pytest.mark.asyncio
+async def test_set_schedule_sends_a_single_changed_entry_on_its_own() -> None:
+    """Replacing the schedule with one changed entry should update only that."""
+    entity = _entity_with_cloud(protocol=0)
+    schedule = _schedule_model(
+        protocol=0,
+        entries=[
+            ScheduleEntry(
+                entry_id=f"p0:{day}:primary",
+                day=day,
+                start="10:00",
+                duration=60,
+                boundary=False,
+                source="primary",
+                secondary=False,
+            )
+            for day in ("monday", "tuesday")
+        ],
+    )
+    entity.coordinator.cloud.get_schedule = lambda serial_number: schedule
+
+    response = await entity._async_service_set_schedule(
+        entries=[
+            {"day": "monday", "start": "10:00", "duration": 60, "boundary": False},
+            {"day": "tuesday", "start": "10:00", "duration": 90, "boundary": False},
+        ]
+    )
+
+    assert (response["write"], response["round_trips"]) == ("entry", 1)
+    entity.coordinator.cloud.set_schedule.assert_not_awaited()
+    entity.coordinator.cloud.update_schedule_entry.assert_awaited_once()
+    serial_number, entry_id, entry = (
+        entity.coordinator.cloud.update_schedule_entry.await_args.args
+    )
+    assert (serial_number, entry_id, entry.duration) == (
+        "serial",
+        "p0:tuesday:primary",
+        90,
+    )
+
+
+@pytest.mark.asyncio
+async def test_set_schedule_is_retried_after_a_transient_failure() -> None:
+    """A schedule write should be resent when the cloud briefly fails."""
+    entity = _entity_with_cloud(protocol=0)
+    entity.coordinator.command_queue = LandroidCommandQueue(
+        retry_policy=RetryPolicy(max_attempts=3, base_delay=0.001, jitter=0, deadline=5)
+    )
+    cloud = entity.coordinator.cloud
+    cloud.set_schedule.side_effect = [ServiceUnavailableError("503"), None]
+
+    response = await entity._async_service_set_schedule(
+        entries=[
+            {"day": "monday", "start": "10:00", "duration": 60, "boundary": False},
+            {"day": "tuesday", "start": "10:00", "duration": 60, "boundary": False},
+        ]
+    )
+
+    assert response["write"] == "schedule"
+    assert cloud.set_schedule.await_count == 2
+    assert entity.coordinator.command_queue.diagnostics()["retries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_set_schedule_skips_an_unchanged_schedule() -> None:
+    """Nothing should be sent when the mower already has the schedule."""
+    entity = _entity_with_cloud(protocol=0)
+
+    response = await entity._async_service_set_schedule(entries=[])
+
+    assert response["write"] == "none"
+    entity.coordinator.cloud.set_schedule.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_protocol_zero_schedule_defaults_boundary_to_false() -> None:
     """Protocol 0 schedule writes should default boundary to false."""
@@ -987,6 +1413,24 @@ async def test_set_nutrition_service_calls_cloud_helper() -> None:
     )
 
 
+@pytest.mark.asyncio
+async def test_nutrition_is_acknowledged_once_the_mower_reports_it() -> None:
+    """Pushes still showing the old nutrition should not confirm the write."""
+    entity = _entity_with_cloud()
+    tracker = entity.coordinator.ack_tracker
+
+    await entity._async_service_set_nutrition(n=10, p=20, k=5)
+    pending = tracker.latest("serial", SERVICE_SET_NUTRITION)
+    tracker.process("serial")
+    assert not pending.future.done()
+
+    settings = entity.device.schedules["auto_schedule"]["settings"]
+    settings["nutrition"] = {"n": 10, "p": 20, "k": 5}
+    tracker.process("serial")
+
+    assert pending.future.done()
+
+
 @pytest.mark.asyncio
 async def test_clear_nutrition_service_calls_cloud_helper() -> None:
     """Clear nutrition should call the dedicated pyworxcloud helper."""
@@ -1134,14 +1578,133 @@ async def test_delete_exclusion_schedule_requires_start_when_day_has_multiple()
         await entity._async_service_delete_exclusion_schedule(day="monday")
 
 
+@pytest.mark.asyncio
+async def test_set_exclusion_week_only_writes_changed_days() -> None:
+    """Unchanged weekdays should not be written again."""
+    entity = _entity_with_cloud()
+    days = entity.coordinator.data["serial"].schedules["auto_schedule"]["settings"][
+        "exclusion_scheduler"
+    ]["days"]
+    days[1]["slots"] = [{"start_time": 600, "duration": 60, "reason": "generic"}]
+    entity.coordinator.cloud.set_auto_schedule_exclude_nights = AsyncMock()
+
+    await entity._async_service_set_exclusion_week(
+        days={
+            "monday": {
+                "slots": [{"start": "10:00", "duration": 60, "reason": "generic"}]
+            },
+            "tuesday": {
+                "exclude_day": True,
+                "slots": [
+                    {"start": "18:00", "duration": 30, "reason": "irrigation"},
+                    {"start": "07:00", "duration": 30, "reason": "generic"},
+                ],
+            },
+        },
+        exclude_nights=True,
+    )
+
+    cloud = entity.coordinator.cloud
+    cloud.set_auto_schedule_exclusion_day.assert_awaited_once_with("serial", 2, True)
+    cloud.set_auto_schedule_exclusion_slots.assert_awaited_once_with(
+        "serial",
+        2,
+        [
+            {"start_time": 420, "duration": 30, "reason": "generic"},
+            {"start_time": 1080, "duration": 30, "reason": "irrigation"},
+        ],
+    )
+    cloud.set_auto_schedule_exclude_nights.assert_awaited_once_with("serial", True)
+
+
+@pytest.mark.asyncio
+async def test_set_exclusion_week_writes_only_the_changed_days() -> None:
+    """Each changed weekday should go out through the public day helpers."""
+    entity = _entity_with_cloud()
+
+    await entity._async_service_set_exclusion_week(
+        days={day: {"exclude_day": True} for day in ("saturday", "sunday")}
+    )
+
+    cloud = entity.coordinator.cloud
+    assert [
+        call.args for call in cloud.set_auto_schedule_exclusion_day.await_args_list
+    ] == [("serial", 0, True), ("serial", 6, True)]
+    cloud.set_auto_schedule_exclusion_slots.assert_not_awaited()
+
+
+def test_exclusion_slots_are_limited_to_one_day() -> None:
+    """An exclusion slot cannot be longer than the 1440 minutes of a day."""
+    schema = vol.Schema(services._EXCLUSION_ENTRY_FIELDS)
+
+    assert schema({"start": "00:00", "duration": 1440})["duration"] == 1440
+    with pytest.raises(vol.Invalid):
+        schema({"start": "00:00", "duration": 1441})
+
+
+@pytest.mark.asyncio
+async def test_set_exclusion_week_skips_an_unchanged_week() -> None:
+    """Re-sending the reported exclusion schedule should not reach the cloud."""
+    entity = _entity_with_cloud()
+
+    await entity._async_service_set_exclusion_week(
+        days={"monday": {"exclude_day": False, "slots": []}}
+    )
+
+    entity.coordinator.cloud.set_auto_schedule_exclusion_day.assert_not_awaited()
+    entity.coordinator.cloud.set_auto_schedule_exclusion_slots.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_analyze_schedule_returns_conflicts_with_exclusions() -> None:
+    """The analysis response should cover the schedule and the exclusions."""
+    entity = _entity_with_cloud()
+    schedule = _schedule_model(
+        protocol=0,
+        entries=[
+            ScheduleEntry(
+                entry_id="p0:monday:primary",
+                day="monday",
+                start="10:00",
+                duration=60,
+                boundary=False,
+                source="primary",
+                secondary=False,
+            )
+        ],
+    )
+    entity.coordinator.cloud.get_schedule = lambda serial_number: schedule
+    entity.coordinator.data["serial"].schedules["auto_schedule"]["settings"][
+        "exclusion_scheduler"
+    ]["days"][1]["exclude_day"] = True
+
+    response = await entity._async_service_analyze_schedule()
+
+    assert response == {
+        "weekly_minutes": 60,
+        "effective_minutes": 0,
+        "coverage": 0.0,
+        "conflicts": [
+            {
+                "type": "exclusion_overlap",
+                "entry_id": "p0:monday:primary",
+                "day": "monday",
+                "start": "10:00",
+                "minutes": 60,
+                "with": "monday (excluded day)",
+            }
+        ],
+    }
+
+
 @pytest.mark.asyncio
 async def test_async_setup_entry_registers_schedule_services(monkeypatch) -> None:
     """Setup should register OTS and schedule services on the mower platform."""
     registrations: list[tuple[str, str]] = []
 
     class FakePlatform:
-        def async_register_entity_service(self, name, schema, method):
-            del schema
+        def async_register_entity_service(self, name, schema, method, **kwargs):
+            del schema, kwargs
             registrations.append((name, method))
 
     monkeypatch.setattr(
@@ -1150,7 +1713,12 @@ async def test_async_setup_entry_registers_schedule_services(monkeypatch) -> Non
     )
 
     entry = SimpleNamespace(
-        runtime_data=SimpleNamespace(coordinator=SimpleNamespace(data={})),
+        runtime_data=SimpleNamespace(
+            coordinator=SimpleNamespace(
+                data={}, async_add_device_listener=lambda listener: lambda: None
+            )
+        ),
+        async_on_unload=lambda remove_listener: None,
     )
 
     await async_setup_entry(
@@ -1168,10 +1736,14 @@ async def test_async_setup_entry_registers_schedule_services(monkeypatch) -> Non
         (SERVICE_ADD_SCHEDULE, "_async_service_add_schedule"),
         (SERVICE_EDIT_SCHEDULE, "_async_service_edit_schedule"),
         (SERVICE_DELETE_SCHEDULE, "_async_service_delete_schedule"),
+        (SERVICE_APPLY_SCHEDULE_CHANGES, "_async_service_apply_schedule_changes"),
+        (SERVICE_SET_SCHEDULE, "_async_service_set_schedule"),
         (SERVICE_SET_NUTRITION, "_async_service_set_nutrition"),
         (SERVICE_CLEAR_NUTRITION, "_async_service_clear_nutrition"),
         (SERVICE_SET_EXCLUSION_DAY, "_async_service_set_exclusion_day"),
         (SERVICE_ADD_EXCLUSION_SCHEDULE, "_async_service_add_exclusion_schedule"),
         (SERVICE_EDIT_EXCLUSION_SCHEDULE, "_async_service_edit_exclusion_schedule"),
         (SERVICE_DELETE_EXCLUSION_SCHEDULE, "_async_service_delete_exclusion_schedule"),
+        (SERVICE_SET_EXCLUSION_WEEK, "_async_service_set_exclusion_week"),
+        (SERVICE_ANALYZE_SCHEDULE, "_async_service_analyze_schedule"),
     ]
@@ -1,11 +1,15 @@
 """Tests for Landroid numbers."""
 
 from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
+import pytest
 from homeassistant.helpers.entity import EntityCategory
 
+from custom_components.landroid_cloud.commands import AckTracker, LandroidCommandQueue
 from custom_components.landroid_cloud.number import (
     NUMBERS,
+    LandroidNumber,
     _lawn_value,
     _rain_delay_value,
     _torque_value,
@@ -109,3 +113,43 @@ def test_rain_delay_max_value_is_1440_minutes() -> None:
     """Rain delay max value should be 1440 minutes (24 hours) to match app."""
     rain_delay_desc = next(desc for desc in NUMBERS if desc.key == "rain_delay")
     assert rain_delay_desc.native_max_value == 1440
+
+
+def _rain_delay_entity(delay: int) -> LandroidNumber:
+    """Return a rain delay number backed by a mocked cloud."""
+    entity = object.__new__(LandroidNumber)
+    entity._serial_number = "serial"
+    entity.entity_description = next(
+        description for description in NUMBERS if description.key == "rain_delay"
+    )
+    entity.coordinator = SimpleNamespace(
+        command_queue=LandroidCommandQueue(),
+        ack_tracker=AckTracker(),
+        cloud=SimpleNamespace(raindelay=AsyncMock()),
+        data={
+            "serial": SimpleNamespace(
+                serial_number="serial", rainsensor={"delay": delay}
+            )
+        },
+    )
+    return entity
+
+
+@pytest.mark.asyncio
+async def test_setting_the_current_value_sends_no_command() -> None:
+    """Re-asserting the reported rain delay should not reach the cloud."""
+    entity = _rain_delay_entity(60)
+
+    await entity.async_set_native_value(60.0)
+
+    entity.coordinator.cloud.raindelay.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_force_resends_the_current_value() -> None:
+    """The force flag should bypass write suppression."""
+    entity = _rain_delay_entity(60)
+
+    await entity._async_service_set_value(value=60.0, force=True)
+
+    entity.coordinator.cloud.raindelay.assert_awaited_once_with("serial", "60")
@@ -0,0 +1,241 @@
+"""Tests for rain delay and one-time schedule planning."""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from pyworxcloud import ScheduleEntry, ScheduleModel
+
+from custom_components.landroid_cloud.commands import LandroidCommandQueue
+from custom_components.landroid_cloud.coordinator import LandroidCloudCoordinator
+from custom_components.landroid_cloud.rain_plan import (
+    ACTION_NONE,
+    ACTION_OTS,
+    ACTION_RAIN_DELAY,
+    MODE_MAKE_UP,
+    MODE_SKIP,
+    ScheduledRun,
+    async_send_rain_plan,
+    plan_rain,
+    scheduled_runs,
+)
+
+# Monday 2026-01-05.
+MONDAY = datetime(2026, 1, 5, tzinfo=UTC)
+
+
+def _at(hour: int, minute: int = 0) -> datetime:
+    return MONDAY + timedelta(hours=hour, minutes=minute)
+
+
+def _run(start: int, end: int, boundary: bool = False) -> ScheduledRun:
+    return ScheduledRun(_at(start), _at(end), boundary)
+
+
+def test_scheduled_runs_carry_time_extension_and_edge_cut() -> None:
+    """Runs should come from the schedule as mowed, including the extension."""
+    schedule = ScheduleModel(
+        enabled=True,
+        time_extension=50,
+        entries=[
+            ScheduleEntry(
+                entry_id="p0:monday:primary",
+                day="monday",
+                start="10:00",
+                duration=60,
+                boundary=True,
+                source="primary",
+                secondary=False,
+            )
+        ],
+        protocol=0,
+    )
+
+    assert scheduled_runs(schedule, UTC, MONDAY, MONDAY + timedelta(days=1)) == [
+        ScheduledRun(_at(10), _at(11, 30), True)
+    ]
+
+
+def test_skip_sets_the_smallest_delay_covering_the_wet_run() -> None:
+    """The delay should run from the rain end to the end of the wet run."""
+    plan = plan_rain(
+        [_run(6, 8), _run(13, 16), _run(20, 21)],
+        now=_at(5),
+        rain_start=_at(7),
+        rain_end=_at(12),
+        drying_time=90,
+        mode=MODE_SKIP,
+        current_rain_delay=60,
+    )
+
+    assert plan.action == ACTION_RAIN_DELAY
+    assert plan.value == 240
+    assert plan.runs == (_run(13, 16),)
+
+
+def test_skip_needs_nothing_when_runs_end_before_the_rain_stops() -> None:
+    """The rain sensor alone stops runs inside the rain window."""
+    plan = plan_rain(
+        [_run(8, 10)],
+        now=_at(5),
+        rain_start=_at(7),
+        rain_end=_at(12),
+        mode=MODE_SKIP,
+    )
+
+    assert plan.action == ACTION_NONE
+
+
+def test_skip_never_lowers_the_current_delay() -> None:
+    """A mower whose delay already covers the runs needs no command."""
+    kwargs = {"now": _at(5), "rain_start": _at(7), "rain_end": _at(13)}
+
+    for current_rain_delay in (60, 120):
+        plan = plan_rain(
+            [_run(12, 14)],
+            mode=MODE_SKIP,
+            current_rain_delay=current_rain_delay,
+            **kwargs,
+        )
+        assert (plan.action, plan.value) == (ACTION_NONE, 60)
+
+    plan = plan_rain([_run(12, 14)], mode=MODE_SKIP, current_rain_delay=30, **kwargs)
+    assert (plan.action, plan.value) == (ACTION_RAIN_DELAY, 60)
+
+
+def test_rain_delay_plans_report_the_delay_to_restore() -> None:
+    """The response should carry the delay the mower had before the plan."""
+    plan = plan_rain(
+        [_run(12, 14)],
+        now=_at(5),
+        rain_start=_at(7),
+        rain_end=_at(13),
+        mode=MODE_SKIP,
+        current_rain_delay=30,
+    )
+
+    assert plan.as_dict()["previous_value"] == 30
+    assert plan.as_dict()["value"] == 60
+    assert plan.as_dict()["restore_at"] == _at(14).isoformat()
+
+
+class _RainDelayCloud:
+    """Fake cloud that records the rain delays it is sent."""
+
+    def __init__(self) -> None:
+        self.delays: list[str] = []
+
+    async def raindelay(self, serial_number: str, value: str) -> None:
+        self.delays.append(value)
+
+
+def _restoring_coordinator(monkeypatch, delay: int) -> LandroidCloudCoordinator:
+    """Return a coordinator whose restore timers and tasks are recorded."""
+    coordinator = object.__new__(LandroidCloudCoordinator)
+    coordinator.hass = None
+    coordinator.cloud = _RainDelayCloud()
+    coordinator.command_queue = LandroidCommandQueue()
+    coordinator.data = {"serial": SimpleNamespace(rainsensor={"delay": delay})}
+    coordinator.config_entry = Mock()
+    coordinator._rain_delay_restores = {}
+    coordinator.timers = []
+
+    def _track(hass, action, when):
+        coordinator.timers.append((action, when))
+        return Mock()
+
+    monkeypatch.setattr(
+        "custom_components.landroid_cloud.coordinator.async_track_point_in_utc_time",
+        _track,
+    )
+    return coordinator
+
+
+async def _async_fire_restore(coordinator: LandroidCloudCoordinator) -> None:
+    """Run the last restore timer and the task it starts."""
+    action, when = coordinator.timers[-1]
+    action(when)
+    await coordinator.config_entry.async_create_background_task.call_args.args[1]
+
+
+@pytest.mark.asyncio
+async def test_raised_rain_delay_is_restored_once_it_has_run_out(monkeypatch) -> None:
+    """The previous delay should be set back after the latest covered run."""
+    coordinator = _restoring_coordinator(monkeypatch, delay=30)
+    kwargs = {"now": _at(5), "rain_start": _at(7), "mode": MODE_SKIP}
+
+    await async_send_rain_plan(
+        coordinator,
+        "serial",
+        plan_rain([_run(12, 14)], rain_end=_at(13), current_rain_delay=30, **kwargs),
+    )
+    coordinator.data["serial"].rainsensor["delay"] = 60
+    first_timer = coordinator.rain_delay_restore("serial").cancel
+    # A later window the raised delay already covers moves the restore back.
+    covered = plan_rain(
+        [ScheduledRun(_at(13), _at(14, 10), False)],
+        rain_end=_at(13, 30),
+        current_rain_delay=60,
+        **kwargs,
+    )
+    await async_send_rain_plan(coordinator, "serial", covered)
+
+    assert covered.action == ACTION_NONE
+    assert coordinator.cloud.delays == ["60"]
+    first_timer.assert_called_once()
+    restore = coordinator.rain_delay_restore("serial")
+    assert (restore.previous, restore.raised, restore.when) == (30, 60, _at(14, 10))
+
+    await _async_fire_restore(coordinator)
+
+    assert coordinator.cloud.delays == ["60", "30"]
+    assert coordinator.rain_delay_restore("serial") is None
+
+
+@pytest.mark.asyncio
+async def test_rain_delay_changed_since_it_was_raised_is_left_alone(
+    monkeypatch,
+) -> None:
+    """A delay the user changed in the meantime should not be overwritten."""
+    coordinator = _restoring_coordinator(monkeypatch, delay=0)
+    await async_send_rain_plan(
+        coordinator,
+        "serial",
+        plan_rain(
+            [_run(12, 14)],
+            now=_at(5),
+            rain_start=_at(7),
+            rain_end=_at(13),
+            mode=MODE_SKIP,
+            current_rain_delay=0,
+        ),
+    )
+    coordinator.data["serial"].rainsensor["delay"] = 90
+
+    await _async_fire_restore(coordinator)
+
+    assert coordinator.cloud.delays == ["60"]
+
+
+def test_auto_makes_up_lost_mowing_once_the_lawn_is_dry() -> None:
+    """Lost minutes should become one one-time schedule, clamped to its range."""
+    runs = [_run(8, 9, boundary=True), _run(11, 14)]
+    kwargs = {"rain_start": _at(8, 30), "rain_end": _at(11), "drying_time": 30}
+
+    plan = plan_rain(runs, now=_at(15), **kwargs)
+
+    assert plan.action == ACTION_OTS
+    assert plan.lost_minutes == 60
+    assert (plan.value, plan.boundary) == (60, True)
+    assert plan_rain(runs, now=_at(9), **kwargs).action == ACTION_RAIN_DELAY
+    assert (
+        plan_rain(
+            [_run(8, 20)],
+            now=_at(21),
+            rain_start=_at(8),
+            rain_end=_at(12),
+            mode=MODE_MAKE_UP,
+        ).value
+        == 120
+    )
@@ -0,0 +1,153 @@
+"""Tests for the schedule conflict analyzer."""
+
+from pyworxcloud import ScheduleEntry, ScheduleModel
+
+from custom_components.landroid_cloud.schedule_analysis import (
+    CONFLICT_EXCEEDS_DAY,
+    CONFLICT_EXCLUSION,
+    CONFLICT_MIDNIGHT,
+    CONFLICT_OVERLAP,
+    analyze_schedule,
+)
+
+
+def _entry(
+    day: str, start: str, duration: int, source: str = "primary"
+) -> ScheduleEntry:
+    return ScheduleEntry(
+        entry_id=f"p0:{day}:{source}",
+        day=day,
+        start=start,
+        duration=duration,
+        boundary=False,
+        source=source,
+        secondary=source == "secondary",
+    )
+
+
+def _schedule(*entries: ScheduleEntry, time_extension: int = 0) -> ScheduleModel:
+    return ScheduleModel(
+        enabled=True,
+        time_extension=time_extension,
+        entries=list(entries),
+        protocol=0,
+    )
+
+
+def _exclusions(**days: dict) -> list[dict]:
+    names = ("sunday", "monday", "tuesday", "wednesday", "thursday", "friday")
+    names += ("saturday",)
+    return [days.get(name, {"exclude_day": False, "slots": []}) for name in names]
+
+
+def test_clean_schedule_has_no_conflicts_and_full_coverage() -> None:
+    """Separate entries should be summed and fully covered."""
+    analysis = analyze_schedule(
+        _schedule(_entry("monday", "10:00", 60), _entry("tuesday", "10:00", 90))
+    )
+
+    assert analysis.as_dict() == {
+        "weekly_minutes": 150,
+        "effective_minutes": 150,
+        "coverage": 100.0,
+        "conflicts": [],
+    }
+
+
+def test_overlapping_entries_on_one_day_are_reported() -> None:
+    """Primary and secondary slots that overlap should be one conflict."""
+    analysis = analyze_schedule(
+        _schedule(
+            _entry("monday", "10:00", 120),
+            _entry("monday", "11:00", 120, "secondary"),
+        )
+    )
+
+    assert [conflict.as_dict() for conflict in analysis.conflicts] == [
+        {
+            "type": CONFLICT_OVERLAP,
+            "entry_id": "p0:monday:primary",
+            "day": "monday",
+            "start": "10:00",
+            "minutes": 60,
+            "with": "p0:monday:secondary",
+        }
+    ]
+    assert analysis.weekly_minutes == 240
+    assert analysis.effective_minutes == 180
+
+
+def test_time_extension_can_push_an_entry_past_a_day() -> None:
+    """The extended duration is what is checked against 24 hours."""
+    analysis = analyze_schedule(
+        _schedule(_entry("monday", "00:00", 1200), time_extension=50)
+    )
+
+    assert analysis.weekly_minutes == 1800
+    assert [(c.kind, c.minutes) for c in analysis.conflicts] == [
+        (CONFLICT_EXCEEDS_DAY, 360)
+    ]
+
+
+def test_entries_colliding_across_midnight_and_week_end_are_reported() -> None:
+    """Saturday night runs into Sunday morning at the end of the week."""
+    analysis = analyze_schedule(
+        _schedule(
+            _entry("saturday", "23:00", 120),
+            _entry("sunday", "00:30", 60),
+        )
+    )
+
+    assert [(c.kind, c.entry_id, c.minutes, c.other) for c in analysis.conflicts] == [
+        (CONFLICT_MIDNIGHT, "p0:saturday:primary", 30, "p0:sunday:primary")
+    ]
+    assert analysis.effective_minutes == 150
+
+
+def test_exclusions_reduce_effective_coverage() -> None:
+    """Excluded days and slots should be reported and not count as mowing."""
+    analysis = analyze_schedule(
+        _schedule(_entry("monday", "10:00", 120), _entry("wednesday", "10:00", 60)),
+        _exclusions(
+            monday={
+                "exclude_day": False,
+                "slots": [{"start_time": 660, "duration": 30, "reason": "irrigation"}],
+            },
+            wednesday={"exclude_day": True, "slots": []},
+        ),
+    )
+
+    assert [(c.kind, c.day, c.minutes, c.other) for c in analysis.conflicts] == [
+        (CONFLICT_EXCLUSION, "monday", 30, "monday 11:00 (irrigation)"),
+        (CONFLICT_EXCLUSION, "wednesday", 60, "wednesday (excluded day)"),
+    ]
+    assert analysis.weekly_minutes == 180
+    assert analysis.effective_minutes == 90
+    assert analysis.coverage == 50.0
+
+
+def test_long_exclusions_still_block_entries_late_in_the_day() -> None:
+    """An excluded day should be found behind the later slots that start in it."""
+    analysis = analyze_schedule(
+        _schedule(_entry("monday", "08:00", 60), _entry("monday", "20:00", 60, "b")),
+        _exclusions(
+            monday={
+                "exclude_day": True,
+                "slots": [{"start_time": 360, "duration": 30, "reason": "generic"}],
+            },
+        ),
+    )
+
+    assert [(c.start, c.minutes, c.other) for c in analysis.conflicts] == [
+        ("08:00", 60, "monday (excluded day)"),
+        ("20:00", 60, "monday (excluded day)"),
+    ]
+    assert analysis.effective_minutes == 0
+
+
+def test_missing_schedule_is_empty() -> None:
+    """No schedule should analyze to nothing rather than fail."""
+    analysis = analyze_schedule(None)
+
+    assert analysis.conflicts == ()
+    assert analysis.coverage == 0.0
@@ -0,0 +1,112 @@
+"""Tests for schedule write planning."""
+
+from pyworxcloud import ScheduleEntry, ScheduleModel
+
+from custom_components.landroid_cloud.schedule_plan import (
+    OPERATION_ADD,
+    OPERATION_DELETE,
+    OPERATION_UPDATE,
+    WRITE_ENTRY,
+    WRITE_NONE,
+    WRITE_SCHEDULE,
+    plan_schedule_write,
+)
+
+
+def _entry(
+    day: str, start: str, duration: int, source: str = "primary"
+) -> ScheduleEntry:
+    return ScheduleEntry(
+        entry_id=f"p0:{day}:{source}",
+        day=day,
+        start=start,
+        duration=duration,
+        boundary=False,
+        source=source,
+        secondary=source == "secondary",
+    )
+
+
+def _schedule(*entries: ScheduleEntry, time_extension: int = 0) -> ScheduleModel:
+    return ScheduleModel(
+        enabled=True,
+        time_extension=time_extension,
+        entries=list(entries),
+        protocol=0,
+    )
+
+
+def test_identical_schedules_need_no_write() -> None:
+    """Entries that only swapped primary and secondary are unchanged."""
+    plan = plan_schedule_write(
+        _schedule(
+            _entry("monday", "16:00", 30), _entry("monday", "10:00", 60, "secondary")
+        ),
+        _schedule(
+            _entry("monday", "10:00", 60), _entry("monday", "16:00", 30, "secondary")
+        ),
+    )
+
+    assert plan.write == WRITE_NONE
+    assert plan.as_dict() == {
+        "write": WRITE_NONE,
+        "round_trips": 0,
+        "entry_round_trips": 0,
+        "settings_changed": False,
+        "operations": [],
+    }
+
+
+def test_one_changed_entry_is_sent_as_an_entry_update() -> None:
+    """A moved start on the same day and slot should update that entry."""
+    plan = plan_schedule_write(
+        _schedule(_entry("monday", "10:00", 60), _entry("tuesday", "10:00", 60)),
+        _schedule(_entry("monday", "11:00", 60), _entry("tuesday", "10:00", 60)),
+    )
+
+    assert plan.write == WRITE_ENTRY
+    assert [(op.action, op.entry_id, op.entry.start) for op in plan.operations] == [
+        (OPERATION_UPDATE, "p0:monday:primary", "11:00")
+    ]
+
+
+def test_several_changes_are_sent_as_one_schedule_write() -> None:
+    """More than one entry change should go out as one full write."""
+    plan = plan_schedule_write(
+        _schedule(_entry("monday", "10:00", 60), _entry("tuesday", "10:00", 60)),
+        _schedule(_entry("tuesday", "10:00", 90), _entry("friday", "08:00", 30)),
+    )
+
+    assert plan.write == WRITE_SCHEDULE
+    assert plan.round_trips == 1
+    assert plan.as_dict()["entry_round_trips"] == 3
+    assert [(op.action, op.entry.day) for op in plan.operations] == [
+        (OPERATION_DELETE, "monday"),
+        (OPERATION_UPDATE, "tuesday"),
+        (OPERATION_ADD, "friday"),
+    ]
+
+
+def test_time_extension_change_needs_a_schedule_write() -> None:
+    """Settings are only sent with the whole schedule."""
+    plan = plan_schedule_write(
+        _schedule(_entry("monday", "10:00", 60)),
+        _schedule(_entry("monday", "10:00", 60), time_extension=20),
+    )
+
+    assert plan.operations == ()
+    assert plan.write == WRITE_SCHEDULE
+
+
+def test_added_protocol_zero_entry_takes_the_free_slot() -> None:
+    """An added entry should not collide with the slot a kept entry holds."""
+    plan = plan_schedule_write(
+        _schedule(_entry("monday", "16:00", 30)),
+        _schedule(
+            _entry("monday", "10:00", 60), _entry("monday", "16:00", 30, "secondary")
+        ),
+    )
+
+    (operation,) = plan.operations
+    assert operation.action == OPERATION_ADD
+    assert (operation.entry.start, operation.entry.source) == ("10:00", "secondary")
@@ -2,18 +2,26 @@
 
 from datetime import datetime
 from types import SimpleNamespace
+from unittest.mock import Mock
 from zoneinfo import ZoneInfo
 
+import pytest
+
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import ATTR_BATTERY_CHARGING
 from homeassistant.helpers.entity import EntityCategory
 
 import custom_components.landroid_cloud.sensor as sensor_module
-from custom_components.landroid_cloud.const import ERROR_STATE_MAP, ERROR_STATE_OPTIONS
+from custom_components.landroid_cloud.const import (
+    DEFAULT_TELEMETRY_MIN_INTERVAL,
+    ERROR_STATE_MAP,
+    ERROR_STATE_OPTIONS,
+)
 from custom_components.landroid_cloud.sensor import (
     LandroidSensor,
     SCHEDULE_UNRECORDED_ATTRIBUTES,
     SENSORS,
+    TelemetryFilter,
     _battery_cycle_value,
     _battery_charging_attribute,
     _battery_value,
@@ -32,7 +40,9 @@ from custom_components.landroid_cloud.sensor import (
     _schedule_attributes,
     _schedule_attributes_with_normalized_schedule,
     _schedule_entry_label,
+    _section_reported,
     _statistics_value,
+    async_setup_entry,
 )
 
 
@@ -171,6 +181,7 @@ def test_schedule_attributes_are_excluded_from_recorder_history() -> None:
     assert LandroidSensor._unrecorded_attributes == SCHEDULE_UNRECORDED_ATTRIBUTES
     assert {
         "active",
+        "conflicts",
         "daily_progress",
         "days",
         "enabled",
@@ -536,6 +547,97 @@ def test_next_schedule_sensor_stays_available_with_valid_schedule(monkeypatch) -
     assert entity.available is True
 
 
+def test_schedule_conflicts_sensor_counts_conflicts() -> None:
+    """The conflicts sensor should expose the schedule analysis."""
+    schedule = SimpleNamespace(
+        time_extension=0,
+        entries=[
+            SimpleNamespace(
+                entry_id="p0:friday:primary",
+                day="friday",
+                start="23:00",
+                duration=120,
+                boundary=False,
+            ),
+            SimpleNamespace(
+                entry_id="p0:saturday:primary",
+                day="saturday",
+                start="00:00",
+                duration=60,
+                boundary=False,
+            ),
+        ],
+    )
+    entity = object.__new__(LandroidSensor)
+    entity.entity_description = next(
+        description
+        for description in SENSORS
+        if description.key == "schedule_conflicts"
+    )
+    entity.coordinator = SimpleNamespace(
+        last_update_success=True,
+        cloud=SimpleNamespace(get_schedule=lambda serial_number: schedule),
+        data={"serial": SimpleNamespace(serial_number="serial", schedules={})},
+    )
+    entity._serial_number = "serial"
+
+    assert entity.native_value == 1
+    attributes = entity.extra_state_attributes
+    assert attributes["weekly_minutes"] == 180
+    assert attributes["effective_minutes"] == 120
+    assert attributes["conflicts"][0]["type"] == "midnight_overlap"
+
+
+def test_schedule_conflicts_are_analyzed_once_per_schedule_revision(
+    monkeypatch,
+) -> None:
+    """Rendering state and attributes should reuse one analysis per revision."""
+    entries = [
+        SimpleNamespace(
+            entry_id="p0:monday:primary",
+            day="monday",
+            start="10:00",
+            duration=60,
+            boundary=False,
+        )
+    ]
+    schedule = SimpleNamespace(time_extension=0, entries=entries)
+    analyze = Mock(wraps=sensor_module.analyze_schedule)
+    monkeypatch.setattr(sensor_module, "analyze_schedule", analyze)
+    entity = object.__new__(LandroidSensor)
+    entity.entity_description = next(
+        description
+        for description in SENSORS
+        if description.key == "schedule_conflicts"
+    )
+    entity.coordinator = SimpleNamespace(
+        last_update_success=True,
+        cloud=SimpleNamespace(get_schedule=lambda serial_number: schedule),
+        data={"serial": SimpleNamespace(serial_number="serial", schedules={})},
+    )
+    entity._serial_number = "serial"
+
+    for _ in range(3):
+        entity._update_schedule_analysis()
+        assert entity.native_value == 0
+        assert entity.extra_state_attributes["weekly_minutes"] == 60
+    assert analyze.call_count == 1
+
+    entries.append(
+        SimpleNamespace(
+            entry_id="p0:monday:secondary",
+            day="monday",
+            start="10:30",
+            duration=60,
+            boundary=False,
+        )
+    )
+    entity._update_schedule_analysis()
+
+    assert entity.native_value == 1
+    assert analyze.call_count == 2
+
+
 def test_rain_delay_remaining_sensor_is_unavailable_when_zero() -> None:
     """Rain delay remaining sensor should be unavailable when delay is inactive."""
     entity = object.__new__(LandroidSensor)
@@ -705,3 +807,314 @@ def test_last_update_is_disabled_by_default() -> None:
     )
 
     assert last_update.entity_registry_enabled_default is False
+
+
+def test_noisy_telemetry_sensors_define_deadbands() -> None:
+    """Orientation, signal and battery telemetry should be filtered."""
+    filtered = {
+        description.key
+        for description in SENSORS
+        if description.deadband is not None or description.deadband_relative is not None
+    }
+
+    assert filtered == {
+        "rssi",
+        "battery_voltage",
+        "battery_temperature",
+        "pitch",
+        "roll",
+        "yaw",
+    }
+
+
+def test_telemetry_filter_ignores_changes_within_deadband() -> None:
+    """Readings within the absolute deadband should keep the published value."""
+    telemetry = TelemetryFilter(deadband=2)
+
+    assert telemetry.update(10.0, 0) == 10.0
+    assert telemetry.update(11.5, 1) == 10.0
+    assert telemetry.update(12.5, 2) == 12.5
+
+
+def test_telemetry_filter_supports_relative_deadband() -> None:
+    """The relative deadband should scale with the published value."""
+    telemetry = TelemetryFilter(deadband_relative=0.1)
+
+    assert telemetry.update(20.0, 0) == 20.0
+    assert telemetry.update(21.5, 1) == 20.0
+    assert telemetry.update(22.5, 2) == 22.5
+
+
+def test_telemetry_filter_rate_limits_writes() -> None:
+    """Changes inside the minimum interval should be held and retried later."""
+    telemetry = TelemetryFilter(deadband=1, min_interval=30)
+
+    assert telemetry.update(10.0, 0) == 10.0
+    assert telemetry.update(20.0, 10) == 10.0
+    assert telemetry.retry_in(10) == 20
+    assert telemetry.update(20.0, 30) == 20.0
+    assert telemetry.retry_in(30) is None
+
+
+def test_telemetry_filter_writes_past_the_deadband_without_rate_limit() -> None:
+    """The shipped defaults should only apply the deadband."""
+    telemetry = TelemetryFilter(deadband=1, min_interval=DEFAULT_TELEMETRY_MIN_INTERVAL)
+
+    assert telemetry.update(10.0, 0) == 10.0
+    assert telemetry.update(20.0, 1) == 20.0
+    assert telemetry.update(20.5, 2) == 20.0
+    assert telemetry.retry_in(2) is None
+
+
+def test_telemetry_filter_averages_over_window() -> None:
+    """Averaging should publish the mean of readings inside the window."""
+    telemetry = TelemetryFilter(average_window=60)
+
+    assert telemetry.update(-60, 0) == -60
+    assert telemetry.update(-70, 10) == -65
+    assert telemetry.update(-80, 100) == -80
+
+
+def test_telemetry_filter_passes_through_missing_values() -> None:
+    """A missing reading should clear the published value immediately."""
+    telemetry = TelemetryFilter(deadband=5, min_interval=60)
+
+    telemetry.update(10.0, 0)
+
+    assert telemetry.update(None, 1) is None
+    assert telemetry.update(11.0, 2) == 11.0
+
+
+def test_telemetry_filter_flush_publishes_the_held_reading() -> None:
+    """A retry should publish the held reading without adding a sample."""
+    telemetry = TelemetryFilter(deadband=1, min_interval=30, average_window=600)
+
+    telemetry.update(10.0, 0)
+    telemetry.update(20.0, 10)
+
+    assert telemetry.flush(30) == 15.0
+    assert telemetry.retry_in(30) is None
+    assert len(telemetry._samples) == 2
+
+
+def test_filtered_sensor_publishes_filtered_value() -> None:
+    """Filtered sensors should render the filter output, not the raw reading."""
+    entity = object.__new__(LandroidSensor)
+    entity.entity_description = next(
+        description for description in SENSORS if description.key == "pitch"
+    )
+    entity.coordinator = SimpleNamespace(
+        last_update_success=True,
+        data={"serial": SimpleNamespace(orientation={"pitch": 4.5})},
+    )
+    entity._serial_number = "serial"
+    entity._telemetry_filter = TelemetryFilter(deadband=2)
+    entity._telemetry_filter.update(3.0, 0)
+
+    assert entity.native_value == 3.0
+    assert entity._raw_native_value() == 4.5
+
+
+def test_filtered_sensor_samples_each_mower_reading_once() -> None:
+    """Updates without a new reading from this mower must not add samples."""
+    entity = object.__new__(LandroidSensor)
+    entity.entity_description = next(
+        description for description in SENSORS if description.key == "pitch"
+    )
+    device = SimpleNamespace(
+        online=True, orientation={"pitch": 4.0}, updated=datetime(2026, 1, 1, 12)
+    )
+    entity.coordinator = SimpleNamespace(
+        last_update_success=True, data={"serial": device}
+    )
+    entity._serial_number = "serial"
+    entity._telemetry_filter = TelemetryFilter(deadband=1, average_window=600)
+
+    entity._update_telemetry_filter()
+    device.orientation = {"pitch": 8.0}
+    entity._update_telemetry_filter()
+
+    assert entity.native_value == 4.0
+    assert len(entity._telemetry_filter._samples) == 1
+
+    device.updated = datetime(2026, 1, 1, 12, 1)
+    entity._update_telemetry_filter()
+
+    assert entity.native_value == 6.0
+
+
+def test_section_reported_walks_nested_payload_sections() -> None:
+    """Dotted sections should resolve through attributes and nested dicts."""
+    device = SimpleNamespace(
+        battery={"temperature": 21.0, "cycles": {"total": 12}},
+        orientation={},
+        statistics=None,
+    )
+
+    assert _section_reported(device, "battery.temperature") is True
+    assert _section_reported(device, "battery.cycles.total") is True
+    assert _section_reported(device, "battery.voltage") is False
+    assert _section_reported(device, "orientation.pitch") is False
+    assert _section_reported(device, "statistics.distance") is False
+
+
+def _setup_entry_for(device, *, reported: set[str] | None = None):
+    listeners: list = []
+    coordinator = SimpleNamespace(
+        data={"serial": device},
+        reported_sections=lambda serial_number: set(reported or ()),
+        record_reported_sections=Mock(),
+        async_add_listener=lambda listener: listeners.append(listener) or Mock(),
+    )
+    entry = SimpleNamespace(
+        runtime_data=SimpleNamespace(coordinator=coordinator),
+        async_on_unload=Mock(),
+        data={},
+        options={},
+    )
+    return entry, listeners
+
+
+def _minimal_device(**overrides) -> SimpleNamespace:
+    payload = {
+        "battery": {"percent": 80},
+        "orientation": {},
+        "statistics": {"worktime_total": 100},
+        "blades": {},
+        "schedules": {},
+        "rssi": -60,
+    }
+    payload.update(overrides)
+    return SimpleNamespace(**payload)
+
+
+@pytest.mark.asyncio
+async def test_async_setup_entry_skips_sections_the_mower_never_reports(
+    monkeypatch,
+) -> None:
+    """Sensors for missing payload sections should not be created."""
+    monkeypatch.setattr(
+        "custom_components.landroid_cloud.sensor.er.async_get",
+        lambda hass: SimpleNamespace(
+            async_get_entity_id=lambda *args: None, async_get=lambda entity_id: None
+        ),
+    )
+    entry, _ = _setup_entry_for(_minimal_device())
+    added: list = []
+
+    await async_setup_entry(SimpleNamespace(), entry, added.extend)
+
+    keys = {entity.entity_description.key for entity in added}
+    assert "mower_runtime_total" in keys
+    assert "rssi" in keys
+    assert "battery" in keys
+    assert not keys & {
+        "pitch",
+        "roll",
+        "yaw",
+        "distance_driven_total",
+        "battery_temperature",
+        "nutrition",
+        "exclusion_schedules",
+    }
+    entry.runtime_data.coordinator.record_reported_sections.assert_called_once_with(
+        "serial", {"rssi", "statistics.worktime_total"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_setup_entry_adds_sensors_when_section_appears(
+    monkeypatch,
+) -> None:
+    """Sensors should be added once a new payload section is reported."""
+    monkeypatch.setattr(
+        "custom_components.landroid_cloud.sensor.er.async_get",
+        lambda hass: SimpleNamespace(
+            async_get_entity_id=lambda *args: None, async_get=lambda entity_id: None
+        ),
+    )
+    device = _minimal_device()
+    entry, listeners = _setup_entry_for(device)
+    added: list = []
+    await async_setup_entry(SimpleNamespace(), entry, added.extend)
+    initial_count = len(added)
+
+    device.orientation = {"pitch": 1.0, "roll": 2.0, "yaw": 3.0}
+    listeners[0]()
+    listeners[0]()
+
+    new_keys = [entity.entity_description.key for entity in added[initial_count:]]
+    assert sorted(new_keys) == ["pitch", "roll", "yaw"]
+
+
+@pytest.mark.asyncio
+async def test_async_setup_entry_uses_persisted_and_customized_sensors(
+    monkeypatch,
+) -> None:
+    """Persisted sections and customized registry entries should keep sensors."""
+    registry_entries = {
+        "sensor.garden_yaw": SimpleNamespace(
+            name="Heading", icon=None, area_id=None, labels=set(), aliases=set()
+        ),
+        "sensor.garden_pitch": SimpleNamespace(
+            name=None, icon=None, area_id=None, labels=set(), aliases=set()
+        ),
+    }
+    registry = SimpleNamespace(
+        async_get_entity_id=lambda domain, platform, unique_id: {
+            "serial_yaw": "sensor.garden_yaw",
+            "serial_pitch": "sensor.garden_pitch",
+        }.get(unique_id),
+        async_get=registry_entries.get,
+        async_remove=Mock(),
+    )
+    monkeypatch.setattr(
+        "custom_components.landroid_cloud.sensor.er.async_get", lambda hass: registry
+    )
+    entry, _ = _setup_entry_for(_minimal_device(), reported={"statistics.distance"})
+    added: list = []
+
+    await async_setup_entry(SimpleNamespace(), entry, added.extend)
+
+    keys = {entity.entity_description.key for entity in added}
+    assert {"distance_driven_total", "yaw"} <= keys
+    assert "pitch" not in keys
+    registry.async_remove.assert_called_once_with("sensor.garden_pitch")
+
+
+@pytest.mark.asyncio
+async def test_async_setup_entry_only_checks_new_readings_of_pending_sections(
+    monkeypatch,
+) -> None:
+    """Pushes should not repeat registry lookups or re-check handled sections."""
+    registry = SimpleNamespace(
+        async_get_entity_id=Mock(return_value=None), async_get=Mock()
+    )
+    monkeypatch.setattr(
+        "custom_components.landroid_cloud.sensor.er.async_get", lambda hass: registry
+    )
+    device = _minimal_device(updated=datetime(2026, 1, 1, 12))
+    entry, listeners = _setup_entry_for(device)
+    added: list = []
+    await async_setup_entry(SimpleNamespace(), entry, added.extend)
+    initial_count = len(added)
+    lookups = registry.async_get_entity_id.call_count
+    record = entry.runtime_data.coordinator.record_reported_sections
+
+    device.orientation = {"pitch": 1.0}
+    listeners[0]()
+
+    assert len(added) == initial_count
+    assert record.call_count == 1
+
+    device.updated = datetime(2026, 1, 1, 12, 1)
+    listeners[0]()
+    device.updated = datetime(2026, 1, 1, 12, 2)
+    listeners[0]()
+
+    assert [entity.entity_description.key for entity in added[initial_count:]] == [
+        "pitch"
+    ]
+    record.assert_called_with("serial", {"orientation.pitch"})
+    assert record.call_count == 2
+    assert registry.async_get_entity_id.call_count == lookups
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock
 import pytest
 from homeassistant.helpers.entity import EntityCategory
 
+from custom_components.landroid_cloud.commands import AckTracker, LandroidCommandQueue
 from custom_components.landroid_cloud.switch import LandroidSwitch, SWITCHES
 
 
@@ -124,6 +125,8 @@ async def test_firmware_auto_update_calls_cloud_command() -> None:
     entity._attr_requires_online = True
     entity._attr_requires_auto_schedule = False
     entity.coordinator = SimpleNamespace(
+        command_queue=LandroidCommandQueue(),
+        ack_tracker=AckTracker(),
         cloud=SimpleNamespace(set_firmware_auto_upgrade=AsyncMock()),
         data={
             "serial": SimpleNamespace(serial_number="serial", online=True, firmware={})
@@ -135,3 +138,50 @@ async def test_firmware_auto_update_calls_cloud_command() -> None:
     entity.coordinator.cloud.set_firmware_auto_upgrade.assert_awaited_once_with(
         "serial", True
     )
+
+
+@pytest.mark.asyncio
+async def test_switch_shows_requested_state_until_the_mower_confirms() -> None:
+    """Toggling should update the switch right away instead of after the push."""
+    entity = object.__new__(LandroidSwitch)
+    entity._serial_number = "serial"
+    entity.entity_description = next(
+        description for description in SWITCHES if description.key == "lock"
+    )
+    entity._attr_requires_online = True
+    entity._attr_requires_auto_schedule = False
+    entity.coordinator = SimpleNamespace(
+        command_queue=LandroidCommandQueue(),
+        ack_tracker=AckTracker(),
+        cloud=SimpleNamespace(set_lock=AsyncMock()),
+        data={"serial": SimpleNamespace(serial_number="serial", locked=False)},
+    )
+
+    await entity.async_turn_on()
+
+    assert entity.is_on is True
+    assert entity._reported_is_on is False
+
+
+@pytest.mark.asyncio
+async def test_switch_skips_writes_matching_the_current_state() -> None:
+    """Turning on a switch that is already on should only be sent when forced."""
+    entity = object.__new__(LandroidSwitch)
+    entity._serial_number = "serial"
+    entity.entity_description = next(
+        description for description in SWITCHES if description.key == "lock"
+    )
+    entity._attr_requires_online = True
+    entity._attr_requires_auto_schedule = False
+    entity.coordinator = SimpleNamespace(
+        command_queue=LandroidCommandQueue(),
+        ack_tracker=AckTracker(),
+        cloud=SimpleNamespace(set_lock=AsyncMock()),
+        data={"serial": SimpleNamespace(serial_number="serial", locked=True)},
+    )
+
+    await entity.async_turn_on()
+    entity.coordinator.cloud.set_lock.assert_not_awaited()
+
+    await entity._async_service_set_state(state=True, force=True)
+    entity.coordinator.cloud.set_lock.assert_awaited_once_with("serial", True)
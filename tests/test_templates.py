@@ -0,0 +1,290 @@
+"""Tests for stored schedule templates."""
+
+from functools import partial
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from homeassistant.exceptions import HomeAssistantError
+from pyworxcloud import ScheduleEntry, ScheduleModel
+import voluptuous as vol
+
+from custom_components.landroid_cloud.commands import LandroidCommandQueue
+from custom_components.landroid_cloud.fleet import async_run_fleet
+from custom_components.landroid_cloud.schedule_snapshot import (
+    schedule_from_snapshot,
+    schedule_snapshot,
+    snapshot_hash,
+    snapshot_json,
+)
+from custom_components.landroid_cloud.templates import (
+    SNAPSHOT_SCHEMA,
+    TEMPLATE_EXCLUSION_SLOT_SCHEMA,
+    _template_from_call,
+    _template_from_mower,
+    async_apply_template,
+)
+
+
+def _model(protocol: int, *entries: tuple[str, str, int]) -> ScheduleModel:
+    """Return a schedule with one entry per (day, start, duration)."""
+    seen: set[str] = set()
+    schedule_entries = []
+    for index, (day, start, duration) in enumerate(entries):
+        secondary = protocol == 0 and day in seen
+        seen.add(day)
+        schedule_entries.append(
+            ScheduleEntry(
+                entry_id=f"entry{index}",
+                day=day,
+                start=start,
+                duration=duration,
+                boundary=False,
+                source=("secondary" if secondary else "primary")
+                if protocol == 0
+                else "slot",
+                secondary=secondary,
+            )
+        )
+    return ScheduleModel(
+        enabled=True,
+        time_extension=0 if protocol == 0 else None,
+        entries=schedule_entries,
+        protocol=protocol,
+    )
+
+
+TEMPLATE = {
+    "schedule": schedule_snapshot(
+        _model(0, ("monday", "10:00", 60), ("monday", "16:00", 30))
+    )
+}
+
+
+class _Cloud:
+    """Fake cloud holding one schedule per mower."""
+
+    def __init__(self, schedules: dict[str, ScheduleModel]) -> None:
+        self.schedules = schedules
+        self.writes: list[str] = []
+
+    def get_schedule(self, serial_number: str) -> ScheduleModel:
+        return self.schedules[serial_number]
+
+    async def set_schedule(self, serial_number: str, schedule: ScheduleModel) -> None:
+        self.writes.append(serial_number)
+        self.schedules[serial_number] = schedule
+
+
+def _coordinator(cloud, serial_numbers, **device) -> SimpleNamespace:
+    return SimpleNamespace(
+        cloud=cloud,
+        command_queue=LandroidCommandQueue(),
+        data={
+            serial_number: SimpleNamespace(online=True, **device)
+            for serial_number in serial_numbers
+        },
+    )
+
+
+def test_schedule_snapshot_ignores_protocol_details() -> None:
+    """The same weekly plan should hash the same for both protocols."""
+    protocol_zero = _model(0, ("monday", "16:00", 30), ("monday", "10:00", 60))
+    protocol_one = _model(1, ("monday", "10:00", 60), ("monday", "16:00", 30))
+    protocol_one.time_extension = 0
+
+    assert snapshot_hash(schedule_snapshot(protocol_zero)) == snapshot_hash(
+        schedule_snapshot(protocol_one)
+    )
+
+
+def test_schedule_from_snapshot_limits_protocol_zero_to_two_entries_a_day() -> None:
+    """Protocol 0 mowers cannot take a third entry on one day."""
+    snapshot = schedule_snapshot(
+        _model(
+            1, ("monday", "08:00", 30), ("monday", "12:00", 30), ("monday", "18:00", 30)
+        )
+    )
+
+    assert len(schedule_from_snapshot(_model(1), snapshot).entries) == 3
+    with pytest.raises(ValueError, match="at most two schedules"):
+        schedule_from_snapshot(_model(0), snapshot)
+
+
+@pytest.mark.asyncio
+async def test_apply_template_skips_mowers_that_already_match() -> None:
+    """Only mowers whose schedule differs from the template should be written."""
+    cloud = _Cloud(
+        {
+            "same": _model(0, ("monday", "10:00", 60), ("monday", "16:00", 30)),
+            "other": _model(0, ("tuesday", "10:00", 60)),
+        }
+    )
+    coordinator = _coordinator(cloud, cloud.schedules)
+
+    results = await async_run_fleet(
+        [(coordinator, "same"), (coordinator, "other")],
+        partial(async_apply_template, TEMPLATE),
+    )
+
+    assert results["same"]["skipped"] is True
+    assert results["other"]["skipped"] is False
+    assert cloud.writes == ["other"]
+    assert schedule_snapshot(cloud.schedules["other"]) == TEMPLATE["schedule"]
+
+
+@pytest.mark.asyncio
+async def test_apply_template_writes_only_changed_exclusions() -> None:
+    """A template's exclusions should be compared and only changed days sent."""
+    template = _template_from_call(
+        {
+            "entries": [{"day": "monday", "start": "10:00", "duration": 60}],
+            "days": {"sunday": {"exclude_day": True, "slots": []}},
+        }
+    )
+    cloud = _Cloud({"serial": schedule_from_snapshot(_model(0), template["schedule"])})
+    cloud.set_auto_schedule_exclusion_day = AsyncMock()
+    cloud.set_auto_schedule_exclusion_slots = AsyncMock()
+    cloud.set_auto_schedule_exclude_nights = AsyncMock()
+    coordinator = _coordinator(
+        cloud,
+        ["serial"],
+        schedules={
+            "auto_schedule": {
+                "enabled": True,
+                "settings": {
+                    "exclusion_scheduler": {
+                        "exclude_nights": True,
+                        "days": [{"exclude_day": False, "slots": []}] * 7,
+                    }
+                },
+            }
+        },
+    )
+
+    result = await async_apply_template(template, coordinator, "serial")
+
+    assert result == {"skipped": False}
+    assert cloud.writes == []
+    cloud.set_auto_schedule_exclusion_day.assert_awaited_once_with("serial", 0, True)
+    cloud.set_auto_schedule_exclusion_slots.assert_not_awaited()
+    cloud.set_auto_schedule_exclude_nights.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_apply_template_needs_auto_schedule_for_exclusions() -> None:
+    """Exclusions can only be applied to mowers using auto schedule."""
+    template = _template_from_call(
+        {
+            "entries": [],
+            "days": {"sunday": {"exclude_day": True, "slots": []}},
+        }
+    )
+    cloud = _Cloud({"serial": _model(0)})
+    coordinator = _coordinator(cloud, ["serial"], schedules={})
+
+    with pytest.raises(HomeAssistantError, match="Enable auto schedule"):
+        await async_apply_template(template, coordinator, "serial")
+
+
+def _auto_schedule(**settings) -> dict:
+    """Return device schedules with auto schedule enabled."""
+    return {
+        "auto_schedule": {
+            "enabled": True,
+            "settings": {
+                "boost": 0,
+                "grass_type": "mixed_species",
+                "nutrition": None,
+                "exclusion_scheduler": {
+                    "exclude_nights": True,
+                    "days": [{"exclude_day": False, "slots": []}] * 7,
+                },
+                **settings,
+            },
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_export_of_fifty_mowers_imports_back_without_writes() -> None:
+    """Exporting 50 mowers reads cached state and imports back without calls."""
+    cloud = _Cloud(
+        {
+            f"serial{index}": _model(
+                0, ("monday", "10:00", 60), ("friday", "08:00", 30)
+            )
+            for index in range(50)
+        }
+    )
+    cloud.set_auto_schedule_exclusion_day = AsyncMock()
+    cloud.set_auto_schedule_boost = AsyncMock()
+    coordinator = _coordinator(cloud, cloud.schedules, schedules=_auto_schedule())
+
+    exported = {
+        serial_number: snapshot_json(
+            _template_from_mower(coordinator, serial_number, include_settings=True)
+        )
+        for serial_number in cloud.schedules
+    }
+
+    snapshot = SNAPSHOT_SCHEMA(exported["serial0"])
+    assert snapshot["auto_schedule"] == {
+        "boost": 0,
+        "grass_type": "mixed_species",
+        "nutrition": None,
+    }
+    results = await async_run_fleet(
+        [(coordinator, serial_number) for serial_number in exported],
+        lambda coordinator, serial_number: async_apply_template(
+            SNAPSHOT_SCHEMA(exported[serial_number]), coordinator, serial_number
+        ),
+    )
+
+    assert all(result["skipped"] for result in results.values())
+    assert cloud.writes == []
+    cloud.set_auto_schedule_exclusion_day.assert_not_awaited()
+    cloud.set_auto_schedule_boost.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_import_sends_only_changed_settings_and_exclusions() -> None:
+    """Changed settings and exclusion days should go out through public helpers."""
+    cloud = _Cloud({"serial": _model(0, ("monday", "10:00", 60))})
+    cloud.set_auto_schedule_boost = AsyncMock()
+    cloud.set_auto_schedule_grass_type = AsyncMock()
+    cloud.set_auto_schedule_nutrition = AsyncMock()
+    cloud.set_auto_schedule_exclusion_day = AsyncMock()
+    coordinator = _coordinator(cloud, ["serial"], schedules=_auto_schedule())
+    snapshot = SNAPSHOT_SCHEMA(
+        {
+            "exclusions": {
+                "days": [{"exclude_day": True}] + [{}] * 6,
+            },
+            "auto_schedule": {"boost": 2, "nutrition": {"n": 10, "p": 5, "k": 5}},
+        }
+    )
+
+    result = await async_apply_template(snapshot, coordinator, "serial")
+
+    assert result == {"skipped": False}
+    cloud.set_auto_schedule_boost.assert_awaited_once_with("serial", 2)
+    cloud.set_auto_schedule_nutrition.assert_awaited_once_with("serial", 10, 5, 5)
+    cloud.set_auto_schedule_exclusion_day.assert_awaited_once_with("serial", 0, True)
+    cloud.set_auto_schedule_grass_type.assert_not_awaited()
+
+
+def test_exclusion_slots_are_limited_to_one_day() -> None:
+    """Template and snapshot slots cannot be longer than one day."""
+    TEMPLATE_EXCLUSION_SLOT_SCHEMA({"start": "00:00", "duration": 1440})
+    with pytest.raises(vol.Invalid):
+        TEMPLATE_EXCLUSION_SLOT_SCHEMA({"start": "00:00", "duration": 1441})
+    with pytest.raises(vol.Invalid):
+        SNAPSHOT_SCHEMA(
+            {
+                "exclusions": {
+                    "days": [{"slots": [{"start_time": 0, "duration": 1441}]}]
+                    + [{}] * 6
+                }
+            }
+        )
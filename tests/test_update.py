@@ -10,6 +10,10 @@ from homeassistant.components.update import UpdateEntityFeature
 from homeassistant.exceptions import HomeAssistantError
 from pyworxcloud.exceptions import NoConnectionError, OfflineError
 
+from custom_components.landroid_cloud.commands import (
+    CloudCircuitBreaker,
+    CloudRateLimiter,
+)
 from custom_components.landroid_cloud.update import (
     LandroidFirmwareUpdateEntity,
     NoFirmwareAvailableError,
@@ -46,6 +50,8 @@ def _make_entity(
             refresh_firmware_update_info or AsyncMock(return_value=info or {})
         ),
         async_update_listeners=lambda: None,
+        rate_limiter=CloudRateLimiter(60, 10),
+        circuit_breaker=CloudCircuitBreaker(5, 60),
     )
     return entity
 